@@ -8,6 +8,7 @@ from functools import lru_cache
 from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
+    from src.core.query_engine.engine_pool import HybridSearchPool
     from src.core.query_engine.hybrid_search import HybridSearch
     from src.core.settings import Settings
     from src.ingestion.pipeline import IngestionPipeline
@@ -27,16 +28,36 @@ def get_settings() -> Settings:
 
 
 # ---------------------------------------------------------------------------
-# HybridSearch (lazy singleton)
+# HybridSearch (per-collection LRU engine pool)
 # ---------------------------------------------------------------------------
 
-_hybrid_search: Optional[HybridSearch] = None
-_hybrid_collection: str = ""
+_engine_pool: Optional[HybridSearchPool] = None
 _init_lock = threading.Lock()
 
 
+def get_engine_pool() -> HybridSearchPool:
+    """Return the shared HybridSearch engine pool.
+
+    Engines are cached per collection (bounded LRU with idle eviction) and
+    share one embedding client, reranker model and LLM.
+
+    Returns:
+        Initialized HybridSearchPool.
+    """
+    global _engine_pool
+    if _engine_pool is not None:
+        return _engine_pool
+
+    with _init_lock:
+        if _engine_pool is not None:
+            return _engine_pool
+        from src.core.query_engine.engine_pool import HybridSearchPool
+        _engine_pool = HybridSearchPool(get_settings(), llm_factory=get_llm)
+        return _engine_pool
+
+
 def get_hybrid_search(collection: str = "default") -> HybridSearch:
-    """Return a cached HybridSearch instance, rebuilding if collection changes.
+    """Return the pooled HybridSearch engine for a collection.
 
     Args:
         collection: Name of the vector store collection.
@@ -44,93 +65,7 @@ def get_hybrid_search(collection: str = "default") -> HybridSearch:
     Returns:
         Initialized HybridSearch engine.
     """
-    global _hybrid_search, _hybrid_collection
-
-    if _hybrid_search is not None and _hybrid_collection == collection:
-        return _hybrid_search
-
-    with _init_lock:
-        # Double-checked locking
-        if _hybrid_search is not None and _hybrid_collection == collection:
-            return _hybrid_search
-
-        settings = get_settings()
-
-        from src.core.settings import resolve_path
-        from src.libs.embedding.embedding_factory import EmbeddingFactory
-        from src.libs.vector_store.vector_store_factory import VectorStoreFactory
-        from src.ingestion.storage.bm25_indexer import BM25Indexer
-        from src.core.query_engine.dense_retriever import DenseRetriever
-        from src.core.query_engine.sparse_retriever import SparseRetriever
-        from src.core.query_engine.query_processor import QueryProcessor
-        from src.core.query_engine.fusion import RRFFusion
-        from src.core.query_engine.hybrid_search import HybridSearch
-        from src.core.query_engine.strategy_router import StrategyRouter
-        from src.core.query_engine.reranker import CoreReranker
-
-        embedding = EmbeddingFactory.create(settings)
-        vector_store = VectorStoreFactory.create(settings, collection_name=collection)
-
-        bm25 = BM25Indexer(index_dir=str(resolve_path(f"data/db/bm25/{collection}")))
-        bm25.load(collection)
-
-        dense_retriever = DenseRetriever(settings=settings, embedding_client=embedding, vector_store=vector_store)
-        sparse_retriever = SparseRetriever(settings=settings, bm25_indexer=bm25, vector_store=vector_store)
-        query_processor = QueryProcessor()
-        fusion = RRFFusion()
-
-        # Create reranker (gracefully falls back to NoneReranker if disabled/failed)
-        reranker: CoreReranker | None = None
-        try:
-            reranker = CoreReranker(settings)
-            if not reranker.is_enabled:
-                reranker = None
-        except Exception as e:
-            logger.warning(f"Reranker init failed, proceeding without: {e}")
-
-        _hybrid_search = HybridSearch(
-            settings=settings,
-            query_processor=query_processor,
-            dense_retriever=dense_retriever,
-            sparse_retriever=sparse_retriever,
-            fusion=fusion,
-            reranker=reranker,
-        )
-
-        parent_mode = getattr(settings.retrieval, "parent_retrieval_mode", "never")
-        graph_mode = getattr(settings.retrieval, "graph_rag_mode", "never")
-
-        if parent_mode != "never":
-            try:
-                from src.ingestion.storage.parent_store import ParentStore
-
-                _hybrid_search.parent_store = ParentStore(
-                    db_path=str(resolve_path(f"data/db/parent_store/{collection}.db"))
-                )
-            except Exception as e:
-                logger.warning(f"ParentStore init failed: {e}")
-
-        if graph_mode != "never":
-            try:
-                from src.ingestion.storage.graph_store import GraphStore
-
-                _hybrid_search.graph_store = GraphStore(
-                    db_path=str(resolve_path(f"data/db/graph_store/{collection}.db"))
-                )
-            except Exception as e:
-                logger.warning(f"GraphStore init failed: {e}")
-
-        router_llm = None
-        if parent_mode == "auto" or graph_mode == "auto":
-            try:
-                router_llm = get_llm()
-            except Exception as e:
-                logger.warning(f"StrategyRouter LLM init failed, using fallback routing: {e}")
-
-        _hybrid_search.strategy_router = StrategyRouter(settings=settings, llm=router_llm)
-        _hybrid_collection = collection
-        logger.info(f"HybridSearch initialized for collection '{collection}'")
-        return _hybrid_search
+    return get_engine_pool().get(collection)
 
 
 # ---------------------------------------------------------------------------
@@ -200,9 +135,10 @@ def get_pipeline(
 
 def reset_all() -> None:
     """Clear all cached instances — called after config update."""
-    global _hybrid_search, _hybrid_collection, _llm, _pipelines
-    _hybrid_search = None
-    _hybrid_collection = ""
+    global _engine_pool, _llm, _pipelines
+    if _engine_pool is not None:
+        _engine_pool.close()
+    _engine_pool = None
     _llm = None
     # Close pipeline resources before clearing
     for p in _pipelines.values():
@@ -221,15 +157,21 @@ def shutdown_stores() -> None:
     Called on FastAPI shutdown event. Ensures ChromaDB WAL is checkpointed
     and HNSW index is flushed before process exits.
     """
-    global _hybrid_search
-    if _hybrid_search is not None:
-        try:
-            dense = getattr(_hybrid_search, "dense_retriever", None)
-            if dense:
-                vs = getattr(dense, "vector_store", None)
-                if vs and hasattr(vs, "close"):
-                    vs.close()
-                    logger.info("Vector store closed gracefully")
-        except Exception as e:
-            logger.warning(f"Error closing vector store: {e}")
+    # Evicting pooled engines closes each engine's vector store
     reset_all()
+
+    from src.core.query_engine.search_executor import (
+        shutdown_llm_executor,
+        shutdown_search_executor,
+    )
+    shutdown_search_executor()
+    shutdown_llm_executor()
+
+    from src.libs.embedding.embedding_cache import close_embedding_caches
+    close_embedding_caches()
+
+    from src.core.query_engine.rerank_score_cache import close_rerank_score_caches
+    close_rerank_score_caches()
+
+    from src.ingestion.storage.chunk_docstore import close_chunk_docstores
+    close_chunk_docstores()
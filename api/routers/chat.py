@@ -6,14 +6,16 @@ This module is a thin HTTP adapter. All business logic resides in
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any, Dict, List
 
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
 
-from api.deps import get_hybrid_search, get_llm
+from api.deps import get_hybrid_search, get_llm, get_settings
 from api.models import ChatRequest
+from src.core.query_engine.semantic_answer_cache import get_semantic_answer_cache
 from src.repositories.history_repo import HistoryRepository
 from src.services.chat_service import ChatService
 
@@ -31,10 +33,13 @@ async def chat_stream(req: ChatRequest):
     Delegates entirely to ChatService for retrieval, LLM streaming,
     image processing, and history persistence.
     """
+    # Cold engine builds block, so keep them off the event loop
+    hybrid_search = await asyncio.to_thread(get_hybrid_search, req.collection)
     service = ChatService(
         llm=get_llm(),
-        hybrid_search=get_hybrid_search(req.collection),
+        hybrid_search=hybrid_search,
         history_repo=_history_repo,
+        semantic_cache=get_semantic_answer_cache(get_settings().retrieval.semantic_cache),
     )
     return StreamingResponse(
         service.stream_answer(
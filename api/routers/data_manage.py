@@ -8,7 +8,9 @@ from typing import List
 
 from fastapi import APIRouter
 
+from src.core.query_engine.cache_generation import bump_cache_generation
 from src.core.settings import resolve_path
+from src.ingestion.storage.sparse_index_factory import sparse_index_dirs, sparse_index_roots
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -16,7 +18,7 @@ router = APIRouter()
 
 @router.delete("/clear-all")
 async def clear_all_data():
-    """Clear all data from all stores (ChromaDB, BM25, images, history).
+    """Clear all data from all stores (ChromaDB, BM25, docstore, images, history).
     
     WARNING: This is a destructive operation!
     
@@ -26,6 +28,7 @@ async def clear_all_data():
     summary = {
         "chroma_cleared": False,
         "bm25_cleared": False,
+        "docstore_cleared": False,
         "images_cleared": False,
         "history_cleared": False,
         "traces_cleared": False,
@@ -43,17 +46,30 @@ async def clear_all_data():
         summary["errors"].append(f"ChromaDB: {e}")
         logger.exception(f"Failed to clear ChromaDB: {e}")
     
-    # 2. Clear BM25 indexes
+    # 2. Clear sparse indexes (every provider)
     try:
-        bm25_dir = resolve_path("data/db/bm25")
-        if bm25_dir.exists():
-            shutil.rmtree(bm25_dir)
-            bm25_dir.mkdir(parents=True, exist_ok=True)
+        for index_root in sparse_index_roots():
+            if index_root.exists():
+                shutil.rmtree(index_root)
+                index_root.mkdir(parents=True, exist_ok=True)
         summary["bm25_cleared"] = True
     except Exception as e:
         summary["errors"].append(f"BM25: {e}")
         logger.exception(f"Failed to clear BM25: {e}")
     
+    # 2b. Clear chunk docstores (close open connections before removing files)
+    try:
+        from src.ingestion.storage.chunk_docstore import close_chunk_docstores
+        
+        close_chunk_docstores()
+        docstore_dir = resolve_path("data/db/docstore")
+        if docstore_dir.exists():
+            shutil.rmtree(docstore_dir)
+        summary["docstore_cleared"] = True
+    except Exception as e:
+        summary["errors"].append(f"Docstore: {e}")
+        logger.exception(f"Failed to clear docstore: {e}")
+    
     # 3. Clear image storage
     try:
         img_db = resolve_path("data/db/image_index.db")
@@ -88,6 +104,9 @@ async def clear_all_data():
         summary["errors"].append(f"Traces: {e}")
         logger.exception(f"Failed to clear traces: {e}")
     
+    # Retire query caches for every collection
+    bump_cache_generation()
+    
     # Reset cached instances
     try:
         from api.deps import reset_all
@@ -113,6 +132,7 @@ async def clear_collection(collection_name: str):
         "collection": collection_name,
         "chroma_cleared": False,
         "bm25_cleared": False,
+        "docstore_cleared": False,
         "errors": [],
     }
     
@@ -131,16 +151,29 @@ async def clear_collection(collection_name: str):
         summary["errors"].append(f"ChromaDB: {e}")
         logger.exception(f"Failed to clear ChromaDB collection: {e}")
     
-    # 2. Clear BM25 index for collection
+    # 2. Clear sparse indexes for collection (every provider)
     try:
-        bm25_dir = resolve_path(f"data/db/bm25/{collection_name}")
-        if bm25_dir.exists():
-            shutil.rmtree(bm25_dir)
+        for index_dir in sparse_index_dirs(collection_name):
+            if index_dir.exists():
+                shutil.rmtree(index_dir)
         summary["bm25_cleared"] = True
     except Exception as e:
         summary["errors"].append(f"BM25: {e}")
         logger.exception(f"Failed to clear BM25 index: {e}")
     
+    # 3. Clear the collection's chunk docstore
+    try:
+        from src.ingestion.storage.chunk_docstore import get_chunk_docstore
+        
+        get_chunk_docstore(collection_name).clear()
+        summary["docstore_cleared"] = True
+    except Exception as e:
+        summary["errors"].append(f"Docstore: {e}")
+        logger.exception(f"Failed to clear docstore: {e}")
+    
+    # Retire query caches for this collection only
+    bump_cache_generation(collection_name)
+    
     # Reset cached instances
     try:
         from api.deps import reset_all
@@ -200,13 +200,13 @@ async def delete_document(req: DocumentDeleteRequest):
         from src.core.settings import load_settings
         from src.ingestion.document_manager import DocumentManager
         from src.libs.vector_store.vector_store_factory import VectorStoreFactory
-        from src.ingestion.storage.bm25_indexer import BM25Indexer
+        from src.ingestion.storage.sparse_index_factory import create_sparse_indexer
         from src.ingestion.storage.image_storage import ImageStorage
         from src.core.settings import resolve_path
 
         settings = load_settings()
         chroma = VectorStoreFactory.create(settings, collection_name=req.collection)
-        bm25 = BM25Indexer(index_dir=str(resolve_path(f"data/db/bm25/{req.collection}")))
+        bm25 = create_sparse_indexer(settings, req.collection)
         images = ImageStorage(
             db_path=str(resolve_path("data/db/image_index.db")),
             images_root=str(resolve_path("data/images")),
@@ -246,8 +246,8 @@ async def clear_collection(req: CollectionDeleteRequest):
     try:
         from src.core.settings import load_settings, resolve_path
         from src.libs.vector_store.vector_store_factory import VectorStoreFactory
-        from src.ingestion.storage.bm25_indexer import BM25Indexer
         from src.libs.loader.file_integrity import SQLiteIntegrityChecker
+        from src.core.query_engine.cache_generation import bump_cache_generation
 
         settings = load_settings()
         deleted_info: dict[str, int] = {}
@@ -263,17 +263,27 @@ async def clear_collection(req: CollectionDeleteRequest):
             logger.warning(f"ChromaDB clear failed: {e}")
             deleted_info["chunks"] = 0
 
-        # 2. Clear BM25 index
+        # 2. Clear sparse indexes (every provider)
         try:
-            bm25_dir = resolve_path(f"data/db/bm25/{req.collection}")
-            if bm25_dir.exists():
-                shutil.rmtree(str(bm25_dir))
-                logger.info(f"BM25 index directory '{bm25_dir}' removed")
+            from src.ingestion.storage.sparse_index_factory import sparse_index_dirs
+
+            for index_dir in sparse_index_dirs(req.collection):
+                if index_dir.exists():
+                    shutil.rmtree(str(index_dir))
+                    logger.info(f"Sparse index directory '{index_dir}' removed")
             deleted_info["bm25"] = 1
         except Exception as e:
             logger.warning(f"BM25 clear failed: {e}")
             deleted_info["bm25"] = 0
 
+        # 2b. Clear the chunk docstore
+        try:
+            from src.ingestion.storage.chunk_docstore import get_chunk_docstore
+
+            get_chunk_docstore(req.collection).clear()
+        except Exception as e:
+            logger.warning(f"Chunk docstore clear failed: {e}")
+
         # 3. Remove integrity records for this collection
         try:
             integrity = SQLiteIntegrityChecker(
@@ -290,6 +300,9 @@ async def clear_collection(req: CollectionDeleteRequest):
             logger.warning(f"Integrity cleanup failed: {e}")
             deleted_info["records"] = 0
 
+        # 4. Retire query caches for this collection
+        bump_cache_generation(req.collection)
+
         return {
             "ok": True,
             "message": f"集合 '{req.collection}' 已清空",
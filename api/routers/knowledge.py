@@ -16,7 +16,7 @@ import threading
 import time
 import uuid
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
 from fastapi import APIRouter
 from fastapi.responses import StreamingResponse
@@ -79,13 +79,38 @@ async def scan_folder(body: Dict[str, Any]):
     }
 
 
+def _file_metadata(task: Dict[str, Any], fpath: str) -> Optional[Dict[str, str]]:
+    """Per-file chunk metadata: task metadata plus name-derived fields."""
+    from src.ingestion.vendor_inference import infer_from_filename
+
+    fname = Path(fpath).name
+    extra_meta = task.get("extra_metadata")
+    file_meta = dict(extra_meta) if extra_meta else {}
+    file_meta["source_filename"] = fname
+    file_meta["source_directory"] = str(Path(fpath).parent.name)
+    # Auto-infer vendor/model from filename when not provided
+    if not file_meta.get("product_vendor") or not file_meta.get("product_model"):
+        inf_vendor, inf_model = infer_from_filename(fname)
+        if inf_vendor and not file_meta.get("product_vendor"):
+            file_meta["product_vendor"] = inf_vendor
+        if inf_model and not file_meta.get("product_model"):
+            file_meta["product_model"] = inf_model
+    return file_meta if file_meta else None
+
+
 def _run_ingestion_worker(task_id: str, task: Dict[str, Any]) -> None:
     """Background worker that runs ingestion and pushes events to queue.
     
-    This runs in a separate thread, decoupled from SSE connection.
+    This runs in a separate thread, decoupled from SSE connection. Files
+    go through PipelinedIngestion, so parsing, transforms, embedding and
+    storage of consecutive files overlap; events are still one
+    ``progress`` when a file starts and one ``file_done`` when it ends.
     """
+    import asyncio
+
     from src.core.settings import load_settings
-    from src.ingestion.pipeline import IngestionPipeline
+    from src.ingestion.pipeline import IngestionPipeline, PipelineResult
+    from src.ingestion.pipelined_ingestion import IngestFile, PipelinedIngestion
 
     event_queue: queue.Queue = task["event_queue"]
     
@@ -107,59 +132,54 @@ def _run_ingestion_worker(task_id: str, task: Dict[str, Any]) -> None:
             task["total"] = total
         
         results = {"success": 0, "failed": 0, "skipped": 0}
-
-        for idx, fpath in enumerate(files):
-            if task["stop_requested"]:
-                event_queue.put({"type": "stopped", "completed": idx, "total": total})
-                break
-
-            fname = Path(fpath).name
-            
+        started = 0
+
+        def _on_stage(idx: int, stage: str) -> None:
+            nonlocal started
+            if stage != "integrity":
+                return
+            started += 1
+            fname = Path(files[idx]).name
             with _task_lock:
-                task["current"] = idx + 1
+                task["current"] = started
                 task["current_file"] = fname
-            
             event_queue.put({
                 "type": "progress", 
-                "current": idx + 1, 
+                "current": started, 
                 "total": total, 
                 "file": fname, 
                 "stage": "处理中"
             })
 
-            try:
-                from src.ingestion.vendor_inference import infer_from_filename
-
-                extra_meta = task.get("extra_metadata")
-                file_meta = dict(extra_meta) if extra_meta else {}
-                file_meta["source_filename"] = fname
-                file_meta["source_directory"] = str(Path(fpath).parent.name)
-                # Auto-infer vendor/model from filename when not provided
-                if not file_meta.get("product_vendor") or not file_meta.get("product_model"):
-                    inf_vendor, inf_model = infer_from_filename(fname)
-                    if inf_vendor and not file_meta.get("product_vendor"):
-                        file_meta["product_vendor"] = inf_vendor
-                    if inf_model and not file_meta.get("product_model"):
-                        file_meta["product_model"] = inf_model
-                import asyncio
-                result = asyncio.run(pipeline.run(
-                    file_path=fpath,
-                    original_filename=fname,
-                    extra_metadata=file_meta if file_meta else None,
-                ))
-                if result.stages.get("integrity", {}).get("skipped"):
-                    results["skipped"] += 1
-                    event_queue.put({"type": "file_done", "file": fname, "status": "skipped"})
-                elif result.success:
-                    results["success"] += 1
-                    event_queue.put({"type": "file_done", "file": fname, "status": "success", "chunks": result.chunk_count})
-                else:
-                    results["failed"] += 1
-                    event_queue.put({"type": "file_done", "file": fname, "status": "failed", "error": result.error or "未知错误"})
-            except Exception as e:
+        def _on_result(idx: int, result: PipelineResult) -> None:
+            fname = Path(files[idx]).name
+            if result.stages.get("integrity", {}).get("skipped"):
+                results["skipped"] += 1
+                event_queue.put({"type": "file_done", "file": fname, "status": "skipped"})
+            elif result.success:
+                results["success"] += 1
+                event_queue.put({"type": "file_done", "file": fname, "status": "success", "chunks": result.chunk_count})
+            else:
                 results["failed"] += 1
-                event_queue.put({"type": "file_done", "file": fname, "status": "failed", "error": str(e)})
-                logger.exception(f"Ingestion failed for {fname}")
+                event_queue.put({"type": "file_done", "file": fname, "status": "failed", "error": result.error or "未知错误"})
+
+        specs = [
+            IngestFile(
+                path=fpath,
+                original_filename=Path(fpath).name,
+                extra_metadata=_file_metadata(task, fpath),
+            )
+            for fpath in files
+        ]
+        runner = PipelinedIngestion.from_settings(pipeline)
+        done = asyncio.run(runner.run(
+            specs,
+            on_stage=_on_stage,
+            on_result=_on_result,
+            should_stop=lambda: task["stop_requested"],
+        ))
+        if len(done) < total:
+            event_queue.put({"type": "stopped", "completed": len(done), "total": total})
 
         with _task_lock:
             task["status"] = "done"
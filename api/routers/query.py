@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Awaitable, Dict, Optional
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 from pydantic import BaseModel
 
 from api.deps import get_hybrid_search
@@ -14,6 +15,9 @@ from api.deps import get_hybrid_search
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Upper bound on queries per batch request (larger jobs send several batches)
+MAX_BATCH_QUERIES = 500
+
 
 class QueryRequest(BaseModel):
     """Request model for test query."""
@@ -39,12 +43,80 @@ class QueryResponse(BaseModel):
     latency_ms: float
 
 
+class BatchQueryRequest(BaseModel):
+    """Request model for a batch of queries."""
+    queries: list[str]
+    collection: str = "default"
+    top_k: int = 10
+    filters: Optional[Dict[str, Any]] = None  # Applied to every query
+
+
+class BatchQueryItem(BaseModel):
+    """Results of one query in a batch."""
+    query: str
+    results: list[QueryResult]
+    latency_ms: Dict[str, float]  # Per stage (query_processing, dense, sparse, fusion, rerank, finalize, total)
+    cache_hit: bool = False
+    error: Optional[str] = None
+
+
+class BatchQueryResponse(BaseModel):
+    """Response model for a batch of queries."""
+    items: list[BatchQueryItem]
+    latency_ms: float
+
+
+def _to_query_results(results: list[Any]) -> list[QueryResult]:
+    """Convert RetrievalResults to API query results."""
+    return [
+        QueryResult(
+            source=r.metadata.get("source_path", "未知"),
+            source_path=r.metadata.get("source_path", "未知"),
+            text=r.text[:500],
+            content=r.text[:500],
+            score=round(r.score, 4),
+            page=r.metadata.get("page"),
+        )
+        for r in results
+    ]
+
+
+async def _search_until_disconnect(
+    request: Request,
+    coro: Awaitable[Any],
+    poll_interval: float = 0.5,
+) -> Optional[Any]:
+    """Await a search coroutine, cancelling it if the client disconnects.
+
+    Args:
+        request: Incoming request (polled for disconnect).
+        coro: The search coroutine.
+        poll_interval: Seconds between disconnect checks.
+
+    Returns:
+        The search result, or None if the client went away first.
+    """
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                task.cancel()
+                return None
+    finally:
+        if not task.done():
+            task.cancel()
+
+
 @router.post("")
-async def test_query(req: QueryRequest):
+async def test_query(req: QueryRequest, request: Request):
     """Execute a test retrieval query.
     
     Args:
         req: Query request with query text, collection, and top_k
+        request: Raw request, used to cancel the search on disconnect
         
     Returns:
         Query results with latency
@@ -52,31 +124,89 @@ async def test_query(req: QueryRequest):
     try:
         start = time.time()
         
-        search = get_hybrid_search(req.collection)
-        results = search.search(query=req.query, top_k=req.top_k, filters=req.filters)
+        # Cold engine builds block, so keep them off the event loop too
+        search = await asyncio.to_thread(get_hybrid_search, req.collection)
+        results = await _search_until_disconnect(
+            request,
+            search.asearch(query=req.query, top_k=req.top_k, filters=req.filters),
+        )
+        if results is None:
+            logger.info("Client disconnected, query cancelled")
+            return {"ok": False, "message": "client disconnected"}
         
         latency_ms = (time.time() - start) * 1000
         
-        query_results = [
-            QueryResult(
-                source=r.metadata.get("source_path", "未知"),
-                source_path=r.metadata.get("source_path", "未知"),
-                text=r.text[:500],
-                content=r.text[:500],
-                score=round(r.score, 4),
-                page=r.metadata.get("page"),
+        return {
+            "ok": True,
+            "data": QueryResponse(
+                results=_to_query_results(results),
+                latency_ms=round(latency_ms, 2),
+            ).model_dump(),
+        }
+        
+    except Exception as e:
+        logger.exception(f"Query failed: {e}")
+        return {"ok": False, "message": str(e)}
+
+
+@router.post("/batch")
+async def batch_query(req: BatchQueryRequest, request: Request):
+    """Execute a batch of retrieval queries with shared, batched stages.
+    
+    All queries are embedded in one call, searched with one vector store
+    query, scored in one BM25 pass and reranked in one cross-encoder batch
+    (see HybridSearch.search_batch).
+    
+    Args:
+        req: Batch request with queries, collection, top_k and filters
+        request: Raw request, used to stop waiting on disconnect
+        
+    Returns:
+        Per-query results in input order with per-stage latencies
+    """
+    if not req.queries:
+        return {"ok": False, "message": "queries cannot be empty"}
+    if len(req.queries) > MAX_BATCH_QUERIES:
+        return {
+            "ok": False,
+            "message": f"too many queries ({len(req.queries)} > {MAX_BATCH_QUERIES})",
+        }
+    
+    try:
+        start = time.time()
+        
+        search = await asyncio.to_thread(get_hybrid_search, req.collection)
+        batch = await _search_until_disconnect(
+            request,
+            asyncio.to_thread(
+                search.search_batch, req.queries, top_k=req.top_k, filters=req.filters
+            ),
+        )
+        if batch is None:
+            logger.info("Client disconnected, batch query abandoned")
+            return {"ok": False, "message": "client disconnected"}
+        
+        latency_ms = (time.time() - start) * 1000
+        
+        items = [
+            BatchQueryItem(
+                query=item.query,
+                results=_to_query_results(item.results),
+                latency_ms={k: round(v, 2) for k, v in item.timings_ms.items()},
+                cache_hit=item.cache_hit,
+                error=item.error,
             )
-            for r in results
+            for item in batch
         ]
         
         return {
             "ok": True,
-            "data": QueryResponse(
-                results=query_results,
+            "data": BatchQueryResponse(
+                items=items,
                 latency_ms=round(latency_ms, 2),
             ).model_dump(),
         }
         
     except Exception as e:
-        logger.exception(f"Query failed: {e}")
+        logger.exception(f"Batch query failed: {e}")
         return {"ok": False, "message": str(e)}
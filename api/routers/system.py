@@ -123,26 +123,39 @@ async def get_cache_stats():
     """Return cache statistics for performance monitoring.
     
     Returns:
-        Statistics for all cache layers (L1: Embedding, L2: Retrieval, L3: Answer, Rerank).
+        Statistics for all cache layers (L1: Embedding, L2: Retrieval, L3: Answer
+        and semantic answer, Rerank results and per-pair scores, LLM rewrite/routing decisions) plus the current index generation of each
+        collection.
     """
     try:
-        from src.libs.embedding.embedding_cache import get_query_cache
+        from api.deps import get_settings
+        from src.libs.embedding.embedding_cache import get_embedding_cache_stats
         from src.core.query_engine.retrieval_cache import get_retrieval_cache
         from src.core.query_engine.answer_cache import get_answer_cache
+        from src.core.query_engine.semantic_answer_cache import get_semantic_answer_cache
         from src.core.query_engine.rerank_cache import get_rerank_cache
+        from src.core.query_engine.rerank_score_cache import get_rerank_score_cache_stats
+        from src.core.query_engine.decision_cache import get_decision_cache
+        from src.core.query_engine.cache_generation import get_cache_generations
         
-        query_cache = get_query_cache()
         retrieval_cache = get_retrieval_cache()
         answer_cache = get_answer_cache()
         rerank_cache = get_rerank_cache()
+        semantic_cache = get_semantic_answer_cache(get_settings().retrieval.semantic_cache)
         
         return {
             "ok": True,
             "data": {
-                "L1_embedding_cache": query_cache.stats(),
+                "L1_embedding_cache": get_embedding_cache_stats(),
                 "L2_retrieval_cache": retrieval_cache.stats(),
                 "L3_answer_cache": answer_cache.stats(),
+                "L3_semantic_answer_cache": (
+                    semantic_cache.stats() if semantic_cache is not None else {"enabled": False}
+                ),
                 "rerank_cache": rerank_cache.stats(),
+                "rerank_score_cache": get_rerank_score_cache_stats(),
+                "decision_cache": get_decision_cache().stats(),
+                "generations": get_cache_generations().snapshot(),
             }
         }
     except Exception as e:
@@ -0,0 +1,337 @@
+#!/usr/bin/env python
+"""Compare the fp32 Cross-Encoder reranker with the int8 ONNX backend.
+
+For every query of a golden test set, retrieves candidates with HybridSearch
+(no reranking), scores the same candidates with both backends and reports:
+
+- Latency per query (mean / p50 / p95) and the speedup
+- Agreement: top-k overlap, top-1 agreement and Spearman rank correlation
+  of the two score lists
+- Hit rate / MRR at top-k against expected_chunk_ids (when the test set
+  has them)
+
+Usage:
+    # Compare on the default golden test set
+    python scripts/compare_rerankers.py --collection technical_docs
+
+    # Try a different token budget / thread count for the ONNX model
+    python scripts/compare_rerankers.py --max-length 256 --threads 4
+
+    # Compare against the un-quantized ONNX model
+    python scripts/compare_rerankers.py --no-quantize --json
+
+Exit codes:
+    0 - Success
+    1 - Comparison failure
+    2 - Configuration error
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import numpy as np
+
+# Set UTF-8 encoding for Windows console
+if sys.platform == "win32":
+    import io
+    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding="utf-8")
+    sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding="utf-8")
+
+# Add project root to path
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+
+def parse_args() -> argparse.Namespace:
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(
+        description="Compare fp32 Cross-Encoder and int8 ONNX rerankers (accuracy and latency)."
+    )
+    parser.add_argument(
+        "--test-set",
+        default="tests/fixtures/golden_test_set.json",
+        help="Path to golden test set JSON file (default: tests/fixtures/golden_test_set.json)",
+    )
+    parser.add_argument(
+        "--collection",
+        default="default",
+        help="Collection name to retrieve candidates from (default: 'default').",
+    )
+    parser.add_argument(
+        "--candidates",
+        type=int,
+        default=20,
+        help="Candidates retrieved and reranked per query (default: 20).",
+    )
+    parser.add_argument(
+        "--top-k",
+        type=int,
+        default=5,
+        help="Cut-off for overlap, hit rate and MRR (default: 5).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=1,
+        help="Timed runs per query and backend; the fastest run counts (default: 1).",
+    )
+    parser.add_argument("--threads", type=int, default=None, help="ONNX intra-op threads.")
+    parser.add_argument("--max-length", type=int, default=None, help="ONNX token budget per pair.")
+    parser.add_argument("--batch-size", type=int, default=None, help="ONNX pairs per batch.")
+    parser.add_argument(
+        "--no-quantize",
+        action="store_true",
+        help="Use the fp32 ONNX model instead of the int8 one.",
+    )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Output results as JSON instead of formatted text.",
+    )
+    return parser.parse_args()
+
+
+def main() -> int:
+    """Main entry point."""
+    args = parse_args()
+
+    try:
+        from src.core.settings import load_settings
+        from src.observability.evaluation.eval_runner import load_test_set
+
+        settings = load_settings()
+        test_cases = load_test_set(args.test_set)
+    except Exception as exc:
+        print(f"❌ Configuration error: {exc}", file=sys.stderr)
+        return 2
+
+    try:
+        hybrid_search = _create_hybrid_search(settings, args.collection)
+        baseline, onnx = _create_rerankers(settings, args)
+    except Exception as exc:
+        print(f"❌ Failed to initialize: {exc}", file=sys.stderr)
+        return 2
+
+    from src.core.query_engine.reranker import CoreReranker
+
+    # Candidate text is prepared exactly as in production (filename prefix, truncation)
+    formatter = CoreReranker(settings, reranker=baseline)
+
+    rows: List[Dict[str, Any]] = []
+    try:
+        for case in test_cases:
+            results = hybrid_search.search(case.query, top_k=args.candidates)
+            candidates = formatter._results_to_candidates(results)
+            if len(candidates) < 2:
+                continue
+
+            # Warm-up (first call of each backend pays one-off allocations)
+            if not rows:
+                baseline.rerank(case.query, candidates)
+                onnx.rerank(case.query, candidates)
+
+            base_ms, base_ranked = _timed_rerank(baseline, case.query, candidates, args.repeat)
+            onnx_ms, onnx_ranked = _timed_rerank(onnx, case.query, candidates, args.repeat)
+            rows.append(_compare(case, candidates, base_ranked, onnx_ranked, base_ms, onnx_ms, args.top_k))
+    except Exception as exc:
+        print(f"❌ Comparison failed: {exc}", file=sys.stderr)
+        return 1
+
+    if not rows:
+        print("❌ No query returned enough candidates to compare.", file=sys.stderr)
+        return 1
+
+    summary = _summarize(rows, args)
+    if args.json:
+        print(json.dumps({"summary": summary, "queries": rows}, indent=2, ensure_ascii=False))
+    else:
+        _print_summary(summary)
+    return 0
+
+
+def _create_hybrid_search(settings: Any, collection: str) -> Any:
+    """Build HybridSearch (without reranker) for *collection*."""
+    from src.core.query_engine.dense_retriever import create_dense_retriever
+    from src.core.query_engine.hybrid_search import create_hybrid_search
+    from src.core.query_engine.query_processor import QueryProcessor
+    from src.core.query_engine.sparse_retriever import create_sparse_retriever
+    from src.ingestion.storage.bm25_indexer import BM25Indexer
+    from src.libs.embedding.embedding_factory import EmbeddingFactory
+    from src.libs.vector_store.vector_store_factory import VectorStoreFactory
+
+    vector_store = VectorStoreFactory.create(settings, collection_name=collection)
+    dense_retriever = create_dense_retriever(
+        settings=settings,
+        embedding_client=EmbeddingFactory.create(settings),
+        vector_store=vector_store,
+    )
+    sparse_retriever = create_sparse_retriever(
+        settings=settings,
+        bm25_indexer=BM25Indexer(index_dir=f"data/db/bm25/{collection}"),
+        vector_store=vector_store,
+    )
+    sparse_retriever.default_collection = collection
+    return create_hybrid_search(
+        settings=settings,
+        query_processor=QueryProcessor(),
+        dense_retriever=dense_retriever,
+        sparse_retriever=sparse_retriever,
+    )
+
+
+def _create_rerankers(settings: Any, args: argparse.Namespace) -> tuple:
+    """Create the fp32 baseline and the ONNX reranker for the configured model."""
+    from src.libs.reranker.cross_encoder_reranker import CrossEncoderReranker
+    from src.libs.reranker.onnx_reranker import OnnxCrossEncoderReranker
+
+    overrides: Dict[str, Any] = {}
+    if args.threads is not None:
+        overrides["num_threads"] = args.threads
+    if args.max_length is not None:
+        overrides["max_length"] = args.max_length
+    if args.batch_size is not None:
+        overrides["batch_size"] = args.batch_size
+    if args.no_quantize:
+        overrides["quantize"] = False
+
+    return CrossEncoderReranker(settings), OnnxCrossEncoderReranker(settings, **overrides)
+
+
+def _timed_rerank(reranker: Any, query: str, candidates: List[Dict[str, Any]], repeat: int) -> tuple:
+    """Rerank *repeat* times; return (fastest ms, ranked candidates)."""
+    best = float("inf")
+    ranked: List[Dict[str, Any]] = []
+    for _ in range(max(1, repeat)):
+        t0 = time.perf_counter()
+        ranked = reranker.rerank(query, candidates)
+        best = min(best, (time.perf_counter() - t0) * 1000.0)
+    return best, ranked
+
+
+def _compare(
+    case: Any,
+    candidates: List[Dict[str, Any]],
+    base_ranked: List[Dict[str, Any]],
+    onnx_ranked: List[Dict[str, Any]],
+    base_ms: float,
+    onnx_ms: float,
+    top_k: int,
+) -> Dict[str, Any]:
+    """Per-query latency and agreement metrics."""
+    base_ids = [c["id"] for c in base_ranked]
+    onnx_ids = [c["id"] for c in onnx_ranked]
+    base_scores = {c["id"]: c["rerank_score"] for c in base_ranked}
+    onnx_scores = {c["id"]: c["rerank_score"] for c in onnx_ranked}
+    ids = [c["id"] for c in candidates]
+
+    row: Dict[str, Any] = {
+        "query": case.query,
+        "candidates": len(candidates),
+        "fp32_ms": round(base_ms, 2),
+        "onnx_ms": round(onnx_ms, 2),
+        "top1_agree": base_ids[0] == onnx_ids[0],
+        "topk_overlap": len(set(base_ids[:top_k]) & set(onnx_ids[:top_k])) / min(top_k, len(ids)),
+        "spearman": _spearman([base_scores[i] for i in ids], [onnx_scores[i] for i in ids]),
+        "max_score_diff": max(abs(base_scores[i] - onnx_scores[i]) for i in ids),
+    }
+    expected = set(case.expected_chunk_ids)
+    if expected:
+        row["fp32_hit"], row["fp32_rr"] = _hit_and_rr(base_ids[:top_k], expected)
+        row["onnx_hit"], row["onnx_rr"] = _hit_and_rr(onnx_ids[:top_k], expected)
+    return row
+
+
+def _spearman(a: List[float], b: List[float]) -> float:
+    """Spearman rank correlation of two score lists (ties broken by position)."""
+    ra = np.argsort(np.argsort(a)).astype(float)
+    rb = np.argsort(np.argsort(b)).astype(float)
+    if ra.std() == 0 or rb.std() == 0:
+        return 1.0
+    return float(np.corrcoef(ra, rb)[0, 1])
+
+
+def _hit_and_rr(ranked_ids: List[str], expected: set) -> tuple:
+    """Hit (0/1) and reciprocal rank of the first expected chunk."""
+    for rank, chunk_id in enumerate(ranked_ids, start=1):
+        if chunk_id in expected:
+            return 1.0, 1.0 / rank
+    return 0.0, 0.0
+
+
+def _summarize(rows: List[Dict[str, Any]], args: argparse.Namespace) -> Dict[str, Any]:
+    """Aggregate per-query rows."""
+    fp32 = np.array([r["fp32_ms"] for r in rows])
+    onnx = np.array([r["onnx_ms"] for r in rows])
+    summary: Dict[str, Any] = {
+        "queries": len(rows),
+        "candidates_per_query": args.candidates,
+        "top_k": args.top_k,
+        "fp32_ms": _latency(fp32),
+        "onnx_ms": _latency(onnx),
+        "speedup": round(float(fp32.mean() / onnx.mean()), 2) if onnx.mean() > 0 else None,
+        "top1_agreement": round(float(np.mean([r["top1_agree"] for r in rows])), 4),
+        "topk_overlap": round(float(np.mean([r["topk_overlap"] for r in rows])), 4),
+        "spearman": round(float(np.mean([r["spearman"] for r in rows])), 4),
+        "max_score_diff": round(float(max(r["max_score_diff"] for r in rows)), 4),
+    }
+    labelled = [r for r in rows if "fp32_hit" in r]
+    if labelled:
+        for backend in ("fp32", "onnx"):
+            summary[f"{backend}_hit_rate"] = round(float(np.mean([r[f"{backend}_hit"] for r in labelled])), 4)
+            summary[f"{backend}_mrr"] = round(float(np.mean([r[f"{backend}_rr"] for r in labelled])), 4)
+    return summary
+
+
+def _latency(values: np.ndarray) -> Dict[str, float]:
+    """Mean / p50 / p95 of latencies in ms."""
+    return {
+        "mean": round(float(values.mean()), 2),
+        "p50": round(float(np.percentile(values, 50)), 2),
+        "p95": round(float(np.percentile(values, 95)), 2),
+    }
+
+
+def _print_summary(summary: Dict[str, Any]) -> None:
+    """Print formatted comparison report."""
+    print("=" * 60)
+    print("  RERANKER COMPARISON: fp32 Cross-Encoder vs ONNX")
+    print("=" * 60)
+    print(f"  Queries:     {summary['queries']}")
+    print(f"  Candidates:  {summary['candidates_per_query']} per query, top-k = {summary['top_k']}")
+    print()
+    print("─" * 60)
+    print("  LATENCY (ms per query)        mean      p50      p95")
+    print("─" * 60)
+    for backend in ("fp32", "onnx"):
+        lat = summary[f"{backend}_ms"]
+        print(f"  {backend:<28s} {lat['mean']:>8.1f} {lat['p50']:>8.1f} {lat['p95']:>8.1f}")
+    print(f"  Speedup: {summary['speedup']}x")
+    print()
+    print("─" * 60)
+    print("  AGREEMENT")
+    print("─" * 60)
+    print(f"  Top-1 agreement:   {summary['top1_agreement']:.4f}")
+    print(f"  Top-k overlap:     {summary['topk_overlap']:.4f}")
+    print(f"  Spearman (scores): {summary['spearman']:.4f}")
+    print(f"  Max |score diff|:  {summary['max_score_diff']:.4f}")
+    if "fp32_hit_rate" in summary:
+        print()
+        print("─" * 60)
+        print("  RETRIEVAL QUALITY (expected_chunk_ids)")
+        print("─" * 60)
+        for backend in ("fp32", "onnx"):
+            print(
+                f"  {backend:<6s} hit_rate={summary[f'{backend}_hit_rate']:.4f}  "
+                f"mrr={summary[f'{backend}_mrr']:.4f}"
+            )
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,6 +13,9 @@ Usage:
     # Use a specific collection
     python scripts/evaluate.py --collection technical_docs
 
+    # Retrieve 64 queries per batch (one embedding/search/rerank call each)
+    python scripts/evaluate.py --batch-size 64
+
     # JSON output
     python scripts/evaluate.py --json
 
@@ -61,6 +64,12 @@ def parse_args() -> argparse.Namespace:
         default=10,
         help="Number of chunks to retrieve per query (default: 10).",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=32,
+        help="Number of queries retrieved per batch search (default: 32).",
+    )
     parser.add_argument(
         "--json",
         action="store_true",
@@ -148,12 +157,14 @@ def main() -> int:
     try:
         print(f"\n🔍 Running evaluation with {evaluator_name}...")
         print(f"📄 Test set: {args.test_set}")
-        print(f"🔢 Top-K: {args.top_k}\n")
+        print(f"🔢 Top-K: {args.top_k}")
+        print(f"📦 Batch size: {args.batch_size}\n")
 
         report = runner.run(
             test_set_path=args.test_set,
             top_k=args.top_k,
             collection=args.collection,
+            batch_size=args.batch_size,
         )
     except Exception as exc:
         print(f"❌ Evaluation failed: {exc}", file=sys.stderr)
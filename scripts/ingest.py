@@ -14,6 +14,9 @@ Usage:
     # Force re-processing (ignore previous ingestion)
     python scripts/ingest.py --path documents/report.pdf --collection contracts --force
     
+    # Re-process a modified file, redoing only its changed chunks
+    python scripts/ingest.py --path documents/report.pdf --collection contracts --force --diff
+    
     # Use custom configuration file
     python scripts/ingest.py --path documents/ --collection contracts --config custom_settings.yaml
 
@@ -24,6 +27,7 @@ Exit codes:
 """
 
 import argparse
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -47,6 +51,7 @@ sys.path.insert(0, str(project_root))
 from src.core.settings import load_settings, Settings
 from src.core.trace import TraceContext, TraceCollector
 from src.ingestion.pipeline import IngestionPipeline, PipelineResult
+from src.ingestion.pipelined_ingestion import IngestFile, PipelinedIngestion
 from src.observability.logger import get_logger
 
 logger = get_logger(__name__)
@@ -83,6 +88,14 @@ def parse_args() -> argparse.Namespace:
         help="Force re-processing even if file was previously ingested"
     )
     
+    parser.add_argument(
+        "--diff",
+        action="store_true",
+        default=None,
+        help="With --force, keep unchanged chunks and only re-process changed ones "
+             "(default: ingestion.diff_reingest)"
+    )
+    
     parser.add_argument(
         "--config",
         default=str(_REPO_ROOT / "config" / "settings.yaml"),
@@ -241,7 +254,8 @@ def main() -> int:
         pipeline = IngestionPipeline(
             settings=settings,
             collection=args.collection,
-            force=args.force
+            force=args.force,
+            diff_reingest=args.diff,
         )
     except Exception as e:
         print(f"[FAIL] Failed to initialize pipeline: {e}")
@@ -254,33 +268,51 @@ def main() -> int:
     
     collector = TraceCollector()
 
-    for i, file_path in enumerate(files, 1):
-        print(f"\n[{i}/{len(files)}] Processing: {file_path}")
-        
-        try:
+    async def _process_all() -> None:
+        # Stages of consecutive files overlap (ingestion.pipelining)
+        runner = PipelinedIngestion.from_settings(pipeline)
+        traces = []
+        done = {}
+        for file_path in files:
             trace = TraceContext(trace_type="ingestion")
             trace.metadata["source_path"] = str(file_path)
-            result = pipeline.run(str(file_path), trace=trace)
-            collector.collect(trace)
-            results.append(result)
-            
+            traces.append(trace)
+
+        def _on_stage(i: int, stage: str) -> None:
+            if stage == "integrity":
+                print(f"\n[{i + 1}/{len(files)}] Processing: {files[i]}")
+
+        def _on_result(i: int, result: PipelineResult) -> None:
+            done[i] = result
+            collector.collect(traces[i])
             if result.success:
                 skipped = result.stages.get("integrity", {}).get("skipped", False)
                 if skipped:
-                    print(f"   [SKIP] Skipped (already processed)")
+                    print(f"   [SKIP] Skipped: {files[i]}")
                 else:
-                    print(f"   [OK] Success: {result.chunk_count} chunks, {result.image_count} images")
+                    print(f"   [OK] Success: {files[i]}: {result.chunk_count} chunks, {result.image_count} images")
             else:
-                print(f"   [FAIL] Failed: {result.error}")
-        
-        except Exception as e:
-            logger.exception(f"Unexpected error processing {file_path}")
-            results.append(PipelineResult(
-                success=False,
-                file_path=str(file_path),
-                error=str(e)
-            ))
-            print(f"   [FAIL] Error: {e}")
+                print(f"   [FAIL] Failed: {files[i]}: {result.error}")
+
+        # One sparse-index commit for the whole folder (Tantivy backend)
+        with pipeline.batch_index_commits():
+            try:
+                await runner.run(
+                    [IngestFile(str(f), trace=t) for f, t in zip(files, traces)],
+                    on_stage=_on_stage,
+                    on_result=_on_result,
+                )
+                error = "not processed"
+            except Exception as e:
+                logger.exception("Unexpected error during ingestion")
+                print(f"   [FAIL] Error: {e}")
+                error = str(e)
+        results.extend(
+            done.get(i) or PipelineResult(success=False, file_path=str(f), error=error)
+            for i, f in enumerate(files)
+        )
+
+    asyncio.run(_process_all())
     
     # Print summary
     print_summary(results, args.verbose)
@@ -35,6 +35,7 @@ from src.core.query_engine.hybrid_search import (
     HybridSearchResult,
     create_hybrid_search,
 )
+from src.core.query_engine.engine_pool import HybridSearchPool
 
 __all__ = [
     "QueryProcessor",
@@ -53,4 +54,5 @@ __all__ = [
     "HybridSearchConfig",
     "HybridSearchResult",
     "create_hybrid_search",
+    "HybridSearchPool",
 ]
@@ -13,6 +13,8 @@ Design Principles:
 - Memory-bounded: LRU eviction
 - TTL support: Auto-expire stale entries (shorter TTL for dynamic content)
 - Query normalization: Consistent cache keys
+- Collection-scoped: Keys include the collection and its index generation,
+  so re-ingesting a document retires answers built from the old content
 """
 
 from __future__ import annotations
@@ -25,6 +27,8 @@ from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from src.core.query_engine.cache_generation import cache_scope
+
 logger = logging.getLogger(__name__)
 
 
@@ -52,10 +56,10 @@ class AnswerCache:
         >>> cache = AnswerCache(max_size=500, ttl_seconds=604800)  # 7 days
         >>> 
         >>> # Check cache
-        >>> cached = cache.get("报销流程是什么")
+        >>> cached = cache.get("报销流程是什么", collection="default")
         >>> if cached is None:
         ...     answer = rag_pipeline.generate("报销流程是什么")
-        ...     cache.put("报销流程是什么", answer, sources)
+        ...     cache.put("报销流程是什么", answer, sources, collection="default")
     """
     
     def __init__(
@@ -77,25 +81,39 @@ class AnswerCache:
         self._misses = 0
         self._expired = 0
     
-    def _make_key(self, query: str) -> str:
-        """Generate cache key from normalized query."""
+    def _make_key(
+        self,
+        query: str,
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> str:
+        """Generate cache key from collection, index generation and normalized query."""
         normalized = normalize_query(query)
-        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:20]
+        key_str = f"{cache_scope(collection, generation)}|{normalized}"
+        return hashlib.sha256(key_str.encode("utf-8")).hexdigest()[:20]
     
     def _is_expired(self, entry: CachedAnswer) -> bool:
         """Check if cache entry has expired."""
         return (time.time() - entry.timestamp) > self.ttl_seconds
     
-    def get(self, query: str) -> Optional[CachedAnswer]:
+    def get(
+        self,
+        query: str,
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> Optional[CachedAnswer]:
         """Get cached answer.
         
         Args:
             query: Search query.
+            collection: Collection the question targets (defaults to "default").
+            generation: Index generation captured at request start. If None,
+                the collection's current generation is used.
             
         Returns:
             Cached answer or None if not found/expired.
         """
-        key = self._make_key(query)
+        key = self._make_key(query, collection, generation)
         
         with self._lock:
             if key not in self._cache:
@@ -122,6 +140,8 @@ class AnswerCache:
         answer: str,
         sources: List[Dict[str, Any]],
         metadata: Optional[Dict[str, Any]] = None,
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
     ) -> None:
         """Store answer in cache.
         
@@ -130,8 +150,11 @@ class AnswerCache:
             answer: Generated answer text.
             sources: List of source chunks used.
             metadata: Optional metadata (model, tokens, etc.).
+            collection: Collection the question targets (defaults to "default").
+            generation: Index generation the answer was built from. Pass the
+                value captured before retrieval.
         """
-        key = self._make_key(query)
+        key = self._make_key(query, collection, generation)
         
         with self._lock:
             # Evict oldest if at capacity
@@ -145,11 +168,16 @@ class AnswerCache:
                 metadata=metadata or {},
             )
     
-    def invalidate(self, query: Optional[str] = None) -> int:
+    def invalidate(
+        self,
+        query: Optional[str] = None,
+        collection: Optional[str] = None,
+    ) -> int:
         """Invalidate cache entries.
         
         Args:
             query: Specific query to invalidate. If None, clears all.
+            collection: Collection of the query (defaults to "default").
             
         Returns:
             Number of entries invalidated.
@@ -160,7 +188,7 @@ class AnswerCache:
                 self._cache.clear()
                 return count
             
-            key = self._make_key(query)
+            key = self._make_key(query, collection)
             if key in self._cache:
                 del self._cache[key]
                 return 1
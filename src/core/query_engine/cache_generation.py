@@ -0,0 +1,230 @@
+"""Per-collection index generations for cache invalidation.
+
+Every cache tier (retrieval, answer, rerank) includes the collection name and
+its current index *generation* in the cache key.  Ingestion, document
+deletion and collection clearing bump the generation, so entries computed
+against the old index simply become unreachable and age out through LRU
+eviction -- no global flush, and untouched collections keep their hit rate.
+
+Generations are persisted to ``data/db/cache_generations.json`` so a bump made
+by another process (CLI ingestion, dashboard, MCP server) is picked up by the
+API process within ``refresh_seconds``.
+
+Design Principles:
+- Monotonic: A generation never decreases (bumps take the max of the
+  in-memory and on-disk values, plus one)
+- Cheap reads: In-memory lookup; the file is re-read only when its mtime
+  changes, checked at most every ``refresh_seconds``
+- Global epoch: ``bump_all()`` invalidates every collection at once (used
+  when all data is cleared), including collections never seen before
+- Best-effort persistence: I/O errors are logged, never raised to callers
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_COLLECTION = "default"
+_GLOBAL_KEY = "*"
+
+
+class CacheGenerations:
+    """Registry of monotonically increasing per-collection generations.
+
+    The effective generation of a collection is its own counter plus the
+    global epoch, so both ``bump(collection)`` and ``bump_all()`` change it.
+
+    Example:
+        >>> generations = CacheGenerations("data/db/cache_generations.json")
+        >>> gen = generations.current("contracts")
+        >>> generations.bump("contracts")  # after ingesting a document
+        >>> generations.current("contracts") > gen
+        True
+    """
+
+    def __init__(
+        self,
+        persist_path: Optional[str] = None,
+        refresh_seconds: float = 1.0,
+    ):
+        """Initialize the registry.
+
+        Args:
+            persist_path: JSON file shared across processes. If None, the
+                generations live in memory only.
+            refresh_seconds: Minimum interval between on-disk change checks.
+        """
+        self.persist_path = Path(persist_path) if persist_path else None
+        self.refresh_seconds = refresh_seconds
+        self._counters: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._file_mtime: Optional[float] = None
+        self._last_check = 0.0
+
+        with self._lock:
+            self._refresh_locked(force=True)
+
+    def current(self, collection: Optional[str] = None) -> int:
+        """Return the current generation of *collection*.
+
+        Args:
+            collection: Collection name (defaults to "default").
+
+        Returns:
+            Effective generation (collection counter + global epoch).
+        """
+        name = collection or DEFAULT_COLLECTION
+        with self._lock:
+            self._refresh_locked()
+            return self._counters.get(name, 0) + self._counters.get(_GLOBAL_KEY, 0)
+
+    def bump(self, collection: Optional[str] = None) -> int:
+        """Advance the generation of *collection* after its index changed.
+
+        Args:
+            collection: Collection name (defaults to "default").
+
+        Returns:
+            The new effective generation.
+        """
+        name = collection or DEFAULT_COLLECTION
+        with self._lock:
+            self._bump_locked(name)
+            generation = self._counters[name] + self._counters.get(_GLOBAL_KEY, 0)
+        logger.debug(f"Cache generation for collection '{name}' -> {generation}")
+        return generation
+
+    def bump_all(self) -> None:
+        """Advance the global epoch, invalidating every collection."""
+        with self._lock:
+            self._bump_locked(_GLOBAL_KEY)
+        logger.debug("Cache generation epoch advanced for all collections")
+
+    def snapshot(self) -> Dict[str, int]:
+        """Return the effective generation of every known collection."""
+        with self._lock:
+            self._refresh_locked()
+            epoch = self._counters.get(_GLOBAL_KEY, 0)
+            return {
+                name: count + epoch
+                for name, count in self._counters.items()
+                if name != _GLOBAL_KEY
+            }
+
+    # ===== Private Helper Methods =====
+
+    def _bump_locked(self, key: str) -> None:
+        """Increment *key*, merging concurrent on-disk bumps (caller holds lock)."""
+        on_disk = self._read()
+        merged = dict(self._counters)
+        for name, count in on_disk.items():
+            merged[name] = max(merged.get(name, 0), count)
+        merged[key] = merged.get(key, 0) + 1
+        self._counters = merged
+        self._write()
+
+    def _refresh_locked(self, force: bool = False) -> None:
+        """Pick up bumps made by other processes (caller holds lock)."""
+        if self.persist_path is None:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_check < self.refresh_seconds:
+            return
+        self._last_check = now
+        try:
+            mtime = os.stat(self.persist_path).st_mtime
+        except OSError:
+            return
+        if mtime == self._file_mtime:
+            return
+        self._file_mtime = mtime
+        for name, count in self._read().items():
+            if count > self._counters.get(name, 0):
+                self._counters[name] = count
+
+    def _read(self) -> Dict[str, int]:
+        """Read persisted counters (empty on missing or corrupt file)."""
+        if self.persist_path is None or not self.persist_path.exists():
+            return {}
+        try:
+            with open(self.persist_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return {str(k): int(v) for k, v in data.items()}
+        except Exception as e:
+            logger.warning(f"Failed to read cache generations: {e}")
+            return {}
+
+    def _write(self) -> None:
+        """Persist counters atomically (write temp file, then rename)."""
+        if self.persist_path is None:
+            return
+        try:
+            self.persist_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.persist_path.with_name(
+                f"{self.persist_path.name}.{os.getpid()}.tmp"
+            )
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._counters, f, ensure_ascii=False)
+            os.replace(tmp_path, self.persist_path)
+            self._file_mtime = os.stat(self.persist_path).st_mtime
+        except Exception as e:
+            logger.warning(f"Failed to persist cache generations: {e}")
+
+
+# Global registry instance
+_cache_generations: Optional[CacheGenerations] = None
+_generations_lock = threading.Lock()
+
+
+def get_cache_generations() -> CacheGenerations:
+    """Get the global cache generation registry."""
+    global _cache_generations
+    if _cache_generations is None:
+        with _generations_lock:
+            if _cache_generations is None:
+                from src.core.settings import resolve_path
+                _cache_generations = CacheGenerations(
+                    persist_path=str(resolve_path("data/db/cache_generations.json"))
+                )
+    return _cache_generations
+
+
+def cache_scope(collection: Optional[str] = None, generation: Optional[int] = None) -> str:
+    """Build the collection/generation prefix used in cache keys.
+
+    Args:
+        collection: Collection name (defaults to "default").
+        generation: Index generation captured by the caller. If None, the
+            current generation is looked up.
+
+    Returns:
+        Scope string such as ``"contracts@3"``.
+    """
+    name = collection or DEFAULT_COLLECTION
+    if generation is None:
+        generation = get_cache_generations().current(name)
+    return f"{name}@{generation}"
+
+
+def bump_cache_generation(collection: Optional[str] = None) -> None:
+    """Invalidate cached results for *collection* after its index changed.
+
+    Args:
+        collection: Collection name. If None, every collection is invalidated.
+    """
+    try:
+        registry = get_cache_generations()
+        if collection is None:
+            registry.bump_all()
+        else:
+            registry.bump(collection)
+    except Exception as e:
+        logger.warning(f"Failed to bump cache generation: {e}")
@@ -0,0 +1,264 @@
+"""Compact candidate set for the fusion and post-fusion search stages.
+
+Fusion, filtering, filename boosting and source diversification used to
+rebuild lists of ``RetrievalResult`` dataclasses at every step, copying
+metadata dicts and re-sorting each time. ``CandidateSet`` keeps the
+candidates as parallel NumPy arrays (chunk IDs, scores, index of the
+source result, boost flag) over a pool of the retrievers' own results.
+Stages select, reorder and rescore the arrays; text and metadata are read
+from the pool only when a stage needs them, and ``RetrievalResult``
+objects are built only for the rows finally returned.
+
+Design Principles:
+- Zero-copy: Source results are shared, never modified or copied
+- Vectorized: Selection, RRF accumulation and group limits use NumPy
+- Deterministic: Ordering is (score desc, chunk_id asc), as before
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.core.types import RetrievalResult
+
+
+class CandidateSet:
+    """Retrieval candidates as parallel arrays over a pool of source results.
+
+    Attributes:
+        pool: Source RetrievalResults (shared, never modified).
+        ids: Chunk ID per candidate (NumPy unicode array).
+        scores: Current score per candidate (float64).
+        src: Index of each candidate's source result in ``pool``.
+        boosted: Filename-boost flag per candidate.
+
+    Example:
+        >>> dense = CandidateSet.from_results(dense_results, dedup=True)
+        >>> top = dense.top(10)
+        >>> results = top.to_results()
+    """
+
+    __slots__ = ("pool", "ids", "scores", "src", "boosted", "_codes")
+
+    def __init__(
+        self,
+        pool: List[RetrievalResult],
+        ids: np.ndarray,
+        scores: np.ndarray,
+        src: np.ndarray,
+        boosted: Optional[np.ndarray] = None,
+    ) -> None:
+        """Initialize from arrays (use from_results() to wrap a result list).
+
+        Args:
+            pool: Source results referenced by ``src``.
+            ids: Chunk IDs.
+            scores: Scores.
+            src: Pool index per candidate.
+            boosted: Optional boost flags (default: all False).
+        """
+        self.pool = pool
+        self.ids = ids
+        self.scores = scores
+        self.src = src
+        self.boosted = boosted if boosted is not None else np.zeros(len(ids), dtype=bool)
+        # Lazily computed (source code per candidate, distinct source paths)
+        self._codes: Optional[Tuple[np.ndarray, List[Any]]] = None
+
+    @classmethod
+    def from_results(
+        cls,
+        results: Sequence[RetrievalResult],
+        dedup: bool = False,
+    ) -> CandidateSet:
+        """Wrap results without copying them.
+
+        Args:
+            results: Retrieval results.
+            dedup: If True, keep the best-scored occurrence of each chunk
+                and order by score (ties keep first-occurrence order);
+                otherwise keep the results as given.
+
+        Returns:
+            CandidateSet over *results*.
+        """
+        pool = list(results)
+        if not pool:
+            return cls.empty()
+        ids = np.array([r.chunk_id for r in pool])
+        scores = np.array([r.score for r in pool], dtype=np.float64)
+        src = np.arange(len(pool))
+        if not dedup:
+            return cls(pool, ids, scores, src)
+
+        # Best record per chunk: first occurrence in descending score order
+        _, first_seen = np.unique(ids, return_index=True)
+        by_score = np.argsort(-scores, kind="stable")
+        _, best_pos = np.unique(ids[by_score], return_index=True)
+        best = by_score[best_pos]
+        rows = best[np.lexsort((first_seen, -scores[best]))]
+        return cls(pool, ids[rows], scores[rows], src[rows])
+
+    @classmethod
+    def empty(cls) -> CandidateSet:
+        """Return a set without candidates."""
+        return cls([], np.array([], dtype=str), np.zeros(0), np.zeros(0, dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def take(self, rows: np.ndarray) -> CandidateSet:
+        """Return the candidates at *rows* (in that order), sharing the pool."""
+        subset = CandidateSet(
+            self.pool, self.ids[rows], self.scores[rows], self.src[rows], self.boosted[rows]
+        )
+        if self._codes is not None:
+            subset._codes = (self._codes[0][rows], self._codes[1])
+        return subset
+
+    def select(self, mask: np.ndarray) -> CandidateSet:
+        """Return the candidates where *mask* is True, keeping their order."""
+        return self.take(np.flatnonzero(mask))
+
+    def head(self, k: int) -> CandidateSet:
+        """Return the first *k* candidates."""
+        return self.take(np.arange(min(max(k, 0), len(self))))
+
+    def sort(self) -> CandidateSet:
+        """Return the candidates ordered by (score desc, chunk_id asc)."""
+        return self.take(np.lexsort((self.ids, -self.scores)))
+
+    def top(self, k: Optional[int], sort: bool = True) -> CandidateSet:
+        """Return the best *k* candidates by (score desc, chunk_id asc).
+
+        Selection uses a partition, so only the selected rows are sorted.
+
+        Args:
+            k: Number of candidates to keep (None or <= 0 keeps all).
+            sort: If False, the selected rows are returned unordered.
+        """
+        n = len(self)
+        if k is None or k <= 0 or k >= n:
+            return self.sort() if sort else self
+        neg = -self.scores
+        kth = np.partition(neg, k - 1)[k - 1]
+        above = np.flatnonzero(neg < kth)
+        ties = np.flatnonzero(neg == kth)
+        ties = ties[np.argsort(self.ids[ties], kind="stable")][: k - len(above)]
+        selected = self.take(np.concatenate([above, ties]))
+        return selected.sort() if sort else selected
+
+    def concat(self, other: CandidateSet) -> CandidateSet:
+        """Append *other*'s candidates after these ones."""
+        if not len(other):
+            return self
+        if not len(self):
+            return other
+        if other.pool is self.pool:
+            pool, other_src = self.pool, other.src
+        else:
+            pool, other_src = self.pool + other.pool, other.src + len(self.pool)
+        return CandidateSet(
+            pool,
+            np.concatenate([self.ids, other.ids]),
+            np.concatenate([self.scores, other.scores]),
+            np.concatenate([self.src, other_src]),
+            np.concatenate([self.boosted, other.boosted]),
+        )
+
+    def metadata(self, row: int) -> Dict[str, Any]:
+        """Metadata of the candidate at *row* (the source's dict; do not modify)."""
+        return self.pool[int(self.src[row])].metadata
+
+    def source_codes(self) -> Tuple[np.ndarray, List[Any]]:
+        """Group candidates by ``source_path`` metadata.
+
+        Returns:
+            Tuple of (code per candidate, distinct source paths indexed by
+            code). Candidates without a source path share the code of "".
+        """
+        if self._codes is None:
+            index: Dict[Any, int] = {}
+            paths: List[Any] = []
+            codes = np.empty(len(self), dtype=np.int64)
+            for row, i in enumerate(self.src.tolist()):
+                path = self.pool[i].metadata.get("source_path", "")
+                code = index.get(path)
+                if code is None:
+                    code = index[path] = len(paths)
+                    paths.append(path)
+                codes[row] = code
+            self._codes = (codes, paths)
+        return self._codes
+
+    def to_results(self, limit: Optional[int] = None) -> List[RetrievalResult]:
+        """Materialize RetrievalResults for the first *limit* candidates.
+
+        A candidate whose score and flags match its source result is
+        returned as that object; others get a new result with a shallow
+        copy of the source metadata.
+        """
+        rows = range(len(self) if limit is None else min(limit, len(self)))
+        results = []
+        for row in rows:
+            source = self.pool[int(self.src[row])]
+            score = float(self.scores[row])
+            boosted = bool(self.boosted[row])
+            if score == source.score and not boosted:
+                results.append(source)
+                continue
+            metadata = dict(source.metadata)
+            if boosted:
+                metadata["filename_boosted"] = True
+            results.append(RetrievalResult(
+                chunk_id=source.chunk_id,
+                score=score,
+                text=source.text,
+                metadata=metadata,
+            ))
+        return results
+
+
+def rrf_fuse(
+    candidate_sets: Sequence[CandidateSet],
+    weights: Sequence[float],
+    k: int,
+    top_k: Optional[int] = None,
+    sort: bool = True,
+) -> CandidateSet:
+    """Weighted Reciprocal Rank Fusion over candidate sets.
+
+    Each set contributes ``weight / (k + rank)`` per candidate (1-based
+    rank in the set's order). Contributions are accumulated per chunk with
+    one ``bincount``; each chunk keeps its first occurrence as source.
+
+    Args:
+        candidate_sets: Ranked candidate sets (empty sets are skipped).
+        weights: Weight per set, aligned with *candidate_sets*.
+        k: RRF smoothing constant.
+        top_k: Maximum number of candidates to return (None = all).
+        sort: If False, the top_k selection is returned unordered.
+
+    Returns:
+        Fused CandidateSet with RRF scores.
+    """
+    pairs = [(s, w) for s, w in zip(candidate_sets, weights) if len(s)]
+    if not pairs:
+        return CandidateSet.empty()
+
+    pool: List[RetrievalResult] = []
+    srcs: List[np.ndarray] = []
+    for s, _ in pairs:
+        srcs.append(s.src + len(pool))
+        pool.extend(s.pool)
+    ids = np.concatenate([s.ids for s, _ in pairs])
+    contrib = np.concatenate([
+        w / (k + np.arange(1, len(s) + 1, dtype=np.float64)) for s, w in pairs
+    ])
+
+    unique_ids, first, inverse = np.unique(ids, return_index=True, return_inverse=True)
+    scores = np.bincount(inverse.ravel(), weights=contrib, minlength=len(unique_ids))
+    fused = CandidateSet(pool, unique_ids, scores, np.concatenate(srcs)[first])
+    return fused.top(top_k, sort=sort)
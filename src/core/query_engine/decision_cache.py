@@ -0,0 +1,127 @@
+"""Cache of per-query LLM decisions (query rewrites, strategy routing).
+
+QueryRewriter and StrategyRouter each cost one LLM round-trip per search,
+and their output depends only on the question text, not on the index. So
+repeated questions reuse the earlier decision instead of asking the LLM
+again. Keys are the normalized query (see ``normalize_query``) plus a
+decision kind.
+
+Design Principles:
+- Thread-safe: Uses threading.Lock for concurrent access
+- Memory-bounded: LRU eviction when cache is full
+- Time-bounded: Entries expire after ``ttl_seconds`` (prompts or models may
+  change behind a long-running server)
+- Successful decisions only: Callers never cache LLM failures or fallbacks
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from src.libs.embedding.embedding_cache import normalize_query
+
+logger = logging.getLogger(__name__)
+
+
+class DecisionCache:
+    """LRU + TTL cache of LLM decisions keyed by (kind, normalized query).
+    
+    Example:
+        >>> cache = DecisionCache(max_size=2000)
+        >>> decision = cache.get("route", query)
+        >>> if decision is None:
+        ...     decision = router_llm(query)
+        ...     cache.put("route", query, decision)
+    """
+    
+    def __init__(self, max_size: int = 2000, ttl_seconds: float = 3600.0):
+        """Initialize decision cache.
+        
+        Args:
+            max_size: Maximum number of cached decisions.
+            ttl_seconds: Lifetime of an entry (0 = never expires).
+        """
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._cache: OrderedDict[Tuple[str, str], Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    def get(self, kind: str, query: str) -> Optional[Any]:
+        """Get a cached decision.
+        
+        Args:
+            kind: Decision kind (e.g. "rewrite", "route").
+            query: Raw query string.
+        
+        Returns:
+            Cached decision or None if missing or expired.
+        """
+        key = (kind, normalize_query(query))
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and self.ttl_seconds > 0 and time.time() - entry[0] > self.ttl_seconds:
+                del self._cache[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+    
+    def put(self, kind: str, query: str, decision: Any) -> None:
+        """Store a decision.
+        
+        Args:
+            kind: Decision kind (e.g. "rewrite", "route").
+            query: Raw query string.
+            decision: Decision to cache (treated as immutable).
+        """
+        key = (kind, normalize_query(query))
+        with self._lock:
+            if key in self._cache:
+                self._cache.move_to_end(key)
+            while len(self._cache) >= self.max_size and key not in self._cache:
+                self._cache.popitem(last=False)
+            self._cache[key] = (time.time(), decision)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            hit_rate = self._hits / total if total > 0 else 0.0
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": len(self._cache),
+                "max_size": self.max_size,
+                "hit_rate": round(hit_rate, 4),
+            }
+    
+    def clear(self) -> None:
+        """Clear cache."""
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+
+# Global cache instance
+_decision_cache: Optional[DecisionCache] = None
+_decision_cache_lock = threading.Lock()
+
+
+def get_decision_cache(max_size: int = 2000, ttl_seconds: float = 3600.0) -> DecisionCache:
+    """Get global decision cache (size and TTL apply when it is created)."""
+    global _decision_cache
+    if _decision_cache is None:
+        with _decision_cache_lock:
+            if _decision_cache is None:
+                _decision_cache = DecisionCache(max_size=max_size, ttl_seconds=ttl_seconds)
+    return _decision_cache
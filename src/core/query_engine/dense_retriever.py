@@ -8,10 +8,14 @@ It forms the Dense route in the Hybrid Search Engine.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from src.core.types import RetrievalResult
-from src.libs.embedding.embedding_cache import get_query_cache
+from src.libs.embedding.embedding_cache import (
+    EmbeddingCache,
+    client_fingerprint,
+    get_query_cache,
+)
 
 if TYPE_CHECKING:
     from src.core.settings import Settings
@@ -85,6 +89,11 @@ class DenseRetriever:
         self.embedding_client = embedding_client
         self.vector_store = vector_store
         
+        # Persistent query embedding cache (settings.embedding.cache_dir)
+        embedding_config = getattr(settings, 'embedding', None)
+        self._cache_dir: Optional[str] = getattr(embedding_config, 'cache_dir', None)
+        self._cache_dtype: str = getattr(embedding_config, 'cache_dtype', 'float32')
+        
         # Extract default_top_k from settings if available
         self.default_top_k = default_top_k
         if settings is not None:
@@ -98,6 +107,80 @@ class DenseRetriever:
             f"DenseRetriever initialized with default_top_k={self.default_top_k}"
         )
     
+    @property
+    def cache_namespace(self) -> str:
+        """Query embedding cache namespace (the collection).
+        
+        A query's vector only depends on the embedding model, so it is not
+        tied to the index generation; the model itself is part of every key
+        through the cache fingerprint (see _query_cache).
+        """
+        return getattr(self.vector_store, "collection_name", None) or "default"
+    
+    def _query_cache(self) -> EmbeddingCache:
+        """Query embedding cache for this retriever's embedding model."""
+        return get_query_cache(
+            fingerprint=client_fingerprint(self.embedding_client),
+            persist_dir=self._cache_dir,
+            dtype=self._cache_dtype,
+        )
+    
+    def embed_query(self, query: str, trace: Optional[Any] = None) -> List[float]:
+        """Embed a query through the query embedding cache.
+        
+        Shared by retrieve() and by callers that need the query vector
+        before retrieval (e.g. the semantic answer cache); the second use
+        of the same query is a cache hit.
+        
+        Args:
+            query: The search query string.
+            trace: Optional TraceContext for observability.
+        
+        Returns:
+            Query embedding vector.
+        
+        Raises:
+            RuntimeError: If the embedding call fails.
+        """
+        try:
+            cache = self._query_cache()
+            query_vector = cache.get(query, namespace=self.cache_namespace)
+            
+            if query_vector is None:
+                # Cache miss - compute embedding
+                query_vectors = self.embedding_client.embed([query], trace=trace)
+                query_vector = query_vectors[0]
+                cache.put(query, query_vector, namespace=self.cache_namespace)
+                logger.debug("Query embedding: cache miss")
+            else:
+                logger.debug("Query embedding: cache hit")
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to embed query: {e}. "
+                "Check embedding client configuration and connectivity."
+            ) from e
+        return query_vector
+    
+    async def aembed_query(self, query: str, trace: Optional[Any] = None) -> List[float]:
+        """Async version of embed_query() using the client's embed_async."""
+        try:
+            cache = self._query_cache()
+            query_vector = cache.get(query, namespace=self.cache_namespace)
+            
+            if query_vector is None:
+                query_vectors = await self.embedding_client.embed_async([query], trace=trace)
+                query_vector = query_vectors[0]
+                cache.put(query, query_vector, namespace=self.cache_namespace)
+                logger.debug("Query embedding: cache miss")
+            else:
+                logger.debug("Query embedding: cache hit")
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to embed query: {e}. "
+                "Check embedding client configuration and connectivity."
+            ) from e
+        return query_vector
+    
     def retrieve(
         self,
         query: str,
@@ -137,23 +220,7 @@ class DenseRetriever:
         logger.debug(f"Retrieving for query='{query[:50]}...', top_k={effective_top_k}")
         
         # Step 1: Embed the query (with caching)
-        try:
-            cache = get_query_cache()
-            query_vector = cache.get(query)
-            
-            if query_vector is None:
-                # Cache miss - compute embedding
-                query_vectors = self.embedding_client.embed([query], trace=trace)
-                query_vector = query_vectors[0]
-                cache.put(query, query_vector)
-                logger.debug("Query embedding: cache miss")
-            else:
-                logger.debug("Query embedding: cache hit")
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to embed query: {e}. "
-                "Check embedding client configuration and connectivity."
-            ) from e
+        query_vector = self.embed_query(query, trace)
         
         # Step 2: Query the vector store
         try:
@@ -175,6 +242,124 @@ class DenseRetriever:
         logger.debug(f"Retrieved {len(results)} results for query")
         return results
     
+    async def aretrieve(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        trace: Optional[Any] = None,
+    ) -> List[RetrievalResult]:
+        """Async version of retrieve().
+        
+        The query embedding is awaited through the client's ``embed_async``
+        (native async for OpenAI-compatible providers), and the blocking
+        vector store query runs on the shared search executor, so the event
+        loop is never blocked.
+        
+        Args:
+            query: The search query string. Must not be empty.
+            top_k: Maximum number of results to return. If None, uses default_top_k.
+            filters: Optional metadata filters.
+            trace: Optional TraceContext for observability.
+        
+        Returns:
+            List of RetrievalResult objects, sorted by similarity (descending).
+        
+        Raises:
+            ValueError: If query is empty or invalid.
+            RuntimeError: If dependencies are missing or retrieval fails.
+        """
+        from src.core.query_engine.search_executor import run_blocking
+        
+        self._validate_query(query)
+        self._validate_dependencies()
+        
+        effective_top_k = top_k if top_k is not None else self.default_top_k
+        
+        # Step 1: Embed the query (with caching)
+        query_vector = await self.aembed_query(query, trace)
+        
+        # Step 2: Query the vector store off the event loop
+        try:
+            raw_results = await run_blocking(
+                self.vector_store.query,
+                vector=query_vector,
+                top_k=effective_top_k,
+                filters=filters,
+                trace=trace,
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to query vector store: {e}. "
+                "Check vector store configuration and data availability."
+            ) from e
+        
+        return self._transform_results(raw_results)
+    
+    def retrieve_batch(
+        self,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        trace: Optional[Any] = None,
+    ) -> List[List[RetrievalResult]]:
+        """Retrieve for several queries with one embedding call and one search.
+        
+        Used for rewritten query variants: all queries are embedded in a
+        single batch (see embed_queries_batch) and searched with one
+        multi-vector vector store query.
+        
+        Args:
+            queries: Query strings. Must not be empty.
+            top_k: Maximum number of results per query. If None, uses default_top_k.
+            filters: Optional metadata filters applied to every query.
+            trace: Optional TraceContext for observability.
+        
+        Returns:
+            One result list per query, in input order.
+        
+        Raises:
+            ValueError: If any query is empty or invalid.
+            RuntimeError: If dependencies are missing or retrieval fails.
+        """
+        for query in queries:
+            self._validate_query(query)
+        self._validate_dependencies()
+        
+        effective_top_k = top_k if top_k is not None else self.default_top_k
+        vectors = self.embed_queries_batch(queries, trace=trace)
+        raw_results = self._query_vectors(vectors, effective_top_k, filters, trace)
+        return [self._transform_results(raw) for raw in raw_results]
+    
+    async def aretrieve_batch(
+        self,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        trace: Optional[Any] = None,
+    ) -> List[List[RetrievalResult]]:
+        """Async version of retrieve_batch().
+        
+        Returns:
+            One result list per query, in input order.
+        
+        Raises:
+            ValueError: If any query is empty or invalid.
+            RuntimeError: If dependencies are missing or retrieval fails.
+        """
+        from src.core.query_engine.search_executor import run_blocking
+        
+        for query in queries:
+            self._validate_query(query)
+        self._validate_dependencies()
+        
+        effective_top_k = top_k if top_k is not None else self.default_top_k
+        vectors = await self.aembed_queries_batch(queries, trace=trace)
+        raw_results = await run_blocking(
+            self._query_vectors, vectors, effective_top_k, filters, trace
+        )
+        return [self._transform_results(raw) for raw in raw_results]
+    
     def embed_queries_batch(
         self,
         queries: List[str],
@@ -200,39 +385,113 @@ class DenseRetriever:
         if not queries:
             return []
         
-        cache = get_query_cache()
+        results, uncached_queries, uncached_indices = self._lookup_cached_vectors(queries)
+        
+        # Embed uncached queries in single batch
+        if uncached_queries:
+            try:
+                new_vectors = self.embedding_client.embed(uncached_queries, trace=trace)
+            except Exception as e:
+                raise RuntimeError(f"Failed to batch embed queries: {e}") from e
+            self._store_vectors(results, uncached_queries, uncached_indices, new_vectors)
+        
+        return results  # type: ignore
+    
+    async def aembed_queries_batch(
+        self,
+        queries: List[str],
+        trace: Optional[Any] = None,
+    ) -> List[List[float]]:
+        """Async version of embed_queries_batch() (uses ``embed_async``).
+        
+        Args:
+            queries: List of query strings to embed.
+            trace: Optional TraceContext for observability.
+        
+        Returns:
+            List of embedding vectors (one per query).
+        """
+        if not queries:
+            return []
+        
+        results, uncached_queries, uncached_indices = self._lookup_cached_vectors(queries)
+        
+        if uncached_queries:
+            try:
+                new_vectors = await self.embedding_client.embed_async(uncached_queries, trace=trace)
+            except Exception as e:
+                raise RuntimeError(f"Failed to batch embed queries: {e}") from e
+            self._store_vectors(results, uncached_queries, uncached_indices, new_vectors)
+        
+        return results  # type: ignore
+    
+    def _lookup_cached_vectors(
+        self,
+        queries: List[str],
+    ) -> Tuple[List[Optional[List[float]]], List[str], List[int]]:
+        """Look up query vectors in the embedding cache.
+        
+        Returns:
+            Tuple of (vectors with None for misses, uncached queries, their indices).
+        """
+        cache = self._query_cache()
         
-        # Check cache for each query
         results: List[Optional[List[float]]] = []
         uncached_queries: List[str] = []
         uncached_indices: List[int] = []
         
         for i, query in enumerate(queries):
-            cached = cache.get(query)
+            cached = cache.get(query, namespace=self.cache_namespace)
             results.append(cached)
             if cached is None:
                 uncached_queries.append(query)
                 uncached_indices.append(i)
         
-        # Embed uncached queries in single batch
-        if uncached_queries:
-            try:
-                new_vectors = self.embedding_client.embed(uncached_queries, trace=trace)
-                
-                # Store in cache and fill results
-                for query, vector, idx in zip(uncached_queries, new_vectors, uncached_indices):
-                    cache.put(query, vector)
-                    results[idx] = vector
-                    
-                logger.debug(f"Batch embedded {len(uncached_queries)} queries (cache miss)")
-            except Exception as e:
-                raise RuntimeError(f"Failed to batch embed queries: {e}") from e
-        
         cache_hits = len(queries) - len(uncached_queries)
         if cache_hits > 0:
             logger.debug(f"Batch query embedding: {cache_hits} cache hits")
         
-        return results  # type: ignore
+        return results, uncached_queries, uncached_indices
+    
+    def _store_vectors(
+        self,
+        results: List[Optional[List[float]]],
+        queries: List[str],
+        indices: List[int],
+        vectors: List[List[float]],
+    ) -> None:
+        """Cache freshly computed vectors and fill them into *results*."""
+        cache = self._query_cache()
+        for query, vector, idx in zip(queries, vectors, indices):
+            cache.put(query, vector, namespace=self.cache_namespace)
+            results[idx] = vector
+        logger.debug(f"Batch embedded {len(queries)} queries (cache miss)")
+    
+    def _query_vectors(
+        self,
+        vectors: List[List[float]],
+        top_k: int,
+        filters: Optional[Dict[str, Any]],
+        trace: Optional[Any],
+    ) -> List[List[Dict[str, Any]]]:
+        """Search the vector store with several vectors in one call if supported.
+        
+        Raises:
+            RuntimeError: If the vector store query fails.
+        """
+        try:
+            query_batch = getattr(self.vector_store, "query_batch", None)
+            if callable(query_batch):
+                return query_batch(vectors, top_k=top_k, filters=filters, trace=trace)
+            return [
+                self.vector_store.query(vector=v, top_k=top_k, filters=filters, trace=trace)
+                for v in vectors
+            ]
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to query vector store: {e}. "
+                "Check vector store configuration and data availability."
+            ) from e
     
     def _validate_query(self, query: str) -> None:
         """Validate the query string.
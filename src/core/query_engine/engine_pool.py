@@ -0,0 +1,399 @@
+"""Per-collection HybridSearch engine pool.
+
+Building a HybridSearch engine is expensive: it opens a ChromaDB client
+(with a startup HNSW backup), loads the BM25 index, and wires up
+ParentStore, GraphStore and the StrategyRouter.  Rebuilding on every
+collection switch made users alternating between two knowledge bases pay a
+multi-second cold start per request, including reloading the cross-encoder.
+
+This pool keeps one engine per collection and shares the heavyweight,
+collection-independent parts (embedding client, CoreReranker model, LLM)
+across all of them.
+
+Design Principles:
+- Thread-safe: Pool bookkeeping under one lock; builds use per-collection
+  locks so a slow build never blocks queries on other collections
+- Memory-bounded: LRU eviction beyond ``max_engines``
+- Idle eviction: Engines unused for ``idle_seconds`` are dropped
+- Shared stateless parts: Embedding client, reranker and LLM built once
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.core.settings import Settings, resolve_path
+
+if TYPE_CHECKING:
+    from src.core.query_engine.hybrid_search import HybridSearch
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PooledEngine:
+    """A cached engine plus its bookkeeping."""
+    engine: HybridSearch
+    created_at: float
+    last_used: float
+    hits: int = 0
+
+
+class HybridSearchPool:
+    """Bounded LRU pool of per-collection HybridSearch engines.
+
+    Example:
+        >>> pool = HybridSearchPool(settings, max_engines=4)
+        >>> search = pool.get("contracts")
+        >>> results = search.search("付款条款", top_k=5)
+    """
+
+    def __init__(
+        self,
+        settings: Settings,
+        max_engines: Optional[int] = None,
+        idle_seconds: Optional[float] = None,
+        llm_factory: Optional[Callable[[], Any]] = None,
+        attach_reranker: bool = True,
+        enable_query_rewrite: bool = False,
+    ):
+        """Initialize the pool.
+
+        Args:
+            settings: Application settings.
+            max_engines: Maximum cached engines. Defaults to
+                ``settings.retrieval.engine_pool_size``.
+            idle_seconds: Drop engines unused for this long (0 disables).
+                Defaults to ``settings.retrieval.engine_idle_seconds``.
+            llm_factory: Callable returning the shared LLM. Defaults to
+                ``LLMFactory.create(settings)`` (built once).
+            attach_reranker: Attach the shared CoreReranker to each engine.
+                Callers that rerank themselves (MCP tool) pass False and use
+                ``pool.reranker`` directly.
+            enable_query_rewrite: Attach a QueryRewriter on the shared LLM.
+        """
+        retrieval = getattr(settings, "retrieval", None)
+        if max_engines is None:
+            max_engines = getattr(retrieval, "engine_pool_size", 4)
+        if idle_seconds is None:
+            idle_seconds = getattr(retrieval, "engine_idle_seconds", 1800.0)
+        if max_engines < 1:
+            raise ValueError(f"max_engines must be >= 1, got {max_engines}")
+
+        self.settings = settings
+        self.max_engines = max_engines
+        self.idle_seconds = idle_seconds
+        self.attach_reranker = attach_reranker
+        self.enable_query_rewrite = enable_query_rewrite
+        self._llm_factory = llm_factory
+
+        self._engines: OrderedDict[str, _PooledEngine] = OrderedDict()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self._shared_lock = threading.Lock()
+
+        # Shared, collection-independent components (built lazily)
+        self._embedding: Optional[Any] = None
+        self._reranker: Optional[Any] = None
+        self._reranker_built = False
+        self._llm: Optional[Any] = None
+        self._llm_failed = False
+
+        self._builds = 0
+        self._hits = 0
+        self._evictions = 0
+
+    # ===== Public API =====
+
+    def get(self, collection: str = "default") -> HybridSearch:
+        """Return the engine for *collection*, building it on first use.
+
+        Args:
+            collection: Name of the vector store collection.
+
+        Returns:
+            Initialized HybridSearch engine.
+        """
+        stale: List[Tuple[str, _PooledEngine]] = []
+        with self._lock:
+            entry = self._lookup(collection, stale)
+            if entry is not None:
+                return entry.engine
+            build_lock = self._build_locks.setdefault(collection, threading.Lock())
+        for name, old in stale:
+            self._close_engine(name, old.engine)
+
+        with build_lock:
+            # Another thread may have built it while we waited
+            stale = []
+            with self._lock:
+                entry = self._lookup(collection, stale)
+            for name, old in stale:
+                self._close_engine(name, old.engine)
+            if entry is not None:
+                return entry.engine
+
+            engine = self._build(collection)
+
+            now = time.time()
+            with self._lock:
+                # A build racing on a dropped build lock may have won
+                replaced = self._engines.pop(collection, None)
+                self._engines[collection] = _PooledEngine(
+                    engine=engine, created_at=now, last_used=now
+                )
+                self._builds += 1
+                evicted = self._evict_locked(keep=collection)
+                if replaced is not None:
+                    evicted.append((collection, replaced))
+
+        for name, old in evicted:
+            self._close_engine(name, old.engine)
+        return engine
+
+    def evict(self, collection: Optional[str] = None) -> int:
+        """Drop cached engines.
+
+        Args:
+            collection: Engine to drop. If None, drops all engines.
+
+        Returns:
+            Number of engines dropped.
+        """
+        with self._lock:
+            if collection is None:
+                dropped = list(self._engines.items())
+                self._engines.clear()
+            else:
+                entry = self._engines.pop(collection, None)
+                dropped = [(collection, entry)] if entry is not None else []
+            self._drop_build_locks(name for name, _ in dropped)
+        for name, entry in dropped:
+            self._close_engine(name, entry.engine)
+        return len(dropped)
+
+    def close(self) -> None:
+        """Drop all engines and release shared components."""
+        self.evict()
+        with self._shared_lock:
+            self._embedding = None
+            self._reranker = None
+            self._reranker_built = False
+            self._llm = None
+            self._llm_failed = False
+
+    def engines(self) -> List[HybridSearch]:
+        """Snapshot of the currently cached engines."""
+        with self._lock:
+            return [entry.engine for entry in self._engines.values()]
+
+    def stats(self) -> Dict[str, Any]:
+        """Get pool statistics."""
+        with self._lock:
+            now = time.time()
+            return {
+                "size": len(self._engines),
+                "max_engines": self.max_engines,
+                "idle_seconds": self.idle_seconds,
+                "builds": self._builds,
+                "hits": self._hits,
+                "evictions": self._evictions,
+                "collections": {
+                    name: {
+                        "hits": entry.hits,
+                        "idle_seconds": round(now - entry.last_used, 1),
+                    }
+                    for name, entry in self._engines.items()
+                },
+            }
+
+    @property
+    def embedding_client(self) -> Any:
+        """Shared embedding client."""
+        with self._shared_lock:
+            if self._embedding is None:
+                from src.libs.embedding.embedding_factory import EmbeddingFactory
+                self._embedding = EmbeddingFactory.create(self.settings)
+            return self._embedding
+
+    @property
+    def reranker(self) -> Optional[Any]:
+        """Shared CoreReranker, or None when reranking is disabled/failed."""
+        with self._shared_lock:
+            if not self._reranker_built:
+                from src.core.query_engine.reranker import CoreReranker
+                try:
+                    reranker = CoreReranker(self.settings)
+                    self._reranker = reranker if reranker.is_enabled else None
+                except Exception as e:
+                    logger.warning(f"Reranker init failed, proceeding without: {e}")
+                    self._reranker = None
+                self._reranker_built = True
+            return self._reranker
+
+    @property
+    def llm(self) -> Optional[Any]:
+        """Shared LLM, or None if it cannot be created."""
+        with self._shared_lock:
+            if self._llm is None and not self._llm_failed:
+                try:
+                    if self._llm_factory is not None:
+                        self._llm = self._llm_factory()
+                    else:
+                        from src.libs.llm.llm_factory import LLMFactory
+                        self._llm = LLMFactory.create(self.settings)
+                except Exception as e:
+                    logger.warning(f"Shared LLM init failed: {e}")
+                    self._llm_failed = True
+            return self._llm
+
+    # ===== Private Helper Methods =====
+
+    def _lookup(
+        self,
+        collection: str,
+        evicted: List[Tuple[str, _PooledEngine]],
+    ) -> Optional[_PooledEngine]:
+        """Return a live pooled entry and mark it used (caller holds lock).
+
+        A stale entry is popped into *evicted*; the caller closes it
+        outside the lock.
+        """
+        entry = self._engines.get(collection)
+        if entry is None:
+            return None
+        now = time.time()
+        if self.idle_seconds and now - entry.last_used > self.idle_seconds:
+            evicted.append((collection, self._engines.pop(collection)))
+            self._evictions += 1
+            self._drop_build_locks([collection])
+            return None
+        entry.last_used = now
+        entry.hits += 1
+        self._hits += 1
+        self._engines.move_to_end(collection)
+        return entry
+
+    def _evict_locked(self, keep: str) -> List[Tuple[str, _PooledEngine]]:
+        """Pop idle and over-capacity engines (caller holds lock)."""
+        now = time.time()
+        evicted: List[Tuple[str, _PooledEngine]] = []
+        if self.idle_seconds:
+            for name in list(self._engines):
+                if name != keep and now - self._engines[name].last_used > self.idle_seconds:
+                    evicted.append((name, self._engines.pop(name)))
+        while len(self._engines) > self.max_engines:
+            name, entry = self._engines.popitem(last=False)
+            evicted.append((name, entry))
+        self._evictions += len(evicted)
+        self._drop_build_locks(name for name, _ in evicted)
+        return evicted
+
+    def _drop_build_locks(self, collections: Iterable[str]) -> None:
+        """Forget build locks of evicted engines (caller holds lock).
+
+        A lock held by an ongoing build is kept; it is dropped with the
+        engine that build produces once that engine is evicted.
+        """
+        for name in collections:
+            build_lock = self._build_locks.get(name)
+            if build_lock is not None and not build_lock.locked():
+                del self._build_locks[name]
+
+    def _close_engine(self, collection: str, engine: HybridSearch) -> None:
+        """Flush an evicted engine's vector store (best-effort)."""
+        try:
+            dense = getattr(engine, "dense_retriever", None)
+            vector_store = getattr(dense, "vector_store", None)
+            if vector_store is not None and hasattr(vector_store, "close"):
+                vector_store.close()
+        except Exception as e:
+            logger.warning(f"Error closing engine for collection '{collection}': {e}")
+        logger.info(f"HybridSearch engine for collection '{collection}' evicted")
+
+    def _build(self, collection: str) -> HybridSearch:
+        """Build a HybridSearch engine for *collection* using shared parts."""
+        settings = self.settings
+
+        from src.libs.vector_store.vector_store_factory import VectorStoreFactory
+        from src.core.query_engine.dense_retriever import DenseRetriever
+        from src.core.query_engine.sparse_retriever import SparseRetriever
+        from src.ingestion.storage.sparse_index_factory import create_sparse_indexer
+        from src.core.query_engine.query_processor import QueryProcessor
+        from src.core.query_engine.fusion import RRFFusion
+        from src.core.query_engine.hybrid_search import HybridSearch
+        from src.core.query_engine.strategy_router import StrategyRouter
+
+        started = time.monotonic()
+        vector_store = VectorStoreFactory.create(settings, collection_name=collection)
+
+        dense_retriever = DenseRetriever(
+            settings=settings,
+            embedding_client=self.embedding_client,
+            vector_store=vector_store,
+        )
+        # The SparseRetriever keeps the index resident and reloads it when
+        # the on-disk generation changes, so pooled engines stay fresh.
+        bm25 = create_sparse_indexer(settings, collection, embedding=self.embedding_client)
+        sparse_retriever = SparseRetriever(
+            settings=settings,
+            bm25_indexer=bm25,
+            vector_store=vector_store,
+        )
+        sparse_retriever.default_collection = collection
+
+        query_rewriter = None
+        if self.enable_query_rewrite and self.llm is not None:
+            from src.core.query_engine.query_rewriter import QueryRewriter
+            try:
+                query_rewriter = QueryRewriter(settings, self.llm)
+            except Exception as e:
+                logger.warning(f"Failed to initialize QueryRewriter: {e}")
+
+        engine = HybridSearch(
+            settings=settings,
+            query_processor=QueryProcessor(),
+            dense_retriever=dense_retriever,
+            sparse_retriever=sparse_retriever,
+            fusion=RRFFusion(k=getattr(getattr(settings, "retrieval", None), "rrf_k", 60)),
+            reranker=self.reranker if self.attach_reranker else None,
+            query_rewriter=query_rewriter,
+        )
+        engine.collection = collection
+
+        parent_mode = getattr(settings.retrieval, "parent_retrieval_mode", "never")
+        graph_mode = getattr(settings.retrieval, "graph_rag_mode", "never")
+
+        if parent_mode != "never":
+            try:
+                from src.ingestion.storage.parent_store import ParentStore
+
+                engine.parent_store = ParentStore(
+                    db_path=str(resolve_path(f"data/db/parent_store/{collection}.db"))
+                )
+            except Exception as e:
+                logger.warning(f"ParentStore init failed: {e}")
+
+        if graph_mode != "never":
+            try:
+                from src.ingestion.storage.graph_store import GraphStore
+
+                engine.graph_store = GraphStore(
+                    db_path=str(resolve_path(f"data/db/graph_store/{collection}.db"))
+                )
+            except Exception as e:
+                logger.warning(f"GraphStore init failed: {e}")
+
+        router_llm = self.llm if "auto" in (parent_mode, graph_mode) else None
+        engine.strategy_router = StrategyRouter(settings=settings, llm=router_llm)
+
+        logger.info(
+            f"HybridSearch engine built for collection '{collection}' "
+            f"in {time.monotonic() - started:.2f}s"
+        )
+        return engine
@@ -13,8 +13,9 @@ Reference:
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, List, Optional
 
+from src.core.query_engine.candidate_set import CandidateSet, rrf_fuse
 from src.core.types import RetrievalResult
 
 logger = logging.getLogger(__name__)
@@ -42,6 +43,7 @@ class RRFFusion:
     - Type-Safe: Returns standardized RetrievalResult objects
     - Deterministic: Stable sorting with tie-breaking on chunk_id
     - Observable: Logging for debugging fusion process
+    - Vectorized: Scores are accumulated on CandidateSet arrays
     
     Attributes:
         k: Smoothing constant for RRF formula (default: 60).
@@ -130,46 +132,13 @@ class RRFFusion:
             f"sizes {[len(lst) for lst in non_empty_lists]}"
         )
         
-        # Step 1: Calculate RRF scores for each unique chunk
-        rrf_scores: Dict[str, float] = {}
-        chunk_data: Dict[str, RetrievalResult] = {}  # Preserve text/metadata
-        
-        for list_idx, ranking_list in enumerate(non_empty_lists):
-            for rank, result in enumerate(ranking_list, start=1):
-                chunk_id = result.chunk_id
-                
-                # Calculate RRF contribution: 1 / (k + rank)
-                rrf_contribution = 1.0 / (self.k + rank)
-                
-                # Accumulate scores
-                if chunk_id not in rrf_scores:
-                    rrf_scores[chunk_id] = 0.0
-                    # Store first occurrence's data (text, metadata)
-                    chunk_data[chunk_id] = result
-                
-                rrf_scores[chunk_id] += rrf_contribution
-        
-        logger.debug(f"Computed RRF scores for {len(rrf_scores)} unique chunks")
-        
-        # Step 2: Create fused results with RRF scores
-        fused_results = []
-        for chunk_id, rrf_score in rrf_scores.items():
-            original = chunk_data[chunk_id]
-            fused_results.append(
-                RetrievalResult(
-                    chunk_id=chunk_id,
-                    score=rrf_score,
-                    text=original.text,
-                    metadata=original.metadata.copy(),
-                )
-            )
-        
-        # Step 3: Sort by RRF score (descending), then by chunk_id for stability
-        fused_results.sort(key=lambda r: (-r.score, r.chunk_id))
-        
-        # Step 4: Apply top_k limit if specified
-        if top_k is not None and top_k > 0:
-            fused_results = fused_results[:top_k]
+        # RRF scores per unique chunk (text/metadata from the first occurrence),
+        # sorted by score (descending), then by chunk_id for stability
+        fused = self.fuse_candidates(
+            [CandidateSet.from_results(lst) for lst in non_empty_lists],
+            top_k=top_k,
+        )
+        fused_results = fused.to_results()
         
         logger.debug(
             f"Fusion complete: {len(fused_results)} results "
@@ -248,40 +217,52 @@ class RRFFusion:
             f"weights={list(filtered_weights)}"
         )
         
-        # Calculate weighted RRF scores
-        rrf_scores: Dict[str, float] = {}
-        chunk_data: Dict[str, RetrievalResult] = {}
+        # Calculate weighted RRF scores, then sort and trim
+        fused = self.fuse_candidates(
+            [CandidateSet.from_results(lst) for lst in non_empty_lists],
+            weights=list(filtered_weights),
+            top_k=top_k,
+        )
+        return fused.to_results()
+    
+    def fuse_candidates(
+        self,
+        candidate_sets: List[CandidateSet],
+        weights: Optional[List[float]] = None,
+        top_k: Optional[int] = None,
+        sort: bool = True,
+    ) -> CandidateSet:
+        """Fuse ranked candidate sets without materializing results.
         
-        for list_idx, (ranking_list, weight) in enumerate(zip(non_empty_lists, filtered_weights)):
-            for rank, result in enumerate(ranking_list, start=1):
-                chunk_id = result.chunk_id
-                
-                # Weighted RRF contribution
-                rrf_contribution = weight * (1.0 / (self.k + rank))
-                
-                if chunk_id not in rrf_scores:
-                    rrf_scores[chunk_id] = 0.0
-                    chunk_data[chunk_id] = result
-                
-                rrf_scores[chunk_id] += rrf_contribution
+        Same scores and ordering as fuse_with_weights(), computed on the
+        sets' arrays; HybridSearch uses this so that RetrievalResults are
+        only built for the final results.
         
-        # Create and sort results
-        fused_results = [
-            RetrievalResult(
-                chunk_id=chunk_id,
-                score=rrf_score,
-                text=chunk_data[chunk_id].text,
-                metadata=chunk_data[chunk_id].metadata.copy(),
-            )
-            for chunk_id, rrf_score in rrf_scores.items()
-        ]
-        
-        fused_results.sort(key=lambda r: (-r.score, r.chunk_id))
+        Args:
+            candidate_sets: Ranked CandidateSets (e.g. [dense, sparse]).
+            weights: Optional weight per set (default: uniform).
+            top_k: Maximum number of candidates to return. If None, returns all.
+            sort: If False, the top_k selection is returned unordered (for
+                callers that rescore and sort once afterwards).
         
-        if top_k is not None and top_k > 0:
-            fused_results = fused_results[:top_k]
+        Returns:
+            Fused CandidateSet with RRF scores.
         
-        return fused_results
+        Raises:
+            ValueError: If weights length doesn't match candidate_sets or
+                a weight is negative.
+        """
+        if weights is None:
+            weights = [1.0] * len(candidate_sets)
+        if len(weights) != len(candidate_sets):
+            raise ValueError(
+                f"weights length ({len(weights)}) must match "
+                f"candidate_sets length ({len(candidate_sets)})"
+            )
+        for i, w in enumerate(weights):
+            if not isinstance(w, (int, float)) or w < 0:
+                raise ValueError(f"Weight at index {i} must be non-negative, got {w}")
+        return rrf_fuse(candidate_sets, weights, self.k, top_k=top_k, sort=sort)
 
 
 def rrf_score(rank: int, k: int = RRFFusion.DEFAULT_K) -> float:
@@ -11,18 +11,37 @@ Design Principles:
 - Pluggable: All components injected via constructor for testability
 - Observable: TraceContext integration for debugging and monitoring
 - Config-Driven: Top-k and other parameters read from settings
+- Async-Native: asearch() awaits I/O on the event loop and runs blocking
+  stages on a shared bounded executor
+- Speculative: LLM query rewriting and strategy routing run in the
+  background while the original query is already being retrieved
+- Compact: Fusion and post-fusion stages work on CandidateSet arrays;
+  RetrievalResults are only built for the results handed on
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from src.core.types import ProcessedQuery, RetrievalResult
+from src.core.query_engine.candidate_set import CandidateSet
+from src.core.query_engine.cache_generation import DEFAULT_COLLECTION, get_cache_generations
+from src.core.query_engine.rerank_cascade import RerankCascade
 from src.core.query_engine.retrieval_cache import get_retrieval_cache, normalize_query
+from src.core.query_engine.search_executor import (
+    configure_executors,
+    get_llm_executor,
+    get_search_executor,
+    in_search_executor,
+    run_blocking,
+)
 
 if TYPE_CHECKING:
     from src.core.query_engine.dense_retriever import DenseRetriever
@@ -73,6 +92,10 @@ class HybridSearchConfig:
         enable_sparse: Whether to use sparse retrieval
         parallel_retrieval: Whether to run retrievals in parallel
         metadata_filter_post: Apply metadata filters after fusion (fallback)
+        rewrite_deadline_ms: Time from search start after which LLM rewrite
+            variants that have not arrived are skipped
+        routing_grace_ms: Extra wait for the LLM routing decision once
+            results are final; pattern routing decides after that
     """
     dense_top_k: int = 20
     sparse_top_k: int = 20
@@ -81,6 +104,8 @@ class HybridSearchConfig:
     enable_sparse: bool = True
     parallel_retrieval: bool = True
     metadata_filter_post: bool = True
+    rewrite_deadline_ms: int = 1500
+    routing_grace_ms: int = 0
 
 
 @dataclass
@@ -105,6 +130,57 @@ class HybridSearchResult:
     processed_query: Optional[ProcessedQuery] = None
 
 
+@dataclass
+class BatchSearchResult:
+    """Result of one query of a batch search.
+    
+    Attributes:
+        query: The query string
+        results: Final ranked list of RetrievalResults
+        timings_ms: Per-stage latency in milliseconds (query_processing,
+            dense, sparse, fusion, rerank, finalize, total). Batched stages
+            report the duration of the shared call the query took part in;
+            total is the time from batch start until this query was done.
+        cache_hit: Whether the results came from the retrieval cache
+        error: Error message if this query failed (results are empty)
+    """
+    query: str
+    results: List[RetrievalResult] = field(default_factory=list)
+    timings_ms: Dict[str, float] = field(default_factory=dict)
+    cache_hit: bool = False
+    error: Optional[str] = None
+
+
+@dataclass
+class _SearchState:
+    """Intermediate state passed between search stages."""
+    processed_query: ProcessedQuery
+    dense_results: Optional[CandidateSet] = None  # Deduplicated, None if empty
+    sparse_results: Optional[CandidateSet] = None
+    dense_error: Optional[str] = None
+    sparse_error: Optional[str] = None
+    used_fallback: bool = False
+    fused_results: CandidateSet = field(default_factory=CandidateSet.empty)
+    all_candidates: CandidateSet = field(default_factory=CandidateSet.empty)
+
+
+@dataclass
+class _Speculation:
+    """LLM stages started alongside retrieval of the original query."""
+    started: float  # time.monotonic() at search start
+    queries: List[str]  # variants retrieved so far (original first)
+    rewrite: Optional[Future] = None  # -> RewriteResult
+    routing: Optional[Future] = None  # -> RoutingDecision
+    rewrite_used: bool = False
+    rewrite_timed_out: bool = False
+    
+    def cancel(self) -> None:
+        """Drop LLM calls that have not started yet."""
+        for future in (self.rewrite, self.routing):
+            if future is not None:
+                future.cancel()
+
+
 class HybridSearch:
     """Hybrid Search Engine combining Dense and Sparse retrieval.
     
@@ -174,12 +250,30 @@ class HybridSearch:
         self.reranker = reranker
         self.query_rewriter = query_rewriter
         self.parent_store: Optional[Any] = None  # ParentStore, set externally for Parent Retrieval
+        self.docstore: Optional[Any] = None  # ChunkDocStore override; default is the collection's
         self.graph_store: Optional[Any] = None   # GraphStore, set externally for GraphRAG
         self.strategy_router: Optional[Any] = None  # StrategyRouter, set externally
+        self.collection: Optional[str] = None  # Collection name, set externally (cache scope)
         
         # Extract config from settings or use provided/default
         self.config = config or self._extract_config(settings)
         
+        # Process-wide pool sizes; they apply when the executors start
+        retrieval_settings = getattr(settings, "retrieval", None)
+        if retrieval_settings is not None:
+            configure_executors(
+                search_workers=getattr(retrieval_settings, "search_executor_workers", None),
+                llm_workers=getattr(retrieval_settings, "llm_executor_workers", None),
+            )
+        
+        # Optional skip/prune stage in front of the cross-encoder
+        cascade_config = getattr(getattr(settings, "rerank", None), "cascade", None)
+        self.rerank_cascade: Optional[RerankCascade] = (
+            RerankCascade(cascade_config, dense_retriever)
+            if cascade_config is not None and cascade_config.enabled
+            else None
+        )
+        
         logger.info(
             f"HybridSearch initialized: dense={self.dense_retriever is not None}, "
             f"sparse={self.sparse_retriever is not None}, "
@@ -187,6 +281,15 @@ class HybridSearch:
             f"config={self.config}"
         )
     
+    @property
+    def cache_collection(self) -> str:
+        """Collection name used to scope the retrieval and rerank caches."""
+        return (
+            self.collection
+            or getattr(self.sparse_retriever, "default_collection", None)
+            or DEFAULT_COLLECTION
+        )
+    
     def _extract_config(self, settings: Optional[Settings]) -> HybridSearchConfig:
         """Extract HybridSearchConfig from Settings.
         
@@ -211,6 +314,8 @@ class HybridSearch:
             enable_sparse=True,
             parallel_retrieval=True,
             metadata_filter_post=True,
+            rewrite_deadline_ms=int(getattr(retrieval_config, 'rewrite_deadline_ms', 1500)),
+            routing_grace_ms=int(getattr(retrieval_config, 'routing_grace_ms', 0)),
         )
     
     def search(
@@ -243,7 +348,338 @@ class HybridSearch:
             >>> for r in results:
             ...     print(f"[{r.score:.4f}] {r.chunk_id}: {r.text[:50]}...")
         """
-        # Validate query
+        effective_top_k, fusion_top_k = self._resolve_top_k(query, top_k)
+        # Capture the index generation up front so results computed against
+        # the old index are never cached under a newer generation
+        generation = get_cache_generations().current(self.cache_collection)
+        
+        # Step 0: Check retrieval cache (Level 2 cache - skips embedding + search)
+        cached_results = self._get_cached_results(query, filters, generation)
+        if cached_results is not None:
+            # Still apply reranking if available (reranker has its own cache)
+            if self.reranker is not None and cached_results:
+                cached_results = self._rerank(
+                    query, cached_results, effective_top_k * 2, generation
+                )
+            return self._finish_cached(cached_results, effective_top_k, return_details)
+        
+        # Step 1: Start LLM rewrite/routing in the background and process
+        # the original query (or an earlier cached rewrite) right away
+        logger.info("[Thinking] Retrieving: Processing query and searching indexes...")
+        spec = self._start_speculation(query, trace)
+        try:
+            processed_queries = [self._process_query(q) for q in spec.queries]
+            
+            # Step 2: Run retrievals for all known query variants
+            merged = [self._merge_filters(pq.filters, filters) for pq in processed_queries]
+            retrievals = self._run_variant_retrievals(processed_queries, merged, trace)
+            
+            # Step 2.5: Merge rewritten variants that arrive before the deadline
+            late_queries = self._collect_rewrite(spec, self._rewrite_time_left(spec))
+            if late_queries:
+                late_processed = [self._process_query(q) for q in late_queries]
+                late_merged = [self._merge_filters(pq.filters, filters) for pq in late_processed]
+                retrievals += self._run_variant_retrievals(late_processed, late_merged, trace)
+                processed_queries += late_processed
+                merged += late_merged
+            self._record_query_processing(query, spec, processed_queries, trace)
+            
+            # Steps 3-5.3: Fallback handling, fusion, filters, filename boost
+            state = self._fuse_stage(
+                query, processed_queries[0], retrievals, merged[-1], fusion_top_k, trace
+            )
+            
+            # Step 5.5: Rerank with cross-encoder if available
+            if self.reranker is not None and state.fused_results:
+                state.fused_results = self._rerank_candidates(
+                    query, state.fused_results, effective_top_k * 2, generation, trace
+                )
+            
+            # Steps 5.7-7: Diversify, title guarantee, top_k, retrieval cache
+            final_results = self._finalize(query, state, effective_top_k, filters, generation)
+            
+            if self.strategy_router is not None:
+                routing = self._collect_routing(
+                    query, spec, trace, self.config.routing_grace_ms / 1000.0
+                )
+                final_results = self._route_and_expand(query, final_results, trace, routing)
+        except BaseException:
+            spec.cancel()
+            raise
+        
+        return self._build_output(final_results, state, return_details)
+    
+    async def asearch(
+        self,
+        query: str,
+        top_k: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+        trace: Optional[Any] = None,
+        return_details: bool = False,
+    ) -> List[RetrievalResult] | HybridSearchResult:
+        """Async version of search() that never blocks the event loop.
+        
+        Same stages and results as :meth:`search`, but:
+        
+        - Dense retrieval awaits the embedding client's ``embed_async``
+          (native async for OpenAI-compatible providers).
+        - Blocking stages (BM25 scoring, vector store query, reranking)
+          run on the shared, bounded search executor; LLM query rewriting
+          and strategy routing on the separate LLM executor (see
+          ``search_executor``).
+        - Dense and sparse retrieval for all query variants run
+          concurrently (variants share one batched embedding call).
+        
+        Cancelling the awaiting task (e.g. the client disconnected) stops
+        the search: pending stages are never started and their results are
+        discarded.
+        
+        Args:
+            query: The search query string.
+            top_k: Maximum number of results to return. If None, uses config.fusion_top_k.
+            filters: Optional metadata filters (e.g., {"collection": "docs"}).
+            trace: Optional TraceContext for observability.
+            return_details: If True, return HybridSearchResult with debug info.
+        
+        Returns:
+            Same as :meth:`search`.
+        
+        Raises:
+            ValueError: If query is empty or invalid.
+            RuntimeError: If both retrievers fail or are unavailable.
+        """
+        effective_top_k, fusion_top_k = self._resolve_top_k(query, top_k)
+        generation = get_cache_generations().current(self.cache_collection)
+        
+        cached_results = self._get_cached_results(query, filters, generation)
+        if cached_results is not None:
+            if self.reranker is not None and cached_results:
+                cached_results = await run_blocking(
+                    self._rerank, query, cached_results, effective_top_k * 2, generation
+                )
+            return self._finish_cached(cached_results, effective_top_k, return_details)
+        
+        logger.info("[Thinking] Retrieving: Processing query and searching indexes...")
+        spec = self._start_speculation(query, trace)
+        try:
+            processed_queries = [self._process_query(q) for q in spec.queries]
+            
+            merged = [self._merge_filters(pq.filters, filters) for pq in processed_queries]
+            retrievals = await self._arun_variant_retrievals(processed_queries, merged, trace)
+            
+            await self._await_future(spec.rewrite, self._rewrite_time_left(spec))
+            late_queries = self._collect_rewrite(spec, 0.0)
+            if late_queries:
+                late_processed = [self._process_query(q) for q in late_queries]
+                late_merged = [self._merge_filters(pq.filters, filters) for pq in late_processed]
+                retrievals += await self._arun_variant_retrievals(late_processed, late_merged, trace)
+                processed_queries += late_processed
+                merged += late_merged
+            self._record_query_processing(query, spec, processed_queries, trace)
+            
+            state = self._fuse_stage(
+                query, processed_queries[0], retrievals, merged[-1], fusion_top_k, trace
+            )
+            
+            if self.reranker is not None and state.fused_results:
+                state.fused_results = await run_blocking(
+                    self._rerank_candidates, query, state.fused_results,
+                    effective_top_k * 2, generation, trace,
+                )
+            
+            final_results = self._finalize(query, state, effective_top_k, filters, generation)
+            
+            if self.strategy_router is not None:
+                await self._await_future(spec.routing, self.config.routing_grace_ms / 1000.0)
+                final_results = await run_blocking(
+                    self._route_and_expand, query, final_results, trace,
+                    self._collect_routing(query, spec, trace, 0.0),
+                )
+        except BaseException:
+            spec.cancel()
+            raise
+        
+        return self._build_output(final_results, state, return_details)
+    
+    async def aembed_query(self, query: str) -> Optional[List[float]]:
+        """Embed *query* through the dense retriever's query embedding cache.
+        
+        Lets callers (e.g. the semantic answer cache) use the query vector
+        before searching; the later dense retrieval of the same query then
+        hits the embedding cache instead of calling the API again.
+        
+        Args:
+            query: The search query string.
+        
+        Returns:
+            Query embedding, or None if no dense retriever is configured.
+        """
+        if self.dense_retriever is None:
+            return None
+        aembed = getattr(self.dense_retriever, "aembed_query", None)
+        if aembed is None:
+            return None
+        return await aembed(query)
+    
+    def search_batch(
+        self,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        filters: Optional[Dict[str, Any]] = None,
+    ) -> List[BatchSearchResult]:
+        """Search several queries, running each retrieval stage once for the batch.
+        
+        - Dense: all queries are embedded in one provider call and searched
+          with one multi-vector vector store query per distinct filter set.
+        - Sparse: all keyword lists are scored in one BM25 pass and their
+          records fetched with one docstore lookup.
+        - Rerank: every (query, passage) pair is scored in one batched
+          cross-encoder forward pass (see CoreReranker.rerank_batch).
+        
+        Query processing, fusion, diversification and the retrieval cache
+        work per query as in :meth:`search`. LLM rewriting and routing cost
+        one LLM round-trip per query, so a batch only uses rewrites and
+        routing decisions already in the decision cache; routing otherwise
+        falls back to patterns.
+        
+        A failing query (empty, or both retrieval paths failed) gets its
+        ``error`` set without affecting the others.
+        
+        Args:
+            queries: The query strings.
+            top_k: Maximum number of results per query. If None, uses config.fusion_top_k.
+            filters: Optional metadata filters applied to every query.
+        
+        Returns:
+            One BatchSearchResult per query, in input order.
+        """
+        started = time.monotonic()
+        items = [BatchSearchResult(query=q) for q in queries]
+        generation = get_cache_generations().current(self.cache_collection)
+        
+        # Step 0: Validate and check the retrieval cache per query
+        effective_top_k = top_k if top_k is not None else self.config.fusion_top_k
+        fusion_top_k = effective_top_k
+        pools: Dict[int, Any] = {}  # cache hit results (list) or fused CandidateSet
+        live: List[int] = []
+        for i, query in enumerate(queries):
+            try:
+                effective_top_k, fusion_top_k = self._resolve_top_k(query, top_k)
+            except ValueError as e:
+                items[i].error = str(e)
+                continue
+            items[i].timings_ms = dict.fromkeys(
+                ("query_processing", "dense", "sparse", "fusion", "rerank", "finalize"), 0.0
+            )
+            cached_results = self._get_cached_results(query, filters, generation)
+            if cached_results is not None:
+                pools[i] = cached_results
+                items[i].cache_hit = True
+            else:
+                live.append(i)
+        
+        # Step 1: Process each query and its cached rewrite variants
+        owners: List[int] = []
+        processed_queries: List[ProcessedQuery] = []
+        merged: List[Dict[str, Any]] = []
+        for i in live:
+            _t0 = time.monotonic()
+            for variant in self._cached_variants(queries[i]):
+                pq = self._process_query(variant)
+                owners.append(i)
+                processed_queries.append(pq)
+                merged.append(self._merge_filters(pq.filters, filters))
+            items[i].timings_ms["query_processing"] = (time.monotonic() - _t0) * 1000.0
+        
+        # Step 2: Batched dense and sparse retrieval for every variant
+        retrievals, dense_ms, sparse_ms = self._run_batch_retrievals(processed_queries, merged)
+        variants_of: Dict[int, List[int]] = {}
+        for j, i in enumerate(owners):
+            variants_of.setdefault(i, []).append(j)
+            items[i].timings_ms["dense"] = max(items[i].timings_ms["dense"], dense_ms[j])
+            items[i].timings_ms["sparse"] = max(items[i].timings_ms["sparse"], sparse_ms[j])
+        
+        # Steps 3-5.3: Fusion per query
+        states: Dict[int, _SearchState] = {}
+        for i in live:
+            variant_ids = variants_of[i]
+            _t0 = time.monotonic()
+            try:
+                states[i] = self._fuse_stage(
+                    queries[i], processed_queries[variant_ids[0]],
+                    [retrievals[j] for j in variant_ids],
+                    merged[variant_ids[-1]], fusion_top_k, None,
+                )
+            except RuntimeError as e:
+                items[i].error = str(e)
+            items[i].timings_ms["fusion"] = (time.monotonic() - _t0) * 1000.0
+            items[i].timings_ms["total"] = (time.monotonic() - started) * 1000.0
+        for i, state in states.items():
+            pools[i] = state.fused_results
+        
+        # Step 5.5: One batched rerank over all queries
+        to_rerank = [i for i in sorted(pools) if pools[i]]
+        if self.reranker is not None and to_rerank:
+            _t0 = time.monotonic()
+            # Rerank cascade: skipped queries keep their fused order, the
+            # others send only their pruned pool to the cross-encoder
+            unscored: Dict[int, CandidateSet] = {}
+            for i in [i for i in to_rerank if i in states]:
+                kept, unscored[i] = self._apply_rerank_cascade(queries[i], pools[i])
+                if kept is None:
+                    pools[i] = unscored[i].head(effective_top_k * 2)
+                    items[i].timings_ms["rerank"] = 0.0
+                    to_rerank.remove(i)
+                else:
+                    pools[i] = kept
+            reranked = self._rerank_batch(
+                [queries[i] for i in to_rerank],
+                [pools[i].to_results() if i in states else pools[i] for i in to_rerank],
+                effective_top_k * 2,
+                generation,
+            ) if to_rerank else []
+            rerank_ms = (time.monotonic() - _t0) * 1000.0
+            for i, results in zip(to_rerank, reranked):
+                if i in states:
+                    pools[i] = CandidateSet.from_results(results).concat(
+                        unscored[i]
+                    ).head(effective_top_k * 2)
+                else:
+                    pools[i] = results
+                items[i].timings_ms["rerank"] = rerank_ms
+        
+        # Steps 5.7-7 per query (cached routing decisions only)
+        for i in sorted(pools):
+            _t0 = time.monotonic()
+            if i in states:
+                states[i].fused_results = pools[i]
+                final_results = self._finalize(
+                    queries[i], states[i], effective_top_k, filters, generation
+                )
+                if self.strategy_router is not None:
+                    routing = self.strategy_router.route(queries[i], allow_llm=False)
+                    final_results = self._route_and_expand(queries[i], final_results, None, routing)
+            else:
+                final_results = self._finish_cached(pools[i], effective_top_k, False)
+            items[i].results = final_results
+            items[i].timings_ms["finalize"] = (time.monotonic() - _t0) * 1000.0
+            items[i].timings_ms["total"] = (time.monotonic() - started) * 1000.0
+        
+        logger.info(
+            f"Batch search: {len(queries)} queries ({len(live)} retrieved, "
+            f"{sum(1 for it in items if it.cache_hit)} from cache) "
+            f"in {(time.monotonic() - started) * 1000.0:.1f} ms"
+        )
+        return items
+    
+    # ===== Search stages (shared by search() and asearch()) =====
+    
+    def _resolve_top_k(self, query: str, top_k: Optional[int]) -> Tuple[int, int]:
+        """Validate the query and compute (effective_top_k, fusion_top_k).
+        
+        Raises:
+            ValueError: If query is empty or whitespace-only.
+        """
         if not query or not query.strip():
             raise ValueError("Query cannot be empty or whitespace-only")
         
@@ -252,115 +688,252 @@ class HybridSearch:
         fusion_top_k = effective_top_k * 3 if self.reranker is not None else effective_top_k
         
         logger.debug(f"HybridSearch: query='{query[:50]}...', top_k={effective_top_k}, fusion_k={fusion_top_k}")
+        return effective_top_k, fusion_top_k
+    
+    def _get_cached_results(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]],
+        generation: Optional[int] = None,
+    ) -> Optional[List[RetrievalResult]]:
+        """Return results from the retrieval cache (L2), or None on miss.
         
-        # Step 0: Check retrieval cache (Level 2 cache - skips embedding + search)
-        retrieval_cache = get_retrieval_cache()
-        cached = retrieval_cache.get(query)
-        
-        if cached is not None and not filters:  # Don't use cache if filters specified
-            logger.debug("Retrieval cache hit - skipping embedding and search")
-            # Reconstruct RetrievalResult from cache
-            cached_results = [
-                RetrievalResult(
-                    chunk_id=chunk_id,
-                    score=cached.scores.get(chunk_id, 0.0),
-                    text=cached.texts.get(chunk_id, ""),
-                    metadata={**cached.metadata.get(chunk_id, {}), "cache_hit": True},
-                )
-                for chunk_id in cached.chunk_ids
-            ]
-            
-            # Still apply reranking if available (reranker has its own cache)
-            if self.reranker is not None and cached_results:
-                rerank_result = self.reranker.rerank(query, cached_results, top_k=effective_top_k * 2)
-                cached_results = rerank_result.results
-            
-            # Apply source diversification and limits
-            cached_results = self._diversify_by_source(cached_results, max_per_source=2)
-            final_results = cached_results[:effective_top_k]
-            
-            if return_details:
-                return HybridSearchResult(
-                    results=final_results,
-                    dense_results=None,
-                    sparse_results=None,
-                    used_fallback=False,
-                    processed_query=None,
-                )
-            return final_results
+        Entries are scoped to this engine's collection and *generation*.
+        """
+        if filters:  # Don't use cache if filters specified
+            return None
         
-        # Step 1: Process query (and optional rewrite)
-        logger.info("[Thinking] Retrieving: Processing query and searching indexes...")
-        _t0 = time.monotonic()
+        cached = get_retrieval_cache().get(
+            query, collection=self.cache_collection, generation=generation
+        )
+        if cached is None:
+            return None
+        
+        logger.debug("Retrieval cache hit - skipping embedding and search")
+        # Reconstruct RetrievalResult from cache
+        return [
+            RetrievalResult(
+                chunk_id=chunk_id,
+                score=cached.scores.get(chunk_id, 0.0),
+                text=cached.texts.get(chunk_id, ""),
+                metadata={**cached.metadata.get(chunk_id, {}), "cache_hit": True},
+            )
+            for chunk_id in cached.chunk_ids
+        ]
+    
+    def _cached_variants(self, query: str) -> List[str]:
+        """Return *query* plus its rewrite variants from the decision cache (no LLM call)."""
+        spec = _Speculation(started=time.monotonic(), queries=[query])
+        rewriter = getattr(self, "query_rewriter", None)
+        if rewriter is not None and rewriter.rewrite_enabled:
+            cached = rewriter.cached_rewrite(query)
+            if cached is not None:
+                self._apply_rewrite(spec, cached)
+        return spec.queries
+    
+    def _finish_cached(
+        self,
+        cached_results: List[RetrievalResult],
+        effective_top_k: int,
+        return_details: bool,
+    ) -> List[RetrievalResult] | HybridSearchResult:
+        """Diversify and trim (possibly reranked) cached results."""
+        candidates = self._diversify_by_source(
+            CandidateSet.from_results(cached_results), max_per_source=2
+        )
+        final_results = candidates.to_results(limit=effective_top_k)
         
-        queries_to_process = [query]
-        rewrite_used = False
-        if getattr(self, "query_rewriter", None) is not None and self.query_rewriter.rewrite_enabled:
-            rewrite_result = self.query_rewriter.rewrite(query)
-            if rewrite_result.rewritten_queries and len(rewrite_result.rewritten_queries) > 1:
-                queries_to_process = rewrite_result.rewritten_queries
-                rewrite_used = True
-                logger.info(f"Query rewritten into {len(queries_to_process)} variants: {queries_to_process}")
-
-        processed_queries = [self._process_query(q) for q in queries_to_process]
-        processed_query_for_intent = processed_queries[0]
+        if return_details:
+            return HybridSearchResult(
+                results=final_results,
+                dense_results=None,
+                sparse_results=None,
+                used_fallback=False,
+                processed_query=None,
+            )
+        return final_results
+    
+    def _start_speculation(self, query: str, trace: Optional[Any]) -> _Speculation:
+        """Start LLM rewrite and routing in the background.
         
-        _elapsed = (time.monotonic() - _t0) * 1000.0
-        if trace is not None:
-            trace.record_stage("query_processing", {
-                "method": "llm_rewrite" if rewrite_used else "query_processor",
-                "original_query": query,
-                "rewritten_queries": queries_to_process if rewrite_used else [],
-                "primary_keywords": processed_query_for_intent.keywords,
-            }, elapsed_ms=_elapsed)
-            
-        all_dense = []
-        all_sparse = []
-        d_errors = []
-        s_errors = []
-        
-        # Step 2: Run retrievals for all query variants
-        for pq in processed_queries:
-            merged_filters = self._merge_filters(pq.filters, filters)
-            d_res, s_res, d_err, s_err = self._run_retrievals(pq, merged_filters, trace)
+        A rewrite cached for this question is used immediately, so its
+        variants are retrieved together with the original query. Both LLM
+        stages run on the dedicated LLM executor, so slow LLM calls never
+        hold search executor workers and nested searches cannot deadlock.
+        Routing is only submitted when it may call the LLM; deterministic
+        or pattern routing runs inline after retrieval.
+        
+        Returns:
+            _Speculation whose ``queries`` are the variants known up front.
+        """
+        spec = _Speculation(started=time.monotonic(), queries=[query])
+        
+        rewriter = getattr(self, "query_rewriter", None)
+        if rewriter is not None and rewriter.rewrite_enabled:
+            cached = rewriter.cached_rewrite(query)
+            if cached is not None:
+                self._apply_rewrite(spec, cached)
+            else:
+                spec.rewrite = get_llm_executor().submit(rewriter.rewrite, query)
+        
+        if self.strategy_router is not None and self.strategy_router.uses_llm:
+            spec.routing = get_llm_executor().submit(
+                self.strategy_router.route, query, trace
+            )
+        return spec
+    
+    def _rewrite_time_left(self, spec: _Speculation) -> float:
+        """Seconds left until the rewrite deadline (never negative)."""
+        elapsed = time.monotonic() - spec.started
+        return max(0.0, self.config.rewrite_deadline_ms / 1000.0 - elapsed)
+    
+    @staticmethod
+    async def _await_future(future: Optional[Future], timeout: float) -> None:
+        """Wait up to *timeout* seconds for a background stage, without blocking the loop.
+        
+        The stage is never cancelled here: a late LLM result still fills
+        the decision cache for the next identical question.
+        """
+        if future is None or future.done():
+            return
+        await asyncio.wait({asyncio.wrap_future(future)}, timeout=timeout)
+    
+    def _collect_rewrite(self, spec: _Speculation, timeout: float) -> List[str]:
+        """Take the background rewrite if it arrives within *timeout* seconds.
+        
+        Returns:
+            Rewritten variants not retrieved yet (empty if none, failed or late).
+        """
+        if spec.rewrite is None:
+            return []
+        try:
+            result = spec.rewrite.result(timeout=timeout)
+        except FutureTimeoutError:
+            spec.rewrite_timed_out = True
+            logger.info(
+                f"Query rewrite missed the {self.config.rewrite_deadline_ms} ms deadline; "
+                "continuing with the original query"
+            )
+            return []
+        except Exception as e:
+            logger.warning(f"Query rewrite failed: {e}")
+            return []
+        return self._apply_rewrite(spec, result)
+    
+    def _apply_rewrite(self, spec: _Speculation, rewrite_result: Any) -> List[str]:
+        """Add rewritten variants to *spec*; returns the newly added ones."""
+        variants = rewrite_result.rewritten_queries or []
+        new_queries = [q for q in variants if q not in spec.queries]
+        if new_queries:
+            spec.queries.extend(new_queries)
+            spec.rewrite_used = True
+            logger.info(f"Query rewritten into {len(spec.queries)} variants: {spec.queries}")
+        return new_queries
+    
+    def _collect_routing(
+        self,
+        query: str,
+        spec: _Speculation,
+        trace: Optional[Any],
+        timeout: float,
+    ) -> Optional[Any]:
+        """Take the background routing decision if it arrives within *timeout* seconds.
+        
+        Returns:
+            RoutingDecision (LLM, or pattern-based if the LLM is late or
+            failed), or None if routing was not started in the background.
+        """
+        if spec.routing is None:
+            return None
+        try:
+            return spec.routing.result(timeout=timeout)
+        except FutureTimeoutError:
+            logger.info("LLM routing still running; pattern routing decides this search")
+        except Exception as e:
+            logger.warning(f"Background routing failed: {e}")
+        return self.strategy_router.route(query, trace=trace, allow_llm=False)
+    
+    def _record_query_processing(
+        self,
+        query: str,
+        spec: _Speculation,
+        processed_queries: List[ProcessedQuery],
+        trace: Optional[Any],
+    ) -> None:
+        """Record the query processing / rewrite stage in the trace."""
+        if trace is None:
+            return
+        trace.record_stage("query_processing", {
+            "method": "llm_rewrite" if spec.rewrite_used else "query_processor",
+            "original_query": query,
+            "rewritten_queries": spec.queries if spec.rewrite_used else [],
+            "rewrite_timed_out": spec.rewrite_timed_out,
+            "primary_keywords": processed_queries[0].keywords,
+        }, elapsed_ms=(time.monotonic() - spec.started) * 1000.0)
+    
+    def _fuse_stage(
+        self,
+        query: str,
+        processed_query: ProcessedQuery,
+        retrievals: List[Tuple[
+            Optional[List[RetrievalResult]],
+            Optional[List[RetrievalResult]],
+            Optional[str],
+            Optional[str],
+        ]],
+        merged_filters: Dict[str, Any],
+        fusion_top_k: int,
+        trace: Optional[Any],
+    ) -> _SearchState:
+        """Merge per-variant retrievals, handle fallback and fuse.
+        
+        Raises:
+            RuntimeError: If both retrieval paths failed.
+        """
+        all_dense: List[RetrievalResult] = []
+        all_sparse: List[RetrievalResult] = []
+        d_errors: List[str] = []
+        s_errors: List[str] = []
+        for d_res, s_res, d_err, s_err in retrievals:
             if d_res: all_dense.extend(d_res)
             if s_res: all_sparse.extend(s_res)
             if d_err is not None: d_errors.append(d_err)
             if s_err is not None: s_errors.append(s_err)
-            
-        def dedup_and_sort(res_list: List[RetrievalResult]) -> Optional[List[RetrievalResult]]:
-            if not res_list: return None
-            seen = {}
-            for r in res_list:
-                if r.chunk_id not in seen or r.score > seen[r.chunk_id].score:
-                    seen[r.chunk_id] = r
-            return sorted(list(seen.values()), key=lambda x: x.score, reverse=True)
-            
-        dense_results = dedup_and_sort(all_dense)
-        sparse_results = dedup_and_sort(all_sparse)
-        dense_error = " ; ".join(set(d_errors)) if d_errors else None
-        sparse_error = " ; ".join(set(s_errors)) if s_errors else None
+        
+        def dedup_and_sort(res_list: List[RetrievalResult]) -> Optional[CandidateSet]:
+            # Best score per chunk, sorted by score (ties keep first occurrence)
+            return CandidateSet.from_results(res_list, dedup=True) if res_list else None
+        
+        state = _SearchState(
+            processed_query=processed_query,
+            dense_results=dedup_and_sort(all_dense),
+            sparse_results=dedup_and_sort(all_sparse),
+            dense_error=" ; ".join(set(d_errors)) if d_errors else None,
+            sparse_error=" ; ".join(set(s_errors)) if s_errors else None,
+        )
         
         # Step 3: Handle fallback scenarios
-        used_fallback = False
-        if dense_error and sparse_error:
-            raise RuntimeError(f"Both retrieval paths failed. Dense error: {dense_error}. Sparse error: {sparse_error}")
-        elif dense_error:
-            logger.warning(f"Dense retrieval failed, using sparse only: {dense_error}")
-            used_fallback = True
-            fused_results = sparse_results or []
-        elif sparse_error:
-            logger.warning(f"Sparse retrieval failed, using dense only: {sparse_error}")
-            used_fallback = True
-            fused_results = dense_results or []
-        elif not dense_results and not sparse_results:
-            fused_results = []
+        if state.dense_error and state.sparse_error:
+            raise RuntimeError(
+                f"Both retrieval paths failed. Dense error: {state.dense_error}. "
+                f"Sparse error: {state.sparse_error}"
+            )
+        elif state.dense_error:
+            logger.warning(f"Dense retrieval failed, using sparse only: {state.dense_error}")
+            state.used_fallback = True
+            fused_results = state.sparse_results or CandidateSet.empty()
+        elif state.sparse_error:
+            logger.warning(f"Sparse retrieval failed, using dense only: {state.sparse_error}")
+            state.used_fallback = True
+            fused_results = state.dense_results or CandidateSet.empty()
+        elif not state.dense_results and not state.sparse_results:
+            fused_results = CandidateSet.empty()
         else:
-            # Step 4: Fuse results
+            # Step 4: Fuse results (top fusion_top_k, sorted once after the boost)
             fused_results = self._fuse_results(
-                dense_results=dense_results or [],
-                sparse_results=sparse_results or [],
-                weights=processed_query_for_intent.intent_weights,
+                dense_results=state.dense_results or CandidateSet.empty(),
+                sparse_results=state.sparse_results or CandidateSet.empty(),
+                weights=processed_query.intent_weights,
                 top_k=fusion_top_k,
                 trace=trace,
             )
@@ -369,122 +942,689 @@ class HybridSearch:
         if merged_filters and self.config.metadata_filter_post:
             fused_results = self._apply_metadata_filters(fused_results, merged_filters)
         
-        # Step 5.3: Filename boost — nudge chunks whose source filename
-        #           contains query keywords so they enter the reranker pool.
-        fused_results = self._apply_filename_boost(fused_results, query)
+        # Step 5.3: Filename boost — nudge chunks whose source filename
+        #           contains query keywords so they enter the reranker pool.
+        fused_results = self._apply_filename_boost(fused_results, query)
+        
+        # Snapshot all candidates before reranking trims the list
+        state.all_candidates = fused_results
+        state.fused_results = fused_results
+        return state
+    
+    def _rerank(
+        self,
+        query: str,
+        results: List[RetrievalResult],
+        top_k: int,
+        generation: Optional[int] = None,
+        trace: Optional[Any] = None,
+    ) -> List[RetrievalResult]:
+        """Rerank results with the cross-encoder (top_k is 2x the final k).
+        
+        The extra candidates give source diversification room to work.
+        """
+        logger.info(f"[Thinking] Reranking: Scoring {len(results)} candidates...")
+        rerank_result = self.reranker.rerank(
+            query, results, top_k=top_k, trace=trace,
+            collection=self.cache_collection, generation=generation,
+        )
+        logger.info(
+            f"Reranked {len(rerank_result.results)} results "
+            f"(fallback={rerank_result.used_fallback}, type={rerank_result.reranker_type})"
+        )
+        return rerank_result.results
+    
+    def _rerank_candidates(
+        self,
+        query: str,
+        candidates: CandidateSet,
+        top_k: int,
+        generation: Optional[int] = None,
+        trace: Optional[Any] = None,
+    ) -> CandidateSet:
+        """_rerank() for a candidate set (the reranker needs materialized results).
+        
+        With a rerank cascade, confident fused rankings skip the
+        cross-encoder and the remaining pools are pruned before it; pruned
+        candidates follow the reranked ones.
+        """
+        candidates, rest = self._apply_rerank_cascade(query, candidates, trace)
+        if candidates is None:
+            return rest.head(top_k)
+        reranked = CandidateSet.from_results(
+            self._rerank(query, candidates.to_results(), top_k, generation, trace)
+        )
+        return reranked.concat(rest).head(top_k)
+    
+    def _apply_rerank_cascade(
+        self,
+        query: str,
+        candidates: CandidateSet,
+        trace: Optional[Any] = None,
+    ) -> Tuple[Optional[CandidateSet], CandidateSet]:
+        """Split candidates into (cross-encoder input, candidates kept unscored).
+        
+        Returns:
+            ``(None, candidates)`` if reranking is skipped; otherwise the
+            pruned pool and the pruned-away rest (empty without a cascade).
+        """
+        cascade = self.rerank_cascade
+        if cascade is None:
+            return candidates, CandidateSet.empty()
+        if cascade.should_skip(candidates, trace):
+            return None, candidates
+        return cascade.prune(query, candidates, trace)
+    
+    def _rerank_batch(
+        self,
+        queries: List[str],
+        results_list: List[List[RetrievalResult]],
+        top_k: int,
+        generation: Optional[int] = None,
+    ) -> List[List[RetrievalResult]]:
+        """Rerank several queries' results, in one backend call if supported."""
+        rerank_batch = getattr(self.reranker, "rerank_batch", None)
+        if not callable(rerank_batch):
+            return [
+                self._rerank(q, results, top_k, generation)
+                for q, results in zip(queries, results_list)
+            ]
+        
+        logger.info(
+            f"[Thinking] Reranking: Scoring {sum(len(r) for r in results_list)} "
+            f"candidates for {len(queries)} queries..."
+        )
+        rerank_results = rerank_batch(
+            queries, results_list, top_k=top_k,
+            collection=self.cache_collection, generation=generation,
+        )
+        return [r.results for r in rerank_results]
+    
+    def _finalize(
+        self,
+        query: str,
+        state: _SearchState,
+        effective_top_k: int,
+        filters: Optional[Dict[str, Any]],
+        generation: Optional[int] = None,
+    ) -> List[RetrievalResult]:
+        """Diversify, guarantee title matches, trim and fill the L2 cache."""
+        # Step 5.7: Source diversification — limit chunks per source document
+        #           so results cover different files, not just one big doc.
+        fused_results = self._diversify_by_source(
+            state.fused_results, max_per_source=2,
+        )
+        
+        # Step 5.9: Title match guarantee — if a document whose filename
+        #           matches the query isn't in results yet, inject its best chunk.
+        fused_results = self._inject_title_matches(
+            fused_results, state.all_candidates, query,
+        )
+        
+        # Step 6: Limit to top_k (only these become RetrievalResults)
+        final_results = fused_results.to_results(limit=effective_top_k)
+        
+        # Step 7: Store in retrieval cache (L2) if no filters were applied
+        if not filters and final_results:
+            try:
+                chunk_ids = [r.chunk_id for r in final_results]
+                scores = {r.chunk_id: r.score for r in final_results}
+                texts = {r.chunk_id: r.text for r in final_results}
+                metadata = {r.chunk_id: r.metadata for r in final_results}
+                get_retrieval_cache().put(
+                    query, chunk_ids, scores, texts, metadata,
+                    collection=self.cache_collection, generation=generation,
+                )
+                logger.debug(f"Stored {len(final_results)} results in retrieval cache")
+            except Exception as e:
+                logger.warning(f"Failed to store in retrieval cache: {e}")
+        
+        logger.debug(f"HybridSearch: returning {len(final_results)} results")
+        return final_results
+    
+    def _route_and_expand(
+        self,
+        query: str,
+        final_results: List[RetrievalResult],
+        trace: Optional[Any],
+        routing: Optional[Any] = None,
+    ) -> List[RetrievalResult]:
+        """Route the query and expand results with Parent/Graph context.
+        
+        Args:
+            routing: RoutingDecision made in the background; if None the
+                router is asked now.
+        """
+        if routing is None:
+            logger.info("[Thinking] Routing: Optimizing retrieval strategy...")
+            routing = self.strategy_router.route(query, trace=trace)
+        if (routing.use_parent_retrieval and self.parent_store is not None) or \
+           (routing.use_graph_rag and self.graph_store is not None):
+            logger.info("[Thinking] Expanding: Augmenting with Graph/Parent context...")
+        
+        if routing.use_parent_retrieval and self.parent_store is not None:
+            final_results = self._expand_with_parents(final_results)
+        if routing.use_graph_rag and self.graph_store is not None:
+            final_results = self._expand_with_graph(final_results, query)
+        return final_results
+    
+    def _build_output(
+        self,
+        final_results: List[RetrievalResult],
+        state: _SearchState,
+        return_details: bool,
+    ) -> List[RetrievalResult] | HybridSearchResult:
+        """Wrap final results per ``return_details``."""
+        if return_details:
+            return HybridSearchResult(
+                results=final_results,
+                dense_results=state.dense_results.to_results() if state.dense_results else None,
+                sparse_results=state.sparse_results.to_results() if state.sparse_results else None,
+                dense_error=state.dense_error,
+                sparse_error=state.sparse_error,
+                used_fallback=state.used_fallback,
+                processed_query=state.processed_query,
+            )
+        
+        return final_results
+    
+    def _process_query(self, query: str) -> ProcessedQuery:
+        """Process raw query using QueryProcessor.
+        
+        Args:
+            query: Raw query string.
+            
+        Returns:
+            ProcessedQuery with keywords and filters.
+        """
+        if self.query_processor is None:
+            # Fallback: create basic ProcessedQuery
+            logger.warning("No QueryProcessor configured, using basic tokenization")
+            keywords = query.split()
+            return ProcessedQuery(
+                original_query=query,
+                keywords=keywords,
+                filters={},
+            )
+        
+        return self.query_processor.process(query)
+    
+    def _merge_filters(
+        self,
+        query_filters: Dict[str, Any],
+        explicit_filters: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Merge query-extracted filters with explicit filters.
+        
+        Explicit filters take precedence over query-extracted filters.
+        
+        Args:
+            query_filters: Filters extracted from query by QueryProcessor.
+            explicit_filters: Filters passed explicitly to search().
+            
+        Returns:
+            Merged filter dictionary.
+        """
+        merged = query_filters.copy() if query_filters else {}
+        if explicit_filters:
+            merged.update(explicit_filters)
+        return merged
+    
+    def _run_retrievals(
+        self,
+        processed_query: ProcessedQuery,
+        filters: Optional[Dict[str, Any]],
+        trace: Optional[Any],
+    ) -> Tuple[
+        Optional[List[RetrievalResult]],
+        Optional[List[RetrievalResult]],
+        Optional[str],
+        Optional[str],
+    ]:
+        """Run Dense and Sparse retrievals.
+        
+        Runs in parallel if configured, otherwise sequentially.
+        
+        Args:
+            processed_query: The processed query with keywords.
+            filters: Merged filters to apply.
+            trace: Optional TraceContext.
+            
+        Returns:
+            Tuple of (dense_results, sparse_results, dense_error, sparse_error).
+        """
+        dense_results: Optional[List[RetrievalResult]] = None
+        sparse_results: Optional[List[RetrievalResult]] = None
+        dense_error: Optional[str] = None
+        sparse_error: Optional[str] = None
+        
+        # Determine what to run
+        run_dense, run_sparse = self._retrieval_plan(processed_query)
+        
+        if not run_dense and not run_sparse:
+            # Nothing to run
+            if self.dense_retriever is None and self.sparse_retriever is None:
+                dense_error = "No retriever configured"
+                sparse_error = "No retriever configured"
+            return dense_results, sparse_results, dense_error, sparse_error
+        
+        if self.config.parallel_retrieval and run_dense and run_sparse and not in_search_executor():
+            # Run in parallel
+            dense_results, sparse_results, dense_error, sparse_error = (
+                self._run_parallel_retrievals(processed_query, filters, trace)
+            )
+        else:
+            # Run sequentially
+            if run_dense:
+                dense_results, dense_error = self._run_dense_retrieval(
+                    processed_query.original_query, filters, trace
+                )
+            
+            if run_sparse:
+                sparse_results, sparse_error = self._run_sparse_retrieval(
+                    processed_query.keywords, filters, trace
+                )
+        
+        return dense_results, sparse_results, dense_error, sparse_error
+    
+    def _run_variant_retrievals(
+        self,
+        processed_queries: List[ProcessedQuery],
+        merged_filters: List[Dict[str, Any]],
+        trace: Optional[Any],
+    ) -> List[Tuple[
+        Optional[List[RetrievalResult]],
+        Optional[List[RetrievalResult]],
+        Optional[str],
+        Optional[str],
+    ]]:
+        """Run Dense and Sparse retrievals for every query variant.
+        
+        With several rewritten variants sharing the same filters, all
+        variants are embedded in one batch and searched with one
+        multi-vector vector store query, while the per-variant BM25
+        lookups run concurrently on the shared search executor.
+        Otherwise each variant goes through _run_retrievals().
+        
+        Args:
+            processed_queries: Processed query variants (original first).
+            merged_filters: Merged filters, one per variant.
+            trace: Optional TraceContext.
+        
+        Returns:
+            One (dense_results, sparse_results, dense_error, sparse_error)
+            tuple per variant, in input order.
+        """
+        if not self._can_batch_variants(processed_queries, merged_filters):
+            return [
+                self._run_retrievals(pq, mf, trace)
+                for pq, mf in zip(processed_queries, merged_filters)
+            ]
+        
+        filters = merged_filters[0]
+        plans = [self._retrieval_plan(pq) for pq in processed_queries]
+        run_dense = any(rd for rd, _ in plans)
+        
+        # Submit sparse lookups first so they overlap the dense batch
+        sparse_futures: Dict[int, Any] = {}
+        if self.config.parallel_retrieval and not in_search_executor():
+            executor = get_search_executor()
+            for i, (pq, (_, run_sparse)) in enumerate(zip(processed_queries, plans)):
+                if run_sparse:
+                    sparse_futures[i] = executor.submit(
+                        self._run_sparse_retrieval, pq.keywords, filters, trace
+                    )
+        
+        dense_batch: List[Optional[List[RetrievalResult]]] = [None] * len(processed_queries)
+        dense_error: Optional[str] = None
+        if run_dense:
+            dense_batch, dense_error = self._run_dense_batch_retrieval(
+                [pq.original_query for pq in processed_queries], filters, trace
+            )
+        
+        retrievals = []
+        for i, (pq, (_, run_sparse)) in enumerate(zip(processed_queries, plans)):
+            sparse_results: Optional[List[RetrievalResult]] = None
+            sparse_error: Optional[str] = None
+            if i in sparse_futures:
+                future = sparse_futures[i]
+                try:
+                    sparse_results, sparse_error = future.result(timeout=30)
+                except Exception as e:
+                    future.cancel()
+                    sparse_error = f"sparse retrieval failed with exception: {e}"
+                    logger.error(sparse_error)
+            elif run_sparse:
+                sparse_results, sparse_error = self._run_sparse_retrieval(
+                    pq.keywords, filters, trace
+                )
+            retrievals.append((dense_batch[i], sparse_results, dense_error, sparse_error))
+        return retrievals
+    
+    async def _arun_variant_retrievals(
+        self,
+        processed_queries: List[ProcessedQuery],
+        merged_filters: List[Dict[str, Any]],
+        trace: Optional[Any],
+    ) -> List[Tuple[
+        Optional[List[RetrievalResult]],
+        Optional[List[RetrievalResult]],
+        Optional[str],
+        Optional[str],
+    ]]:
+        """Async version of _run_variant_retrievals().
+        
+        Returns:
+            One (dense_results, sparse_results, dense_error, sparse_error)
+            tuple per variant, in input order.
+        """
+        if not self._can_batch_variants(processed_queries, merged_filters):
+            return list(await asyncio.gather(*(
+                self._arun_retrievals(pq, mf, trace)
+                for pq, mf in zip(processed_queries, merged_filters)
+            )))
+        
+        filters = merged_filters[0]
+        plans = [self._retrieval_plan(pq) for pq in processed_queries]
+        run_dense = any(rd for rd, _ in plans)
+        
+        async def _no_dense() -> Tuple[List[None], None]:
+            return [None] * len(processed_queries), None
+        
+        async def _no_sparse() -> Tuple[None, None]:
+            return None, None
+        
+        dense_coro = (
+            self._arun_dense_batch_retrieval(
+                [pq.original_query for pq in processed_queries], filters, trace
+            )
+            if run_dense else _no_dense()
+        )
+        sparse_coros = [
+            run_blocking(self._run_sparse_retrieval, pq.keywords, filters, trace)
+            if run_sparse else _no_sparse()
+            for pq, (_, run_sparse) in zip(processed_queries, plans)
+        ]
+        
+        if self.config.parallel_retrieval:
+            (dense_batch, dense_error), *sparse = await asyncio.gather(dense_coro, *sparse_coros)
+        else:
+            dense_batch, dense_error = await dense_coro
+            sparse = [await coro for coro in sparse_coros]
+        
+        return [
+            (dense_batch[i], sparse_results, dense_error, sparse_error)
+            for i, (sparse_results, sparse_error) in enumerate(sparse)
+        ]
+    
+    def _can_batch_variants(
+        self,
+        processed_queries: List[ProcessedQuery],
+        merged_filters: List[Dict[str, Any]],
+    ) -> bool:
+        """Check whether query variants can share one batched retrieval.
+        
+        Batching needs several variants, a single filter set (one vector
+        store query takes one ``where`` clause) and at least one retriever.
+        """
+        if len(processed_queries) < 2:
+            return False
+        if any(mf != merged_filters[0] for mf in merged_filters[1:]):
+            return False
+        return self.dense_retriever is not None or self.sparse_retriever is not None
+    
+    def _run_dense_batch_retrieval(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]],
+        trace: Optional[Any],
+    ) -> Tuple[List[Optional[List[RetrievalResult]]], Optional[str]]:
+        """Run dense retrieval for several query variants in one batch.
+        
+        Falls back to one retrieve() call per query for retrievers without
+        ``retrieve_batch``.
+        
+        Args:
+            queries: Query variant strings.
+            filters: Filters to apply.
+            trace: Optional TraceContext.
+        
+        Returns:
+            Tuple of (results per query, error). On error every entry is None.
+        """
+        if self.dense_retriever is None:
+            return [None] * len(queries), "Dense retriever not configured"
+        
+        try:
+            _t0 = time.monotonic()
+            retrieve_batch = getattr(self.dense_retriever, "retrieve_batch", None)
+            if callable(retrieve_batch):
+                batch = retrieve_batch(
+                    queries=queries,
+                    top_k=self.config.dense_top_k,
+                    filters=filters,
+                    trace=trace,
+                )
+            else:
+                batch = [
+                    self.dense_retriever.retrieve(
+                        query=q, top_k=self.config.dense_top_k, filters=filters, trace=trace
+                    )
+                    for q in queries
+                ]
+            self._record_dense_batch(batch, trace, (time.monotonic() - _t0) * 1000.0)
+            return batch, None
+        except Exception as e:
+            return [None] * len(queries), self._record_dense_error(e, trace)
+    
+    async def _arun_dense_batch_retrieval(
+        self,
+        queries: List[str],
+        filters: Optional[Dict[str, Any]],
+        trace: Optional[Any],
+    ) -> Tuple[List[Optional[List[RetrievalResult]]], Optional[str]]:
+        """Async version of _run_dense_batch_retrieval().
+        
+        Returns:
+            Tuple of (results per query, error). On error every entry is None.
+        """
+        if self.dense_retriever is None:
+            return [None] * len(queries), "Dense retriever not configured"
+        
+        aretrieve_batch = getattr(self.dense_retriever, "aretrieve_batch", None)
+        if not callable(aretrieve_batch):
+            return await run_blocking(self._run_dense_batch_retrieval, queries, filters, trace)
+        
+        try:
+            _t0 = time.monotonic()
+            batch = await aretrieve_batch(
+                queries=queries,
+                top_k=self.config.dense_top_k,
+                filters=filters,
+                trace=trace,
+            )
+            self._record_dense_batch(batch, trace, (time.monotonic() - _t0) * 1000.0)
+            return batch, None
+        except Exception as e:
+            return [None] * len(queries), self._record_dense_error(e, trace)
+    
+    def _record_dense_batch(
+        self,
+        batch: List[List[RetrievalResult]],
+        trace: Optional[Any],
+        elapsed_ms: float,
+    ) -> None:
+        """Record one dense_retrieval trace stage for a batched retrieval."""
+        if trace is None:
+            return
+        trace.record_stage("dense_retrieval", {
+            "method": "dense",
+            "provider": getattr(self.dense_retriever, 'provider_name', 'unknown'),
+            "top_k": self.config.dense_top_k,
+            "batch_size": len(batch),
+            "result_count": sum(len(r) for r in batch if r),
+            "chunks": _snapshot_results(batch[0] if batch else None),
+        }, elapsed_ms=elapsed_ms)
+    
+    def _record_dense_error(self, error: Exception, trace: Optional[Any]) -> str:
+        """Log a dense retrieval failure and record it on the trace."""
+        error_msg = f"Dense retrieval error: {error}"
+        logger.error(error_msg)
+        if trace is not None:
+            trace.record_stage("dense_retrieval", {
+                "method": "dense",
+                "error": error_msg,
+                "result_count": 0,
+            })
+        return error_msg
+    
+    def _run_batch_retrievals(
+        self,
+        processed_queries: List[ProcessedQuery],
+        merged_filters: List[Dict[str, Any]],
+    ) -> Tuple[
+        List[Tuple[
+            Optional[List[RetrievalResult]],
+            Optional[List[RetrievalResult]],
+            Optional[str],
+            Optional[str],
+        ]],
+        List[float],
+        List[float],
+    ]:
+        """Run Dense and Sparse retrievals for the queries of a batch search.
+        
+        Queries sharing a filter set share one batched dense retrieval (one
+        embedding call, one multi-vector vector store query); queries
+        sharing a collection share one batched sparse retrieval. Sparse
+        batches run on the shared search executor while dense batches run
+        on the calling thread.
         
-        # Snapshot all candidates before reranking trims the list
-        all_candidates = list(fused_results)
-        
-        # Step 5.5: Rerank with cross-encoder if available
-        if self.reranker is not None and fused_results:
-            logger.info(f"[Thinking] Reranking: Scoring {len(fused_results)} candidates...")
-            # Request 2x top_k so source diversification has enough candidates
-            rerank_top_k = effective_top_k * 2
-            rerank_result = self.reranker.rerank(query, fused_results, top_k=rerank_top_k)
-            fused_results = rerank_result.results
-            logger.info(
-                f"Reranked {len(fused_results)} results "
-                f"(fallback={rerank_result.used_fallback}, type={rerank_result.reranker_type})"
-            )
+        Args:
+            processed_queries: Processed queries (all variants of all queries).
+            merged_filters: Merged filters, one per query.
         
-        # Step 5.7: Source diversification — limit chunks per source document
-        #           so results cover different files, not just one big doc.
-        fused_results = self._diversify_by_source(
-            fused_results, max_per_source=2,
-        )
+        Returns:
+            Tuple of (one (dense_results, sparse_results, dense_error,
+            sparse_error) tuple per query, dense stage ms per query,
+            sparse stage ms per query).
+        """
+        n = len(processed_queries)
+        dense: List[Optional[List[RetrievalResult]]] = [None] * n
+        sparse: List[Optional[List[RetrievalResult]]] = [None] * n
+        dense_errors: List[Optional[str]] = [None] * n
+        sparse_errors: List[Optional[str]] = [None] * n
+        dense_ms = [0.0] * n
+        sparse_ms = [0.0] * n
+        if self.dense_retriever is None and self.sparse_retriever is None:
+            errors = ["No retriever configured"] * n
+            return list(zip(dense, sparse, errors, errors)), dense_ms, sparse_ms
+        
+        # Group queries: dense by filter set, sparse by collection
+        dense_groups: List[Tuple[Dict[str, Any], List[int]]] = []
+        sparse_groups: Dict[Optional[str], List[int]] = {}
+        for i, (pq, filters) in enumerate(zip(processed_queries, merged_filters)):
+            run_dense, run_sparse = self._retrieval_plan(pq)
+            if run_dense:
+                for group_filters, members in dense_groups:
+                    if group_filters == filters:
+                        members.append(i)
+                        break
+                else:
+                    dense_groups.append((filters, [i]))
+            if run_sparse:
+                sparse_groups.setdefault(filters.get("collection"), []).append(i)
         
-        # Step 5.9: Title match guarantee — if a document whose filename
-        #           matches the query isn't in results yet, inject its best chunk.
-        fused_results = self._inject_title_matches(
-            fused_results, all_candidates, query,
-        )
+        def _timed_sparse(collection: Optional[str], members: List[int]) -> Tuple[Any, float]:
+            _t0 = time.monotonic()
+            batch = self._run_sparse_batch_retrieval(
+                [processed_queries[i].keywords for i in members], collection
+            )
+            return batch, (time.monotonic() - _t0) * 1000.0
         
-        # Step 6: Limit to top_k
-        final_results = fused_results[:effective_top_k]
+        sparse_futures: Dict[Optional[str], Future] = {}
+        if self.config.parallel_retrieval and not in_search_executor():
+            executor = get_search_executor()
+            for collection, members in sparse_groups.items():
+                sparse_futures[collection] = executor.submit(_timed_sparse, collection, members)
         
-        # Step 7: Store in retrieval cache (L2) if no filters were applied
-        if not filters and final_results:
+        for filters, members in dense_groups:
+            _t0 = time.monotonic()
+            batch, error = self._run_dense_batch_retrieval(
+                [processed_queries[i].original_query for i in members], filters, None
+            )
+            elapsed = (time.monotonic() - _t0) * 1000.0
+            for i, results in zip(members, batch):
+                dense[i], dense_errors[i], dense_ms[i] = results, error, elapsed
+        
+        for collection, members in sparse_groups.items():
+            future = sparse_futures.get(collection)
             try:
-                chunk_ids = [r.chunk_id for r in final_results]
-                scores = {r.chunk_id: r.score for r in final_results}
-                texts = {r.chunk_id: r.text for r in final_results}
-                metadata = {r.chunk_id: r.metadata for r in final_results}
-                retrieval_cache.put(query, chunk_ids, scores, texts, metadata)
-                logger.debug(f"Stored {len(final_results)} results in retrieval cache")
+                (batch, error), elapsed = (
+                    future.result() if future is not None
+                    else _timed_sparse(collection, members)
+                )
             except Exception as e:
-                logger.warning(f"Failed to store in retrieval cache: {e}")
-        
-        logger.debug(f"HybridSearch: returning {len(final_results)} results")
-
-        if self.strategy_router is not None:
-            logger.info("[Thinking] Routing: Optimizing retrieval strategy...")
-            routing = self.strategy_router.route(query, trace=trace)
-            if (routing.use_parent_retrieval and self.parent_store is not None) or \
-               (routing.use_graph_rag and self.graph_store is not None):
-                logger.info("[Thinking] Expanding: Augmenting with Graph/Parent context...")
-            
-            if routing.use_parent_retrieval and self.parent_store is not None:
-                final_results = self._expand_with_parents(final_results)
-            if routing.use_graph_rag and self.graph_store is not None:
-                final_results = self._expand_with_graph(final_results, query)
-
-        if return_details:
-            return HybridSearchResult(
-                results=final_results,
-                dense_results=dense_results,
-                sparse_results=sparse_results,
-                dense_error=dense_error,
-                sparse_error=sparse_error,
-                used_fallback=used_fallback,
-                processed_query=processed_query,
-            )
+                error = f"sparse retrieval failed with exception: {e}"
+                logger.error(error)
+                batch, elapsed = [None] * len(members), 0.0
+            for i, results in zip(members, batch):
+                sparse[i], sparse_errors[i], sparse_ms[i] = results, error, elapsed
         
-        return final_results
+        return list(zip(dense, sparse, dense_errors, sparse_errors)), dense_ms, sparse_ms
     
-    def _process_query(self, query: str) -> ProcessedQuery:
-        """Process raw query using QueryProcessor.
+    def _run_sparse_batch_retrieval(
+        self,
+        keywords_list: List[List[str]],
+        collection: Optional[str],
+    ) -> Tuple[List[Optional[List[RetrievalResult]]], Optional[str]]:
+        """Run sparse retrieval for several keyword lists in one batch.
+        
+        Falls back to one retrieve() call per list for retrievers without
+        ``retrieve_batch``.
         
-        Args:
-            query: Raw query string.
-            
         Returns:
-            ProcessedQuery with keywords and filters.
+            Tuple of (results per list, error). On error every entry is None.
         """
-        if self.query_processor is None:
-            # Fallback: create basic ProcessedQuery
-            logger.warning("No QueryProcessor configured, using basic tokenization")
-            keywords = query.split()
-            return ProcessedQuery(
-                original_query=query,
-                keywords=keywords,
-                filters={},
-            )
-        
-        return self.query_processor.process(query)
+        try:
+            retrieve_batch = getattr(self.sparse_retriever, "retrieve_batch", None)
+            if callable(retrieve_batch):
+                batch = retrieve_batch(
+                    keywords_list=keywords_list,
+                    top_k=self.config.sparse_top_k,
+                    collection=collection,
+                )
+            else:
+                batch = [
+                    self.sparse_retriever.retrieve(
+                        keywords=keywords, top_k=self.config.sparse_top_k, collection=collection
+                    )
+                    for keywords in keywords_list
+                ]
+            return batch, None
+        except Exception as e:
+            error_msg = f"Sparse retrieval error: {e}"
+            logger.error(error_msg)
+            return [None] * len(keywords_list), error_msg
     
-    def _merge_filters(
-        self,
-        query_filters: Dict[str, Any],
-        explicit_filters: Optional[Dict[str, Any]],
-    ) -> Dict[str, Any]:
-        """Merge query-extracted filters with explicit filters.
+    def _retrieval_plan(self, processed_query: ProcessedQuery) -> Tuple[bool, bool]:
+        """Decide which retrieval paths to run for a processed query.
         
-        Explicit filters take precedence over query-extracted filters.
-        
-        Args:
-            query_filters: Filters extracted from query by QueryProcessor.
-            explicit_filters: Filters passed explicitly to search().
-            
         Returns:
-            Merged filter dictionary.
+            Tuple of (run_dense, run_sparse).
         """
-        merged = query_filters.copy() if query_filters else {}
-        if explicit_filters:
-            merged.update(explicit_filters)
-        return merged
+        run_dense = (
+            self.config.enable_dense 
+            and self.dense_retriever is not None
+        )
+        run_sparse = bool(
+            self.config.enable_sparse 
+            and self.sparse_retriever is not None
+            and processed_query.keywords  # Need keywords for sparse
+        )
+        return run_dense, run_sparse
     
-    def _run_retrievals(
+    def _run_parallel_retrievals(
         self,
         processed_query: ProcessedQuery,
         filters: Optional[Dict[str, Any]],
@@ -495,61 +1635,43 @@ class HybridSearch:
         Optional[str],
         Optional[str],
     ]:
-        """Run Dense and Sparse retrievals.
+        """Run Dense and Sparse retrievals in parallel on the shared search executor.
         
-        Runs in parallel if configured, otherwise sequentially.
+        Sparse retrieval is submitted to the executor while dense retrieval
+        runs on the calling thread, so one query occupies at most one pool
+        worker.
         
         Args:
-            processed_query: The processed query with keywords.
-            filters: Merged filters to apply.
+            processed_query: The processed query.
+            filters: Filters to apply.
             trace: Optional TraceContext.
             
         Returns:
             Tuple of (dense_results, sparse_results, dense_error, sparse_error).
         """
-        dense_results: Optional[List[RetrievalResult]] = None
-        sparse_results: Optional[List[RetrievalResult]] = None
-        dense_error: Optional[str] = None
-        sparse_error: Optional[str] = None
-        
-        # Determine what to run
-        run_dense = (
-            self.config.enable_dense 
-            and self.dense_retriever is not None
-        )
-        run_sparse = (
-            self.config.enable_sparse 
-            and self.sparse_retriever is not None
-            and processed_query.keywords  # Need keywords for sparse
+        sparse_future = get_search_executor().submit(
+            self._run_sparse_retrieval,
+            processed_query.keywords,
+            filters,
+            trace,
         )
         
-        if not run_dense and not run_sparse:
-            # Nothing to run
-            if self.dense_retriever is None and self.sparse_retriever is None:
-                dense_error = "No retriever configured"
-                sparse_error = "No retriever configured"
-            return dense_results, sparse_results, dense_error, sparse_error
+        dense_results, dense_error = self._run_dense_retrieval(
+            processed_query.original_query, filters, trace
+        )
         
-        if self.config.parallel_retrieval and run_dense and run_sparse:
-            # Run in parallel
-            dense_results, sparse_results, dense_error, sparse_error = (
-                self._run_parallel_retrievals(processed_query, filters, trace)
-            )
-        else:
-            # Run sequentially
-            if run_dense:
-                dense_results, dense_error = self._run_dense_retrieval(
-                    processed_query.original_query, filters, trace
-                )
-            
-            if run_sparse:
-                sparse_results, sparse_error = self._run_sparse_retrieval(
-                    processed_query.keywords, filters, trace
-                )
+        sparse_results: Optional[List[RetrievalResult]] = None
+        sparse_error: Optional[str] = None
+        try:
+            sparse_results, sparse_error = sparse_future.result(timeout=30)
+        except Exception as e:
+            sparse_future.cancel()
+            sparse_error = f"sparse retrieval failed with exception: {e}"
+            logger.error(sparse_error)
         
         return dense_results, sparse_results, dense_error, sparse_error
     
-    def _run_parallel_retrievals(
+    async def _arun_retrievals(
         self,
         processed_query: ProcessedQuery,
         filters: Optional[Dict[str, Any]],
@@ -560,57 +1682,41 @@ class HybridSearch:
         Optional[str],
         Optional[str],
     ]:
-        """Run Dense and Sparse retrievals in parallel using ThreadPoolExecutor.
+        """Async version of _run_retrievals().
+        
+        Dense retrieval is awaited natively; sparse (BM25) scoring runs on
+        the shared search executor.  Both run concurrently when
+        ``parallel_retrieval`` is enabled.
         
-        Args:
-            processed_query: The processed query.
-            filters: Filters to apply.
-            trace: Optional TraceContext.
-            
         Returns:
             Tuple of (dense_results, sparse_results, dense_error, sparse_error).
         """
-        dense_results: Optional[List[RetrievalResult]] = None
-        sparse_results: Optional[List[RetrievalResult]] = None
-        dense_error: Optional[str] = None
-        sparse_error: Optional[str] = None
+        run_dense, run_sparse = self._retrieval_plan(processed_query)
         
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            futures = {}
-            
-            # Submit dense retrieval
-            futures['dense'] = executor.submit(
-                self._run_dense_retrieval,
-                processed_query.original_query,
-                filters,
-                trace,
-            )
-            
-            # Submit sparse retrieval
-            futures['sparse'] = executor.submit(
-                self._run_sparse_retrieval,
-                processed_query.keywords,
-                filters,
-                trace,
+        if not run_dense and not run_sparse:
+            if self.dense_retriever is None and self.sparse_retriever is None:
+                return None, None, "No retriever configured", "No retriever configured"
+            return None, None, None, None
+        
+        async def _none() -> Tuple[None, None]:
+            return None, None
+        
+        dense_coro = (
+            self._arun_dense_retrieval(processed_query.original_query, filters, trace)
+            if run_dense else _none()
+        )
+        sparse_coro = (
+            run_blocking(self._run_sparse_retrieval, processed_query.keywords, filters, trace)
+            if run_sparse else _none()
+        )
+        
+        if self.config.parallel_retrieval:
+            (dense_results, dense_error), (sparse_results, sparse_error) = (
+                await asyncio.gather(dense_coro, sparse_coro)
             )
-            
-            # Collect results
-            for name, future in futures.items():
-                try:
-                    results, error = future.result(timeout=30)
-                    if name == 'dense':
-                        dense_results = results
-                        dense_error = error
-                    else:
-                        sparse_results = results
-                        sparse_error = error
-                except Exception as e:
-                    error_msg = f"{name} retrieval failed with exception: {e}"
-                    logger.error(error_msg)
-                    if name == 'dense':
-                        dense_error = error_msg
-                    else:
-                        sparse_error = error_msg
+        else:
+            dense_results, dense_error = await dense_coro
+            sparse_results, sparse_error = await sparse_coro
         
         return dense_results, sparse_results, dense_error, sparse_error
     
@@ -662,6 +1768,56 @@ class HybridSearch:
                 })
             return None, error_msg
     
+    async def _arun_dense_retrieval(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]],
+        trace: Optional[Any],
+    ) -> Tuple[Optional[List[RetrievalResult]], Optional[str]]:
+        """Async version of _run_dense_retrieval().
+        
+        Uses ``DenseRetriever.aretrieve`` when available, otherwise runs
+        the synchronous retriever on the shared search executor.
+        
+        Returns:
+            Tuple of (results, error). If successful, error is None.
+        """
+        if self.dense_retriever is None:
+            return None, "Dense retriever not configured"
+        
+        aretrieve = getattr(self.dense_retriever, "aretrieve", None)
+        if not callable(aretrieve):
+            return await run_blocking(self._run_dense_retrieval, query, filters, trace)
+        
+        try:
+            _t0 = time.monotonic()
+            results = await aretrieve(
+                query=query,
+                top_k=self.config.dense_top_k,
+                filters=filters,
+                trace=trace,
+            )
+            _elapsed = (time.monotonic() - _t0) * 1000.0
+            if trace is not None:
+                trace.record_stage("dense_retrieval", {
+                    "method": "dense",
+                    "provider": getattr(self.dense_retriever, 'provider_name', 'unknown'),
+                    "top_k": self.config.dense_top_k,
+                    "result_count": len(results) if results else 0,
+                    "chunks": _snapshot_results(results),
+                }, elapsed_ms=_elapsed)
+            return results, None
+        except Exception as e:
+            error_msg = f"Dense retrieval error: {e}"
+            logger.error(error_msg)
+            if trace is not None:
+                trace.record_stage("dense_retrieval", {
+                    "method": "dense",
+                    "error": error_msg,
+                    "result_count": 0,
+                })
+            return None, error_msg
+    
     def _run_sparse_retrieval(
         self,
         keywords: List[str],
@@ -712,28 +1868,30 @@ class HybridSearch:
     
     def _fuse_results(
         self,
-        dense_results: List[RetrievalResult],
-        sparse_results: List[RetrievalResult],
+        dense_results: CandidateSet,
+        sparse_results: CandidateSet,
         top_k: int,
         weights: Optional[List[float]] = None,
         trace: Optional[Any] = None,
-    ) -> List[RetrievalResult]:
+    ) -> CandidateSet:
         """Fuse Dense and Sparse results using RRF.
         
         Args:
-            dense_results: Results from dense retrieval.
-            sparse_results: Results from sparse retrieval.
+            dense_results: Candidates from dense retrieval.
+            sparse_results: Candidates from sparse retrieval.
             top_k: Number of results to return after fusion.
             weights: Optional weights for [dense, sparse].
             trace: Optional TraceContext.
             
         Returns:
-            Fused and ranked list of RetrievalResults.
+            Fused and ranked CandidateSet.
         """
         if self.fusion is None:
             # Fallback: interleave results (simple round-robin)
             logger.warning("No fusion configured, using simple interleave")
-            return self._interleave_results(dense_results, sparse_results, top_k)
+            return CandidateSet.from_results(self._interleave_results(
+                dense_results.to_results(), sparse_results.to_results(), top_k
+            ))
         
         # Build ranking lists for RRF
         ranking_lists = []
@@ -743,19 +1901,22 @@ class HybridSearch:
             ranking_lists.append(sparse_results)
         
         if not ranking_lists:
-            return []
+            return CandidateSet.empty()
         
         if len(ranking_lists) == 1:
             # Only one source, no fusion needed
-            return ranking_lists[0][:top_k]
+            return ranking_lists[0].head(top_k)
         
         _t0 = time.monotonic()
-        fused = self.fusion.fuse_with_weights(
-            ranking_lists=ranking_lists,
-            weights=weights,
-            top_k=top_k,
-            trace=trace,
-        )
+        if hasattr(self.fusion, "fuse_candidates"):
+            fused = self.fusion.fuse_candidates(ranking_lists, weights=weights, top_k=top_k)
+        else:
+            fused = CandidateSet.from_results(self.fusion.fuse_with_weights(
+                ranking_lists=[c.to_results() for c in ranking_lists],
+                weights=weights,
+                top_k=top_k,
+                trace=trace,
+            ))
         _elapsed = (time.monotonic() - _t0) * 1000.0
         if trace is not None:
             trace.record_stage("fusion", {
@@ -763,7 +1924,7 @@ class HybridSearch:
                 "input_lists": len(ranking_lists),
                 "top_k": top_k,
                 "result_count": len(fused),
-                "chunks": _snapshot_results(fused),
+                "chunks": _snapshot_results(fused.to_results()),
             }, elapsed_ms=_elapsed)
         return fused
     
@@ -810,10 +1971,10 @@ class HybridSearch:
     
     def _inject_title_matches(
         self,
-        results: List[RetrievalResult],
-        all_candidates: List[RetrievalResult],
+        results: CandidateSet,
+        all_candidates: CandidateSet,
         query: str,
-    ) -> List[RetrievalResult]:
+    ) -> CandidateSet:
         """Guarantee that documents whose filename matches the query appear.
 
         If a candidate's source filename contains query keywords but no chunk
@@ -821,159 +1982,142 @@ class HybridSearch:
         chunk from ``all_candidates``.
 
         Args:
-            results: Current result list (post-diversification).
+            results: Current candidates (post-diversification).
             all_candidates: Full candidate pool (pre-rerank).
             query: Original user query.
 
         Returns:
             Results with title-matching chunks injected (appended at end).
         """
-        if not all_candidates or not query:
+        if not len(all_candidates) or not query:
             return results
 
-        keywords = [w for w in query.strip().split() if len(w) >= 2]
-        if not keywords:
-            keywords = [query.strip()]
+        keywords = _title_keywords(query)
 
         # Sources already in results
-        existing_sources = {r.metadata.get("source_path", "") for r in results}
-
-        # Find title-matching candidates NOT in results
-        injected = []
-        seen_sources: set[str] = set()
-        for r in all_candidates:
-            source = r.metadata.get("source_path", "")
-            if source in existing_sources or source in seen_sources:
-                continue
-            fname = source.rsplit("/", 1)[-1].rsplit("\\", 1)[-1] if source else ""
-            stem = fname.rsplit(".", 1)[0] if "." in fname else fname
-            if any(kw in stem for kw in keywords):
-                injected.append(r)
-                seen_sources.add(source)
+        codes, paths = results.source_codes()
+        existing_sources = {paths[c] for c in np.unique(codes)}
 
-        if injected:
-            sources = [r.metadata.get("source_path", "").rsplit("\\", 1)[-1] for r in injected]
-            logger.info(f"Title match guarantee: injected {len(injected)} chunk(s) from {sources}")
+        # First candidate of every title-matching source NOT in results
+        cand_codes, cand_paths = all_candidates.source_codes()
+        wanted = np.array([
+            path not in existing_sources and any(kw in _filename_stem(path) for kw in keywords)
+            for path in cand_paths
+        ])
+        unique_codes, first_rows = np.unique(cand_codes, return_index=True)
+        rows = np.sort(first_rows[wanted[unique_codes]])
+        if not len(rows):
+            return results
 
-        return list(results) + injected
+        injected = all_candidates.take(rows)
+        sources = [cand_paths[c].rsplit("\\", 1)[-1] for c in cand_codes[rows]]
+        logger.info(f"Title match guarantee: injected {len(rows)} chunk(s) from {sources}")
+        return results.concat(injected)
 
     def _diversify_by_source(
         self,
-        results: List[RetrievalResult],
+        results: CandidateSet,
         max_per_source: int = 3,
-    ) -> List[RetrievalResult]:
+    ) -> CandidateSet:
         """Limit chunks per source document to ensure result diversity.
 
-        Iterates through results in score order, keeping at most
-        ``max_per_source`` chunks from each source file.
+        Keeps, in score order, at most ``max_per_source`` chunks from each
+        source file.
 
         Args:
-            results: Scored results (descending by score).
+            results: Scored candidates (descending by score).
             max_per_source: Maximum chunks to keep per source document.
 
         Returns:
-            Diversified results preserving original score order.
+            Diversified candidates preserving original score order.
         """
-        if not results or max_per_source <= 0:
+        if not len(results) or max_per_source <= 0:
             return results
 
-        source_counts: Dict[str, int] = {}
-        diversified: List[RetrievalResult] = []
-
-        for r in results:
-            source = r.metadata.get("source_path", "")
-            count = source_counts.get(source, 0)
-            if count < max_per_source:
-                diversified.append(r)
-                source_counts[source] = count + 1
-
-        if len(diversified) < len(results):
-            logger.debug(
-                f"Source diversification: {len(results)} -> {len(diversified)} "
-                f"(max {max_per_source}/source)"
-            )
+        # Rank of each candidate within its source (stable sort keeps score order)
+        codes, _ = results.source_codes()
+        order = np.argsort(codes, kind="stable")
+        sorted_codes = codes[order]
+        group_start = np.flatnonzero(np.r_[True, sorted_codes[1:] != sorted_codes[:-1]])
+        group_sizes = np.diff(np.r_[group_start, len(codes)])
+        rank = np.empty(len(codes), dtype=np.int64)
+        rank[order] = np.arange(len(codes)) - np.repeat(group_start, group_sizes)
 
+        keep = rank < max_per_source
+        if keep.all():
+            return results
+        diversified = results.select(keep)
+        logger.debug(
+            f"Source diversification: {len(results)} -> {len(diversified)} "
+            f"(max {max_per_source}/source)"
+        )
         return diversified
 
     def _apply_filename_boost(
         self,
-        results: List[RetrievalResult],
+        results: CandidateSet,
         query: str,
         boost_factor: float = 1.5,
-    ) -> List[RetrievalResult]:
+    ) -> CandidateSet:
         """Boost scores for chunks whose source filename contains query keywords.
 
         Ensures documents whose title directly matches the query topic rank
-        higher and enter the reranker candidate pool.
+        higher and enter the reranker candidate pool. Matching is done once
+        per distinct source file.
 
         Args:
-            results: Fused results to boost.
+            results: Fused candidates to boost.
             query: Original user query string.
             boost_factor: Score multiplier for matching chunks (default: 1.5).
 
         Returns:
-            Re-sorted results with filename-matching chunks boosted.
+            Re-sorted candidates with filename-matching chunks boosted.
         """
-        if not results or not query:
+        if not len(results) or not query:
             return results
 
-        # Build keyword set: split query into 2+ char segments
-        keywords = [w for w in query.strip().split() if len(w) >= 2]
-        if not keywords:
-            keywords = [query.strip()]
-
-        boosted = []
-        boosted_count = 0
-        for r in results:
-            source = r.metadata.get("source_path", "")
-            filename = source.rsplit("/", 1)[-1].rsplit("\\", 1)[-1] if source else ""
-            # Strip extension for matching
-            fname_stem = filename.rsplit(".", 1)[0] if "." in filename else filename
-
-            matched = any(kw in fname_stem for kw in keywords)
-            if matched:
-                boosted.append(RetrievalResult(
-                    chunk_id=r.chunk_id,
-                    score=r.score * boost_factor,
-                    text=r.text,
-                    metadata={**r.metadata, "filename_boosted": True},
-                ))
-                boosted_count += 1
-            else:
-                boosted.append(r)
-
-        if boosted_count > 0:
-            boosted.sort(key=lambda x: (-x.score, x.chunk_id))
-            logger.info(f"Filename boost: {boosted_count} chunks boosted for query '{query[:30]}'")
+        keywords = _title_keywords(query)
+        codes, paths = results.source_codes()
+        matched_paths = np.array([
+            any(kw in _filename_stem(path) for kw in keywords) for path in paths
+        ])
+        matched = matched_paths[codes]
+        boosted_count = int(matched.sum())
+        if not boosted_count:
+            return results
 
-        return boosted
+        boosted = results.take(np.arange(len(results)))
+        boosted.scores = np.where(matched, results.scores * boost_factor, results.scores)
+        boosted.boosted = results.boosted | matched
+        logger.info(f"Filename boost: {boosted_count} chunks boosted for query '{query[:30]}'")
+        return boosted.sort()
 
     def _apply_metadata_filters(
         self,
-        results: List[RetrievalResult],
+        results: CandidateSet,
         filters: Dict[str, Any],
-    ) -> List[RetrievalResult]:
+    ) -> CandidateSet:
         """Apply metadata filters to results (post-fusion fallback).
         
         This is a backup filter mechanism for cases where the underlying
         storage doesn't fully support the filter syntax.
         
         Args:
-            results: Results to filter.
+            results: Candidates to filter.
             filters: Filter conditions to apply.
             
         Returns:
-            Filtered results.
+            Filtered candidates.
         """
-        if not filters:
+        if not filters or not len(results):
             return results
         
-        filtered = []
-        for result in results:
-            if self._matches_filters(result.metadata, filters):
-                filtered.append(result)
-        
-        return filtered
+        mask = np.fromiter(
+            (self._matches_filters(results.metadata(i), filters) for i in range(len(results))),
+            dtype=bool,
+            count=len(results),
+        )
+        return results.select(mask)
     
     def _matches_filters(
         self,
@@ -1021,6 +2165,19 @@ class HybridSearch:
         return True
 
 
+def _title_keywords(query: str) -> List[str]:
+    """Split a query into 2+ char keywords for filename matching."""
+    keywords = [w for w in query.strip().split() if len(w) >= 2]
+    return keywords or [query.strip()]
+
+
+def _filename_stem(source: Any) -> str:
+    """Return the file name of a source path without extension."""
+    filename = source.rsplit("/", 1)[-1].rsplit("\\", 1)[-1] if source else ""
+    # Strip extension for matching
+    return filename.rsplit(".", 1)[0] if "." in filename else filename
+
+
 def create_hybrid_search(
     settings: Optional[Settings] = None,
     query_processor: Optional[QueryProcessor] = None,
@@ -1090,27 +2247,42 @@ def create_hybrid_search(
 def _expand_results_with_parents(
     results: List[RetrievalResult],
     parent_store: Any,
+    docstore: Optional[Any] = None,
 ) -> List[RetrievalResult]:
     """Replace child chunk text with parent chunk text for context expansion.
     
     For each result that has a 'parent_id' in metadata, fetches the parent text
-    from ParentStore and replaces the result text to provide broader context.
+    (from the chunk docstore, then ParentStore for any it lacks) and replaces
+    the result text to provide broader context.
     
     Args:
         results: List of retrieval results (may include child chunks).
         parent_store: ParentStore instance for fetching parent texts.
+        docstore: Optional ChunkDocStore holding parent chunks.
         
     Returns:
         Updated results list with parent texts where available.
     """
-    parent_ids = [r.metadata.get("parent_id") for r in results if r.metadata.get("parent_id")]
+    parent_ids = list(dict.fromkeys(
+        r.metadata.get("parent_id") for r in results if r.metadata.get("parent_id")
+    ))
     if not parent_ids:
         return results
     
-    try:
-        parent_texts = parent_store.get_parent_texts(parent_ids)
-    except Exception as e:
-        logger.warning(f"Parent store fetch failed: {e}")
+    parent_texts: Dict[str, str] = {}
+    if docstore is not None:
+        try:
+            parent_texts = docstore.get_texts(parent_ids)
+        except Exception as e:
+            logger.warning(f"Docstore parent fetch failed: {e}")
+    
+    missing = [pid for pid in parent_ids if pid not in parent_texts]
+    if missing and parent_store is not None:
+        try:
+            parent_texts.update(parent_store.get_parent_texts(missing))
+        except Exception as e:
+            logger.warning(f"Parent store fetch failed: {e}")
+    if not parent_texts:
         return results
     
     expanded = []
@@ -1190,7 +2362,14 @@ def _expand_results_with_graph(
 # Bind as instance methods to HybridSearch
 def _hs_expand_with_parents(self, results: List[RetrievalResult]) -> List[RetrievalResult]:
     """Instance method wrapper for parent expansion."""
-    return _expand_results_with_parents(results, self.parent_store)
+    docstore = self.docstore
+    if docstore is None and self.collection:
+        try:
+            from src.ingestion.storage.chunk_docstore import get_chunk_docstore
+            docstore = get_chunk_docstore(self.collection)
+        except Exception as e:
+            logger.warning(f"Chunk docstore unavailable for parent expansion: {e}")
+    return _expand_results_with_parents(results, self.parent_store, docstore)
 
 
 def _hs_expand_with_graph(self, results: List[RetrievalResult], query: str) -> List[RetrievalResult]:
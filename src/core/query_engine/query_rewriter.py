@@ -8,13 +8,16 @@ Design Principles:
 - Optional: Both features can be disabled via configuration
 - Graceful degradation: Falls back to original query on LLM errors
 - Configurable: Prompts and behavior controlled via settings
+- Cached: Successful LLM output is reused for repeated questions (DecisionCache)
 """
 
 from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, List, Optional
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from src.core.query_engine.decision_cache import get_decision_cache
 
 if TYPE_CHECKING:
     from src.core.settings import Settings
@@ -86,6 +89,10 @@ class QueryRewriter:
         retrieval = getattr(settings, "retrieval", None)
         self._rewrite_enabled = getattr(retrieval, "query_rewrite", False) if retrieval else False
         self._hyde_enabled = getattr(retrieval, "hyde_enabled", False) if retrieval else False
+        self._cache = get_decision_cache(
+            max_size=getattr(retrieval, "decision_cache_size", 2000),
+            ttl_seconds=getattr(retrieval, "decision_cache_ttl_seconds", 3600.0),
+        )
         
         logger.info(
             f"QueryRewriter initialized: rewrite={self._rewrite_enabled}, hyde={self._hyde_enabled}"
@@ -121,20 +128,57 @@ class QueryRewriter:
         if not query or not query.strip():
             return result
         
+        cached = self.cached_rewrite(query)
+        if cached is not None:
+            return cached
+        
         # LLM Query Rewriting
+        rewritten: List[str] = []
         if self._rewrite_enabled:
             rewritten = self._do_rewrite(query)
-            if rewritten:
-                result.rewritten_queries = [query] + rewritten  # Original + rewritten
-                result.rewrite_used = True
         
         # HyDE Expansion
-        if self._hyde_enabled:
-            hyde_doc = self._do_hyde(query)
-            if hyde_doc:
-                result.hyde_document = hyde_doc
-                result.hyde_used = True
+        hyde_doc = self._do_hyde(query) if self._hyde_enabled else None
+        
+        if rewritten or hyde_doc:
+            self._cache.put(self._cache_kind, query, (rewritten, hyde_doc))
+        return self._build_result(query, rewritten, hyde_doc)
+    
+    def cached_rewrite(self, query: str) -> Optional[RewriteResult]:
+        """Return the rewrite of an earlier identical (normalized) query.
+        
+        Never calls the LLM, so callers can check it before deciding to
+        run rewrite() in the background.
         
+        Args:
+            query: Original user query
+            
+        Returns:
+            RewriteResult, or None if this query has not been rewritten yet
+        """
+        if not (self._rewrite_enabled or self._hyde_enabled):
+            return None
+        cached: Optional[Tuple[List[str], Optional[str]]] = self._cache.get(self._cache_kind, query)
+        if cached is None:
+            return None
+        return self._build_result(query, *cached)
+    
+    @property
+    def _cache_kind(self) -> str:
+        """Decision cache kind (changes with the enabled features)."""
+        return f"rewrite:{int(self._rewrite_enabled)}{int(self._hyde_enabled)}"
+    
+    @staticmethod
+    def _build_result(query: str, rewritten: List[str], hyde_doc: Optional[str]) -> RewriteResult:
+        """Assemble a RewriteResult from LLM output."""
+        result = RewriteResult(
+            original_query=query,
+            rewritten_queries=[query] + list(rewritten),  # Original + rewritten
+            rewrite_used=bool(rewritten),
+        )
+        if hyde_doc:
+            result.hyde_document = hyde_doc
+            result.hyde_used = True
         return result
     
     def _do_rewrite(self, query: str) -> List[str]:
@@ -1,8 +1,9 @@
 """Reranker result cache for reducing redundant cross-encoder calls.
 
 Cross-encoder reranking is CPU-intensive (~3.5s per query). This cache
-stores reranked results keyed by (query, candidate_ids) to avoid
-recomputing for repeated queries with same candidates.
+stores reranked results keyed by (collection, index generation, query,
+candidate_ids) to avoid recomputing for repeated queries with same
+candidates, while never serving scores for chunks whose text was re-ingested.
 
 Design Principles:
 - Thread-safe: Uses threading.Lock for concurrent access
@@ -19,6 +20,8 @@ from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Tuple
 
+from src.core.query_engine.cache_generation import cache_scope
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,28 +60,38 @@ class RerankCache:
         self._hits = 0
         self._misses = 0
     
-    def _make_key(self, query: str, candidate_ids: List[str]) -> str:
-        """Generate cache key from query and candidate IDs."""
+    def _make_key(
+        self,
+        query: str,
+        candidate_ids: List[str],
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> str:
+        """Generate cache key from collection scope, query and candidate IDs."""
         # Sort candidate IDs for consistent hashing
         sorted_ids = sorted(candidate_ids)
-        key_str = f"{query}|{'|'.join(sorted_ids)}"
+        key_str = f"{cache_scope(collection, generation)}|{query}|{'|'.join(sorted_ids)}"
         return hashlib.sha256(key_str.encode("utf-8")).hexdigest()[:24]
     
     def get(
         self, 
         query: str, 
-        candidate_ids: List[str]
+        candidate_ids: List[str],
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
     ) -> Optional[CachedRerankResult]:
         """Get cached rerank result.
         
         Args:
             query: The search query.
             candidate_ids: List of candidate chunk IDs.
+            collection: Collection the candidates came from (defaults to "default").
+            generation: Index generation. If None, the current one is used.
             
         Returns:
             Cached result or None if not found.
         """
-        key = self._make_key(query, candidate_ids)
+        key = self._make_key(query, candidate_ids, collection, generation)
         
         with self._lock:
             if key in self._cache:
@@ -95,6 +108,8 @@ class RerankCache:
         candidate_ids: List[str],
         reranked_ids: List[str],
         scores: Dict[str, float],
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
     ) -> None:
         """Store rerank result in cache.
         
@@ -103,8 +118,10 @@ class RerankCache:
             candidate_ids: Original candidate chunk IDs.
             reranked_ids: Reranked chunk IDs (in order).
             scores: Dict of chunk_id -> rerank_score.
+            collection: Collection the candidates came from (defaults to "default").
+            generation: Index generation. If None, the current one is used.
         """
-        key = self._make_key(query, candidate_ids)
+        key = self._make_key(query, candidate_ids, collection, generation)
         
         with self._lock:
             # Evict oldest if at capacity
@@ -0,0 +1,172 @@
+"""Early-exit cascade in front of the cross-encoder reranker.
+
+The cross-encoder runs one forward pass per (query, candidate) pair, and a
+cache miss sends the whole fused pool (3x top_k) to it. The cascade cuts
+that work in two ways:
+
+1. Skip: if the fused scores already show a confident winner (the top
+   score leads the runner-up by ``skip_margin``), reranking is skipped.
+2. Prune: otherwise a cheap scorer (cosine between the query embedding
+   and the chunks' stored embeddings) keeps the best ``prune_to``
+   candidates for the cross-encoder. Pruned candidates follow the
+   reranked ones in cheap-score order, so diversification still has room.
+
+Design Principles:
+- Reuse: The query vector comes from the dense retriever's query cache
+  (already filled by dense retrieval) and chunk vectors from the vector
+  store; no extra model runs
+- Graceful: Any prefilter failure reranks the full pool as before
+- Observable: Skip and prefilter decisions and timings go to TraceContext
+- Config-Driven: settings.rerank.cascade
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+
+import numpy as np
+
+from src.core.query_engine.candidate_set import CandidateSet
+
+if TYPE_CHECKING:
+    from src.core.settings import RerankCascadeSettings
+
+logger = logging.getLogger(__name__)
+
+
+class RerankCascade:
+    """Decides which fused candidates the cross-encoder has to score.
+
+    Attributes:
+        config: Cascade settings (prune_to, skip_margin, keep_boosted).
+        dense_retriever: DenseRetriever providing embed_query() and the
+            vector store; without it no pruning happens.
+
+    Example:
+        >>> cascade = RerankCascade(settings.rerank.cascade, dense_retriever)
+        >>> if not cascade.should_skip(fused, trace):
+        ...     to_rerank, rest = cascade.prune(query, fused, trace)
+    """
+
+    def __init__(
+        self,
+        config: RerankCascadeSettings,
+        dense_retriever: Optional[Any] = None,
+    ) -> None:
+        """Initialize RerankCascade.
+
+        Args:
+            config: Cascade settings.
+            dense_retriever: Optional DenseRetriever for the cheap scorer.
+        """
+        self.config = config
+        self.dense_retriever = dense_retriever
+
+    @staticmethod
+    def winner_margin(candidates: CandidateSet) -> float:
+        """Relative lead of the top fused score over the runner-up.
+
+        Returns:
+            (s1 - s2) / s1 for positive s1, else 0.0 (also for < 2 candidates).
+        """
+        if len(candidates) < 2:
+            return 0.0
+        top2 = np.sort(candidates.scores)[-2:]
+        best, runner_up = float(top2[1]), float(top2[0])
+        if best <= 0:
+            return 0.0
+        return (best - runner_up) / best
+
+    def should_skip(self, candidates: CandidateSet, trace: Optional[Any] = None) -> bool:
+        """True if the fused ranking is confident enough to skip reranking."""
+        threshold = self.config.skip_margin
+        if threshold <= 0 or len(candidates) < 2:
+            return False
+        margin = self.winner_margin(candidates)
+        if margin < threshold:
+            return False
+        logger.info(f"Rerank skipped: fused winner margin {margin:.2f} >= {threshold:.2f}")
+        if trace is not None:
+            trace.record_stage("rerank_skip", {
+                "margin": round(margin, 4),
+                "threshold": threshold,
+                "candidate_count": len(candidates),
+            }, elapsed_ms=0.0)
+        return True
+
+    def prune(
+        self,
+        query: str,
+        candidates: CandidateSet,
+        trace: Optional[Any] = None,
+    ) -> Tuple[CandidateSet, CandidateSet]:
+        """Split candidates into (cross-encoder pool, pruned rest).
+
+        The pool keeps the fused order; the rest is ordered by cheap score.
+        With keep_boosted, filename-boosted candidates always stay in the
+        pool (even beyond prune_to).
+
+        Args:
+            query: User query.
+            candidates: Fused candidates.
+            trace: Optional TraceContext.
+
+        Returns:
+            Tuple of (candidates to rerank, candidates to append unscored).
+        """
+        limit = self.config.prune_to
+        if limit <= 0 or len(candidates) <= limit or self.dense_retriever is None:
+            return candidates, CandidateSet.empty()
+
+        _t0 = time.monotonic()
+        try:
+            similarity = self._cosine_scores(query, candidates)
+        except Exception as e:
+            logger.warning(f"Rerank prefilter failed, reranking all candidates: {e}")
+            return candidates, CandidateSet.empty()
+
+        protected = candidates.boosted if self.config.keep_boosted else np.zeros(len(candidates), bool)
+        # Best cheap scores first (stable: ties keep fused order)
+        order = np.argsort(-similarity, kind="stable")
+        order = order[~protected[order]]
+        keep = protected.copy()
+        keep[order[: max(limit - int(protected.sum()), 0)]] = True
+
+        pool = candidates.select(keep)
+        rest = candidates.take(order[~keep[order]])
+        elapsed = (time.monotonic() - _t0) * 1000.0
+        logger.debug(f"Rerank prefilter: {len(candidates)} -> {len(pool)} candidates")
+        if trace is not None:
+            trace.record_stage("rerank_prefilter", {
+                "method": "embedding_cosine",
+                "input_count": len(candidates),
+                "kept": len(pool),
+                "pruned": len(rest),
+                "boosted_kept": int(protected.sum()),
+            }, elapsed_ms=elapsed)
+        return pool, rest
+
+    def _cosine_scores(self, query: str, candidates: CandidateSet) -> np.ndarray:
+        """Cosine between the query vector and each candidate's stored vector.
+
+        Candidates without a stored vector score -inf (pruned first).
+        """
+        query_vector = np.asarray(self.dense_retriever.embed_query(query), dtype=np.float32)
+        records = self.dense_retriever.vector_store.get_by_ids(
+            candidates.ids.tolist(), include_vectors=True
+        )
+        scores = np.full(len(candidates), -np.inf)
+        rows: List[int] = []
+        vectors: List[Any] = []
+        for row, record in enumerate(records):
+            vector = record.get("vector") if record else None
+            if vector is not None and len(vector) == len(query_vector):
+                rows.append(row)
+                vectors.append(vector)
+        if rows:
+            matrix = np.asarray(vectors, dtype=np.float32)
+            norms = np.linalg.norm(matrix, axis=1) * (np.linalg.norm(query_vector) or 1.0)
+            scores[rows] = (matrix @ query_vector) / np.where(norms > 0, norms, 1.0)
+        return scores
@@ -0,0 +1,227 @@
+"""Pair-level rerank score cache.
+
+``RerankCache`` stores whole rerank results keyed by the exact candidate ID
+set, so a pool that differs by a single chunk (filename boosting and query
+rewriting perturb the pool all the time) re-scores every pair. Cross-encoder
+scores are pointwise, though: the score of (query, passage) does not depend
+on the other candidates. This cache stores one score per
+(normalized query, passage content hash), and the reranker scores only the
+pairs it has not seen before.
+
+Keys hash the exact text sent to the model, so a re-ingested chunk with new
+text gets a new key and never inherits a stale score (no generation scoping
+needed). Keys also include the reranker fingerprint (backend, model and
+scoring options), since fp32 and int8 scores differ slightly.
+
+Design Principles:
+- Thread-safe: Uses threading.Lock for concurrent access
+- Memory-bounded: LRU eviction in memory, CLOCK eviction on disk
+- Persistent option: Scores live in a one-column MmapEmbeddingStore and
+  survive restarts
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import re
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.libs.embedding.embedding_cache import normalize_query
+from src.libs.embedding.mmap_embedding_store import MmapEmbeddingStore, StoreLockedError
+
+logger = logging.getLogger(__name__)
+
+
+class RerankScoreCache:
+    """Cache of (query, passage) -> rerank score.
+    
+    Example:
+        >>> cache = RerankScoreCache(max_size=100000, fingerprint="cross_encoder:bge")
+        >>> scores = cache.get_many(query, texts)
+        >>> missing = [t for t, s in zip(texts, scores) if s is None]
+        >>> cache.put_many(query, missing, reranker_scores(missing))
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 200000,
+        persist_dir: Optional[str] = None,
+        fingerprint: str = "",
+    ):
+        """Initialize the score cache.
+        
+        Args:
+            max_size: Maximum number of cached pair scores.
+            persist_dir: Optional directory for the persistent store.
+            fingerprint: Reranker fingerprint included in every key.
+        """
+        self.max_size = max_size
+        self.fingerprint = fingerprint
+        self._cache: OrderedDict[bytes, float] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        
+        self._store: Optional[MmapEmbeddingStore] = None
+        if persist_dir:
+            try:
+                self._store = MmapEmbeddingStore(
+                    persist_dir, max_size=max_size, fingerprint=fingerprint
+                )
+            except (StoreLockedError, OSError, ValueError) as e:
+                logger.warning(f"Persistent rerank score cache unavailable, using memory: {e}")
+    
+    @property
+    def persistent(self) -> bool:
+        """True if backed by the memory-mapped store."""
+        return self._store is not None
+    
+    def _make_key(self, query: str, text: str) -> bytes:
+        """Generate the 16-byte key for a (query, passage) pair."""
+        content_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        key_str = f"{self.fingerprint}|{normalize_query(query)}|{content_hash}"
+        return hashlib.sha256(key_str.encode("utf-8")).digest()[:16]
+    
+    def get_many(self, query: str, texts: Sequence[str]) -> List[Optional[float]]:
+        """Get cached scores for (query, text) pairs.
+        
+        Args:
+            query: The search query.
+            texts: Passage texts exactly as sent to the reranker.
+        
+        Returns:
+            Scores aligned with *texts* (None for misses).
+        """
+        keys = [self._make_key(query, text) for text in texts]
+        
+        if self._store is not None:
+            scores = [v[0] if v else None for v in self._store.get_many(keys)]
+        else:
+            scores = []
+            with self._lock:
+                for key in keys:
+                    score = self._cache.get(key)
+                    if score is not None:
+                        self._cache.move_to_end(key)
+                    scores.append(score)
+        
+        hits = sum(1 for s in scores if s is not None)
+        with self._lock:
+            self._hits += hits
+            self._misses += len(scores) - hits
+        return scores
+    
+    def put_many(self, query: str, texts: Sequence[str], scores: Sequence[float]) -> None:
+        """Store scores for (query, text) pairs.
+        
+        Args:
+            query: The search query.
+            texts: Passage texts exactly as sent to the reranker.
+            scores: Reranker scores aligned with *texts*.
+        """
+        if len(texts) != len(scores):
+            raise ValueError("texts and scores must have same length")
+        keys = [self._make_key(query, text) for text in texts]
+        
+        if self._store is not None:
+            try:
+                self._store.put_many(keys, [[float(s)] for s in scores])
+            except Exception as e:
+                logger.warning(f"Failed to persist rerank scores: {e}")
+            return
+        
+        with self._lock:
+            for key, score in zip(keys, scores):
+                if key in self._cache:
+                    self._cache.move_to_end(key)
+                while len(self._cache) >= self.max_size and key not in self._cache:
+                    self._cache.popitem(last=False)
+                self._cache[key] = float(score)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        store_stats = self._store.stats() if self._store is not None else None
+        with self._lock:
+            total = self._hits + self._misses
+            hit_rate = self._hits / total if total > 0 else 0.0
+            stats: Dict[str, Any] = {
+                "hits": self._hits,
+                "misses": self._misses,
+                "size": store_stats["size"] if store_stats else len(self._cache),
+                "max_size": self.max_size,
+                "hit_rate": round(hit_rate, 4),
+                "backend": "mmap" if store_stats else "memory",
+                "fingerprint": self.fingerprint,
+            }
+        if store_stats:
+            stats["path"] = store_stats["path"]
+        return stats
+    
+    def clear(self) -> None:
+        """Clear all cached scores."""
+        if self._store is not None:
+            self._store.clear()
+        with self._lock:
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+    
+    def close(self) -> None:
+        """Close the persistent store (the cache keeps working in memory)."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+
+# Global cache instances, one per reranker fingerprint
+_score_caches: Dict[str, RerankScoreCache] = {}
+_score_caches_lock = threading.Lock()
+
+
+def get_rerank_score_cache(
+    fingerprint: str,
+    max_size: int = 200000,
+    persist_dir: Optional[str] = None,
+) -> RerankScoreCache:
+    """Get the global score cache for a reranker.
+
+    Args:
+        fingerprint: Reranker fingerprint (backend, model, scoring options).
+        max_size: Maximum cached pair scores (used when the cache is created).
+        persist_dir: Root directory for the persistent store; None keeps
+            scores in memory only.
+    """
+    with _score_caches_lock:
+        cache = _score_caches.get(fingerprint)
+        if cache is None:
+            directory = None
+            if persist_dir:
+                from src.core.settings import resolve_path
+
+                slug = re.sub(r"[^a-z0-9._-]+", "_", fingerprint.lower()).strip("_")[:60]
+                digest = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:8]
+                directory = str(Path(resolve_path(persist_dir)) / f"{slug}-{digest}")
+            cache = RerankScoreCache(
+                max_size=max_size, persist_dir=directory, fingerprint=fingerprint
+            )
+            _score_caches[fingerprint] = cache
+    return cache
+
+
+def get_rerank_score_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Statistics of every score cache, keyed by reranker fingerprint."""
+    with _score_caches_lock:
+        caches = dict(_score_caches)
+    return {fp: c.stats() for fp, c in caches.items()}
+
+
+def close_rerank_score_caches() -> None:
+    """Close every persistent store (called on shutdown)."""
+    with _score_caches_lock:
+        caches = list(_score_caches.values())
+    for cache in caches:
+        cache.close()
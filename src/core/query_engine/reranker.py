@@ -18,10 +18,11 @@ from __future__ import annotations
 import logging
 import time
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from src.core.types import RetrievalResult
 from src.core.query_engine.rerank_cache import get_rerank_cache
+from src.core.query_engine.rerank_score_cache import RerankScoreCache, get_rerank_score_cache
 from src.libs.reranker.base_reranker import BaseReranker, NoneReranker
 from src.libs.reranker.reranker_factory import RerankerFactory
 
@@ -59,7 +60,7 @@ class RerankResult:
         results: Reranked list of RetrievalResults
         used_fallback: Whether fallback was used due to backend failure
         fallback_reason: Reason for fallback (if applicable)
-        reranker_type: Type of reranker used ('llm', 'cross_encoder', 'none')
+        reranker_type: Type of reranker used ('llm', 'cross_encoder', 'onnx', 'none')
         original_order: Original results before reranking (for debugging)
     """
     results: List[RetrievalResult] = field(default_factory=list)
@@ -128,6 +129,9 @@ class CoreReranker:
         
         # Determine reranker type for result reporting
         self._reranker_type = self._get_reranker_type()
+        
+        # Pair-level score cache (pointwise backends only)
+        self._score_cache = self._create_score_cache(settings)
     
     def _extract_config(self, settings: Settings) -> RerankConfig:
         """Extract RerankConfig from settings.
@@ -150,6 +154,31 @@ class CoreReranker:
             logger.warning("Missing rerank configuration, using defaults (disabled)")
             return RerankConfig(enabled=False)
     
+    def _create_score_cache(self, settings: Settings) -> Optional[RerankScoreCache]:
+        """Create the pair-level score cache if the backend supports it.
+        
+        Args:
+            settings: Application settings.
+            
+        Returns:
+            RerankScoreCache shared by all rerankers with the same scoring
+            function, or None if disabled or the backend is not pointwise.
+        """
+        if not getattr(self._reranker, "pointwise", False):
+            return None
+        score_cache = getattr(getattr(settings, "rerank", None), "score_cache", None)
+        if score_cache is None or not score_cache.enabled:
+            return None
+        try:
+            return get_rerank_score_cache(
+                self._reranker.score_fingerprint(),
+                max_size=score_cache.max_size,
+                persist_dir=score_cache.cache_dir,
+            )
+        except Exception as e:
+            logger.warning(f"Rerank score cache unavailable: {e}")
+            return None
+    
     def _get_reranker_type(self) -> str:
         """Get the type name of the current reranker backend.
         
@@ -159,6 +188,8 @@ class CoreReranker:
         class_name = self._reranker.__class__.__name__
         if "LLM" in class_name:
             return "llm"
+        elif "Onnx" in class_name:
+            return "onnx"
         elif "CrossEncoder" in class_name:
             return "cross_encoder"
         elif "None" in class_name:
@@ -202,6 +233,51 @@ class CoreReranker:
             })
         return candidates
     
+    def _score_candidates(
+        self,
+        query: str,
+        candidates: List[Dict[str, Any]],
+        trace: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> tuple[List[Dict[str, Any]], int]:
+        """Score candidates, sending only uncached pairs to the backend.
+        
+        Args:
+            query: The user query string.
+            candidates: Reranker input records (from _results_to_candidates).
+            trace: Optional TraceContext for observability.
+            **kwargs: Additional parameters passed to reranker backend.
+            
+        Returns:
+            Tuple of (candidates sorted by rerank_score, number of pair
+            scores served from the score cache).
+        """
+        if self._score_cache is None:
+            ranked = self._reranker.rerank(query=query, candidates=candidates, trace=trace, **kwargs)
+            return ranked, 0
+        
+        # top_k applies to the merged list, not to the uncached subset
+        top_k = kwargs.pop("top_k", None)
+        texts = [c["text"] for c in candidates]
+        cached_scores = self._score_cache.get_many(query, texts)
+        
+        scored: List[Dict[str, Any]] = []
+        missing = [c for c, s in zip(candidates, cached_scores) if s is None]
+        if missing:
+            fresh = self._reranker.rerank(query=query, candidates=missing, trace=trace, **kwargs)
+            self._score_cache.put_many(
+                query, [c["text"] for c in fresh], [c["rerank_score"] for c in fresh]
+            )
+            scored.extend(fresh)
+        for candidate, score in zip(candidates, cached_scores):
+            if score is not None:
+                scored.append({**candidate, "rerank_score": score})
+        
+        scored.sort(key=lambda c: c["rerank_score"], reverse=True)
+        if top_k is not None:
+            scored = scored[:top_k]
+        return scored, len(candidates) - len(missing)
+    
     def _candidates_to_results(
         self,
         candidates: List[Dict[str, Any]],
@@ -256,6 +332,8 @@ class CoreReranker:
         results: List[RetrievalResult],
         top_k: Optional[int] = None,
         trace: Optional[Any] = None,
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
         **kwargs: Any,
     ) -> RerankResult:
         """Rerank retrieval results using configured backend.
@@ -265,6 +343,9 @@ class CoreReranker:
             results: List of RetrievalResult objects to rerank.
             top_k: Number of results to return. If None, uses config.top_k.
             trace: Optional TraceContext for observability.
+            collection: Collection the results came from (rerank cache scope).
+            generation: Index generation captured at search start. If None,
+                the collection's current generation is used.
             **kwargs: Additional parameters passed to reranker backend.
             
         Returns:
@@ -302,30 +383,12 @@ class CoreReranker:
         
         # Check cache first
         cache = get_rerank_cache()
-        cached = cache.get(query, candidate_ids)
+        cached = cache.get(query, candidate_ids, collection=collection, generation=generation)
         
         if cached is not None:
             # Cache hit - reconstruct results from cached order
             logger.debug("Rerank cache hit")
-            id_to_result = {r.chunk_id: r for r in results}
-            reranked_results = []
-            for chunk_id in cached.reranked_ids:
-                if chunk_id in id_to_result:
-                    original = id_to_result[chunk_id]
-                    reranked_results.append(RetrievalResult(
-                        chunk_id=original.chunk_id,
-                        score=cached.scores.get(chunk_id, original.score),
-                        text=original.text,
-                        metadata={
-                            **original.metadata,
-                            "original_score": original.score,
-                            "rerank_score": cached.scores.get(chunk_id, original.score),
-                            "reranked": True,
-                            "cache_hit": True,
-                        },
-                    ))
-            
-            final_results = reranked_results[:effective_top_k]
+            final_results = self._results_from_cache(cached, results)[:effective_top_k]
             return RerankResult(
                 results=final_results,
                 used_fallback=False,
@@ -337,11 +400,8 @@ class CoreReranker:
         try:
             logger.debug(f"Reranking {len(candidates)} candidates with {self._reranker_type}")
             _t0 = time.monotonic()
-            reranked_candidates = self._reranker.rerank(
-                query=query,
-                candidates=candidates,
-                trace=trace,
-                **kwargs,
+            reranked_candidates, cached_pairs = self._score_candidates(
+                query, candidates, trace=trace, **kwargs
             )
             _elapsed = (time.monotonic() - _t0) * 1000.0
             
@@ -351,7 +411,10 @@ class CoreReranker:
             # Store in cache
             reranked_ids = [r.chunk_id for r in reranked_results]
             scores = {r.chunk_id: r.score for r in reranked_results}
-            cache.put(query, candidate_ids, reranked_ids, scores)
+            cache.put(
+                query, candidate_ids, reranked_ids, scores,
+                collection=collection, generation=generation,
+            )
             
             # Apply top_k limit
             final_results = reranked_results[:effective_top_k]
@@ -364,6 +427,7 @@ class CoreReranker:
                     "provider": self._reranker_type,
                     "input_count": len(candidates),
                     "output_count": len(final_results),
+                    "cached_pairs": cached_pairs,
                     "chunks": [
                         {
                             "chunk_id": r.chunk_id,
@@ -384,31 +448,196 @@ class CoreReranker:
             
         except Exception as e:
             logger.warning(f"Reranking failed, using fallback: {e}")
+            return self._fallback_result(results, effective_top_k, e)
+    
+    def rerank_batch(
+        self,
+        queries: List[str],
+        results_list: List[List[RetrievalResult]],
+        top_k: Optional[int] = None,
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> List[RerankResult]:
+        """Rerank the candidates of several queries with one backend call.
+        
+        Backends exposing ``score_pairs`` (cross-encoders) score every
+        uncached (query, passage) pair of the whole batch in one batched
+        forward pass; the rerank cache and the pair score cache are used
+        exactly as in :meth:`rerank`.  Other backends rerank query by query.
+        
+        Args:
+            queries: The query strings.
+            results_list: Candidates per query, aligned with *queries*.
+            top_k: Number of results per query. If None, uses config.top_k.
+            collection: Collection the results came from (rerank cache scope).
+            generation: Index generation captured at search start.
+            
+        Returns:
+            One RerankResult per query, in input order.
+        
+        Raises:
+            ValueError: If queries and results_list differ in length.
+            RerankError: If scoring fails and fallback is disabled.
+        """
+        if len(queries) != len(results_list):
+            raise ValueError("queries and results_list must have same length")
+        
+        score_pairs = getattr(self._reranker, "score_pairs", None)
+        if not self.is_enabled or not callable(score_pairs):
+            return [
+                self.rerank(q, r, top_k=top_k, collection=collection, generation=generation)
+                for q, r in zip(queries, results_list)
+            ]
+        
+        effective_top_k = top_k if top_k is not None else self.config.top_k
+        cache = get_rerank_cache()
+        out: List[Optional[RerankResult]] = [None] * len(queries)
+        
+        # Per query still to score: (index, candidates, scores with None for misses)
+        pending: List[Tuple[int, List[Dict[str, Any]], List[Optional[float]]]] = []
+        pairs: List[Tuple[str, str]] = []
+        slots: List[Tuple[int, int]] = []  # (pending index, candidate index) per pair
+        for i, (query, results) in enumerate(zip(queries, results_list)):
+            if len(results) < 2:
+                out[i] = self.rerank(query, results, top_k=top_k)
+                continue
             
-            if self.config.fallback_on_error:
-                # Return original order as fallback
-                fallback_results = []
-                for result in results[:effective_top_k]:
-                    fallback_results.append(RetrievalResult(
-                        chunk_id=result.chunk_id,
-                        score=result.score,
-                        text=result.text,
-                        metadata={
-                            **result.metadata,
-                            "reranked": False,
-                            "rerank_fallback": True,
-                        },
-                    ))
-                
-                return RerankResult(
-                    results=fallback_results,
-                    used_fallback=True,
-                    fallback_reason=str(e),
+            candidates = self._results_to_candidates(results)
+            cached = cache.get(
+                query, [c["id"] for c in candidates],
+                collection=collection, generation=generation,
+            )
+            if cached is not None:
+                out[i] = RerankResult(
+                    results=self._results_from_cache(cached, results)[:effective_top_k],
+                    used_fallback=False,
                     reranker_type=self._reranker_type,
                     original_order=results[:],
                 )
-            else:
-                raise RerankError(f"Reranking failed and fallback disabled: {e}") from e
+                continue
+            
+            texts = [c["text"] for c in candidates]
+            scores: List[Optional[float]] = (
+                self._score_cache.get_many(query, texts)
+                if self._score_cache is not None else [None] * len(texts)
+            )
+            for j, (text, score) in enumerate(zip(texts, scores)):
+                if score is None:
+                    pairs.append((query, text))
+                    slots.append((len(pending), j))
+            pending.append((i, candidates, scores))
+        
+        if not pending:
+            return out  # type: ignore[return-value]
+        
+        try:
+            _t0 = time.monotonic()
+            fresh = score_pairs(pairs) if pairs else []
+            _elapsed = (time.monotonic() - _t0) * 1000.0
+        except Exception as e:
+            logger.warning(f"Batch reranking failed, using fallback: {e}")
+            for i, _, _ in pending:
+                out[i] = self._fallback_result(results_list[i], effective_top_k, e)
+            return out  # type: ignore[return-value]
+        
+        fresh_by_query: Dict[int, Tuple[List[str], List[float]]] = {}
+        for (p, j), score in zip(slots, fresh):
+            i, candidates, scores = pending[p]
+            scores[j] = float(score)
+            texts, values = fresh_by_query.setdefault(i, ([], []))
+            texts.append(candidates[j]["text"])
+            values.append(float(score))
+        if self._score_cache is not None:
+            for i, (texts, values) in fresh_by_query.items():
+                self._score_cache.put_many(queries[i], texts, values)
+        
+        for i, candidates, scores in pending:
+            query, results = queries[i], results_list[i]
+            scored = sorted(
+                ({**c, "rerank_score": s} for c, s in zip(candidates, scores)),
+                key=lambda c: c["rerank_score"],
+                reverse=True,
+            )
+            reranked_results = self._candidates_to_results(scored, results)
+            cache.put(
+                query,
+                [c["id"] for c in candidates],
+                [r.chunk_id for r in reranked_results],
+                {r.chunk_id: r.score for r in reranked_results},
+                collection=collection, generation=generation,
+            )
+            out[i] = RerankResult(
+                results=reranked_results[:effective_top_k],
+                used_fallback=False,
+                reranker_type=self._reranker_type,
+                original_order=results[:],
+            )
+        
+        logger.info(
+            f"Batch reranking complete: {len(pairs)} pairs scored for "
+            f"{len(pending)} queries in {_elapsed:.1f} ms"
+        )
+        return out  # type: ignore[return-value]
+    
+    def _results_from_cache(
+        self,
+        cached: Any,
+        results: List[RetrievalResult],
+    ) -> List[RetrievalResult]:
+        """Rebuild reranked results in the order stored in the rerank cache."""
+        id_to_result = {r.chunk_id: r for r in results}
+        reranked_results = []
+        for chunk_id in cached.reranked_ids:
+            if chunk_id in id_to_result:
+                original = id_to_result[chunk_id]
+                reranked_results.append(RetrievalResult(
+                    chunk_id=original.chunk_id,
+                    score=cached.scores.get(chunk_id, original.score),
+                    text=original.text,
+                    metadata={
+                        **original.metadata,
+                        "original_score": original.score,
+                        "rerank_score": cached.scores.get(chunk_id, original.score),
+                        "reranked": True,
+                        "cache_hit": True,
+                    },
+                ))
+        return reranked_results
+    
+    def _fallback_result(
+        self,
+        results: List[RetrievalResult],
+        top_k: int,
+        error: Exception,
+    ) -> RerankResult:
+        """Return the original order after a backend failure.
+        
+        Raises:
+            RerankError: If fallback is disabled.
+        """
+        if not self.config.fallback_on_error:
+            raise RerankError(f"Reranking failed and fallback disabled: {error}") from error
+        
+        fallback_results = []
+        for result in results[:top_k]:
+            fallback_results.append(RetrievalResult(
+                chunk_id=result.chunk_id,
+                score=result.score,
+                text=result.text,
+                metadata={
+                    **result.metadata,
+                    "reranked": False,
+                    "rerank_fallback": True,
+                },
+            ))
+        
+        return RerankResult(
+            results=fallback_results,
+            used_fallback=True,
+            fallback_reason=str(error),
+            reranker_type=self._reranker_type,
+            original_order=results[:],
+        )
     
     @property
     def reranker_type(self) -> str:
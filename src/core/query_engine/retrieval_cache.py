@@ -15,6 +15,8 @@ Design Principles:
 - Memory-bounded: LRU eviction
 - TTL support: Auto-expire stale entries
 - Query normalization: Consistent cache keys
+- Collection-scoped: Keys include the collection and its index generation,
+  so ingestion/deletion makes stale entries unreachable (see cache_generation)
 """
 
 from __future__ import annotations
@@ -27,6 +29,8 @@ from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional
 
+from src.core.query_engine.cache_generation import cache_scope
+
 logger = logging.getLogger(__name__)
 
 
@@ -66,10 +70,10 @@ class RetrievalCache:
         >>> cache = RetrievalCache(max_size=1000, ttl_seconds=86400)
         >>> 
         >>> # Check cache
-        >>> cached = cache.get("报销流程")
+        >>> cached = cache.get("报销流程", collection="default")
         >>> if cached is None:
         ...     results = hybrid_search.search("报销流程")
-        ...     cache.put("报销流程", results)
+        ...     cache.put("报销流程", ..., collection="default")
     """
     
     def __init__(
@@ -91,25 +95,39 @@ class RetrievalCache:
         self._misses = 0
         self._expired = 0
     
-    def _make_key(self, query: str) -> str:
-        """Generate cache key from normalized query."""
+    def _make_key(
+        self,
+        query: str,
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> str:
+        """Generate cache key from collection, index generation and normalized query."""
         normalized = normalize_query(query)
-        return hashlib.sha256(normalized.encode("utf-8")).hexdigest()[:20]
+        key_str = f"{cache_scope(collection, generation)}|{normalized}"
+        return hashlib.sha256(key_str.encode("utf-8")).hexdigest()[:20]
     
     def _is_expired(self, entry: CachedRetrievalResult) -> bool:
         """Check if cache entry has expired."""
         return (time.time() - entry.timestamp) > self.ttl_seconds
     
-    def get(self, query: str) -> Optional[CachedRetrievalResult]:
+    def get(
+        self,
+        query: str,
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> Optional[CachedRetrievalResult]:
         """Get cached retrieval result.
         
         Args:
             query: Search query.
+            collection: Collection the query ran against (defaults to "default").
+            generation: Index generation captured at search start. If None,
+                the collection's current generation is used.
             
         Returns:
             Cached result or None if not found/expired.
         """
-        key = self._make_key(query)
+        key = self._make_key(query, collection, generation)
         
         with self._lock:
             if key not in self._cache:
@@ -137,6 +155,8 @@ class RetrievalCache:
         scores: Dict[str, float],
         texts: Dict[str, str],
         metadata: Dict[str, Dict[str, Any]],
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
     ) -> None:
         """Store retrieval result in cache.
         
@@ -146,8 +166,12 @@ class RetrievalCache:
             scores: Dict of chunk_id -> score.
             texts: Dict of chunk_id -> text.
             metadata: Dict of chunk_id -> metadata.
+            collection: Collection the query ran against (defaults to "default").
+            generation: Index generation the results were computed against.
+                Pass the value captured before searching so results racing
+                with an ingestion are never stored under the new generation.
         """
-        key = self._make_key(query)
+        key = self._make_key(query, collection, generation)
         
         with self._lock:
             # Evict oldest if at capacity
@@ -162,11 +186,16 @@ class RetrievalCache:
                 timestamp=time.time(),
             )
     
-    def invalidate(self, query: Optional[str] = None) -> int:
+    def invalidate(
+        self,
+        query: Optional[str] = None,
+        collection: Optional[str] = None,
+    ) -> int:
         """Invalidate cache entries.
         
         Args:
             query: Specific query to invalidate. If None, clears all.
+            collection: Collection of the query (defaults to "default").
             
         Returns:
             Number of entries invalidated.
@@ -177,7 +206,7 @@ class RetrievalCache:
                 self._cache.clear()
                 return count
             
-            key = self._make_key(query)
+            key = self._make_key(query, collection)
             if key in self._cache:
                 del self._cache[key]
                 return 1
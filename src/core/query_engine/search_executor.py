@@ -0,0 +1,165 @@
+"""Shared bounded executor for blocking query-path stages.
+
+The async search path (``HybridSearch.asearch``) awaits network I/O on the
+event loop, but some stages are blocking or CPU-bound: BM25 scoring,
+ChromaDB queries and cross-encoder reranking.  These run on one
+long-lived, bounded thread pool instead of a fresh ``ThreadPoolExecutor``
+per query.  Speculative LLM calls (query rewriting, strategy routing) wait
+on the network for seconds, so they get a second pool of their own: slow
+LLM round-trips can then never occupy the workers retrieval needs.
+
+Design Principles:
+- Long-lived: One pool per process, created lazily
+- Bounded: Pool sizes cap concurrent blocking work across all queries;
+  ``configure_executors()`` sets them from settings before first use
+- Cancellation-aware: ``run_blocking()`` awaits via ``run_in_executor``, so a
+  cancelled caller stops waiting immediately and queued work is dropped
+- Re-entrancy safe: ``in_search_executor()`` lets sync code avoid
+  submitting nested work from a pool thread (which could deadlock)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_LLM_MAX_WORKERS = 4
+_THREAD_NAME_PREFIX = "search-exec"
+_LLM_THREAD_NAME_PREFIX = "llm-exec"
+
+# Global executor instances
+_search_executor: Optional[ThreadPoolExecutor] = None
+_llm_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+# Pool sizes used when a pool is created
+_search_max_workers = DEFAULT_MAX_WORKERS
+_llm_max_workers = DEFAULT_LLM_MAX_WORKERS
+
+
+def configure_executors(
+    search_workers: Optional[int] = None,
+    llm_workers: Optional[int] = None,
+) -> None:
+    """Set the pool sizes used when the executors are next created.
+
+    A pool that is already running keeps its size until
+    ``shutdown_search_executor()`` / ``shutdown_llm_executor()``.
+
+    Args:
+        search_workers: Search executor size (None keeps the current value).
+        llm_workers: LLM executor size (None keeps the current value).
+
+    Raises:
+        ValueError: If a size is smaller than 1.
+    """
+    global _search_max_workers, _llm_max_workers
+    for name, value in (("search_workers", search_workers), ("llm_workers", llm_workers)):
+        if value is not None and value < 1:
+            raise ValueError(f"{name} must be >= 1, got {value}")
+    with _executor_lock:
+        if search_workers is not None:
+            _search_max_workers = search_workers
+        if llm_workers is not None:
+            _llm_max_workers = llm_workers
+
+
+def get_search_executor(max_workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """Get the global search executor, creating it on first use.
+
+    Args:
+        max_workers: Pool size (only used when the pool is created).
+            Defaults to the size set by ``configure_executors()``.
+
+    Returns:
+        Shared ThreadPoolExecutor.
+    """
+    global _search_executor
+    if _search_executor is None:
+        with _executor_lock:
+            if _search_executor is None:
+                max_workers = max_workers or _search_max_workers
+                _search_executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=_THREAD_NAME_PREFIX,
+                )
+                logger.info(f"Search executor started (max_workers={max_workers})")
+    return _search_executor
+
+
+def get_llm_executor(max_workers: Optional[int] = None) -> ThreadPoolExecutor:
+    """Get the global executor for speculative LLM calls, creating it on first use.
+
+    Args:
+        max_workers: Pool size (only used when the pool is created).
+            Defaults to the size set by ``configure_executors()``.
+
+    Returns:
+        Shared ThreadPoolExecutor, separate from the search executor.
+    """
+    global _llm_executor
+    if _llm_executor is None:
+        with _executor_lock:
+            if _llm_executor is None:
+                max_workers = max_workers or _llm_max_workers
+                _llm_executor = ThreadPoolExecutor(
+                    max_workers=max_workers,
+                    thread_name_prefix=_LLM_THREAD_NAME_PREFIX,
+                )
+                logger.info(f"LLM executor started (max_workers={max_workers})")
+    return _llm_executor
+
+
+def in_search_executor() -> bool:
+    """Return True if the current thread is a search executor worker."""
+    return threading.current_thread().name.startswith(_THREAD_NAME_PREFIX)
+
+
+async def run_blocking(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking callable on the search executor and await its result.
+
+    Args:
+        func: Callable to run.
+        *args: Positional arguments for *func*.
+        **kwargs: Keyword arguments for *func*.
+
+    Returns:
+        The callable's return value.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        get_search_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+def shutdown_search_executor(wait: bool = False) -> None:
+    """Shut down the global executor (a new one is created on next use).
+
+    Args:
+        wait: Block until running work has finished.
+    """
+    global _search_executor
+    with _executor_lock:
+        executor, _search_executor = _search_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
+
+
+def shutdown_llm_executor(wait: bool = False) -> None:
+    """Shut down the global LLM executor (a new one is created on next use).
+
+    Args:
+        wait: Block until running LLM calls have finished.
+    """
+    global _llm_executor
+    with _executor_lock:
+        executor, _llm_executor = _llm_executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,462 @@
+"""Semantic answer cache for near-duplicate questions (Level 3b cache).
+
+The exact answer cache (answer_cache.py) only hits when the normalized
+question text is identical. FAQ traffic is dominated by paraphrases
+("报销流程是什么" / "报销的流程" / "怎么报销"), so this tier matches questions
+by the cosine similarity of their query embeddings instead:
+
+1. The question is embedded through the dense retriever's query embedding
+   cache, so the vector is computed once and reused by dense retrieval
+2. A small in-process vector index of cached questions for the collection
+   is searched (brute-force dot product over normalized vectors)
+3. If the best match reaches ``similarity_threshold``, its answer is served
+
+False hits are measured by verification: a sampled share of hits
+(``verify_sample_rate``) still runs retrieval, and the hit only counts as
+correct if the fresh top sources overlap the cached answer's sources.
+Disagreeing entries are evicted.
+
+Design Principles:
+- Opt-in: Disabled unless retrieval.semantic_cache.enabled is true
+- Thread-safe: Uses threading.Lock
+- Memory-bounded: LRU eviction across all collections, plus TTL
+- Collection-scoped: One index per collection, tied to the collection's
+  index generation (see cache_generation); a newer generation drops the
+  old index, so answers built from replaced content are never served
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from src.core.query_engine.answer_cache import CachedAnswer
+from src.core.query_engine.cache_generation import DEFAULT_COLLECTION, get_cache_generations
+
+logger = logging.getLogger(__name__)
+
+# Minimum share of the cached answer's sources that fresh retrieval must
+# return for a verified hit to count as correct
+SOURCE_AGREEMENT_THRESHOLD = 0.5
+
+
+@dataclass
+class SemanticHit:
+    """A cached answer matched by query similarity."""
+    entry_id: int
+    collection: str
+    matched_query: str
+    similarity: float
+    cached: CachedAnswer
+
+
+@dataclass
+class _Entry:
+    """Cached answer plus its row in the collection index."""
+    collection: str
+    row: int
+    query: str
+    cached: CachedAnswer
+
+
+@dataclass
+class _CollectionIndex:
+    """Normalized query vectors of one collection at one index generation."""
+    generation: int
+    dim: int
+    vectors: np.ndarray
+    row_ids: List[Optional[int]] = field(default_factory=list)
+    free_rows: List[int] = field(default_factory=list)
+
+
+class SemanticAnswerCache:
+    """Answer cache keyed by query embedding similarity.
+    
+    Example:
+        >>> cache = SemanticAnswerCache(similarity_threshold=0.92)
+        >>> vector = await hybrid_search.aembed_query("怎么报销")
+        >>> hit = cache.lookup(vector, collection="default", generation=3)
+        >>> if hit is None:
+        ...     answer = rag_pipeline.generate("怎么报销")
+        ...     cache.put("怎么报销", vector, answer, sources,
+        ...               collection="default", generation=3)
+    """
+    
+    def __init__(
+        self,
+        max_size: int = 1000,
+        ttl_seconds: float = 86400,
+        similarity_threshold: float = 0.92,
+        verify_sample_rate: float = 0.1,
+    ):
+        """Initialize semantic answer cache.
+        
+        Args:
+            max_size: Maximum number of answers across all collections.
+            ttl_seconds: Time-to-live for cache entries (seconds).
+            similarity_threshold: Minimum cosine similarity to serve an answer.
+            verify_sample_rate: Fraction of hits to verify against fresh
+                retrieval (0 disables verification).
+        
+        Raises:
+            ValueError: If a parameter is out of range.
+        """
+        if max_size <= 0:
+            raise ValueError(f"max_size must be positive, got {max_size}")
+        if not 0.0 < similarity_threshold <= 1.0:
+            raise ValueError(
+                f"similarity_threshold must be in (0, 1], got {similarity_threshold}"
+            )
+        if not 0.0 <= verify_sample_rate <= 1.0:
+            raise ValueError(
+                f"verify_sample_rate must be in [0, 1], got {verify_sample_rate}"
+            )
+        
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.similarity_threshold = similarity_threshold
+        self.verify_sample_rate = verify_sample_rate
+        
+        self._entries: OrderedDict[int, _Entry] = OrderedDict()
+        self._indexes: Dict[str, _CollectionIndex] = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+        
+        self._hits = 0
+        self._misses = 0
+        self._expired = 0
+        self._verified = 0
+        self._false_hits = 0
+        self._similarity_sum = 0.0
+    
+    def lookup(
+        self,
+        query_vector: Sequence[float],
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> Optional[SemanticHit]:
+        """Find the cached answer of the most similar earlier question.
+        
+        Args:
+            query_vector: Embedding of the incoming question.
+            collection: Collection the question targets (defaults to "default").
+            generation: Index generation captured at request start. If None,
+                the collection's current generation is used.
+        
+        Returns:
+            SemanticHit if the best match reaches the similarity threshold,
+            otherwise None.
+        """
+        name = collection or DEFAULT_COLLECTION
+        if generation is None:
+            generation = get_cache_generations().current(name)
+        vector = self._normalize(query_vector)
+        
+        with self._lock:
+            index = self._current_index(name, generation)
+            if index is None or vector is None or vector.shape[0] != index.dim:
+                self._misses += 1
+                return None
+            
+            scores = index.vectors[: len(index.row_ids)] @ vector
+            candidates = np.flatnonzero(scores >= self.similarity_threshold)
+            for row in candidates[np.argsort(-scores[candidates])]:
+                similarity = float(scores[row])
+                entry_id = index.row_ids[row]
+                if entry_id is None:
+                    continue
+                entry = self._entries[entry_id]
+                if self._is_expired(entry.cached):
+                    self._remove_locked(entry_id)
+                    self._expired += 1
+                    continue
+                
+                self._entries.move_to_end(entry_id)
+                self._hits += 1
+                self._similarity_sum += similarity
+                return SemanticHit(
+                    entry_id=entry_id,
+                    collection=name,
+                    matched_query=entry.query,
+                    similarity=similarity,
+                    cached=entry.cached,
+                )
+            
+            self._misses += 1
+            return None
+    
+    def put(
+        self,
+        query: str,
+        query_vector: Sequence[float],
+        answer: str,
+        sources: List[Dict[str, Any]],
+        metadata: Optional[Dict[str, Any]] = None,
+        collection: Optional[str] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store an answer under its question's embedding.
+        
+        Args:
+            query: Question text (kept for stats and debugging).
+            query_vector: Embedding of the question.
+            answer: Generated answer text.
+            sources: Source chunks used (chunk_id, source, score, ...).
+            metadata: Optional metadata (model, tokens, etc.).
+            collection: Collection the question targets (defaults to "default").
+            generation: Index generation the answer was built from. Pass the
+                value captured before retrieval; answers for an older
+                generation than the cached index are dropped.
+        """
+        name = collection or DEFAULT_COLLECTION
+        if generation is None:
+            generation = get_cache_generations().current(name)
+        vector = self._normalize(query_vector)
+        if vector is None:
+            return
+        
+        with self._lock:
+            index = self._indexes.get(name)
+            if index is not None and generation < index.generation:
+                return  # Built from content that has since been replaced
+            if index is None or generation > index.generation or index.dim != vector.shape[0]:
+                self._drop_index_locked(name)
+                index = _CollectionIndex(
+                    generation=generation,
+                    dim=vector.shape[0],
+                    vectors=np.zeros((16, vector.shape[0]), dtype=np.float32),
+                )
+                self._indexes[name] = index
+            
+            while len(self._entries) >= self.max_size:
+                oldest_id = next(iter(self._entries))
+                self._remove_locked(oldest_id)
+                # Eviction may have dropped this collection's (now empty) index
+                if name not in self._indexes:
+                    self._indexes[name] = index
+            
+            entry_id = next(self._ids)
+            row = self._allocate_row(index)
+            index.vectors[row] = vector
+            index.row_ids[row] = entry_id
+            self._entries[entry_id] = _Entry(
+                collection=name,
+                row=row,
+                query=query,
+                cached=CachedAnswer(
+                    answer=answer,
+                    sources=sources,
+                    timestamp=time.time(),
+                    metadata=metadata or {},
+                ),
+            )
+    
+    def should_verify(self) -> bool:
+        """Decide whether the current hit should be verified by retrieval."""
+        return self.verify_sample_rate > 0 and random.random() < self.verify_sample_rate
+    
+    def verify(self, hit: SemanticHit, fresh_sources: List[Dict[str, Any]]) -> bool:
+        """Check a hit against freshly retrieved sources and record the outcome.
+        
+        Sources are compared by chunk_id (falling back to the source path).
+        A hit is correct if at least SOURCE_AGREEMENT_THRESHOLD of the
+        smaller source set is shared; otherwise it is counted as a false hit
+        and its entry is evicted.
+        
+        Args:
+            hit: Hit returned by lookup().
+            fresh_sources: Sources retrieved for the incoming question.
+        
+        Returns:
+            True if the cached answer may be served.
+        """
+        cached_keys = {self._source_key(s) for s in hit.cached.sources} - {None}
+        fresh_keys = {self._source_key(s) for s in fresh_sources} - {None}
+        if cached_keys and fresh_keys:
+            overlap = len(cached_keys & fresh_keys) / min(len(cached_keys), len(fresh_keys))
+        else:
+            overlap = 1.0 if not cached_keys and not fresh_keys else 0.0
+        agreed = overlap >= SOURCE_AGREEMENT_THRESHOLD
+        
+        with self._lock:
+            self._verified += 1
+            if not agreed:
+                self._false_hits += 1
+                if hit.entry_id in self._entries:
+                    self._remove_locked(hit.entry_id)
+        if not agreed:
+            logger.info(
+                f"Semantic cache false hit (similarity={hit.similarity:.3f}, "
+                f"source overlap={overlap:.2f}): '{hit.matched_query[:40]}'"
+            )
+        return agreed
+    
+    def invalidate(self, collection: Optional[str] = None) -> int:
+        """Invalidate cache entries.
+        
+        Args:
+            collection: Collection to clear. If None, clears all.
+        
+        Returns:
+            Number of entries invalidated.
+        """
+        with self._lock:
+            if collection is None:
+                count = len(self._entries)
+                self._entries.clear()
+                self._indexes.clear()
+                return count
+            return self._drop_index_locked(collection)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            hit_rate = self._hits / total if total > 0 else 0.0
+            false_hit_rate = self._false_hits / self._verified if self._verified else 0.0
+            avg_similarity = self._similarity_sum / self._hits if self._hits else 0.0
+            return {
+                "enabled": True,
+                "hits": self._hits,
+                "misses": self._misses,
+                "expired": self._expired,
+                "hit_rate": round(hit_rate, 4),
+                "verified_hits": self._verified,
+                "false_hits": self._false_hits,
+                "false_hit_rate": round(false_hit_rate, 4),
+                "avg_hit_similarity": round(avg_similarity, 4),
+                "similarity_threshold": self.similarity_threshold,
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl_seconds,
+                "collections": {
+                    name: {"generation": index.generation, "size": sum(
+                        1 for entry_id in index.row_ids if entry_id is not None
+                    )}
+                    for name, index in self._indexes.items()
+                },
+            }
+    
+    def clear(self) -> None:
+        """Clear all cache entries and statistics."""
+        with self._lock:
+            self._entries.clear()
+            self._indexes.clear()
+            self._hits = 0
+            self._misses = 0
+            self._expired = 0
+            self._verified = 0
+            self._false_hits = 0
+            self._similarity_sum = 0.0
+    
+    # ===== Private Helper Methods =====
+    
+    @staticmethod
+    def _normalize(query_vector: Sequence[float]) -> Optional[np.ndarray]:
+        """Return the unit-length float32 vector (None for empty/zero vectors)."""
+        vector = np.asarray(query_vector, dtype=np.float32).reshape(-1)
+        norm = float(np.linalg.norm(vector)) if vector.size else 0.0
+        if norm == 0.0:
+            return None
+        return vector / norm
+    
+    @staticmethod
+    def _source_key(source: Dict[str, Any]) -> Optional[str]:
+        """Identity of a source for verification (chunk_id, else source path)."""
+        return source.get("chunk_id") or source.get("source") or None
+    
+    def _is_expired(self, cached: CachedAnswer) -> bool:
+        """Check if cache entry has expired."""
+        return (time.time() - cached.timestamp) > self.ttl_seconds
+    
+    def _current_index(self, name: str, generation: int) -> Optional[_CollectionIndex]:
+        """Index of *name* if it matches *generation* (caller holds lock).
+        
+        A newer generation means the collection was re-indexed: the old
+        index is dropped. An older one (request started before the bump)
+        simply misses.
+        """
+        index = self._indexes.get(name)
+        if index is None:
+            return None
+        if generation > index.generation:
+            self._drop_index_locked(name)
+            return None
+        if generation < index.generation:
+            return None
+        return index
+    
+    def _allocate_row(self, index: _CollectionIndex) -> int:
+        """Return a free row of *index*, growing its matrix if needed."""
+        if index.free_rows:
+            return index.free_rows.pop()
+        row = len(index.row_ids)
+        if row >= index.vectors.shape[0]:
+            grown = np.zeros((index.vectors.shape[0] * 2, index.dim), dtype=np.float32)
+            grown[:row] = index.vectors[:row]
+            index.vectors = grown
+        index.row_ids.append(None)
+        return row
+    
+    def _remove_locked(self, entry_id: int) -> None:
+        """Remove one entry and free its index row (caller holds lock)."""
+        entry = self._entries.pop(entry_id)
+        index = self._indexes.get(entry.collection)
+        if index is None or entry.row >= len(index.row_ids) or index.row_ids[entry.row] != entry_id:
+            return
+        index.row_ids[entry.row] = None
+        index.vectors[entry.row] = 0.0
+        index.free_rows.append(entry.row)
+        if len(index.free_rows) == len(index.row_ids):
+            del self._indexes[entry.collection]
+    
+    def _drop_index_locked(self, name: str) -> int:
+        """Drop a collection's index and its entries (caller holds lock)."""
+        index = self._indexes.pop(name, None)
+        if index is None:
+            return 0
+        dropped = 0
+        for entry_id in index.row_ids:
+            if entry_id is not None and entry_id in self._entries:
+                del self._entries[entry_id]
+                dropped += 1
+        return dropped
+
+
+# Global cache instance
+_semantic_answer_cache: Optional[SemanticAnswerCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_semantic_answer_cache(config: Optional[Any] = None) -> Optional[SemanticAnswerCache]:
+    """Get the global semantic answer cache.
+    
+    Args:
+        config: SemanticCacheSettings (settings.retrieval.semantic_cache),
+            used when the cache is first created. If omitted, the existing
+            cache is returned without creating one.
+    
+    Returns:
+        The cache, or None if it is disabled / not yet created.
+    """
+    global _semantic_answer_cache
+    if _semantic_answer_cache is None:
+        if config is None or not getattr(config, "enabled", False):
+            return None
+        with _cache_lock:
+            if _semantic_answer_cache is None:
+                _semantic_answer_cache = SemanticAnswerCache(
+                    max_size=config.max_size,
+                    ttl_seconds=config.ttl_seconds,
+                    similarity_threshold=config.similarity_threshold,
+                    verify_sample_rate=config.verify_sample_rate,
+                )
+    return _semantic_answer_cache
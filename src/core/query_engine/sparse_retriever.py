@@ -8,7 +8,8 @@ Search Engine, complementing the DenseRetriever's semantic search.
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+import threading
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from src.core.types import RetrievalResult
 
@@ -27,7 +28,8 @@ class SparseRetriever(BaseSparseRetriever):
     
     This class performs keyword-based retrieval by:
     1. Querying the BM25 index with keywords to get matching chunk IDs and scores
-    2. Fetching text and metadata from the vector store using get_by_ids()
+    2. Fetching text and metadata from the local ChunkDocStore, falling back
+       to the vector store's get_by_ids() only for chunks missing there
     3. Returning normalized RetrievalResult objects
     
     Design Principles Applied:
@@ -39,7 +41,10 @@ class SparseRetriever(BaseSparseRetriever):
     
     Attributes:
         bm25_indexer: The BM25 indexer for keyword search.
-        vector_store: The vector store for fetching text and metadata.
+        vector_store: The vector store for fetching text and metadata
+            missing from the docstore.
+        docstore: Optional ChunkDocStore used for every collection; None
+            uses the shared per-collection docstore.
         default_top_k: Default number of results to return.
         default_collection: Default BM25 index collection to query.
     
@@ -67,6 +72,7 @@ class SparseRetriever(BaseSparseRetriever):
         vector_store: Optional[BaseVectorStore] = None,
         default_top_k: int = 10,
         default_collection: str = "default",
+        docstore: Optional[Any] = None,
     ) -> None:
         """Initialize SparseRetriever with dependencies.
         
@@ -79,6 +85,7 @@ class SparseRetriever(BaseSparseRetriever):
             default_top_k: Default number of results to return (default: 10).
                            Can be overridden from settings.retrieval.sparse_top_k.
             default_collection: Default BM25 index collection name (default: "default").
+            docstore: Optional ChunkDocStore override (see Attributes).
         
         Note:
             Dependencies can be injected for testing (with mocks) or for
@@ -87,6 +94,16 @@ class SparseRetriever(BaseSparseRetriever):
         self.bm25_indexer = bm25_indexer
         self.vector_store = vector_store
         self.default_collection = default_collection
+        self.docstore = docstore
+        self._docstore_cache_size = getattr(
+            getattr(settings, "retrieval", None), "docstore_cache_size", 20000
+        )
+        
+        # Resident indexes: collection -> (generation, loaded indexer).
+        # Readers take a snapshot of the tuple without locking; a reload
+        # builds a fresh indexer and publishes it with a single dict store.
+        self._resident: Dict[str, Tuple[Optional[str], Any]] = {}
+        self._reload_lock = threading.Lock()
         
         # Extract default_top_k from settings if available
         self.default_top_k = default_top_k
@@ -123,8 +140,8 @@ class SparseRetriever(BaseSparseRetriever):
         
         Raises:
             ValueError: If keywords list is empty.
-            RuntimeError: If bm25_indexer or vector_store is not configured,
-                          or if the retrieval operation fails.
+            RuntimeError: If bm25_indexer is not configured, or if the
+                          retrieval operation fails.
         
         Example:
             >>> results = retriever.retrieve(["Azure", "OpenAI", "配置"])
@@ -145,7 +162,8 @@ class SparseRetriever(BaseSparseRetriever):
         )
         
         # Step 1: Ensure index is loaded
-        if not self._ensure_index_loaded(effective_collection):
+        indexer = self._ensure_index_loaded(effective_collection)
+        if indexer is None:
             logger.warning(
                 f"BM25 index for collection '{effective_collection}' not available. "
                 "Returning empty results."
@@ -154,7 +172,7 @@ class SparseRetriever(BaseSparseRetriever):
         
         # Step 2: Query BM25 index
         try:
-            bm25_results = self.bm25_indexer.query(
+            bm25_results = indexer.query(
                 query_terms=keywords,
                 top_k=effective_top_k,
                 trace=trace,
@@ -170,15 +188,9 @@ class SparseRetriever(BaseSparseRetriever):
             logger.debug("BM25 query returned no results")
             return []
         
-        # Step 3: Fetch text and metadata from vector store
+        # Step 3: Fetch text and metadata (docstore first, then vector store)
         chunk_ids = [r["chunk_id"] for r in bm25_results]
-        try:
-            records = self.vector_store.get_by_ids(chunk_ids, trace=trace)
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to fetch records from vector store: {e}. "
-                "Check vector store configuration and data availability."
-            ) from e
+        records = self._fetch_records(chunk_ids, effective_collection, trace)
         
         # Step 4: Merge BM25 scores with text/metadata
         results = self._merge_results(bm25_results, records)
@@ -186,6 +198,75 @@ class SparseRetriever(BaseSparseRetriever):
         logger.debug(f"Retrieved {len(results)} results for keywords")
         return results
     
+    def retrieve_batch(
+        self,
+        keywords_list: List[List[str]],
+        top_k: Optional[int] = None,
+        collection: Optional[str] = None,
+        trace: Optional[Any] = None,
+    ) -> List[List[RetrievalResult]]:
+        """Retrieve for several keyword lists at once.
+        
+        Indexers with ``query_batch`` (BM25Indexer) score all queries in
+        one pass; others are queried once per list.  Text and metadata for
+        the union of all hits are fetched with a single lookup.
+        
+        Args:
+            keywords_list: Keyword lists, one per query. None may be empty.
+            top_k: Maximum number of results per query. If None, uses default_top_k.
+            collection: BM25 index collection to query. If None, uses default_collection.
+            trace: Optional TraceContext for observability.
+        
+        Returns:
+            One result list per query, in input order.
+        
+        Raises:
+            ValueError: If any keywords list is empty.
+            RuntimeError: If bm25_indexer is not configured, or if the
+                          retrieval operation fails.
+        """
+        for keywords in keywords_list:
+            self._validate_keywords(keywords)
+        self._validate_dependencies()
+        
+        effective_top_k = top_k if top_k is not None else self.default_top_k
+        effective_collection = collection if collection is not None else self.default_collection
+        
+        indexer = self._ensure_index_loaded(effective_collection)
+        if indexer is None:
+            logger.warning(
+                f"BM25 index for collection '{effective_collection}' not available. "
+                "Returning empty results."
+            )
+            return [[] for _ in keywords_list]
+        
+        try:
+            query_batch = getattr(indexer, "query_batch", None)
+            if callable(query_batch):
+                bm25_batch = query_batch(keywords_list, top_k=effective_top_k, trace=trace)
+            else:
+                bm25_batch = [
+                    indexer.query(query_terms=keywords, top_k=effective_top_k, trace=trace)
+                    for keywords in keywords_list
+                ]
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to query BM25 index: {e}. "
+                "Check index availability and query terms."
+            ) from e
+        
+        chunk_ids = list(dict.fromkeys(
+            r["chunk_id"] for bm25_results in bm25_batch for r in bm25_results
+        ))
+        if not chunk_ids:
+            return [[] for _ in keywords_list]
+        records = dict(zip(chunk_ids, self._fetch_records(chunk_ids, effective_collection, trace)))
+        
+        return [
+            self._merge_results(bm25_results, [records[r["chunk_id"]] for r in bm25_results])
+            for bm25_results in bm25_batch
+        ]
+    
     def _validate_keywords(self, keywords: List[str]) -> None:
         """Validate the keywords list.
         
@@ -208,38 +289,172 @@ class SparseRetriever(BaseSparseRetriever):
         """Validate that required dependencies are configured.
         
         Raises:
-            RuntimeError: If bm25_indexer or vector_store is None.
+            RuntimeError: If bm25_indexer is None.
         """
         if self.bm25_indexer is None:
             raise RuntimeError(
                 "SparseRetriever requires a bm25_indexer. "
                 "Provide one during initialization or via setter."
             )
-        if self.vector_store is None:
-            raise RuntimeError(
-                "SparseRetriever requires a vector_store. "
-                "Provide one during initialization or via setter."
+    
+    def _fetch_records(
+        self,
+        chunk_ids: List[str],
+        collection: str,
+        trace: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
+        """Look up text and metadata for BM25 hits.
+        
+        Reads the chunk docstore first; only IDs it does not hold (chunks
+        ingested before the docstore existed) go to the vector store, and
+        what comes back is written to the docstore for next time.
+        
+        Args:
+            chunk_ids: Chunk IDs in BM25 rank order.
+            collection: Collection the IDs belong to.
+            trace: Optional TraceContext.
+        
+        Returns:
+            Records aligned with *chunk_ids* (empty dict when not found).
+        
+        Raises:
+            RuntimeError: If no record could be found in the docstore and
+                the vector store is missing or fails.
+        """
+        docstore = self._get_docstore(collection)
+        records: List[Dict[str, Any]] = [{} for _ in chunk_ids]
+        if docstore is not None:
+            try:
+                records = docstore.get_many(chunk_ids)
+            except Exception as e:
+                logger.warning(f"Chunk docstore read failed for collection '{collection}': {e}")
+        
+        missing = [cid for cid, record in zip(chunk_ids, records) if not record]
+        if not missing:
+            return records
+        
+        try:
+            if self.vector_store is None:
+                raise RuntimeError("no vector_store configured")
+            fetched = self.vector_store.get_by_ids(missing, trace=trace)
+        except Exception as e:
+            if len(missing) == len(chunk_ids):
+                raise RuntimeError(
+                    f"Failed to fetch records from vector store: {e}. "
+                    "Check vector store configuration and data availability."
+                ) from e
+            logger.warning(
+                f"Vector store lookup failed for {len(missing)} chunks missing from "
+                f"the docstore; returning {len(chunk_ids) - len(missing)} docstore hits: {e}"
             )
+            return records
+        
+        by_id = {r["id"]: r for r in fetched if r}
+        if docstore is not None and by_id:
+            try:
+                docstore.put_many(list(by_id.values()))
+            except Exception as e:
+                logger.warning(f"Chunk docstore backfill failed: {e}")
+        return [record or by_id.get(cid, {}) for cid, record in zip(chunk_ids, records)]
+    
+    def _get_docstore(self, collection: str) -> Optional[Any]:
+        """Return the docstore for *collection*, or None if it cannot be opened."""
+        if self.docstore is not None:
+            return self.docstore
+        try:
+            from src.ingestion.storage.chunk_docstore import get_chunk_docstore
+            return get_chunk_docstore(collection, cache_size=self._docstore_cache_size)
+        except Exception as e:
+            logger.warning(f"Chunk docstore unavailable for collection '{collection}': {e}")
+            return None
     
-    def _ensure_index_loaded(self, collection: str) -> bool:
-        """Ensure the BM25 index is loaded for the given collection.
+    def _ensure_index_loaded(self, collection: str) -> Optional[Any]:
+        """Return a loaded indexer for the given collection.
         
-        Always reloads from disk because the index may have been updated
-        by another process (e.g., dashboard ingestion).  The load is
-        fast (a single JSON file read) compared to the overall query.
+        Indexers that expose ``get_generation()`` (BM25Indexer) are kept
+        resident: the on-disk generation token is checked on each call and
+        the index is only re-read when another writer (e.g. dashboard
+        ingestion) has saved a new version, reusing unchanged segments.  The fresh index is loaded into
+        a separate indexer instance and then published atomically, so
+        concurrent queries always see either the old or the new index,
+        never a half-loaded one.
+        
+        Indexers without generation support fall back to a load per call.
         
         Args:
             collection: The collection name to load.
         
         Returns:
-            True if index is loaded and ready, False otherwise.
+            The indexer to query, or None if no index is available.
         """
+        get_generation = getattr(self.bm25_indexer, "get_generation", None)
+        if not callable(get_generation):
+            try:
+                loaded = self.bm25_indexer.load(collection=collection)
+            except Exception as e:
+                logger.warning(f"Failed to load BM25 index for collection '{collection}': {e}")
+                return None
+            return self.bm25_indexer if loaded else None
+        
         try:
-            loaded = self.bm25_indexer.load(collection=collection)
-            return loaded
+            generation = get_generation(collection)
         except Exception as e:
-            logger.warning(f"Failed to load BM25 index for collection '{collection}': {e}")
-            return False
+            logger.warning(f"Failed to read BM25 generation for collection '{collection}': {e}")
+            generation = None
+        
+        resident = self._resident.get(collection)
+        if generation is None:
+            # Index removed from disk (e.g. collection cleared)
+            if resident is not None:
+                self._resident.pop(collection, None)
+            return None
+        if resident is not None and resident[0] == generation:
+            return resident[1]
+        
+        with self._reload_lock:
+            # Another thread may have reloaded while we waited
+            resident = self._resident.get(collection)
+            if resident is not None and resident[0] == generation:
+                return resident[1]
+            
+            fresh = self._new_indexer()
+            if resident is not None and callable(getattr(fresh, "share_segments_from", None)):
+                # Segments are immutable: only changed ones are read from disk
+                fresh.share_segments_from(resident[1])
+            try:
+                if not fresh.load(collection=collection):
+                    self._resident.pop(collection, None)
+                    return None
+            except Exception as e:
+                logger.warning(f"Failed to load BM25 index for collection '{collection}': {e}")
+                # Keep serving the previous index rather than failing queries
+                return resident[1] if resident is not None else None
+            
+            loaded_generation = getattr(fresh, "generation", None) or generation
+            self._resident[collection] = (loaded_generation, fresh)
+            logger.info(
+                f"BM25 index for collection '{collection}' loaded "
+                f"(generation={loaded_generation})"
+            )
+            return fresh
+    
+    def _new_indexer(self) -> Any:
+        """Create an empty indexer configured like ``self.bm25_indexer``.
+        
+        Returns:
+            A new indexer instance of the same type, index_dir and BM25 params
+            (and query encoder, for LearnedSparseIndexer).
+        """
+        template = self.bm25_indexer
+        kwargs: Dict[str, Any] = {}
+        if hasattr(template, "query_encoder"):
+            kwargs["query_encoder"] = template.query_encoder
+        return type(template)(
+            index_dir=str(template.index_dir),
+            k1=template.k1,
+            b=template.b,
+            **kwargs,
+        )
     
     def _merge_results(
         self,
@@ -264,7 +479,7 @@ class SparseRetriever(BaseSparseRetriever):
             # Handle case where record was not found
             if not record:
                 logger.warning(
-                    f"No record found in vector store for chunk_id='{chunk_id}'. "
+                    f"No record found in docstore or vector store for chunk_id='{chunk_id}'. "
                     "Skipping this result."
                 )
                 continue
@@ -296,18 +511,22 @@ def create_sparse_retriever(
     bm25_indexer: Optional[BM25Indexer] = None,
     vector_store: Optional[BaseVectorStore] = None,
     index_dir: str = "data/db/bm25",
+    embedding_client: Optional[Any] = None,
 ) -> SparseRetriever:
     """Factory function to create a SparseRetriever with optional dependency injection.
     
     Supports two sparse indexer backends based on ``settings.retrieval.sparse_provider``:
     - ``"bm25"`` (default): Python BM25Indexer with Pickle storage.
     - ``"tantivy"``: Rust Tantivy engine with Mmap disk indexing.
+    - ``"bge_m3"``: LearnedSparseIndexer over BGE-M3 lexical weights.
     
     Args:
         settings: Application settings.
         bm25_indexer: Optional pre-configured indexer (overrides provider selection).
         vector_store: Optional pre-configured vector store.
         index_dir: Directory for BM25 index files (default: "data/db/bm25").
+        embedding_client: Embedding that encodes queries for "bge_m3" (pass
+            the dense retriever's client to share the model).
     
     Returns:
         Configured SparseRetriever instance.
@@ -329,6 +548,14 @@ def create_sparse_retriever(
             tantivy_dir = index_dir.replace("bm25", "tantivy")
             bm25_indexer = TantivyIndexer(index_dir=tantivy_dir)
             logger.info(f"SparseRetriever: Using TantivyIndexer (dir={tantivy_dir})")
+        elif sparse_provider == "bge_m3":
+            from src.ingestion.storage.learned_sparse_indexer import LearnedSparseIndexer
+            if embedding_client is None:
+                from src.libs.embedding.embedding_factory import EmbeddingFactory
+                embedding_client = EmbeddingFactory.create(settings)
+            learned_dir = index_dir.replace("bm25", "learned_sparse")
+            bm25_indexer = LearnedSparseIndexer(index_dir=learned_dir, query_encoder=embedding_client)
+            logger.info(f"SparseRetriever: Using LearnedSparseIndexer (dir={learned_dir})")
         else:
             from src.ingestion.storage.bm25_indexer import BM25Indexer
             bm25_indexer = BM25Indexer(index_dir=index_dir)
@@ -4,6 +4,7 @@ import re
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, TYPE_CHECKING
 
+from src.core.query_engine.decision_cache import get_decision_cache
 from src.libs.llm.base_llm import Message
 
 if TYPE_CHECKING:
@@ -32,6 +33,7 @@ class StrategyRouter:
     
     Uses LLM-based intent recognition or rule-based patterns to decide 
     whether to apply Parent Document Retrieval and GraphRAG for a given query.
+    LLM decisions are cached per normalized query (DecisionCache).
     """
 
     def __init__(
@@ -53,18 +55,34 @@ class StrategyRouter:
         retrieval_cfg = getattr(settings, "retrieval", None)
         self.parent_mode = getattr(retrieval_cfg, "parent_retrieval_mode", "never")
         self.graph_mode = getattr(retrieval_cfg, "graph_rag_mode", "never")
+        self._cache = get_decision_cache(
+            max_size=getattr(retrieval_cfg, "decision_cache_size", 2000),
+            ttl_seconds=getattr(retrieval_cfg, "decision_cache_ttl_seconds", 3600.0),
+        )
         
         logger.info(
             f"StrategyRouter initialized: parent_mode={self.parent_mode}, "
             f"graph_mode={self.graph_mode}, llm={llm is not None}"
         )
 
-    def route(self, query: str, trace: Optional[Any] = None) -> RoutingDecision:
+    @property
+    def uses_llm(self) -> bool:
+        """True if :meth:`route` may call the LLM (an LLM and an 'auto' mode)."""
+        return self.llm is not None and "auto" in (self.parent_mode, self.graph_mode)
+
+    def route(
+        self,
+        query: str,
+        trace: Optional[Any] = None,
+        allow_llm: bool = True,
+    ) -> RoutingDecision:
         """Route query to appropriate retrieval strategies.
         
         Args:
             query: User's raw query string.
             trace: Optional trace context.
+            allow_llm: If False, only a cached LLM decision is used; otherwise
+                the pattern fallback decides (no LLM round-trip).
             
         Returns:
             RoutingDecision containing flags for parent retrieval and GraphRAG.
@@ -94,8 +112,12 @@ class StrategyRouter:
         # Try LLM first if available, otherwise fallback to patterns
         decision = None
         if self.llm is not None:
-            logger.info("[Thinking] Routing: Analyzing query intent with LLM...")
-            decision = self._route_with_ll(query, trace=trace)
+            decision = self._cache.get("route", query)
+            if decision is None and allow_llm:
+                logger.info("[Thinking] Routing: Analyzing query intent with LLM...")
+                decision = self._route_with_ll(query, trace=trace)
+                if decision is not None:
+                    self._cache.put("route", query, decision)
             
         if decision is None:
             logger.info("[Thinking] Routing: Using pattern matching for strategy selection...")
@@ -118,6 +118,59 @@ def _parse_retrieval_mode(
     )
 
 
+def _parse_semantic_cache(retrieval: Dict[str, Any]) -> "SemanticCacheSettings":
+    """Parse the optional retrieval.semantic_cache section."""
+    data = retrieval.get("semantic_cache")
+    if not isinstance(data, dict):
+        return SemanticCacheSettings()
+    return SemanticCacheSettings(
+        enabled=bool(data.get("enabled", False)),
+        similarity_threshold=float(data.get("similarity_threshold", 0.92)),
+        max_size=int(data.get("max_size", 1000)),
+        ttl_seconds=float(data.get("ttl_seconds", 86400.0)),
+        verify_sample_rate=float(data.get("verify_sample_rate", 0.1)),
+    )
+
+
+def _parse_onnx_rerank(rerank: Dict[str, Any]) -> "OnnxRerankSettings":
+    """Parse the optional rerank.onnx section."""
+    data = rerank.get("onnx")
+    if not isinstance(data, dict):
+        return OnnxRerankSettings()
+    return OnnxRerankSettings(
+        model_dir=str(data.get("model_dir", "data/models/onnx")),
+        quantize=bool(data.get("quantize", True)),
+        num_threads=int(data.get("num_threads", 0)),
+        max_length=int(data.get("max_length", 384)),
+        batch_size=int(data.get("batch_size", 16)),
+    )
+
+
+def _parse_rerank_score_cache(rerank: Dict[str, Any]) -> "RerankScoreCacheSettings":
+    """Parse the optional rerank.score_cache section."""
+    data = rerank.get("score_cache")
+    if not isinstance(data, dict):
+        return RerankScoreCacheSettings()
+    return RerankScoreCacheSettings(
+        enabled=bool(data.get("enabled", True)),
+        max_size=int(data.get("max_size", 200000)),
+        cache_dir=data.get("cache_dir", "data/cache/rerank_scores") or None,
+    )
+
+
+def _parse_rerank_cascade(rerank: Dict[str, Any]) -> "RerankCascadeSettings":
+    """Parse the optional rerank.cascade section."""
+    data = rerank.get("cascade")
+    if not isinstance(data, dict):
+        return RerankCascadeSettings()
+    return RerankCascadeSettings(
+        enabled=bool(data.get("enabled", False)),
+        prune_to=int(data.get("prune_to", 12)),
+        skip_margin=float(data.get("skip_margin", 0.0)),
+        keep_boosted=bool(data.get("keep_boosted", True)),
+    )
+
+
 def _parse_embedding_settings(embedding: Dict[str, Any]) -> "EmbeddingSettings":
     """Parse embedding settings including optional BGE-M3 config."""
     bge_m3_config = None
@@ -140,6 +193,8 @@ def _parse_embedding_settings(embedding: Dict[str, Any]) -> "EmbeddingSettings":
         deployment_name=embedding.get("deployment_name"),
         base_url=embedding.get("base_url"),
         bge_m3=bge_m3_config,
+        cache_dir=embedding.get("cache_dir", "data/cache/embeddings") or None,
+        cache_dtype=str(embedding.get("cache_dtype", "float32")),
     )
 
 
@@ -174,6 +229,45 @@ def _parse_ingestion_settings(ingestion: Dict[str, Any]) -> "IngestionSettings":
                 max_hops=gr_data.get("max_hops", 1),
             )
     
+    pipelining_config = None
+    pl_data = ingestion.get("pipelining")
+    if isinstance(pl_data, dict):
+        pipelining_config = PipeliningConfig(
+            enabled=pl_data.get("enabled", True),
+            load_workers=int(pl_data.get("load_workers", 1)),
+            transform_workers=int(pl_data.get("transform_workers", 2)),
+            embed_workers=int(pl_data.get("embed_workers", 1)),
+            queue_size=int(pl_data.get("queue_size", 2)),
+        )
+    
+    process_pool_config = None
+    pp_data = ingestion.get("process_pool")
+    if isinstance(pp_data, dict):
+        process_pool_config = ProcessPoolConfig(
+            enabled=pp_data.get("enabled", False),
+            max_workers=int(pp_data.get("max_workers", 0)),
+        )
+    
+    worker_config = None
+    wk_data = ingestion.get("worker")
+    if isinstance(wk_data, dict):
+        worker_config = WorkerConfig(
+            concurrency=int(wk_data.get("concurrency", 2)),
+            retry_backoff=float(wk_data.get("retry_backoff", 5.0)),
+            max_backoff=float(wk_data.get("max_backoff", 300.0)),
+            metrics_interval=float(wk_data.get("metrics_interval", 60.0)),
+        )
+    
+    layout_pdf_config = None
+    lp_data = ingestion.get("layout_pdf")
+    if isinstance(lp_data, dict):
+        layout_pdf_config = LayoutPdfConfig(
+            page_workers=int(lp_data.get("page_workers", 1)),
+            min_pages_per_worker=int(lp_data.get("min_pages_per_worker", 16)),
+            ocr_batch_size=int(lp_data.get("ocr_batch_size", 8)),
+            render_cache_dir=lp_data.get("render_cache_dir") or "",
+        )
+    
     # Parse Redis settings (optional)
     redis_config: Optional[RedisSettings] = None
     redis_data = ingestion.get("redis")
@@ -192,11 +286,18 @@ def _parse_ingestion_settings(ingestion: Dict[str, Any]) -> "IngestionSettings":
         splitter=_require_str(ingestion, "splitter", "ingestion"),
         batch_size=_require_int(ingestion, "batch_size", "ingestion"),
         pdf_parser=ingestion.get("pdf_parser", "markitdown"),
+        embedding_concurrency=int(ingestion.get("embedding_concurrency", 4)),
+        embedding_max_retries=int(ingestion.get("embedding_max_retries", 3)),
+        diff_reingest=bool(ingestion.get("diff_reingest", False)),
         chunk_refiner=ingestion.get("chunk_refiner"),
         metadata_enricher=ingestion.get("metadata_enricher"),
         context_enricher=context_enricher_config,
         parent_retrieval=parent_retrieval_config,
         graph_rag=graph_rag_config,
+        pipelining=pipelining_config,
+        process_pool=process_pool_config,
+        worker=worker_config,
+        layout_pdf=layout_pdf_config,
         queue_backend=ingestion.get("queue_backend", "memory"),
         redis=redis_config,
     )
@@ -239,6 +340,9 @@ class EmbeddingSettings:
     base_url: Optional[str] = None
     # BGE-M3 specific config
     bge_m3: Optional[BGEM3Config] = None
+    # Persistent embedding cache (memory-mapped); empty cache_dir disables it
+    cache_dir: Optional[str] = "data/cache/embeddings"
+    cache_dtype: str = "float32"  # float32 / float16
 
 
 @dataclass(frozen=True)
@@ -248,6 +352,16 @@ class VectorStoreSettings:
     collection_name: str
 
 
+@dataclass(frozen=True)
+class SemanticCacheSettings:
+    """Semantic (near-duplicate question) answer cache configuration."""
+    enabled: bool = False
+    similarity_threshold: float = 0.92  # cosine similarity to serve a cached answer
+    max_size: int = 1000  # cached answers across all collections (LRU)
+    ttl_seconds: float = 86400.0
+    verify_sample_rate: float = 0.1  # fraction of hits re-checked against fresh retrieval
+
+
 @dataclass(frozen=True)
 class RetrievalSettings:
     dense_top_k: int
@@ -258,7 +372,17 @@ class RetrievalSettings:
     hyde_enabled: bool = False   # HyDE (Hypothetical Document Embedding)
     parent_retrieval_mode: str = "never"
     graph_rag_mode: str = "never"
-    sparse_provider: str = "bm25"  # bm25 | tantivy
+    sparse_provider: str = "bm25"  # bm25 | tantivy | bge_m3 (learned lexical weights)
+    engine_pool_size: int = 4  # cached per-collection HybridSearch engines
+    engine_idle_seconds: float = 1800.0  # evict engines idle this long (0 = never)
+    rewrite_deadline_ms: int = 1500  # skip LLM rewrite variants arriving later
+    routing_grace_ms: int = 0  # extra wait for LLM routing after retrieval
+    search_executor_workers: int = 8  # threads for blocking retrieval stages
+    llm_executor_workers: int = 4  # threads for speculative LLM rewrite/routing
+    decision_cache_size: int = 2000  # cached rewrite/routing decisions
+    decision_cache_ttl_seconds: float = 3600.0
+    docstore_cache_size: int = 20000  # hot chunks kept in memory per collection docstore
+    semantic_cache: SemanticCacheSettings = field(default_factory=SemanticCacheSettings)
 
     @property
     def parent_retrieval_enabled(self) -> bool:
@@ -271,12 +395,45 @@ class RetrievalSettings:
         return self.graph_rag_mode == "always"
 
 
+@dataclass(frozen=True)
+class OnnxRerankSettings:
+    """ONNX Runtime options for the ``onnx`` rerank provider."""
+    model_dir: str = "data/models/onnx"  # exported/quantized models
+    quantize: bool = True  # int8 dynamic quantization
+    num_threads: int = 0  # intra-op threads (0 = physical cores)
+    max_length: int = 384  # token budget per (query, passage) pair
+    batch_size: int = 16
+
+
+@dataclass(frozen=True)
+class RerankScoreCacheSettings:
+    """Pair-level (query, passage) score cache for pointwise rerankers."""
+    enabled: bool = True
+    max_size: int = 200000  # cached pair scores
+    # Persistent mmap store; empty cache_dir keeps scores in memory only
+    cache_dir: Optional[str] = "data/cache/rerank_scores"
+
+
+@dataclass(frozen=True)
+class RerankCascadeSettings:
+    """Two-stage rerank: cheap embedding prefilter before the cross-encoder."""
+    enabled: bool = False
+    prune_to: int = 12  # candidates the cross-encoder scores (0 = no pruning)
+    # Skip reranking when the fused top score leads the runner-up by this
+    # relative margin, (s1 - s2) / s1 (0 = never skip)
+    skip_margin: float = 0.0
+    keep_boosted: bool = True  # filename-boosted candidates always get reranked
+
+
 @dataclass(frozen=True)
 class RerankSettings:
     enabled: bool
     provider: str
     model: str
     top_k: int
+    onnx: OnnxRerankSettings = field(default_factory=OnnxRerankSettings)
+    score_cache: RerankScoreCacheSettings = field(default_factory=RerankScoreCacheSettings)
+    cascade: RerankCascadeSettings = field(default_factory=RerankCascadeSettings)
 
 
 @dataclass(frozen=True)
@@ -348,6 +505,41 @@ class GraphRAGConfig:
     max_hops: int = 1
 
 
+@dataclass(frozen=True)
+class PipeliningConfig:
+    """Cross-file stage pipelining for multi-file ingestion."""
+    enabled: bool = True
+    load_workers: int = 1  # Files hashed/parsed/chunked concurrently
+    transform_workers: int = 2
+    embed_workers: int = 1
+    queue_size: int = 2  # Files buffered between stages (backpressure)
+
+
+@dataclass(frozen=True)
+class ProcessPoolConfig:
+    """Worker processes for CPU-bound parsing, chunking and tokenization."""
+    enabled: bool = False
+    max_workers: int = 0  # 0 = os.cpu_count()
+
+
+@dataclass(frozen=True)
+class WorkerConfig:
+    """Queue-consuming IngestionWorker (src/ingestion/worker.py)."""
+    concurrency: int = 2  # Tasks processed at once
+    retry_backoff: float = 5.0  # Seconds before the first retry (doubles per attempt)
+    max_backoff: float = 300.0
+    metrics_interval: float = 60.0  # Seconds between metrics log lines (0 = off)
+
+
+@dataclass(frozen=True)
+class LayoutPdfConfig:
+    """Page-parallel parsing and OCR of LayoutPdfLoader (pdf_parser: layout)."""
+    page_workers: int = 1  # Processes parsing page ranges of one PDF (1 = in-process)
+    min_pages_per_worker: int = 16  # Smaller PDFs use fewer workers
+    ocr_batch_size: int = 8  # Scanned pages per OCR batch (one Tesseract run; PaddleOCR stays per page)
+    render_cache_dir: str = "data/cache/page_renders"  # Per-page render/OCR cache ("" = off)
+
+
 @dataclass(frozen=True)
 class IngestionSettings:
     chunk_size: int
@@ -355,11 +547,18 @@ class IngestionSettings:
     splitter: str
     batch_size: int
     pdf_parser: str = "markitdown"  # Options: markitdown, layout
+    embedding_concurrency: int = 4  # Max in-flight embedding API requests
+    embedding_max_retries: int = 3  # Retries per batch on 429 / transient errors
+    diff_reingest: bool = False  # force re-ingestion only redoes changed chunks
     chunk_refiner: Optional[Dict[str, Any]] = None  # 动态配置
     metadata_enricher: Optional[Dict[str, Any]] = None  # 动态配置
     context_enricher: Optional[ContextEnricherConfig] = None  # 上下文注入配置
     parent_retrieval: Optional[ParentRetrievalConfig] = None
     graph_rag: Optional[GraphRAGConfig] = None
+    pipelining: Optional[PipeliningConfig] = None
+    process_pool: Optional[ProcessPoolConfig] = None
+    worker: Optional[WorkerConfig] = None
+    layout_pdf: Optional[LayoutPdfConfig] = None
     queue_backend: str = "memory"  # memory | redis
     redis: Optional[RedisSettings] = None
 
@@ -455,12 +654,25 @@ class Settings:
                     "graph_rag_enabled",
                 ),
                 sparse_provider=retrieval.get("sparse_provider", "bm25"),
+                engine_pool_size=int(retrieval.get("engine_pool_size", 4)),
+                engine_idle_seconds=float(retrieval.get("engine_idle_seconds", 1800.0)),
+                rewrite_deadline_ms=int(retrieval.get("rewrite_deadline_ms", 1500)),
+                routing_grace_ms=int(retrieval.get("routing_grace_ms", 0)),
+                search_executor_workers=int(retrieval.get("search_executor_workers", 8)),
+                llm_executor_workers=int(retrieval.get("llm_executor_workers", 4)),
+                decision_cache_size=int(retrieval.get("decision_cache_size", 2000)),
+                decision_cache_ttl_seconds=float(retrieval.get("decision_cache_ttl_seconds", 3600.0)),
+                docstore_cache_size=int(retrieval.get("docstore_cache_size", 20000)),
+                semantic_cache=_parse_semantic_cache(retrieval),
             ),
             rerank=RerankSettings(
                 enabled=_require_bool(rerank, "enabled", "rerank"),
                 provider=_require_str(rerank, "provider", "rerank"),
                 model=_require_str(rerank, "model", "rerank"),
                 top_k=_require_int(rerank, "top_k", "rerank"),
+                onnx=_parse_onnx_rerank(rerank),
+                score_cache=_parse_rerank_score_cache(rerank),
+                cascade=_parse_rerank_cascade(rerank),
             ),
             evaluation=EvaluationSettings(
                 enabled=_require_bool(evaluation, "enabled", "evaluation"),
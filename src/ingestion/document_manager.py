@@ -16,6 +16,8 @@ import logging
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
+from src.core.query_engine.cache_generation import bump_cache_generation
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,6 +79,8 @@ class DocumentManager:
         bm25_indexer: BM25Indexer instance (sparse index).
         image_storage: ImageStorage instance (image files + SQLite index).
         file_integrity: SQLiteIntegrityChecker instance (ingestion history).
+        docstore: Optional ChunkDocStore; defaults to the shared docstore of
+            the collection being modified.
     """
 
     def __init__(
@@ -85,11 +89,13 @@ class DocumentManager:
         bm25_indexer: Any,
         image_storage: Any,
         file_integrity: Any,
+        docstore: Optional[Any] = None,
     ) -> None:
         self.chroma = chroma_store
         self.bm25 = bm25_indexer
         self.images = image_storage
         self.integrity = file_integrity
+        self.docstore = docstore
 
     # ------------------------------------------------------------------
     # list_documents
@@ -235,6 +241,16 @@ class DocumentManager:
         except Exception as e:
             result.errors.append(f"ChromaDB delete failed: {e}")
 
+        # 1b. Chunk docstore – same chunks (and parent chunks) by doc_hash
+        try:
+            docstore = self.docstore
+            if docstore is None:
+                from src.ingestion.storage.chunk_docstore import get_chunk_docstore
+                docstore = get_chunk_docstore(collection)
+            docstore.delete_by_doc_hash(source_hash)
+        except Exception as e:
+            result.errors.append(f"Docstore delete failed: {e}")
+
         # 2. BM25 – remove postings for this document
         try:
             result.bm25_removed = self.bm25.remove_document(
@@ -265,6 +281,9 @@ class DocumentManager:
         if result.errors:
             result.success = False
 
+        # 5. Retire cached retrievals/answers that may cite this document
+        bump_cache_generation(collection)
+
         return result
 
     # ------------------------------------------------------------------
@@ -4,11 +4,19 @@ Embedding Module.
 This package contains embedding components:
 - Dense encoder
 - Sparse encoder (BM25)
+- Learned sparse encoder (BGE-M3 lexical weights)
 - Batch processor
 """
 
 from src.ingestion.embedding.dense_encoder import DenseEncoder
 from src.ingestion.embedding.sparse_encoder import SparseEncoder
+from src.ingestion.embedding.learned_sparse_encoder import LearnedSparseEncoder
 from src.ingestion.embedding.batch_processor import BatchProcessor, BatchResult
 
-__all__ = ["DenseEncoder", "SparseEncoder", "BatchProcessor", "BatchResult"]
+__all__ = [
+    "DenseEncoder",
+    "SparseEncoder",
+    "LearnedSparseEncoder",
+    "BatchProcessor",
+    "BatchResult",
+]
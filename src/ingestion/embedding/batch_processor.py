@@ -9,18 +9,27 @@ Design Principles:
 - Observable: Records batch timing and statistics via TraceContext
 - Error Handling: Individual batch failures don't crash entire pipeline
 - Deterministic: Same inputs produce same batching and results
+- Reuse First: Reusable dense vectors are looked up once for all chunks,
+  so batches only call the embedding API for changed texts
+- Pipelined: Batches run concurrently (bounded by max_concurrency and the
+  encoder's adaptive rate limiter) and are reassembled in input order
+- Single Pass: A LearnedSparseEncoder takes its weights from the dense
+  model call (embed_with_sparse) instead of tokenizing the chunks again
+- Precomputed Sparse: Term statistics computed elsewhere (the ingestion
+  process pool) are sliced per batch instead of being encoded again
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 import logging
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 
 logger = logging.getLogger(__name__)
 
 from src.core.types import Chunk
 from src.ingestion.embedding.dense_encoder import DenseEncoder
+from src.ingestion.embedding.learned_sparse_encoder import LearnedSparseEncoder
 from src.ingestion.embedding.sparse_encoder import SparseEncoder
 
 
@@ -35,6 +44,10 @@ class BatchResult:
         total_time: Total processing time in seconds
         successful_chunks: Number of successfully processed chunks
         failed_chunks: Number of chunks that failed processing
+        reused_vectors: Dense vectors reused from the chunk embedding cache
+            or the vector store instead of being embedded
+        failed_indices: Input indices of chunks whose batch failed after
+            retries (excluded from dense_vectors and sparse_stats)
     """
     dense_vectors: List[List[float]]
     sparse_stats: List[Dict[str, Any]]
@@ -42,6 +55,8 @@ class BatchResult:
     total_time: float
     successful_chunks: int
     failed_chunks: int
+    reused_vectors: int = 0
+    failed_indices: List[int] = field(default_factory=list)
 
 
 class BatchProcessor:
@@ -53,7 +68,7 @@ class BatchProcessor:
     
     Design:
     - Stateless: No state maintained between process() calls
-    - Parallel Encodings: Dense and sparse encoding happen independently
+    - Parallel Batches: Up to max_concurrency batches are encoded at once
     - Metrics Collection: Records batch-level timing for observability
     - Order Preservation: Output order matches input chunk order
     
@@ -84,49 +99,69 @@ class BatchProcessor:
     def __init__(
         self,
         dense_encoder: DenseEncoder,
-        sparse_encoder: SparseEncoder,
+        sparse_encoder: Union[SparseEncoder, LearnedSparseEncoder],
         batch_size: int = 100,
+        max_concurrency: Optional[int] = None,
     ):
         """Initialize BatchProcessor.
         
         Args:
             dense_encoder: DenseEncoder instance for embedding generation
-            sparse_encoder: SparseEncoder instance for term statistics
+            sparse_encoder: SparseEncoder instance for term statistics, or a
+                LearnedSparseEncoder fed by the dense encoding pass
             batch_size: Number of chunks to process per batch (default: 100)
+            max_concurrency: Batches encoded at once (default: the dense
+                encoder's rate limiter maximum). In-flight API calls are
+                further bounded by that limiter's adaptive limit.
         
         Raises:
-            ValueError: If batch_size <= 0
+            ValueError: If batch_size <= 0 or max_concurrency <= 0
         """
         if batch_size <= 0:
             raise ValueError(f"batch_size must be positive, got {batch_size}")
+        if max_concurrency is None:
+            max_concurrency = dense_encoder.rate_limiter.max_concurrency
+        if max_concurrency <= 0:
+            raise ValueError(f"max_concurrency must be positive, got {max_concurrency}")
         
         self.dense_encoder = dense_encoder
         self.sparse_encoder = sparse_encoder
         self.batch_size = batch_size
+        self.max_concurrency = max_concurrency
+    
+    @property
+    def shares_dense_pass(self) -> bool:
+        """True if sparse weights come from the dense encoder's model call."""
+        return bool(getattr(self.sparse_encoder, "shares_dense_pass", False))
     
     def process(
         self,
         chunks: List[Chunk],
         trace: Optional[Any] = None,
+        sparse_stats: Optional[List[Dict[str, Any]]] = None,
     ) -> BatchResult:
         """Process chunks through dense and sparse encoding pipeline.
         
         Workflow:
         1. Validate inputs
-        2. Create batches from chunks
-        3. Process each batch through both encoders
-        4. Collect results and timing metrics
-        5. Record to TraceContext if provided
+        2. Look up reusable dense vectors for all chunks (one lookup)
+        3. Create batches from chunks
+        4. Process batches concurrently through both encoders (dense embeds
+           misses only; rate-limited batches are retried by the encoder)
+        5. Reassemble results in input order, collect timing metrics
+        6. Record to TraceContext if provided
         
         Args:
             chunks: List of Chunk objects to process
             trace: Optional TraceContext for observability
+            sparse_stats: Optional precomputed term statistics aligned with
+                chunks; the sparse encoder is then not called
         
         Returns:
             BatchResult containing vectors, statistics, and metrics
         
         Raises:
-            ValueError: If chunks list is empty
+            ValueError: If chunks list is empty or sparse_stats is misaligned
             RuntimeError: If both encoders fail completely
         
         Example:
@@ -138,82 +173,70 @@ class BatchProcessor:
         """
         if not chunks:
             raise ValueError("Cannot process empty chunks list")
+        if sparse_stats is not None and len(sparse_stats) != len(chunks):
+            raise ValueError(
+                f"Got {len(sparse_stats)} sparse stats for {len(chunks)} chunks"
+            )
         
         start_time = time.time()
         
+        # Reusable vectors for the whole document in one cache/store lookup
+        # (not with learned sparse weights: the model runs for every chunk)
+        known_vectors: Optional[List[Optional[List[float]]]] = None
+        reused_vectors = 0
+        if self.dense_encoder.reuse_enabled and not self.shares_dense_pass:
+            try:
+                known_vectors, reuse_counts = self.dense_encoder.lookup_reusable(chunks)
+            except ValueError:
+                # Invalid chunk text: let the per-batch encode report it
+                known_vectors, reuse_counts = None, {}
+            reused_vectors = reuse_counts.get("cache", 0) + reuse_counts.get("vector_store", 0)
+            if reused_vectors:
+                logger.info(
+                    f"Reusing {reused_vectors}/{len(chunks)} dense vectors "
+                    f"(cache={reuse_counts['cache']}, vector_store={reuse_counts['vector_store']})"
+                )
+            if trace:
+                trace.record_stage("dense_reuse", dict(reuse_counts, total_chunks=len(chunks)))
+        
         # Create batches
         batches = self._create_batches(chunks)
         batch_count = len(batches)
         
-        # Process all batches
+        # Process all batches, up to max_concurrency at a time
+        def _run(batch_idx: int) -> Tuple[Optional[List[List[float]]], Optional[List[Dict[str, Any]]]]:
+            offset = batch_idx * self.batch_size
+            batch = batches[batch_idx]
+            batch_known = (
+                known_vectors[offset:offset + len(batch)] if known_vectors is not None else None
+            )
+            batch_sparse = (
+                sparse_stats[offset:offset + len(batch)] if sparse_stats is not None else None
+            )
+            return self._process_batch(batch_idx, batch, batch_known, trace, batch_sparse)
+        
+        workers = min(self.max_concurrency, batch_count)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(_run, range(batch_count)))
+        else:
+            outcomes = [_run(batch_idx) for batch_idx in range(batch_count)]
+        
+        # Reassemble in input order
         dense_vectors: List[List[float]] = []
-        sparse_stats: List[Dict[str, Any]] = []
-        successful_chunks = 0
-        failed_chunks = 0
+        sparse_stats = []
+        failed_indices: List[int] = []
         
-        for batch_idx, batch in enumerate(batches):
-            batch_start = time.time()
-            
-            try:
-                # Parallel encoding: Dense and Sparse run concurrently
-                batch_dense = None
-                batch_sparse = None
-                dense_error = None
-                sparse_error = None
-                
-                with ThreadPoolExecutor(max_workers=2) as executor:
-                    dense_future = executor.submit(self.dense_encoder.encode, batch, trace)
-                    sparse_future = executor.submit(self.sparse_encoder.encode, batch, trace)
-                    
-                    try:
-                        batch_dense = dense_future.result()
-                    except Exception as e:
-                        dense_error = e
-                        logger.error(f"Batch {batch_idx} dense encoding failed: {e}")
-                    
-                    try:
-                        batch_sparse = sparse_future.result()
-                    except Exception as e:
-                        sparse_error = e
-                        logger.error(f"Batch {batch_idx} sparse encoding failed: {e}")
-                
-                if dense_error or sparse_error:
-                    error_msg = ""
-                    if dense_error:
-                        error_msg += f"dense={dense_error} "
-                    if sparse_error:
-                        error_msg += f"sparse={sparse_error}"
-                    raise RuntimeError(f"Encoder failed: {error_msg}")
-                
-                if batch_dense:
-                    dense_vectors.extend(batch_dense)
-                if batch_sparse:
-                    sparse_stats.extend(batch_sparse)
-                
-                successful_chunks += len(batch)
-                
-            except Exception as e:
-                # Log failure and continue with remaining batches
-                logger.error(f"Batch {batch_idx} encoding failed ({len(batch)} chunks): {e}")
-                failed_chunks += len(batch)
-                if trace:
-                    trace.record_stage(
-                        f"batch_{batch_idx}_error",
-                        {"error": str(e), "batch_size": len(batch)}
-                    )
-            
-            batch_duration = time.time() - batch_start
-            
-            # Record batch timing if trace available
-            if trace:
-                trace.record_stage(
-                    f"batch_{batch_idx}",
-                    {
-                        "batch_size": len(batch),
-                        "duration_seconds": batch_duration,
-                        "chunks_processed": len(batch)
-                    }
-                )
+        for batch_idx, (batch_dense, batch_sparse) in enumerate(outcomes):
+            offset = batch_idx * self.batch_size
+            if batch_dense is None or batch_sparse is None:
+                failed_indices.extend(range(offset, offset + len(batches[batch_idx])))
+                continue
+            dense_vectors.extend(batch_dense)
+            sparse_stats.extend(batch_sparse)
+        
+        failed_chunks = len(failed_indices)
+        successful_chunks = len(chunks) - failed_chunks
         
         total_time = time.time() - start_time
         
@@ -227,6 +250,9 @@ class BatchProcessor:
                     "batch_size": self.batch_size,
                     "successful_chunks": successful_chunks,
                     "failed_chunks": failed_chunks,
+                    "reused_vectors": reused_vectors,
+                    "max_concurrency": self.max_concurrency,
+                    "rate_limiter": self.dense_encoder.rate_limiter.stats(),
                     "total_time_seconds": total_time
                 }
             )
@@ -237,9 +263,68 @@ class BatchProcessor:
             batch_count=batch_count,
             total_time=total_time,
             successful_chunks=successful_chunks,
-            failed_chunks=failed_chunks
+            failed_chunks=failed_chunks,
+            reused_vectors=reused_vectors,
+            failed_indices=failed_indices
         )
     
+    def _process_batch(
+        self,
+        batch_idx: int,
+        batch: List[Chunk],
+        batch_known: Optional[List[Optional[List[float]]]],
+        trace: Optional[Any],
+        batch_sparse: Optional[List[Dict[str, Any]]] = None,
+    ) -> Tuple[Optional[List[List[float]]], Optional[List[Dict[str, Any]]]]:
+        """Encode one batch with both encoders.
+        
+        Args:
+            batch_idx: Index of the batch (for logs and trace stages)
+            batch: Chunks of the batch
+            batch_known: Reusable dense vectors for the batch, if looked up
+            trace: Optional TraceContext
+            batch_sparse: Precomputed term statistics for the batch, if any
+        
+        Returns:
+            Tuple of (dense vectors, sparse stats), or (None, None) if the
+            batch failed after the encoder's retries.
+        """
+        batch_start = time.time()
+        result: Tuple[Optional[List[List[float]]], Optional[List[Dict[str, Any]]]] = (None, None)
+        
+        try:
+            if self.shares_dense_pass:
+                batch_dense, lexical_weights = self.dense_encoder.encode_with_sparse(batch, trace)
+                batch_sparse = self.sparse_encoder.from_weights(batch, lexical_weights)
+            else:
+                batch_dense = self.dense_encoder.encode(batch, trace, batch_known)
+                if batch_sparse is None:
+                    batch_sparse = self.sparse_encoder.encode(batch, trace)
+            result = (batch_dense, batch_sparse)
+        except Exception as e:
+            # Log failure and continue with remaining batches
+            logger.error(f"Batch {batch_idx} encoding failed ({len(batch)} chunks): {e}")
+            if trace:
+                trace.record_stage(
+                    f"batch_{batch_idx}_error",
+                    {"error": str(e), "batch_size": len(batch)}
+                )
+        
+        batch_duration = time.time() - batch_start
+        
+        # Record batch timing if trace available
+        if trace:
+            trace.record_stage(
+                f"batch_{batch_idx}",
+                {
+                    "batch_size": len(batch),
+                    "duration_seconds": batch_duration,
+                    "chunks_processed": len(batch) if result[0] is not None else 0
+                }
+            )
+        
+        return result
+    
     def _create_batches(self, chunks: List[Chunk]) -> List[List[Chunk]]:
         """Divide chunks into batches of specified size.
         
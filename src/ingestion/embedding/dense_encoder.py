@@ -7,16 +7,36 @@ configurable embedding providers.
 Design Principles:
 - Config-Driven: Uses factory pattern to obtain embedding provider from settings
 - Batch Processing: Optimizes API calls through batching
+- Bounded Concurrency: Batches run in parallel under a shared adaptive rate
+  limiter that backs off on HTTP 429 and retries failed batches
 - Observable: Accepts TraceContext for future observability integration
 - Error Handling: Individual failures shouldn't crash entire batch
 - Deterministic: Same inputs produce same outputs
+- Reuse First: Unchanged texts take their vector from the chunk embedding
+  cache or from the vector store (by content-hash chunk ID); only misses
+  are sent to the embedding API
+- Single Pass: Embeddings with learned sparse output (BGE-M3) return dense
+  vectors and lexical weights from one forward pass (encode_with_sparse)
 """
 
 import asyncio
-from typing import List, Optional, Any
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from src.core.types import Chunk
 from src.libs.embedding.base_embedding import BaseEmbedding
+from src.libs.embedding.embedding_cache import EmbeddingCache, client_fingerprint
+from src.libs.embedding.rate_limiter import AdaptiveRateLimiter, get_rate_limiter
+
+logger = logging.getLogger(__name__)
+
+# Chunk metadata key recording which embedding model produced the stored vector
+EMBEDDING_MODEL_KEY = "embedding_model"
+
+# Looks up stored records for chunks: one dict per chunk ({} if not found)
+# with 'vector', 'text' and 'metadata' keys (see VectorUpserter.get_stored_records)
+VectorLookup = Callable[[List[Chunk]], List[Dict[str, Any]]]
 
 
 class DenseEncoder:
@@ -29,7 +49,10 @@ class DenseEncoder:
     Design:
     - Dependency Injection: Receives BaseEmbedding instance (no direct factory call)
     - Batch-First: Processes all chunks in configurable batch sizes
-    - Stateless: No internal state between encode() calls
+    - Stateless: No internal state between encode() calls (the optional
+      cache and vector lookup are shared, externally owned resources)
+    - Reuse First: With a cache and/or vector_lookup, vectors for unchanged
+      texts are reused and only the misses are embedded
     
     Example:
         >>> from src.libs.embedding.embedding_factory import EmbeddingFactory
@@ -49,12 +72,26 @@ class DenseEncoder:
         self,
         embedding: BaseEmbedding,
         batch_size: int = 100,
+        cache: Optional[EmbeddingCache] = None,
+        vector_lookup: Optional[VectorLookup] = None,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
     ):
         """Initialize DenseEncoder.
         
         Args:
             embedding: Embedding provider instance (from EmbeddingFactory)
             batch_size: Number of chunks to process per API call (default: 100)
+            cache: Optional chunk embedding cache (see get_chunk_cache), keyed
+                by the exact embedding text and the model fingerprint
+            vector_lookup: Optional callable returning the stored records of
+                chunks by their deterministic chunk IDs, used for texts the
+                cache misses
+            max_concurrency: Maximum in-flight embedding requests (default: 4)
+            max_retries: Retries per batch on rate limits / transient errors
+            rate_limiter: Optional limiter to use instead of the one shared by
+                all clients of this embedding model (see get_rate_limiter)
         
         Raises:
             ValueError: If batch_size <= 0
@@ -64,23 +101,40 @@ class DenseEncoder:
         
         self.embedding = embedding
         self.batch_size = batch_size
+        self.cache = cache
+        self.vector_lookup = vector_lookup
+        self.fingerprint = client_fingerprint(embedding)
+        self.rate_limiter = rate_limiter or get_rate_limiter(
+            embedding, max_concurrency=max_concurrency, max_retries=max_retries
+        )
+    
+    @property
+    def reuse_enabled(self) -> bool:
+        """True if vectors can be reused from the cache or the vector store."""
+        return self.cache is not None or self.vector_lookup is not None
     
     def encode(
         self,
         chunks: List[Chunk],
         trace: Optional[Any] = None,
+        known_vectors: Optional[List[Optional[List[float]]]] = None,
     ) -> List[List[float]]:
         """Encode chunks into dense vectors.
         
         This method:
         1. Extracts text from each chunk
-        2. Batches texts according to batch_size
-        3. Calls embedding.embed() for each batch
-        4. Concatenates results maintaining chunk order
+        2. Reuses cached/stored vectors for unchanged texts (see lookup_reusable)
+        3. Batches the remaining texts according to batch_size
+        4. Calls embedding.embed() for the batches concurrently, under the
+           rate limiter (429 backoff, per-batch retries)
+        5. Merges results maintaining chunk order
         
         Args:
             chunks: List of Chunk objects to encode
             trace: Optional TraceContext for observability (reserved for Stage F)
+            known_vectors: Optional result of a prior lookup_reusable() call
+                (one entry per chunk, None = embed). If omitted, the lookup
+                runs here when reuse is enabled.
         
         Returns:
             List of dense vectors (one per chunk, in same order).
@@ -102,46 +156,29 @@ class DenseEncoder:
             raise ValueError("Cannot encode empty chunks list")
         
         # Extract text from chunks, prioritizing embedding_text if available
-        texts = [
-            chunk.metadata.get("embedding_text") or chunk.text
-            for chunk in chunks
-        ]
+        texts = self._extract_texts(chunks)
         
-        # Validate that all texts are non-empty
-        for i, text in enumerate(texts):
-            if not text or not text.strip():
-                raise ValueError(
-                    f"Chunk at index {i} (id={chunks[i].id}) has empty or whitespace-only text"
-                )
+        vectors = self._resolve_known(chunks, texts, known_vectors)
+        miss_indices = [i for i, vec in enumerate(vectors) if vec is None]
+        miss_texts = [texts[i] for i in miss_indices]
         
-        # Process in batches
-        all_vectors: List[List[float]] = []
+        # Process misses in batches (concurrently, results kept in order)
+        starts = list(range(0, len(miss_texts), self.batch_size))
         
-        for batch_start in range(0, len(texts), self.batch_size):
-            batch_end = min(batch_start + self.batch_size, len(texts))
-            batch_texts = texts[batch_start:batch_end]
-            
-            try:
-                # Call embedding provider
-                batch_vectors = self.embedding.embed(
-                    texts=batch_texts,
-                    trace=trace,
-                )
-                
-                # Validate output shape
-                if len(batch_vectors) != len(batch_texts):
-                    raise RuntimeError(
-                        f"Embedding provider returned {len(batch_vectors)} vectors "
-                        f"for {len(batch_texts)} texts in batch {batch_start}-{batch_end}"
-                    )
-                
-                all_vectors.extend(batch_vectors)
-                
-            except Exception as e:
-                # Re-raise with context about which batch failed
-                raise RuntimeError(
-                    f"Failed to encode batch {batch_start}-{batch_end}: {str(e)}"
-                ) from e
+        def _embed(batch_start: int) -> List[List[float]]:
+            batch_end = min(batch_start + self.batch_size, len(miss_texts))
+            return self._embed_batch(miss_texts[batch_start:batch_end], batch_start, trace)
+        
+        new_vectors: List[List[float]] = []
+        if len(starts) == 1:
+            new_vectors = _embed(starts[0])
+        elif starts:
+            workers = min(len(starts), self.rate_limiter.max_concurrency)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for batch_vectors in executor.map(_embed, starts):
+                    new_vectors.extend(batch_vectors)
+        
+        all_vectors = self._merge_new_vectors(chunks, texts, vectors, miss_indices, new_vectors)
         
         # Final validation
         if len(all_vectors) != len(chunks):
@@ -160,8 +197,137 @@ class DenseEncoder:
                         f"{len(vec)} dimensions, expected {expected_dim}"
                     )
         
+        self._stamp_model(chunks)
         return all_vectors
     
+    def encode_with_sparse(
+        self,
+        chunks: List[Chunk],
+        trace: Optional[Any] = None,
+    ) -> Tuple[List[List[float]], List[Dict[Any, float]]]:
+        """Encode chunks into dense vectors and learned sparse weights.
+        
+        Every chunk goes through ``embedding.embed_with_sparse()`` (one
+        forward pass yields both outputs, so reusing a cached dense vector
+        would not save the model call). New dense vectors are still written
+        to the chunk cache. Batches run concurrently under the rate limiter,
+        as in encode().
+        
+        Args:
+            chunks: List of Chunk objects to encode
+            trace: Optional TraceContext for observability
+        
+        Returns:
+            Tuple of (dense vectors, lexical weights), one entry per chunk
+            in input order; lexical weights are {token_id: weight} dicts.
+        
+        Raises:
+            ValueError: If chunks list is empty or the embedding has no
+                embed_with_sparse()
+            RuntimeError: If a batch fails after retries
+        """
+        if not chunks:
+            raise ValueError("Cannot encode empty chunks list")
+        embed_with_sparse = getattr(self.embedding, "embed_with_sparse", None)
+        if embed_with_sparse is None:
+            raise ValueError(
+                f"Embedding {type(self.embedding).__name__} has no embed_with_sparse()"
+            )
+        
+        texts = self._extract_texts(chunks)
+        starts = list(range(0, len(texts), self.batch_size))
+        
+        def _embed(batch_start: int) -> Tuple[List[List[float]], List[Dict[Any, float]]]:
+            batch_texts = texts[batch_start:batch_start + self.batch_size]
+            batch_end = batch_start + len(batch_texts)
+            try:
+                dense, sparse = self.rate_limiter.call(
+                    lambda: embed_with_sparse(batch_texts, trace=trace),
+                    description=f"Embedding batch {batch_start}-{batch_end} (dense+sparse)",
+                )
+            except Exception as e:
+                raise RuntimeError(
+                    f"Failed to encode batch {batch_start}-{batch_end}: {str(e)}"
+                ) from e
+            self._check_batch(dense, batch_texts, batch_start)
+            self._check_batch(sparse, batch_texts, batch_start)
+            return dense, sparse
+        
+        if len(starts) == 1:
+            outcomes = [_embed(starts[0])]
+        else:
+            workers = min(len(starts), self.rate_limiter.max_concurrency)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                outcomes = list(executor.map(_embed, starts))
+        
+        vectors: List[List[float]] = []
+        weights: List[Dict[Any, float]] = []
+        for batch_dense, batch_sparse in outcomes:
+            vectors.extend(batch_dense)
+            weights.extend(batch_sparse)
+        
+        if self.cache is not None:
+            self.cache.put_batch(texts, vectors)
+        self._stamp_model(chunks)
+        return vectors, weights
+    
+    def lookup_reusable(
+        self,
+        chunks: List[Chunk],
+    ) -> Tuple[List[Optional[List[float]]], Dict[str, int]]:
+        """Find vectors that can be reused instead of calling the API.
+        
+        Lookup order per chunk: chunk embedding cache (exact embedding text),
+        then the vector store by deterministic content-hash chunk ID. A stored
+        record is only reused if its stored embedding text equals the current
+        one and it is stamped with the same embedding model (unstamped
+        records are misses); such hits are copied into the cache. Lookup failures degrade to misses.
+        
+        Args:
+            chunks: Chunks about to be encoded.
+        
+        Returns:
+            Tuple of (vectors, counts): vectors[i] is None for misses; counts
+            has "cache", "vector_store" and "miss" totals.
+        """
+        texts = self._extract_texts(chunks)
+        vectors: List[Optional[List[float]]] = [None] * len(chunks)
+        counts = {"cache": 0, "vector_store": 0, "miss": len(chunks)}
+        if not chunks:
+            return vectors, counts
+        
+        if self.cache is not None:
+            try:
+                cached, _ = self.cache.get_batch(texts)
+                for i, vec in enumerate(cached):
+                    if vec is not None:
+                        vectors[i] = list(vec)
+                        counts["cache"] += 1
+            except Exception as e:
+                logger.warning(f"Chunk embedding cache lookup failed: {e}")
+        
+        pending = [i for i, vec in enumerate(vectors) if vec is None]
+        if self.vector_lookup is not None and pending:
+            try:
+                records = self.vector_lookup([chunks[i] for i in pending])
+            except Exception as e:
+                logger.warning(f"Stored vector lookup failed: {e}")
+                records = []
+            found_texts: List[str] = []
+            found_vectors: List[List[float]] = []
+            for i, record in zip(pending, records):
+                vec = self._reusable_stored_vector(record, texts[i])
+                if vec is not None:
+                    vectors[i] = vec
+                    counts["vector_store"] += 1
+                    found_texts.append(texts[i])
+                    found_vectors.append(vec)
+            if found_vectors and self.cache is not None:
+                self.cache.put_batch(found_texts, found_vectors)
+        
+        counts["miss"] = len(chunks) - counts["cache"] - counts["vector_store"]
+        return vectors, counts
+    
     def get_batch_count(self, num_chunks: int) -> int:
         """Calculate number of batches needed for given chunk count.
         
@@ -182,6 +348,7 @@ class DenseEncoder:
         chunks: List[Chunk],
         trace: Optional[Any] = None,
         max_concurrency: int = 5,
+        known_vectors: Optional[List[Optional[List[float]]]] = None,
     ) -> List[List[float]]:
         """Async version of encode() for concurrent batch processing.
         
@@ -192,6 +359,7 @@ class DenseEncoder:
             chunks: List of Chunk objects to encode.
             trace: Optional TraceContext for observability.
             max_concurrency: Maximum concurrent API calls (default: 5).
+            known_vectors: Optional result of a prior lookup_reusable() call.
         
         Returns:
             List of dense vectors (one per chunk, in same order).
@@ -204,29 +372,31 @@ class DenseEncoder:
             raise ValueError("Cannot encode empty chunks list")
         
         # Extract text from chunks
-        texts = [
-            chunk.metadata.get("embedding_text") or chunk.text
-            for chunk in chunks
-        ]
+        texts = self._extract_texts(chunks)
         
-        # Validate texts
-        for i, text in enumerate(texts):
-            if not text or not text.strip():
-                raise ValueError(
-                    f"Chunk at index {i} (id={chunks[i].id}) has empty text"
-                )
+        if known_vectors is None and self.reuse_enabled:
+            # Cache and vector store lookups are blocking I/O
+            known_vectors, _ = await asyncio.to_thread(self.lookup_reusable, chunks)
+        vectors = self._resolve_known(chunks, texts, known_vectors)
+        miss_indices = [i for i, vec in enumerate(vectors) if vec is None]
+        miss_texts = [texts[i] for i in miss_indices]
         
-        # Create batches
-        batches: List[List[str]] = []
-        for i in range(0, len(texts), self.batch_size):
-            batches.append(texts[i:i + self.batch_size])
+        # Create batches of misses
+        starts = list(range(0, len(miss_texts), self.batch_size))
         
-        # Process batches concurrently
-        all_vectors = await self.embedding.embed_batches_async(
-            text_batches=batches,
-            trace=trace,
-            max_concurrency=max_concurrency,
-        )
+        # Process batches concurrently; the rate limiter bounds in-flight calls
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def _embed(batch_start: int) -> List[List[float]]:
+            batch_texts = miss_texts[batch_start:batch_start + self.batch_size]
+            async with semaphore:
+                return await self._embed_batch_async(batch_texts, batch_start, trace)
+        
+        new_vectors: List[List[float]] = []
+        for batch_vectors in await asyncio.gather(*(_embed(start) for start in starts)):
+            new_vectors.extend(batch_vectors)
+        
+        all_vectors = self._merge_new_vectors(chunks, texts, vectors, miss_indices, new_vectors)
         
         # Validate output
         if len(all_vectors) != len(chunks):
@@ -234,4 +404,144 @@ class DenseEncoder:
                 f"Vector count mismatch: got {len(all_vectors)} for {len(chunks)} chunks"
             )
         
+        self._stamp_model(chunks)
         return all_vectors
+    
+    # ===== Private Helper Methods =====
+    
+    def _embed_batch(
+        self,
+        batch_texts: List[str],
+        batch_start: int,
+        trace: Optional[Any],
+    ) -> List[List[float]]:
+        """Embed one batch under the rate limiter (with retries)."""
+        batch_end = batch_start + len(batch_texts)
+        try:
+            batch_vectors = self.rate_limiter.call(
+                lambda: self.embedding.embed(texts=batch_texts, trace=trace),
+                description=f"Embedding batch {batch_start}-{batch_end}",
+            )
+        except Exception as e:
+            # Re-raise with context about which batch failed
+            raise RuntimeError(
+                f"Failed to encode batch {batch_start}-{batch_end}: {str(e)}"
+            ) from e
+        self._check_batch(batch_vectors, batch_texts, batch_start)
+        return batch_vectors
+    
+    async def _embed_batch_async(
+        self,
+        batch_texts: List[str],
+        batch_start: int,
+        trace: Optional[Any],
+    ) -> List[List[float]]:
+        """Async variant of _embed_batch() using embedding.embed_async()."""
+        batch_end = batch_start + len(batch_texts)
+        try:
+            batch_vectors = await self.rate_limiter.call_async(
+                lambda: self.embedding.embed_async(batch_texts, trace),
+                description=f"Embedding batch {batch_start}-{batch_end}",
+            )
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to encode batch {batch_start}-{batch_end}: {str(e)}"
+            ) from e
+        self._check_batch(batch_vectors, batch_texts, batch_start)
+        return batch_vectors
+    
+    @staticmethod
+    def _check_batch(
+        batch_vectors: List[List[float]],
+        batch_texts: List[str],
+        batch_start: int,
+    ) -> None:
+        """Validate that the provider returned one vector per text."""
+        if len(batch_vectors) != len(batch_texts):
+            raise RuntimeError(
+                f"Embedding provider returned {len(batch_vectors)} vectors "
+                f"for {len(batch_texts)} texts in batch "
+                f"{batch_start}-{batch_start + len(batch_texts)}"
+            )
+    
+    def _extract_texts(self, chunks: List[Chunk]) -> List[str]:
+        """Return the text to embed per chunk, validating it is non-empty."""
+        texts = [
+            chunk.metadata.get("embedding_text") or chunk.text
+            for chunk in chunks
+        ]
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                raise ValueError(
+                    f"Chunk at index {i} (id={chunks[i].id}) has empty or whitespace-only text"
+                )
+        return texts
+    
+    def _resolve_known(
+        self,
+        chunks: List[Chunk],
+        texts: List[str],
+        known_vectors: Optional[List[Optional[List[float]]]],
+    ) -> List[Optional[List[float]]]:
+        """Return per-chunk reusable vectors (None = must be embedded)."""
+        if known_vectors is None:
+            if not self.reuse_enabled:
+                return [None] * len(chunks)
+            known_vectors, _ = self.lookup_reusable(chunks)
+        if len(known_vectors) != len(chunks):
+            raise ValueError(
+                f"known_vectors has {len(known_vectors)} entries for {len(chunks)} chunks"
+            )
+        return list(known_vectors)
+    
+    def _merge_new_vectors(
+        self,
+        chunks: List[Chunk],
+        texts: List[str],
+        vectors: List[Optional[List[float]]],
+        miss_indices: List[int],
+        new_vectors: List[List[float]],
+    ) -> List[List[float]]:
+        """Place freshly embedded vectors at the miss positions and cache them."""
+        if len(new_vectors) != len(miss_indices):
+            raise RuntimeError(
+                f"Vector count mismatch: got {len(new_vectors)} vectors "
+                f"for {len(miss_indices)} uncached chunks"
+            )
+        for i, vec in zip(miss_indices, new_vectors):
+            vectors[i] = vec
+        if self.cache is not None and new_vectors:
+            self.cache.put_batch([texts[i] for i in miss_indices], new_vectors)
+        if len(miss_indices) < len(chunks):
+            logger.debug(
+                f"Reused {len(chunks) - len(miss_indices)}/{len(chunks)} chunk vectors, "
+                f"embedded {len(miss_indices)}"
+            )
+        return vectors  # type: ignore[return-value]
+    
+    def _reusable_stored_vector(
+        self,
+        record: Dict[str, Any],
+        text: str,
+    ) -> Optional[List[float]]:
+        """Return a stored record's vector if it was embedded from *text* by this model.
+        
+        Records without the embedding_model stamp (written before it
+        existed) are cache misses: nothing proves which model produced
+        their vectors, so they are re-embedded and stamped.
+        """
+        vector = record.get("vector") if record else None
+        if vector is None or len(vector) == 0:
+            return None
+        metadata = record.get("metadata") or {}
+        stored_text = metadata.get("embedding_text") or metadata.get("text") or record.get("text")
+        if stored_text != text:
+            return None
+        if metadata.get(EMBEDDING_MODEL_KEY) != self.fingerprint:
+            return None
+        return [float(x) for x in vector]
+    
+    def _stamp_model(self, chunks: List[Chunk]) -> None:
+        """Record the embedding model in chunk metadata (stored with the vector)."""
+        for chunk in chunks:
+            chunk.metadata[EMBEDDING_MODEL_KEY] = self.fingerprint
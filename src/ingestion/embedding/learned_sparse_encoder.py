@@ -0,0 +1,131 @@
+"""Learned Sparse Encoder for BGE-M3 lexical weights.
+
+This module implements the sparse side of the ``bge_m3`` sparse provider:
+chunks are represented by the token weights BGE-M3 returns next to the dense
+vector, instead of jieba term counts.
+
+Design Principles:
+- Single Pass: Inside BatchProcessor the weights come from the same
+  embed_with_sparse() call that produces the dense vectors (see
+  DenseEncoder.encode_with_sparse), so there is no second tokenization
+- Clear Contracts: Output keeps the SparseEncoder structure, with token
+  weights as "term_frequencies", so indexers and the pipeline are unchanged
+- Deterministic: Same weights produce the same statistics
+"""
+
+from typing import Any, Dict, List, Optional
+
+from src.core.types import Chunk
+
+
+class LearnedSparseEncoder:
+    """Turns BGE-M3 lexical weights into sparse statistics for LearnedSparseIndexer.
+
+    Output Structure:
+        For each chunk:
+        {
+            "chunk_id": str,
+            "term_frequencies": Dict[str, float],  # token id -> learned weight
+            "doc_length": int,                      # tokens with weight > 0
+            "unique_terms": int
+        }
+
+    Attributes:
+        embedding: Embedding with embed_with_sparse(), used by encode() when
+            the encoder runs on its own.
+        shares_dense_pass: Tells BatchProcessor to take the weights from
+            the dense encoding pass instead of calling encode().
+
+    Example:
+        >>> encoder = LearnedSparseEncoder(embedding)
+        >>> dense, weights = embedding.embed_with_sparse(["电机额定功率"])
+        >>> stats = encoder.from_weights(chunks, weights)
+    """
+
+    shares_dense_pass = True
+
+    def __init__(self, embedding: Optional[Any] = None, min_weight: float = 0.0):
+        """Initialize LearnedSparseEncoder.
+
+        Args:
+            embedding: Optional embedding with embed_with_sparse() for encode().
+            min_weight: Tokens with a weight <= min_weight are dropped.
+
+        Raises:
+            ValueError: If min_weight < 0
+        """
+        if min_weight < 0:
+            raise ValueError(f"min_weight must be >= 0, got {min_weight}")
+        self.embedding = embedding
+        self.min_weight = min_weight
+
+    def encode(
+        self,
+        chunks: List[Chunk],
+        trace: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
+        """Encode chunks with their own embed_with_sparse() call.
+
+        Args:
+            chunks: List of Chunk objects to encode
+            trace: Optional TraceContext for observability
+
+        Returns:
+            List of statistics dictionaries (one per chunk, in same order).
+
+        Raises:
+            ValueError: If chunks is empty, a chunk has empty text or no
+                embedding with embed_with_sparse() is configured
+        """
+        if not chunks:
+            raise ValueError("Cannot encode empty chunks list")
+        if getattr(self.embedding, "embed_with_sparse", None) is None:
+            raise ValueError("LearnedSparseEncoder needs an embedding with embed_with_sparse()")
+
+        texts = []
+        for i, chunk in enumerate(chunks):
+            text = chunk.metadata.get("embedding_text") or chunk.text
+            if not text or not text.strip():
+                raise ValueError(
+                    f"Chunk at index {i} (id={chunk.id}) has empty or whitespace-only text"
+                )
+            texts.append(text)
+        _, weights = self.embedding.embed_with_sparse(texts, trace=trace)
+        return self.from_weights(chunks, weights)
+
+    def from_weights(
+        self,
+        chunks: List[Chunk],
+        lexical_weights: List[Dict[Any, float]],
+    ) -> List[Dict[str, Any]]:
+        """Build statistics from lexical weights computed elsewhere.
+
+        Args:
+            chunks: Chunks the weights belong to.
+            lexical_weights: One {token_id: weight} dict per chunk.
+
+        Returns:
+            List of statistics dictionaries (one per chunk, in same order).
+
+        Raises:
+            ValueError: If the counts of chunks and weights differ
+        """
+        if len(lexical_weights) != len(chunks):
+            raise ValueError(
+                f"Got {len(lexical_weights)} lexical weight dicts for {len(chunks)} chunks"
+            )
+
+        results = []
+        for chunk, weights in zip(chunks, lexical_weights):
+            term_weights = {
+                str(token): float(weight)
+                for token, weight in weights.items()
+                if float(weight) > self.min_weight
+            }
+            results.append({
+                "chunk_id": chunk.id,
+                "term_frequencies": term_weights,
+                "doc_length": len(term_weights),
+                "unique_terms": len(term_weights),
+            })
+        return results
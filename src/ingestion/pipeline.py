@@ -14,12 +14,18 @@ Design Principles:
 - Observable: Logs progress and stage completion
 - Graceful Degradation: LLM failures don't block pipeline
 - Idempotent: SHA256-based skip for unchanged files
+- Incremental: With diff_reingest, a forced re-ingest keeps the chunks whose
+  source text is unchanged and only transforms and embeds the rest
 """
 
 import asyncio
+import dataclasses
+import hashlib
 import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable, List, Optional, Dict, Any, Coroutine
+from typing import Callable, Iterator, List, Optional, Dict, Any, Coroutine
 
 from src.core.settings import Settings, load_settings, resolve_path
 from src.core.types import Document, Chunk
@@ -30,6 +36,7 @@ from src.observability.logger import get_logger
 from src.libs.loader.file_integrity import SQLiteIntegrityChecker
 from src.libs.loader.loader_factory import LoaderFactory
 from src.libs.embedding.embedding_factory import EmbeddingFactory
+from src.libs.embedding.embedding_cache import client_fingerprint, get_chunk_cache
 from src.libs.vector_store.vector_store_factory import VectorStoreFactory
 
 # Ingestion layer imports
@@ -40,17 +47,24 @@ from src.ingestion.transform.metadata_enricher import MetadataEnricher
 from src.ingestion.transform.image_captioner import ImageCaptioner
 from src.ingestion.transform.context_enricher import ContextEnricher
 from src.ingestion.transform.graph_extractor import GraphExtractor
-from src.ingestion.embedding.dense_encoder import DenseEncoder
+from src.ingestion.embedding.dense_encoder import EMBEDDING_MODEL_KEY, DenseEncoder
 from src.ingestion.embedding.sparse_encoder import SparseEncoder
-from src.ingestion.embedding.batch_processor import BatchProcessor
-from src.ingestion.storage.bm25_indexer import BM25Indexer
+from src.ingestion.embedding.learned_sparse_encoder import LearnedSparseEncoder
+from src.ingestion.embedding.batch_processor import BatchProcessor, BatchResult
+from src.ingestion.storage.sparse_index_factory import create_sparse_indexer, get_sparse_provider
 from src.ingestion.storage.vector_upserter import VectorUpserter
 from src.ingestion.storage.image_storage import ImageStorage
 from src.ingestion.storage.parent_store import ParentStore
 from src.ingestion.storage.graph_store import GraphStore
+from src.ingestion.process_pool import encode_sparse_in_pool, get_process_pool, load_and_split, run_in_pool
+from src.core.query_engine.cache_generation import bump_cache_generation
 
 logger = get_logger(__name__)
 
+# Chunk metadata key holding the hash of the chunk text before transforms;
+# diff re-ingestion matches new chunks to stored ones by it
+SOURCE_TEXT_HASH_KEY = "source_text_hash"
+
 
 class PipelineResult:
     """Result of pipeline execution with detailed statistics.
@@ -100,6 +114,46 @@ class PipelineResult:
         }
 
 
+@dataclass
+class FileJob:
+    """Per-file state handed from one pipeline stage to the next.
+    
+    Attributes:
+        file_path: Path of the file being ingested.
+        display_name: Name used in logs, results and integrity records.
+        stages: Per-stage statistics collected for the PipelineResult.
+        file_hash: SHA256 of the file (set by the integrity check).
+        document: Loaded document (set by loading).
+        chunks: Current chunks (set by chunking, replaced by transforms).
+        batch_result: Encoding result (set by encoding).
+        stores_modified: Set once any store was written, so query caches
+            get invalidated even if a later stage fails.
+        previous_ids: Stored chunk IDs of the previous version (diff
+            re-ingestion only, else None).
+        reused_chunks: Unchanged chunks carried over from the previous
+            version with their stored text and metadata.
+        reused_vectors: Stored vectors of reused_chunks.
+        reused_sparse: Sparse statistics of reused_chunks (set by encoding).
+    """
+    file_path: Path
+    display_name: str
+    original_filename: Optional[str] = None
+    extra_metadata: Optional[Dict[str, str]] = None
+    trace: Optional[TraceContext] = None
+    on_progress: Optional[Callable[[str, int, int], None]] = None
+    on_progress_async: Optional[Callable[[str, float], Coroutine[Any, Any, None]]] = None
+    stages: Dict[str, Any] = field(default_factory=dict)
+    file_hash: Optional[str] = None
+    document: Optional[Document] = None
+    chunks: List[Chunk] = field(default_factory=list)
+    batch_result: Optional[Any] = None
+    stores_modified: bool = False
+    previous_ids: Optional[List[str]] = None
+    reused_chunks: List[Chunk] = field(default_factory=list)
+    reused_vectors: List[List[float]] = field(default_factory=list)
+    reused_sparse: List[Dict[str, Any]] = field(default_factory=list)
+
+
 class IngestionPipeline:
     """Main pipeline orchestrator for document ingestion.
     
@@ -123,12 +177,15 @@ class IngestionPipeline:
         >>> print(f"Processed {result.chunk_count} chunks")
     """
     
+    TOTAL_STAGES = 6
+    
     def __init__(
         self,
         settings: Settings,
         collection: str = "default",
         force: bool = False,
         skip_llm_transform: bool = False,
+        diff_reingest: Optional[bool] = None,
     ):
         """Initialize pipeline with all components.
         
@@ -139,11 +196,18 @@ class IngestionPipeline:
             skip_llm_transform: If True, skip LLM-based ChunkRefiner,
                 MetadataEnricher and ImageCaptioner. Useful for bulk
                 re-ingestion where only image extraction changed.
+            diff_reingest: If True, force re-processing keeps the stored
+                chunks whose source text is unchanged (no transforms or
+                embedding for them) and deletes only vanished chunks.
+                Defaults to ingestion.diff_reingest.
         """
         self.settings = settings
         self.collection = collection
         self.force = force
         self.skip_llm_transform = skip_llm_transform
+        if diff_reingest is None:
+            diff_reingest = bool(getattr(settings.ingestion, "diff_reingest", False))
+        self.diff_reingest = diff_reingest
         
         # Initialize all components
         logger.info("Initializing Ingestion Pipeline components...")
@@ -156,6 +220,12 @@ class IngestionPipeline:
         self._image_storage_dir = str(resolve_path(f"data/images/{collection}"))
         logger.info("  ✓ LoaderFactory ready")
         
+        # Optional: worker processes for parsing, chunking and jieba term
+        # statistics (this process stays the only store writer)
+        self.process_pool = get_process_pool(settings)
+        if self.process_pool is not None:
+            logger.info("  ✓ Process pool enabled for load/split/sparse encoding")
+        
         # Stage 3: Chunker
         self.chunker = DocumentChunker(settings)
         logger.info("  ✓ DocumentChunker initialized")
@@ -180,11 +250,40 @@ class IngestionPipeline:
         # Embedding API batch size should be small to respect provider limits
         # (e.g. DashScope text-embedding-v3 limits tokens/texts per request)
         embedding_batch_size = min(batch_size, 6)
-        self.dense_encoder = DenseEncoder(embedding, batch_size=embedding_batch_size)
-        logger.info(f"  ✓ DenseEncoder initialized (provider={settings.embedding.provider})")
+        # Unchanged chunk texts reuse their vectors from the chunk cache (and,
+        # once the upserter exists, from the vector store by chunk ID)
+        chunk_cache = get_chunk_cache(
+            fingerprint=client_fingerprint(embedding),
+            persist_dir=getattr(settings.embedding, "cache_dir", None),
+            dtype=getattr(settings.embedding, "cache_dtype", "float32"),
+        )
+        # Batches are embedded concurrently under an adaptive rate limiter
+        # shared by every pipeline using the same embedding model
+        embedding_concurrency = settings.ingestion.embedding_concurrency if settings.ingestion else 4
+        embedding_max_retries = settings.ingestion.embedding_max_retries if settings.ingestion else 3
+        self.dense_encoder = DenseEncoder(
+            embedding,
+            batch_size=embedding_batch_size,
+            cache=chunk_cache,
+            max_concurrency=embedding_concurrency,
+            max_retries=embedding_max_retries,
+        )
+        logger.info(
+            f"  ✓ DenseEncoder initialized (provider={settings.embedding.provider}, "
+            f"concurrency={embedding_concurrency})"
+        )
         
-        self.sparse_encoder = SparseEncoder()
-        logger.info("  ✓ SparseEncoder initialized")
+        if get_sparse_provider(settings) == "bge_m3":
+            # Learned sparse weights come out of the dense embedding pass
+            if not hasattr(embedding, "embed_with_sparse"):
+                raise ValueError(
+                    "retrieval.sparse_provider 'bge_m3' requires embedding.provider 'bge-m3'"
+                )
+            self.sparse_encoder = LearnedSparseEncoder(embedding)
+            logger.info("  ✓ LearnedSparseEncoder initialized (BGE-M3 lexical weights)")
+        else:
+            self.sparse_encoder = SparseEncoder()
+            logger.info("  ✓ SparseEncoder initialized")
         
         self.batch_processor = BatchProcessor(
             dense_encoder=self.dense_encoder,
@@ -195,10 +294,11 @@ class IngestionPipeline:
         
         # Stage 6: Storage
         self.vector_upserter = VectorUpserter(settings, collection_name=collection)
+        self.dense_encoder.vector_lookup = self.vector_upserter.get_stored_records
         logger.info(f"  ✓ VectorUpserter initialized (provider={settings.vector_store.provider}, collection={collection})")
         
-        self.bm25_indexer = BM25Indexer(index_dir=str(resolve_path(f"data/db/bm25/{collection}")))
-        logger.info("  ✓ BM25Indexer initialized")
+        self.bm25_indexer = create_sparse_indexer(settings, collection, embedding=embedding)
+        logger.info(f"  ✓ Sparse indexer initialized (provider={get_sparse_provider(settings)})")
         
         self.image_storage = ImageStorage(
             db_path=str(resolve_path("data/db/image_index.db")),
@@ -310,6 +410,10 @@ class IngestionPipeline:
     ) -> PipelineResult:
         """Execute the full ingestion pipeline on a file (Async).
         
+        Runs the stage methods (prepare_file, transform_file, encode_file,
+        store_file) one after another. PipelinedIngestion runs the same
+        stages overlapped across files.
+        
         Args:
             file_path: Path to the file to process.
             trace: Optional trace context.
@@ -318,423 +422,697 @@ class IngestionPipeline:
             original_filename: Original name of the file.
             extra_metadata: Extra metadata to inject.
         """
-        file_path = Path(file_path)
-        display_name = original_filename or file_path.name
-        stages: Dict[str, Any] = {}
-        _total_stages = 6
-
-        async def _notify(stage_name: str, step: int, percent: float = 0.0) -> None:
-            if on_progress is not None:
-                on_progress(stage_name, step, _total_stages)
-            if on_progress_async is not None:
-                # Provide a more granular percent if step is fixed
-                # percent = (step - 1) / _total_stages + (local_progress / _total_stages)
-                await on_progress_async(stage_name, percent)
+        job = self.create_job(
+            file_path,
+            trace=trace,
+            on_progress=on_progress,
+            on_progress_async=on_progress_async,
+            original_filename=original_filename,
+            extra_metadata=extra_metadata,
+        )
+        try:
+            skipped = await self.prepare_file(job)
+            if skipped is not None:
+                return skipped
+            await self.transform_file(job)
+            await self.encode_file(job)
+            return await self.store_file(job)
+        except Exception as e:
+            return self.fail_file(job, e)
+    
+    def create_job(
+        self,
+        file_path: str,
+        trace: Optional[TraceContext] = None,
+        on_progress: Optional[Callable[[str, int, int], None]] = None,
+        on_progress_async: Optional[Callable[[str, float], Coroutine[Any, Any, None]]] = None,
+        original_filename: Optional[str] = None,
+        extra_metadata: Optional[Dict[str, str]] = None,
+    ) -> FileJob:
+        """Create the per-file state passed through the stage methods."""
+        path = Path(file_path)
+        return FileJob(
+            file_path=path,
+            display_name=original_filename or path.name,
+            original_filename=original_filename,
+            extra_metadata=extra_metadata,
+            trace=trace,
+            on_progress=on_progress,
+            on_progress_async=on_progress_async,
+        )
+    
+    async def _notify(self, job: FileJob, stage_name: str, step: int, percent: float = 0.0) -> None:
+        """Report stage progress to the job's callbacks."""
+        if job.on_progress is not None:
+            job.on_progress(stage_name, step, self.TOTAL_STAGES)
+        if job.on_progress_async is not None:
+            # Provide a more granular percent if step is fixed
+            # percent = (step - 1) / _total_stages + (local_progress / _total_stages)
+            await job.on_progress_async(stage_name, percent)
+    
+    async def prepare_file(self, job: FileJob) -> Optional[PipelineResult]:
+        """Stages 1-3: integrity check, document loading and chunking.
+        
+        Hashing, parsing and splitting run in a worker thread so the event
+        loop keeps serving the other files' stages.
         
+        Returns:
+            A skip result if the file was already processed, else None.
+        """
+        trace = job.trace
         logger.info(f"=" * 60)
-        logger.info(f"Starting Ingestion Pipeline for: {display_name}")
+        logger.info(f"Starting Ingestion Pipeline for: {job.display_name}")
         logger.info(f"Collection: {self.collection}")
         logger.info(f"=" * 60)
         
-        try:
-            # ─────────────────────────────────────────────────────────────
-            # Stage 1: File Integrity Check
-            # ─────────────────────────────────────────────────────────────
-            logger.info("\n📋 Stage 1: File Integrity Check")
-            await _notify("integrity", 1)
-            
-            file_hash = self.integrity_checker.compute_sha256(str(file_path))
-            logger.info(f"  File hash: {file_hash[:16]}...")
-            
-            if not self.force and self.integrity_checker.should_skip(file_hash):
-                logger.info(f"  ⏭️  File already processed, skipping (use force=True to reprocess)")
-                return PipelineResult(
-                    success=True,
-                    file_path=display_name,
-                    doc_id=file_hash,
-                    stages={"integrity": {"skipped": True, "reason": "already_processed"}}
-                )
-            
-            stages["integrity"] = {"file_hash": file_hash, "skipped": False}
-            logger.info("  ✓ File needs processing")
-            
-            # When force=True, delete old chunks for this source_path so
-            # content-hash-based IDs don't create orphan duplicates.
-            if self.force:
-                src_path = original_filename or str(file_path)
-                deleted = self.vector_upserter.delete_by_source_path(src_path)
-                if deleted:
-                    logger.info(f"  🗑️  Deleted {deleted} old chunks for re-ingestion")
-            
-            # ─────────────────────────────────────────────────────────────
-            # Stage 2: Document Loading
-            # ─────────────────────────────────────────────────────────────
-            logger.info("\n📄 Stage 2: Document Loading")
-            await _notify("load", 2)
-            
-            _t0 = time.monotonic()
-            pdf_parser = "markitdown"
-            if self.settings.ingestion:
-                pdf_parser = getattr(self.settings.ingestion, "pdf_parser", "markitdown")
+        # ─────────────────────────────────────────────────────────────
+        # Stage 1: File Integrity Check
+        # ─────────────────────────────────────────────────────────────
+        logger.info("\n📋 Stage 1: File Integrity Check")
+        await self._notify(job, "integrity", 1)
+        
+        file_hash = await asyncio.to_thread(self.integrity_checker.compute_sha256, str(job.file_path))
+        job.file_hash = file_hash
+        logger.info(f"  File hash: {file_hash[:16]}...")
+        
+        if not self.force and self.integrity_checker.should_skip(file_hash):
+            logger.info(f"  ⏭️  File already processed, skipping (use force=True to reprocess)")
+            return PipelineResult(
+                success=True,
+                file_path=job.display_name,
+                doc_id=file_hash,
+                stages={"integrity": {"skipped": True, "reason": "already_processed"}}
+            )
+        
+        job.stages["integrity"] = {"file_hash": file_hash, "skipped": False}
+        logger.info("  ✓ File needs processing")
+        
+        # ─────────────────────────────────────────────────────────────
+        # Stage 2: Document Loading
+        # ─────────────────────────────────────────────────────────────
+        logger.info("\n📄 Stage 2: Document Loading")
+        await self._notify(job, "load", 2)
+        
+        _t0 = time.monotonic()
+        pdf_parser = "markitdown"
+        if self.settings.ingestion:
+            pdf_parser = getattr(self.settings.ingestion, "pdf_parser", "markitdown")
+        pooled_chunks: Optional[List[Chunk]] = None
+        if self.process_pool is not None:
+            # Parse and split in one worker process round trip
+            document, pooled_chunks, _elapsed, _split_elapsed = await run_in_pool(
+                self.process_pool, load_and_split,
+                str(job.file_path), pdf_parser, self._image_storage_dir, job.original_filename,
+            )
+        else:
             loader = LoaderFactory.create(
-                file_path,
+                job.file_path,
                 extract_images=True,
                 image_storage_dir=self._image_storage_dir,
                 pdf_parser=pdf_parser,
+                layout_config=getattr(self.settings.ingestion, "layout_pdf", None),
             )
-            document = loader.load(str(file_path))
+            document = await asyncio.to_thread(loader.load, str(job.file_path))
             # Override source_path with original filename if provided
-            if original_filename and "source_path" in document.metadata:
-                document.metadata["source_path"] = original_filename
-                document.metadata["original_filename"] = original_filename
+            if job.original_filename and "source_path" in document.metadata:
+                document.metadata["source_path"] = job.original_filename
+                document.metadata["original_filename"] = job.original_filename
             _elapsed = (time.monotonic() - _t0) * 1000.0
-            
-            text_preview = document.text[:200].replace('\n', ' ') + "..." if len(document.text) > 200 else document.text
-            image_count = len(document.metadata.get("images", []))
-            
-            logger.info(f"  Document ID: {document.id}")
-            logger.info(f"  Text length: {len(document.text)} chars")
-            logger.info(f"  Images extracted: {image_count}")
-            logger.info(f"  Preview: {text_preview[:100]}...")
-            
-            stages["loading"] = {
-                "doc_id": document.id,
-                "text_length": len(document.text),
-                "image_count": image_count
-            }
-            self._trace_stage(trace, "load", {
-                "method": "markitdown",
-                "doc_id": document.id,
-                "text_length": len(document.text),
-                "image_count": image_count,
-                "text_preview": document.text,
-            }, elapsed_ms=_elapsed)
-            
-            # ─────────────────────────────────────────────────────────────
-            # Stage 3: Chunking
-            # ─────────────────────────────────────────────────────────────
-            logger.info("\n✂️  Stage 3: Document Chunking")
-            await _notify("split", 3)
-            
+        job.document = document
+        
+        text_preview = document.text[:200].replace('\n', ' ') + "..." if len(document.text) > 200 else document.text
+        image_count = len(document.metadata.get("images", []))
+        
+        logger.info(f"  Document ID: {document.id}")
+        logger.info(f"  Text length: {len(document.text)} chars")
+        logger.info(f"  Images extracted: {image_count}")
+        logger.info(f"  Preview: {text_preview[:100]}...")
+        
+        job.stages["loading"] = {
+            "doc_id": document.id,
+            "text_length": len(document.text),
+            "image_count": image_count
+        }
+        self._trace_stage(trace, "load", {
+            "method": "markitdown",
+            "doc_id": document.id,
+            "text_length": len(document.text),
+            "image_count": image_count,
+            "text_preview": document.text,
+        }, elapsed_ms=_elapsed)
+        
+        # ─────────────────────────────────────────────────────────────
+        # Stage 3: Chunking
+        # ─────────────────────────────────────────────────────────────
+        logger.info("\n✂️  Stage 3: Document Chunking")
+        await self._notify(job, "split", 3)
+        
+        if pooled_chunks is not None:
+            chunks, _elapsed = pooled_chunks, _split_elapsed
+        else:
             _t0 = time.monotonic()
-            chunks = self.chunker.split_document(document)
+            chunks = await asyncio.to_thread(self.chunker.split_document, document)
             _elapsed = (time.monotonic() - _t0) * 1000.0
-            
-            logger.info(f"  Chunks generated: {len(chunks)}")
-            if chunks:
-                logger.info(f"  First chunk ID: {chunks[0].id}")
-                logger.info(f"  First chunk preview: {chunks[0].text[:100]}...")
-            
-            # Inject extra metadata into every chunk (e.g. product_vendor, product_model)
-            if extra_metadata:
-                for c in chunks:
-                    c.metadata.update(extra_metadata)
-                logger.info(f"  Extra metadata injected: {list(extra_metadata.keys())}")
-
-            stages["chunking"] = {
-                "chunk_count": len(chunks),
-                "avg_chunk_size": sum(len(c.text) for c in chunks) // len(chunks) if chunks else 0
+        
+        logger.info(f"  Chunks generated: {len(chunks)}")
+        if chunks:
+            logger.info(f"  First chunk ID: {chunks[0].id}")
+            logger.info(f"  First chunk preview: {chunks[0].text[:100]}...")
+        
+        # Inject extra metadata into every chunk (e.g. product_vendor, product_model)
+        if job.extra_metadata:
+            for c in chunks:
+                c.metadata.update(job.extra_metadata)
+            logger.info(f"  Extra metadata injected: {list(job.extra_metadata.keys())}")
+        for c in chunks:
+            c.metadata[SOURCE_TEXT_HASH_KEY] = hashlib.sha256(c.text.encode("utf-8")).hexdigest()[:16]
+        job.chunks = chunks
+        
+        job.stages["chunking"] = {
+            "chunk_count": len(chunks),
+            "avg_chunk_size": sum(len(c.text) for c in chunks) // len(chunks) if chunks else 0
+        }
+        self._trace_stage(trace, "split", {
+            "method": "recursive",
+            "chunk_count": len(chunks),
+            "avg_chunk_size": sum(len(c.text) for c in chunks) // len(chunks) if chunks else 0,
+            "chunks": self._chunk_details(chunks),
+        }, elapsed_ms=_elapsed)
+        
+        # 3b: Diff against the stored version (forced re-ingestion only)
+        if self.force and self.diff_reingest:
+            _t0 = time.monotonic()
+            await asyncio.to_thread(self._diff_chunks, job)
+            _elapsed = (time.monotonic() - _t0) * 1000.0
+            logger.info(
+                f"  3b. Diff: {len(job.reused_chunks)} unchanged, {len(job.chunks)} changed, "
+                f"{len(job.previous_ids)} previously stored"
+            )
+            job.stages["diff"] = {
+                "previous_chunks": len(job.previous_ids),
+                "reused_chunks": len(job.reused_chunks),
+                "changed_chunks": len(job.chunks),
             }
-            self._trace_stage(trace, "split", {
-                "method": "recursive",
-                "chunk_count": len(chunks),
-                "avg_chunk_size": sum(len(c.text) for c in chunks) // len(chunks) if chunks else 0,
-                "chunks": self._chunk_details(chunks),
-            }, elapsed_ms=_elapsed)
-            
-            # ─────────────────────────────────────────────────────────────
-            # Stage 4: Transform Pipeline
-            # ─────────────────────────────────────────────────────────────
-            logger.info("\n🔄 Stage 4: Transform Pipeline")
-            await _notify("transform", 4)
-            
-            # 4a: Context Enrichment (zero-cost, always run first)
-            _t0_transform = time.monotonic()
-            chunks = self.context_enricher.transform(chunks, trace)
-            context_enriched = sum(1 for c in chunks if c.metadata.get("embedding_text"))
-            logger.info(f"  4a. Context Enrichment: {context_enriched}/{len(chunks)} chunks enriched")
-            await _notify("transform:context", 4, 15.0)
-
-            # 4b: Parallel LLM Transforms
-            _pre_refine_texts = {c.id: c.text for c in chunks}
-            refined_by_llm = refined_by_rule = 0
-            enriched_by_llm = enriched_by_rule = 0
-            captioned = 0
-
-            if self.skip_llm_transform:
-                logger.info("  ⏩ Skipping LLM transforms (skip_llm_transform=True)")
-                chunks = self.chunk_refiner.transform(chunks, trace)
-                refined_by_rule = sum(1 for c in chunks if c.metadata.get("refined_by") == "rule")
-                logger.info(f"      Rule refined: {refined_by_rule}")
-                await _notify("transform:rule", 4, 30.0)
-            else:
-                logger.info("  4b. Parallel LLM Transforms (Refine + Enrich + Caption)...")
-                
-                # We wrap the synchronous transform calls in asyncio.to_thread to run them in parallel
-                # Since these are mostly IO/API bound (LLM calls), this is safe and effective.
-                async def _run_refine():
-                    nonlocal chunks
-                    return await asyncio.to_thread(self.chunk_refiner.transform, chunks, trace)
-                
-                async def _run_enrich():
-                    nonlocal chunks
-                    return await asyncio.to_thread(self.metadata_enricher.transform, chunks, trace)
-                
-                async def _run_caption():
-                    nonlocal chunks
-                    return await asyncio.to_thread(self.image_captioner.transform, chunks, trace)
-
-                # Execute Refine first as it might change the text, then Enrich and Caption in parallel
-                # because metadata enrichment often depends on the final text.
-                chunks = await _run_refine()
-                await _notify("transform:refine", 4, 25.0)
-                
-                # Enrich and Caption can run in parallel
-                await asyncio.gather(_run_enrich(), _run_caption())
-                await _notify("transform:enrich_caption", 4, 45.0)
-                
-                refined_by_llm = sum(1 for c in chunks if c.metadata.get("refined_by") == "llm")
-                refined_by_rule = sum(1 for c in chunks if c.metadata.get("refined_by") == "rule")
-                enriched_by_llm = sum(1 for c in chunks if c.metadata.get("enriched_by") == "llm")
-                enriched_by_rule = sum(1 for c in chunks if c.metadata.get("enriched_by") == "rule")
-                captioned = sum(1 for c in chunks if c.metadata.get("image_captions"))
-                
-                logger.info(f"      LLM refined: {refined_by_llm}, Rule refined: {refined_by_rule}")
-                logger.info(f"      LLM enriched: {enriched_by_llm}, Rule enriched: {enriched_by_rule}")
-                logger.info(f"      Chunks with captions: {captioned}")
-            
-            stages["transform"] = {
-                "context_enricher": {"enriched": context_enriched},
-                "chunk_refiner": {"llm": refined_by_llm, "rule": refined_by_rule},
-                "metadata_enricher": {"llm": enriched_by_llm, "rule": enriched_by_rule},
-                "image_captioner": {"captioned_chunks": captioned}
+            self._trace_stage(trace, "diff", dict(job.stages["diff"]), elapsed_ms=_elapsed)
+        return None
+    
+    def _diff_chunks(self, job: FileJob) -> None:
+        """Split job.chunks into changed chunks and reusable stored chunks.
+        
+        A new chunk is reused if a stored chunk of the same source_path has
+        the same source text hash and was embedded by the current model.
+        It keeps the stored (refined) text, enrichment, captions and vector;
+        its structural metadata (chunk_index, doc_hash, ...) comes from the
+        new chunking. Stored chunks without a source text hash (ingested
+        before diffing existed) or without the current embedding model
+        stamp never match.
+        """
+        src_path = job.original_filename or str(job.file_path)
+        previous = self.vector_upserter.get_records_by_source_path(src_path)
+        job.previous_ids = [r["id"] for r in previous]
+        
+        stored: Dict[str, List[Dict[str, Any]]] = {}
+        for record in previous:
+            metadata = record.get("metadata") or {}
+            key = metadata.get(SOURCE_TEXT_HASH_KEY)
+            model = metadata.get(EMBEDDING_MODEL_KEY)
+            vector = record.get("vector")
+            if not key or vector is None or len(vector) == 0:
+                continue
+            if model != self.dense_encoder.fingerprint:
+                continue
+            stored.setdefault(key, []).append(record)
+        
+        changed: List[Chunk] = []
+        for chunk in job.chunks:
+            matches = stored.get(chunk.metadata[SOURCE_TEXT_HASH_KEY])
+            if not matches:
+                changed.append(chunk)
+                continue
+            record = matches.pop(0)
+            metadata = {
+                k: v for k, v in record["metadata"].items() if k not in ("text", "chunk_id")
             }
-            _elapsed_transform = (time.monotonic() - _t0_transform) * 1000.0
-            self._trace_stage(trace, "transform", {
-                "method": "refine+enrich+caption",
-                "refined_by_llm": refined_by_llm,
-                "refined_by_rule": refined_by_rule,
-                "enriched_by_llm": enriched_by_llm,
-                "enriched_by_rule": enriched_by_rule,
-                "captioned_chunks": captioned,
-                "chunks": self._transform_details(chunks, _pre_refine_texts),
-            }, elapsed_ms=_elapsed_transform)
+            metadata.update(chunk.metadata)
+            job.reused_chunks.append(dataclasses.replace(
+                chunk,
+                text=record.get("text") or record["metadata"].get("text") or chunk.text,
+                metadata=metadata,
+            ))
+            job.reused_vectors.append([float(x) for x in record["vector"]])
+        job.chunks = changed
+    
+    async def transform_file(self, job: FileJob) -> None:
+        """Stage 4: context enrichment and the (LLM) chunk transforms."""
+        trace = job.trace
+        chunks = job.chunks
+        
+        # ─────────────────────────────────────────────────────────────
+        # Stage 4: Transform Pipeline
+        # ─────────────────────────────────────────────────────────────
+        logger.info("\n🔄 Stage 4: Transform Pipeline")
+        await self._notify(job, "transform", 4)
+        
+        if not chunks and job.reused_chunks:
+            logger.info("  ⏩ No changed chunks, all transforms reused")
+            job.stages["transform"] = {"skipped": True, "reason": "no_changed_chunks"}
+            return
+        
+        # 4a: Context Enrichment (zero-cost, always run first)
+        _t0_transform = time.monotonic()
+        chunks = self.context_enricher.transform(chunks, trace)
+        context_enriched = sum(1 for c in chunks if c.metadata.get("embedding_text"))
+        logger.info(f"  4a. Context Enrichment: {context_enriched}/{len(chunks)} chunks enriched")
+        await self._notify(job, "transform:context", 4, 15.0)
+        
+        # 4b: Parallel LLM Transforms
+        _pre_refine_texts = {c.id: c.text for c in chunks}
+        refined_by_llm = refined_by_rule = 0
+        enriched_by_llm = enriched_by_rule = 0
+        captioned = 0
+        
+        if self.skip_llm_transform:
+            logger.info("  ⏩ Skipping LLM transforms (skip_llm_transform=True)")
+            chunks = self.chunk_refiner.transform(chunks, trace)
+            refined_by_rule = sum(1 for c in chunks if c.metadata.get("refined_by") == "rule")
+            logger.info(f"      Rule refined: {refined_by_rule}")
+            await self._notify(job, "transform:rule", 4, 30.0)
+        else:
+            logger.info("  4b. Parallel LLM Transforms (Refine + Enrich + Caption)...")
             
-            # ─────────────────────────────────────────────────────────────
-            # Stage 5: Encoding
-            # ─────────────────────────────────────────────────────────────
-            logger.info("\n🔢 Stage 5: Encoding")
-            await _notify("embed", 5)
+            # We wrap the synchronous transform calls in asyncio.to_thread to run them in parallel
+            # Since these are mostly IO/API bound (LLM calls), this is safe and effective.
+            async def _run_refine():
+                nonlocal chunks
+                return await asyncio.to_thread(self.chunk_refiner.transform, chunks, trace)
             
-            # Process through BatchProcessor
-            _t0 = time.monotonic()
-            batch_result = self.batch_processor.process(chunks, trace)
-            _elapsed = (time.monotonic() - _t0) * 1000.0
+            async def _run_enrich():
+                nonlocal chunks
+                return await asyncio.to_thread(self.metadata_enricher.transform, chunks, trace)
             
-            dense_vectors = batch_result.dense_vectors
-            sparse_stats = batch_result.sparse_stats
+            async def _run_caption():
+                nonlocal chunks
+                return await asyncio.to_thread(self.image_captioner.transform, chunks, trace)
             
-            logger.info(f"  Dense vectors: {len(dense_vectors)} (dim={len(dense_vectors[0]) if dense_vectors else 0})")
-            logger.info(f"  Sparse stats: {len(sparse_stats)} documents")
+            # Execute Refine first as it might change the text, then Enrich and Caption in parallel
+            # because metadata enrichment often depends on the final text.
+            chunks = await _run_refine()
+            await self._notify(job, "transform:refine", 4, 25.0)
             
-            stages["encoding"] = {
-                "dense_vector_count": len(dense_vectors),
-                "dense_dimension": len(dense_vectors[0]) if dense_vectors else 0,
-                "sparse_doc_count": len(sparse_stats)
-            }
-            self._trace_stage(trace, "embed", {
-                "method": "batch_processor",
-                "dense_vector_count": len(dense_vectors),
-                "dense_dimension": len(dense_vectors[0]) if dense_vectors else 0,
-                "sparse_doc_count": len(sparse_stats),
-                "chunks": self._encoding_details(chunks, dense_vectors, sparse_stats),
-            }, elapsed_ms=_elapsed)
+            # Enrich and Caption can run in parallel
+            await asyncio.gather(_run_enrich(), _run_caption())
+            await self._notify(job, "transform:enrich_caption", 4, 45.0)
             
-            # ─────────────────────────────────────────────────────────────
-            # Stage 6: Storage
-            # ─────────────────────────────────────────────────────────────
-            logger.info("\n💾 Stage 6: Storage")
-            await _notify("upsert", 6)
+            refined_by_llm = sum(1 for c in chunks if c.metadata.get("refined_by") == "llm")
+            refined_by_rule = sum(1 for c in chunks if c.metadata.get("refined_by") == "rule")
+            enriched_by_llm = sum(1 for c in chunks if c.metadata.get("enriched_by") == "llm")
+            enriched_by_rule = sum(1 for c in chunks if c.metadata.get("enriched_by") == "rule")
+            captioned = sum(1 for c in chunks if c.metadata.get("image_captions"))
             
-            # 6a: Vector Upsert
-            if len(dense_vectors) == 0:
-                raise RuntimeError(
-                    f"Encoding failed: got 0 vectors for {len(chunks)} chunks. "
-                    f"Check embedding API logs above for details."
-                )
-            if len(dense_vectors) != len(chunks):
-                lost = len(chunks) - len(dense_vectors)
-                logger.warning(
-                    f"Partial encoding: {len(dense_vectors)}/{len(chunks)} chunks succeeded "
-                    f"({lost} chunks lost due to embedding errors). Proceeding with successful chunks."
+            logger.info(f"      LLM refined: {refined_by_llm}, Rule refined: {refined_by_rule}")
+            logger.info(f"      LLM enriched: {enriched_by_llm}, Rule enriched: {enriched_by_rule}")
+            logger.info(f"      Chunks with captions: {captioned}")
+        job.chunks = chunks
+        
+        job.stages["transform"] = {
+            "context_enricher": {"enriched": context_enriched},
+            "chunk_refiner": {"llm": refined_by_llm, "rule": refined_by_rule},
+            "metadata_enricher": {"llm": enriched_by_llm, "rule": enriched_by_rule},
+            "image_captioner": {"captioned_chunks": captioned}
+        }
+        _elapsed_transform = (time.monotonic() - _t0_transform) * 1000.0
+        self._trace_stage(trace, "transform", {
+            "method": "refine+enrich+caption",
+            "refined_by_llm": refined_by_llm,
+            "refined_by_rule": refined_by_rule,
+            "enriched_by_llm": enriched_by_llm,
+            "enriched_by_rule": enriched_by_rule,
+            "captioned_chunks": captioned,
+            "chunks": self._transform_details(chunks, _pre_refine_texts),
+        }, elapsed_ms=_elapsed_transform)
+    
+    async def encode_file(self, job: FileJob) -> None:
+        """Stage 5: dense and sparse encoding through the BatchProcessor."""
+        trace = job.trace
+        chunks = job.chunks
+        
+        # ─────────────────────────────────────────────────────────────
+        # Stage 5: Encoding
+        # ─────────────────────────────────────────────────────────────
+        logger.info("\n🔢 Stage 5: Encoding")
+        await self._notify(job, "embed", 5)
+        
+        _t0 = time.monotonic()
+        pooled = self.process_pool is not None and type(self.sparse_encoder) is SparseEncoder
+        if job.reused_chunks:
+            if self.batch_processor.shares_dense_pass:
+                # Learned sparse weights only come out of the embedding
+                # pass, so reused chunks are encoded again (transforms
+                # are still skipped)
+                chunks = job.chunks = chunks + job.reused_chunks
+                job.reused_chunks, job.reused_vectors = [], []
+            elif pooled:
+                job.reused_sparse = await encode_sparse_in_pool(self.process_pool, job.reused_chunks)
+            else:
+                job.reused_sparse = await asyncio.to_thread(self.sparse_encoder.encode, job.reused_chunks)
+        
+        if not chunks and job.reused_chunks:
+            batch_result = BatchResult(
+                dense_vectors=[], sparse_stats=[], batch_count=0, total_time=0.0,
+                successful_chunks=0, failed_chunks=0,
+            )
+        else:
+            # Process through BatchProcessor
+            # jieba term statistics across the worker processes, if enabled
+            pooled_sparse = None
+            if pooled:
+                pooled_sparse = await encode_sparse_in_pool(self.process_pool, chunks)
+            # Off the event loop: batches block on embedding API calls
+            batch_result = await asyncio.to_thread(
+                self.batch_processor.process, chunks, trace, pooled_sparse
+            )
+        _elapsed = (time.monotonic() - _t0) * 1000.0
+        job.batch_result = batch_result
+        
+        dense_vectors = batch_result.dense_vectors
+        sparse_stats = batch_result.sparse_stats
+        
+        logger.info(f"  Dense vectors: {len(dense_vectors)} (dim={len(dense_vectors[0]) if dense_vectors else 0})")
+        logger.info(f"  Sparse stats: {len(sparse_stats)} documents")
+        
+        job.stages["encoding"] = {
+            "dense_vector_count": len(dense_vectors),
+            "dense_dimension": len(dense_vectors[0]) if dense_vectors else 0,
+            "sparse_doc_count": len(sparse_stats),
+            "reused_vectors": batch_result.reused_vectors,
+            "reused_chunks": len(job.reused_chunks),
+        }
+        self._trace_stage(trace, "embed", {
+            "method": "batch_processor",
+            "dense_vector_count": len(dense_vectors),
+            "reused_vectors": batch_result.reused_vectors,
+            "dense_dimension": len(dense_vectors[0]) if dense_vectors else 0,
+            "sparse_doc_count": len(sparse_stats),
+            "chunks": self._encoding_details(chunks, dense_vectors, sparse_stats),
+        }, elapsed_ms=_elapsed)
+    
+    async def store_file(self, job: FileJob) -> PipelineResult:
+        """Stage 6: vector, sparse, image, parent and graph storage.
+        
+        Blocking writes run in a worker thread. Callers must not run
+        store_file for two files of one pipeline at the same time.
+        """
+        trace = job.trace
+        document = job.document
+        file_hash = job.file_hash
+        batch_result = job.batch_result
+        dense_vectors = batch_result.dense_vectors
+        sparse_stats = batch_result.sparse_stats
+        chunks = job.chunks
+        
+        # ─────────────────────────────────────────────────────────────
+        # Stage 6: Storage
+        # ─────────────────────────────────────────────────────────────
+        logger.info("\n💾 Stage 6: Storage")
+        await self._notify(job, "upsert", 6)
+        
+        # 6a: Vector Upsert
+        if chunks and len(dense_vectors) == 0:
+            raise RuntimeError(
+                f"Encoding failed: got 0 vectors for {len(chunks)} chunks. "
+                f"Check embedding API logs above for details."
+            )
+        if batch_result.failed_indices:
+            lost = len(batch_result.failed_indices)
+            logger.warning(
+                f"Partial encoding: {len(dense_vectors)}/{len(chunks)} chunks succeeded "
+                f"({lost} chunks lost due to embedding errors). Proceeding with successful chunks."
+            )
+            # Drop the chunks of failed batches so chunks, vectors and
+            # sparse_stats stay aligned
+            failed = set(batch_result.failed_indices)
+            chunks = [c for i, c in enumerate(chunks) if i not in failed]
+            job.chunks = chunks
+        if len(dense_vectors) != len(chunks) or len(sparse_stats) != len(chunks):
+            raise RuntimeError(
+                f"Encoding misaligned: {len(dense_vectors)} vectors and "
+                f"{len(sparse_stats)} sparse stats for {len(chunks)} chunks"
+            )
+        if job.reused_chunks:
+            # Unchanged chunks are stored again with their kept vectors
+            chunks = chunks + job.reused_chunks
+            dense_vectors = dense_vectors + job.reused_vectors
+            sparse_stats = sparse_stats + job.reused_sparse
+        _t0_storage = time.monotonic()
+        vector_ids = await asyncio.to_thread(
+            self._write_indexes, job, chunks, dense_vectors, sparse_stats
+        )
+        
+        # 6c: Register images in image storage index
+        # Note: Images are already saved by PdfLoader, we just need to index them
+        logger.info("  6c. Image Storage Index (Background detection)...")
+        images = document.metadata.get("images", [])
+        for img in images:
+            img_path = Path(img["path"])
+            if img_path.exists():
+                # Optimization 2: Persistent Background Detection during ingestion
+                # This ensures background status is known before any queries
+                is_bg = await self.image_storage.adetect_background(
+                    image_id=img["id"],
+                    image_path=str(img_path.resolve())
                 )
-                # Trim chunks and sparse_stats to match the vectors we have
-                chunks = chunks[:len(dense_vectors)]
-                sparse_stats = sparse_stats[:len(dense_vectors)]
-            logger.info("  6a. Vector Storage (ChromaDB)...")
-            _t0_storage = time.monotonic()
-            vector_ids = self.vector_upserter.upsert(chunks, dense_vectors, trace)
-            logger.info(f"      Stored {len(vector_ids)} vectors")
-
-            # Align BM25 chunk_ids with Chroma vector IDs so the SparseRetriever
-            # can look up BM25 hits in the vector store after retrieval.
-            for stat, vid in zip(sparse_stats, vector_ids):
-                stat["chunk_id"] = vid
-
-            # 6b: BM25 Index (with rollback on failure)
-            logger.info("  6b. BM25 Index...")
-            try:
-                self.bm25_indexer.add_documents(
-                    sparse_stats,
+                self.image_storage.register_image(
+                    image_id=img["id"],
+                    file_path=img_path,
                     collection=self.collection,
-                    doc_id=document.id,
-                    trace=trace,
+                    doc_hash=file_hash,
+                    page_num=img.get("page", 0),
+                    is_background=int(is_bg)
                 )
-            except Exception as bm25_err:
-                # Rollback: delete vectors from ChromaDB to maintain consistency
-                logger.error(f"BM25 index failed: {bm25_err}. Rolling back ChromaDB upsert...")
-                try:
-                    self.vector_upserter.vector_store.delete(vector_ids)
-                    logger.info(f"      Rollback: deleted {len(vector_ids)} vectors from ChromaDB")
-                except Exception as rollback_err:
-                    logger.error(f"      Rollback failed: {rollback_err}")
-                raise RuntimeError(
-                    f"BM25 index failed (ChromaDB rolled back): {bm25_err}"
-                ) from bm25_err
-            logger.info(f"      Index built for {len(sparse_stats)} documents")
-            
-            # 6c: Register images in image storage index
-            # Note: Images are already saved by PdfLoader, we just need to index them
-            logger.info("  6c. Image Storage Index (Background detection)...")
-            images = document.metadata.get("images", [])
-            for img in images:
-                img_path = Path(img["path"])
-                if img_path.exists():
-                    # Optimization 2: Persistent Background Detection during ingestion
-                    # This ensures background status is known before any queries
-                    is_bg = await self.image_storage.adetect_background(
-                        image_id=img["id"],
-                        image_path=str(img_path.resolve())
-                    )
-                    self.image_storage.register_image(
-                        image_id=img["id"],
-                        file_path=img_path,
-                        collection=self.collection,
-                        doc_hash=file_hash,
-                        page_num=img.get("page", 0),
-                        is_background=int(is_bg)
-                    )
-            logger.info(f"      Indexed {len(images)} images")
-
-            # 6d: Parent Chunk Storage (if Parent Retrieval enabled)
-            if self.hierarchical_chunker and self.parent_store:
-                logger.info("  6d. Parent Chunk Storage (hierarchical)...")
-                try:
-                    child_chunks, parent_chunks = self.hierarchical_chunker.split_hierarchical(document)
-                    self.parent_store.add_parents(parent_chunks)
-                    logger.info(f"      Stored {len(parent_chunks)} parent chunks, {len(child_chunks)} child chunks indexed")
-                except Exception as pr_err:
-                    logger.warning(f"      Parent Retrieval storage failed (non-fatal): {pr_err}")
-
-            # 6e: GraphRAG Entity Extraction (if enabled)
-            if self.graph_extractor and self.graph_store:
-                logger.info("  6e. GraphRAG Entity Extraction...")
-                try:
-                    e_count, r_count = self.graph_extractor.extract_and_store(
-                        chunks, doc_id=document.id, trace=trace
-                    )
-                    logger.info(f"      Extracted {e_count} entities, {r_count} relationships")
-                except Exception as gr_err:
-                    logger.warning(f"      GraphRAG extraction failed (non-fatal): {gr_err}")
-            
-            stages["storage"] = {
-                "vector_count": len(vector_ids),
-                "bm25_docs": len(sparse_stats),
-                "images_indexed": len(images)
-            }
-            _elapsed_storage = (time.monotonic() - _t0_storage) * 1000.0
-            self._trace_stage(trace, "upsert", {
-                "method": "chroma+bm25+image",
-                "dense_store": {
-                    "backend": "ChromaDB",
-                    "collection": self.collection,
-                    "count": len(vector_ids),
-                    "path": "data/db/chroma/",
-                },
-                "sparse_store": {
-                    "backend": "BM25",
-                    "collection": self.collection,
-                    "count": len(sparse_stats),
-                    "path": f"data/db/bm25/{self.collection}/",
-                },
-                "image_store": {
-                    "backend": "ImageStorage (JSON index)",
-                    "count": len(images),
-                    "images": [
-                        {"image_id": img["id"], "file_path": str(img["path"]),
-                         "page": img.get("page", 0), "doc_hash": file_hash}
-                        for img in images
-                    ],
-                },
-                "chunk_mapping": [
-                    {"chunk_id": c.id,
-                     "vector_id": vector_ids[i] if i < len(vector_ids) else "—",
-                     "collection": self.collection, "store": "ChromaDB"}
-                    for i, c in enumerate(chunks)
+        logger.info(f"      Indexed {len(images)} images")
+        
+        # 6d-6e: Parent chunks and graph entities (non-fatal)
+        await asyncio.to_thread(self._write_derived, job)
+        
+        job.stages["storage"] = {
+            "vector_count": len(vector_ids),
+            "bm25_docs": len(sparse_stats),
+            "images_indexed": len(images)
+        }
+        _elapsed_storage = (time.monotonic() - _t0_storage) * 1000.0
+        self._trace_stage(trace, "upsert", {
+            "method": "chroma+bm25+image",
+            "dense_store": {
+                "backend": "ChromaDB",
+                "collection": self.collection,
+                "count": len(vector_ids),
+                "path": "data/db/chroma/",
+            },
+            "sparse_store": {
+                "backend": "BM25",
+                "collection": self.collection,
+                "count": len(sparse_stats),
+                "path": f"data/db/bm25/{self.collection}/",
+            },
+            "image_store": {
+                "backend": "ImageStorage (JSON index)",
+                "count": len(images),
+                "images": [
+                    {"image_id": img["id"], "file_path": str(img["path"]),
+                     "page": img.get("page", 0), "doc_hash": file_hash}
+                    for img in images
                 ],
-            }, elapsed_ms=_elapsed_storage)
-            
-            # ─────────────────────────────────────────────────────────────
-            # Mark Success
-            # ─────────────────────────────────────────────────────────────
-            self.integrity_checker.mark_success(file_hash, display_name, self.collection)
-            
-            # Force ChromaDB to persist HNSW index to disk after each file
-            # This prevents index corruption during long batch runs
+            },
+            "chunk_mapping": [
+                {"chunk_id": c.id,
+                 "vector_id": vector_ids[i] if i < len(vector_ids) else "—",
+                 "collection": self.collection, "store": "ChromaDB"}
+                for i, c in enumerate(chunks)
+            ],
+        }, elapsed_ms=_elapsed_storage)
+        
+        # ─────────────────────────────────────────────────────────────
+        # Mark Success
+        # ─────────────────────────────────────────────────────────────
+        await asyncio.to_thread(self._commit_file, job)
+        
+        logger.info("\n" + "=" * 60)
+        logger.info("✅ Pipeline completed successfully!")
+        logger.info(f"   Chunks: {len(chunks)}")
+        logger.info(f"   Vectors: {len(vector_ids)}")
+        logger.info(f"   Images: {len(images)}")
+        logger.info("=" * 60)
+        
+        return PipelineResult(
+            success=True,
+            file_path=job.display_name,
+            doc_id=file_hash,
+            chunk_count=len(chunks),
+            image_count=len(images),
+            vector_ids=vector_ids,
+            stages=job.stages
+        )
+    
+    def fail_file(self, job: FileJob, error: Exception) -> PipelineResult:
+        """Record a failed file and build its failure result."""
+        logger.error(f"❌ Pipeline failed: {error}", exc_info=error)
+        if job.file_hash is not None:
+            self.integrity_checker.mark_failed(job.file_hash, job.display_name, str(error))
+        if job.stores_modified:
+            bump_cache_generation(self.collection)
+        
+        return PipelineResult(
+            success=False,
+            file_path=job.display_name,
+            doc_id=job.file_hash,
+            error=str(error),
+            stages=job.stages
+        )
+    
+    def _write_indexes(
+        self,
+        job: FileJob,
+        chunks: List[Chunk],
+        dense_vectors: List,
+        sparse_stats: List[Dict[str, Any]],
+    ) -> List[str]:
+        """Stages 6a-6b: upsert vectors, then add the sparse statistics.
+        
+        With diff re-ingestion the chunks that vanished from the document
+        are deleted afterwards; otherwise a forced re-ingest deletes all old
+        chunks of the source first.
+        
+        Returns:
+            Stored vector IDs.
+        """
+        trace = job.trace
+        logger.info("  6a. Vector Storage (ChromaDB)...")
+        job.stores_modified = True
+        # When force=True, delete old chunks for this source_path so
+        # content-hash-based IDs don't create orphan duplicates. Done
+        # after encoding so unchanged chunks could reuse their vectors.
+        if self.force and job.previous_ids is None:
+            src_path = job.original_filename or str(job.file_path)
+            deleted = self.vector_upserter.delete_by_source_path(src_path)
+            if deleted:
+                logger.info(f"      Deleted {deleted} old chunks for re-ingestion")
+        vector_ids = self.vector_upserter.upsert(chunks, dense_vectors, trace)
+        logger.info(f"      Stored {len(vector_ids)} vectors")
+        
+        # Align BM25 chunk_ids with Chroma vector IDs so the SparseRetriever
+        # can look up BM25 hits in the vector store after retrieval.
+        for stat, vid in zip(sparse_stats, vector_ids):
+            stat["chunk_id"] = vid
+        
+        # 6b: BM25 Index (with rollback on failure)
+        logger.info("  6b. BM25 Index...")
+        try:
+            self.bm25_indexer.add_documents(
+                sparse_stats,
+                collection=self.collection,
+                doc_id=job.document.id,
+                trace=trace,
+            )
+        except Exception as bm25_err:
+            # Rollback: delete vectors from ChromaDB to maintain consistency
+            logger.error(f"BM25 index failed: {bm25_err}. Rolling back ChromaDB upsert...")
+            # IDs of the previous version stay; their records were only rewritten
+            previous = set(job.previous_ids or ())
+            added_ids = [vid for vid in vector_ids if vid not in previous]
             try:
-                self.vector_upserter.vector_store._wal_checkpoint()
-                logger.info("  💾 ChromaDB WAL checkpoint completed")
-            except Exception as flush_err:
-                logger.warning(f"  ⚠️  ChromaDB flush warning: {flush_err}")
-            
-            # Verify HNSW health and create backup after successful ingestion
+                self.vector_upserter.delete(added_ids)
+                logger.info(f"      Rollback: deleted {len(added_ids)} vectors from ChromaDB")
+            except Exception as rollback_err:
+                logger.error(f"      Rollback failed: {rollback_err}")
+            raise RuntimeError(
+                f"BM25 index failed (ChromaDB rolled back): {bm25_err}"
+            ) from bm25_err
+        logger.info(f"      Index built for {len(sparse_stats)} documents")
+        
+        # Diff re-ingestion: drop the chunks the new version no longer has
+        if job.previous_ids:
+            vanished = sorted(set(job.previous_ids) - set(vector_ids))
+            if vanished:
+                self.vector_upserter.delete(vanished)
+                self.bm25_indexer.remove_chunks(vanished, collection=self.collection)
+                logger.info(f"      Deleted {len(vanished)} vanished chunks")
+            job.stages.setdefault("diff", {})["deleted_chunks"] = len(vanished)
+        return vector_ids
+    
+    def _write_derived(self, job: FileJob) -> None:
+        """Stages 6d-6e: parent chunks and GraphRAG entities (if enabled)."""
+        document = job.document
+        
+        # 6d: Parent Chunk Storage (if Parent Retrieval enabled)
+        if self.hierarchical_chunker and self.parent_store:
+            logger.info("  6d. Parent Chunk Storage (hierarchical)...")
             try:
-                vs = self.vector_upserter.vector_store
-                if hasattr(vs, 'backup_manager'):
-                    vs.backup_manager.verify_and_backup(
-                        vs.collection, label="ingest"
-                    )
-            except Exception as bak_err:
-                logger.warning(f"  ⚠️  HNSW backup warning: {bak_err}")
-            
-            logger.info("\n" + "=" * 60)
-            logger.info("✅ Pipeline completed successfully!")
-            logger.info(f"   Chunks: {len(chunks)}")
-            logger.info(f"   Vectors: {len(vector_ids)}")
-            logger.info(f"   Images: {len(images)}")
-            logger.info("=" * 60)
-            
-            return PipelineResult(
-                success=True,
-                file_path=display_name,
-                doc_id=file_hash,
-                chunk_count=len(chunks),
-                image_count=len(images),
-                vector_ids=vector_ids,
-                stages=stages
-            )
-            
-        except Exception as e:
-            logger.error(f"❌ Pipeline failed: {e}", exc_info=True)
-            self.integrity_checker.mark_failed(file_hash, display_name, str(e))
-            
-            return PipelineResult(
-                success=False,
-                file_path=display_name,
-                doc_id=file_hash if 'file_hash' in locals() else None,
-                error=str(e),
-                stages=stages
-            )
+                child_chunks, parent_chunks = self.hierarchical_chunker.split_hierarchical(document)
+                self.parent_store.add_parents(parent_chunks)
+                # Parent texts are also served from the chunk docstore
+                self.vector_upserter.docstore.put_many(
+                    [{"id": p.id, "text": p.text, "metadata": p.metadata} for p in parent_chunks],
+                    kind="parent",
+                )
+                logger.info(f"      Stored {len(parent_chunks)} parent chunks, {len(child_chunks)} child chunks indexed")
+            except Exception as pr_err:
+                logger.warning(f"      Parent Retrieval storage failed (non-fatal): {pr_err}")
+        
+        # 6e: GraphRAG Entity Extraction (if enabled)
+        if self.graph_extractor and self.graph_store:
+            logger.info("  6e. GraphRAG Entity Extraction...")
+            try:
+                e_count, r_count = self.graph_extractor.extract_and_store(
+                    job.chunks, doc_id=document.id, trace=job.trace
+                )
+                logger.info(f"      Extracted {e_count} entities, {r_count} relationships")
+            except Exception as gr_err:
+                logger.warning(f"      GraphRAG extraction failed (non-fatal): {gr_err}")
+    
+    def _commit_file(self, job: FileJob) -> None:
+        """Mark the file as processed, retire caches and checkpoint the store."""
+        self.integrity_checker.mark_success(job.file_hash, job.display_name, self.collection)
+        
+        # Retire cached retrievals/answers/rerank scores for this collection
+        bump_cache_generation(self.collection)
+        
+        # Force ChromaDB to persist HNSW index to disk after each file
+        # This prevents index corruption during long batch runs
+        try:
+            self.vector_upserter.vector_store._wal_checkpoint()
+            logger.info("  💾 ChromaDB WAL checkpoint completed")
+        except Exception as flush_err:
+            logger.warning(f"  ⚠️  ChromaDB flush warning: {flush_err}")
+        
+        # Verify HNSW health and create backup after successful ingestion
+        try:
+            vs = self.vector_upserter.vector_store
+            if hasattr(vs, 'backup_manager'):
+                vs.backup_manager.verify_and_backup(
+                    vs.collection, label="ingest"
+                )
+        except Exception as bak_err:
+            logger.warning(f"  ⚠️  HNSW backup warning: {bak_err}")
+    
+    @contextmanager
+    def batch_index_commits(self) -> Iterator[None]:
+        """Commit the sparse index once for a whole batch of files.
+        
+        With the Tantivy backend every ``run()`` inside the block adds to
+        one open writer and the commit happens when the block exits (folder
+        ingestion pays one commit instead of one per file). Query caches
+        are retired again after that commit, since the batched chunks only
+        become searchable then. Other backends commit per file as usual.
+        """
+        batch = getattr(self.bm25_indexer, "batch_commits", None)
+        if batch is None:
+            yield
+            return
+        try:
+            with batch():
+                yield
+        finally:
+            bump_cache_generation(self.collection)
     
     def close(self) -> None:
         """Clean up resources."""
@@ -0,0 +1,270 @@
+"""Pipelined multi-file ingestion.
+
+``IngestionPipeline.run()`` takes one file through every stage before the
+next file starts, so the CPU idles while embeddings are requested and the
+network idles while PDFs are parsed and OCRed. ``PipelinedIngestion`` runs
+the stage methods of one pipeline as worker pools connected by bounded
+queues:
+
+    prepare (hash, parse, chunk) -> transform -> encode -> store
+
+While file N is embedded, file N+1 is parsed and chunked and file N-1 is
+written to the vector store and sparse index.
+
+Design Principles:
+- Backpressure: Queues between stages hold at most ``queue_size`` files,
+  so a slow stage holds back the earlier ones instead of piling up parsed
+  documents in memory
+- Bounded: Worker count per stage is configurable
+  (ingestion.pipelining in settings.yaml)
+- Single Writer: Storage runs one file at a time, as with run()
+- Same Semantics: Each file goes through the same stage methods and gets
+  the same PipelineResult as with run()
+"""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Sequence
+
+from src.core.trace.trace_context import TraceContext
+from src.observability.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.ingestion.pipeline import FileJob, IngestionPipeline, PipelineResult
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class IngestFile:
+    """A file queued for pipelined ingestion.
+
+    Attributes:
+        path: Path of the file.
+        original_filename: Optional display name (see IngestionPipeline.run).
+        extra_metadata: Optional metadata injected into every chunk.
+        trace: Optional per-file TraceContext.
+    """
+    path: str
+    original_filename: Optional[str] = None
+    extra_metadata: Optional[Dict[str, str]] = None
+    trace: Optional[TraceContext] = None
+
+
+class PipelinedIngestion:
+    """Overlaps the ingestion stages of consecutive files.
+
+    Attributes:
+        pipeline: IngestionPipeline whose stage methods are run.
+        load_workers: Files hashed, parsed and chunked concurrently.
+        transform_workers: Files in the transform stage concurrently.
+        embed_workers: Files encoded concurrently (each file's batches
+            additionally share the embedding rate limiter).
+        queue_size: Files buffered between two stages.
+        overlap: If False, files run one after another (like run()).
+
+    Example:
+        >>> runner = PipelinedIngestion.from_settings(pipeline)
+        >>> results = await runner.run(
+        ...     [IngestFile("docs/a.pdf"), IngestFile("docs/b.pdf")],
+        ...     on_stage=lambda i, stage: print(i, stage),
+        ... )
+    """
+
+    def __init__(
+        self,
+        pipeline: IngestionPipeline,
+        load_workers: int = 1,
+        transform_workers: int = 2,
+        embed_workers: int = 1,
+        queue_size: int = 2,
+        overlap: bool = True,
+    ) -> None:
+        """Initialize PipelinedIngestion.
+
+        Args:
+            pipeline: IngestionPipeline to run.
+            load_workers: Concurrent prepare (hash/parse/chunk) workers.
+            transform_workers: Concurrent transform workers.
+            embed_workers: Concurrent encode workers.
+            queue_size: Capacity of each inter-stage queue.
+            overlap: Set False to disable pipelining.
+
+        Raises:
+            ValueError: If a worker count or queue_size is < 1.
+        """
+        for name, value in (
+            ("load_workers", load_workers),
+            ("transform_workers", transform_workers),
+            ("embed_workers", embed_workers),
+            ("queue_size", queue_size),
+        ):
+            if value < 1:
+                raise ValueError(f"{name} must be >= 1, got {value}")
+        self.pipeline = pipeline
+        self.load_workers = load_workers
+        self.transform_workers = transform_workers
+        self.embed_workers = embed_workers
+        self.queue_size = queue_size
+        self.overlap = overlap
+
+    @classmethod
+    def from_settings(cls, pipeline: IngestionPipeline) -> PipelinedIngestion:
+        """Create a runner configured by ``ingestion.pipelining``."""
+        ingestion = pipeline.settings.ingestion
+        config = getattr(ingestion, "pipelining", None) if ingestion else None
+        if config is None:
+            return cls(pipeline)
+        return cls(
+            pipeline,
+            load_workers=config.load_workers,
+            transform_workers=config.transform_workers,
+            embed_workers=config.embed_workers,
+            queue_size=config.queue_size,
+            overlap=config.enabled,
+        )
+
+    async def run(
+        self,
+        files: Sequence[IngestFile],
+        on_stage: Optional[Callable[[int, str], None]] = None,
+        on_result: Optional[Callable[[int, PipelineResult], None]] = None,
+        should_stop: Optional[Callable[[], bool]] = None,
+    ) -> List[PipelineResult]:
+        """Ingest files with overlapping stages.
+
+        Args:
+            files: Files to ingest, started in this order.
+            on_stage: Called with (file index, stage name) whenever a file
+                enters a stage or sub-stage ("integrity", "load", ...,
+                "upsert"), on the event loop thread.
+            on_result: Called with (file index, result) when a file is
+                finished, skipped or failed.
+            should_stop: Checked before each file is started; once it
+                returns True no new file starts and files already in
+                flight are completed.
+
+        Returns:
+            Results of the started files, in input order.
+        """
+        pipeline = self.pipeline
+        results: Dict[int, PipelineResult] = {}
+        pending = iter(enumerate(files))
+
+        def _finish(index: int, result: PipelineResult) -> None:
+            results[index] = result
+            if on_result is not None:
+                on_result(index, result)
+
+        def _job(index: int, spec: IngestFile) -> FileJob:
+            async def _progress(stage_name: str, percent: float) -> None:
+                if on_stage is not None:
+                    on_stage(index, stage_name)
+
+            return pipeline.create_job(
+                spec.path,
+                trace=spec.trace,
+                on_progress_async=_progress,
+                original_filename=spec.original_filename,
+                extra_metadata=spec.extra_metadata,
+            )
+
+        async def _prepare_worker(outbox: asyncio.Queue) -> None:
+            while not (should_stop is not None and should_stop()):
+                item = next(pending, None)
+                if item is None:
+                    return
+                index, spec = item
+                job = _job(index, spec)
+                try:
+                    skipped = await pipeline.prepare_file(job)
+                except Exception as e:
+                    _finish(index, pipeline.fail_file(job, e))
+                    continue
+                if skipped is not None:
+                    _finish(index, skipped)
+                    continue
+                await outbox.put((index, job))
+
+        async def _stage_worker(
+            step: Callable[[FileJob], Any],
+            inbox: asyncio.Queue,
+            outbox: Optional[asyncio.Queue],
+        ) -> None:
+            while True:
+                item = await inbox.get()
+                if item is None:
+                    return
+                index, job = item
+                try:
+                    result = await step(job)
+                except Exception as e:
+                    _finish(index, pipeline.fail_file(job, e))
+                    continue
+                if outbox is None:
+                    _finish(index, result)
+                else:
+                    await outbox.put(item)
+
+        async def _pool(workers: List[Any], outbox: Optional[asyncio.Queue], consumers: int) -> None:
+            # When a stage is drained, stop each worker of the next one
+            await asyncio.gather(*workers)
+            if outbox is not None:
+                for _ in range(consumers):
+                    await outbox.put(None)
+
+        if not self.overlap:
+            for index, spec in pending:
+                if should_stop is not None and should_stop():
+                    break
+                job = _job(index, spec)
+                try:
+                    result = await pipeline.prepare_file(job)
+                    if result is None:
+                        await pipeline.transform_file(job)
+                        await pipeline.encode_file(job)
+                        result = await pipeline.store_file(job)
+                except Exception as e:
+                    result = pipeline.fail_file(job, e)
+                _finish(index, result)
+            return [results[i] for i in sorted(results)]
+
+        prepared: asyncio.Queue = asyncio.Queue(self.queue_size)
+        transformed: asyncio.Queue = asyncio.Queue(self.queue_size)
+        encoded: asyncio.Queue = asyncio.Queue(self.queue_size)
+        stages = [
+            (
+                [_prepare_worker(prepared) for _ in range(self.load_workers)],
+                prepared, self.transform_workers,
+            ),
+            (
+                [_stage_worker(pipeline.transform_file, prepared, transformed)
+                 for _ in range(self.transform_workers)],
+                transformed, self.embed_workers,
+            ),
+            (
+                [_stage_worker(pipeline.encode_file, transformed, encoded)
+                 for _ in range(self.embed_workers)],
+                encoded, 1,
+            ),
+            # Storage stays single-writer
+            ([_stage_worker(pipeline.store_file, encoded, None)], None, 0),
+        ]
+        logger.info(
+            f"Pipelined ingestion of {len(files)} files "
+            f"(load={self.load_workers}, transform={self.transform_workers}, "
+            f"embed={self.embed_workers}, store=1, queue={self.queue_size})"
+        )
+        tasks = [
+            asyncio.ensure_future(_pool(workers, outbox, consumers))
+            for workers, outbox, consumers in stages
+        ]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # A failing stage must not leave the other stages waiting
+            for task in tasks:
+                task.cancel()
+        return [results[i] for i in sorted(results)]
@@ -0,0 +1,175 @@
+"""Process pool for the CPU-bound ingestion stages.
+
+Document parsing (PDF layout analysis, OCR, markitdown conversion),
+chunking (StructureSplitter) and jieba tokenization for the sparse index
+are pure Python CPU work. In threads they are serialized by the GIL, so a
+bulk ingestion uses about one core however many files are in flight. With
+the pool enabled these stages run in worker processes: a file path goes
+out, the parsed Document and its chunks come back, and chunk texts go out
+for term statistics. The parent process remains the only writer of
+ChromaDB, the sparse index and the SQLite stores.
+
+Design Principles:
+- Long-lived: One pool per process, created lazily on first use
+- Warm Workers: Each worker builds its chunker and loads the jieba
+  dictionary once (initializer), not per file
+- Spawn: Workers are spawned, not forked, so they never inherit locks held
+  by the parent's threads (embedding, ChromaDB, executors)
+- Config-Driven: ingestion.process_pool in settings.yaml (off by default)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+if TYPE_CHECKING:
+    from src.core.settings import Settings
+    from src.core.types import Chunk, Document
+
+logger = logging.getLogger(__name__)
+
+# Global pool instance
+_process_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+# Per-worker state, set by _init_worker (inside worker processes only)
+_worker_state: Dict[str, Any] = {}
+
+
+def get_process_pool(settings: Settings) -> Optional[ProcessPoolExecutor]:
+    """Get the shared ingestion process pool, creating it on first use.
+
+    Args:
+        settings: Application settings. Workers build their chunker from
+            the settings of the first caller.
+
+    Returns:
+        Shared ProcessPoolExecutor, or None if ingestion.process_pool is
+        not enabled.
+    """
+    global _process_pool
+    ingestion = settings.ingestion
+    config = getattr(ingestion, "process_pool", None) if ingestion else None
+    if config is None or not config.enabled:
+        return None
+    if _process_pool is None:
+        with _pool_lock:
+            if _process_pool is None:
+                max_workers = config.max_workers or os.cpu_count() or 1
+                _process_pool = ProcessPoolExecutor(
+                    max_workers=max_workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker,
+                    initargs=(settings,),
+                )
+                logger.info(f"Ingestion process pool started (max_workers={max_workers})")
+    return _process_pool
+
+
+def shutdown_process_pool(wait: bool = True) -> None:
+    """Shut down the shared pool (a new one is created on next use).
+
+    Args:
+        wait: Block until running work has finished.
+    """
+    global _process_pool
+    with _pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+async def run_in_pool(pool: ProcessPoolExecutor, func: Any, *args: Any, **kwargs: Any) -> Any:
+    """Run a module-level function in the pool and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(pool, functools.partial(func, *args, **kwargs))
+
+
+async def encode_sparse_in_pool(
+    pool: ProcessPoolExecutor,
+    chunks: List[Chunk],
+    min_slice: int = 64,
+) -> List[Dict[str, Any]]:
+    """Compute SparseEncoder term statistics across the pool's workers.
+
+    Chunks are split into one slice per worker (at least ``min_slice``
+    chunks each, so small documents are not spread thinly).
+
+    Returns:
+        Term statistics aligned with *chunks*.
+    """
+    workers = getattr(pool, "_max_workers", 1) or 1
+    size = max(min_slice, -(-len(chunks) // workers))
+    parts = await asyncio.gather(*(
+        run_in_pool(pool, encode_sparse, chunks[i:i + size])
+        for i in range(0, len(chunks), size)
+    ))
+    return [stat for part in parts for stat in part]
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# Worker side (executed in pool processes)
+# ─────────────────────────────────────────────────────────────────────────
+
+def _init_worker(settings: Settings) -> None:
+    """Build the per-worker chunker and sparse encoder."""
+    import jieba
+
+    from src.ingestion.chunking.document_chunker import DocumentChunker
+    from src.ingestion.embedding.sparse_encoder import SparseEncoder
+
+    jieba.setLogLevel(logging.WARNING)
+    jieba.initialize()
+    _worker_state["settings"] = settings
+    _worker_state["chunker"] = DocumentChunker(settings)
+    _worker_state["sparse_encoder"] = SparseEncoder()
+
+
+def load_and_split(
+    file_path: str,
+    pdf_parser: str,
+    image_storage_dir: str,
+    original_filename: Optional[str] = None,
+) -> Tuple[Document, List[Chunk], float, float]:
+    """Parse a file and split it into chunks (in a worker process).
+
+    Mirrors IngestionPipeline stages 2-3: ``source_path`` is replaced by
+    *original_filename* before splitting.
+
+    Returns:
+        Tuple of (document, chunks, load_ms, split_ms).
+    """
+    from src.libs.loader.loader_factory import LoaderFactory
+
+    _t0 = time.monotonic()
+    ingestion = _worker_state["settings"].ingestion
+    loader = LoaderFactory.create(
+        file_path,
+        extract_images=True,
+        image_storage_dir=image_storage_dir,
+        pdf_parser=pdf_parser,
+        layout_config=getattr(ingestion, "layout_pdf", None) if ingestion else None,
+    )
+    document = loader.load(str(file_path))
+    if original_filename and "source_path" in document.metadata:
+        document.metadata["source_path"] = original_filename
+        document.metadata["original_filename"] = original_filename
+    load_ms = (time.monotonic() - _t0) * 1000.0
+
+    _t0 = time.monotonic()
+    chunks = _worker_state["chunker"].split_document(document)
+    split_ms = (time.monotonic() - _t0) * 1000.0
+    return document, chunks, load_ms, split_ms
+
+
+def encode_sparse(chunks: List[Chunk]) -> List[Dict[str, Any]]:
+    """SparseEncoder.encode() in a worker process."""
+    return _worker_state["sparse_encoder"].encode(chunks)
@@ -5,7 +5,7 @@ Defines the common interface for all queue backends (Memory, Redis).
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional, Protocol
+from typing import Any, Dict, List, Optional, Protocol
 
 
 class BaseQueue(Protocol):
@@ -14,7 +14,7 @@ class BaseQueue(Protocol):
     All queue backends must implement these methods to ensure
     compatibility with the IngestionWorker.
 
-    Task lifecycle: enqueue → dequeue → (process) → ack/nack
+    Task lifecycle: enqueue → dequeue → (process) → ack or requeue
     """
 
     async def enqueue(self, task_data: Dict[str, Any]) -> str:
@@ -68,3 +68,39 @@ class BaseQueue(Protocol):
             Count of pending tasks.
         """
         ...
+
+    async def requeue(
+        self, task_data: Dict[str, Any], retry_count: int, error: str = ""
+    ) -> None:
+        """Put a dequeued task back for another attempt.
+
+        The current delivery is settled only after the new entry exists,
+        so a crash in between never loses the task.
+
+        Args:
+            task_data: Task dict as returned by dequeue().
+            retry_count: Attempt number stored with the new entry.
+            error: Error of the failed attempt.
+        """
+        ...
+
+    async def reclaim(self, min_idle_ms: int, count: int = 10) -> List[Dict[str, Any]]:
+        """Take over tasks delivered to consumers that stopped responding.
+
+        Args:
+            min_idle_ms: Minimum time since the last delivery or heartbeat
+                before a task counts as orphaned.
+            count: Maximum number of tasks to reclaim.
+
+        Returns:
+            Reclaimed task dicts (same format as dequeue()).
+        """
+        ...
+
+    async def heartbeat(self) -> None:
+        """Mark the tasks this consumer is still working on as alive.
+
+        Called periodically by the worker so reclaim() on other consumers
+        only takes over tasks whose consumer stopped responding.
+        """
+        ...
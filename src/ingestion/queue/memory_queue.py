@@ -11,7 +11,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -107,3 +107,28 @@ class MemoryQueue:
             Count of pending tasks in queue.
         """
         return self._queue.qsize()
+
+    async def requeue(
+        self, task_data: Dict[str, Any], retry_count: int, error: str = ""
+    ) -> None:
+        """Put a dequeued task back for another attempt.
+
+        Args:
+            task_data: Task dict as returned by dequeue().
+            retry_count: Attempt number for the next delivery.
+            error: Error of the failed attempt.
+        """
+        task = {**task_data, "_retry_count": retry_count}
+        task_id = task["task_id"]
+        if error:
+            self._errors[task_id] = error
+        await self._queue.put(task)
+        self._status[task_id] = "pending"
+        logger.info(f"MemoryQueue: Requeued task {task_id} (retry {retry_count})")
+
+    async def reclaim(self, min_idle_ms: int, count: int = 10) -> List[Dict[str, Any]]:
+        """Return no tasks: in-process tasks cannot outlive their consumer."""
+        return []
+
+    async def heartbeat(self) -> None:
+        """Do nothing: in-process tasks are never reclaimed."""
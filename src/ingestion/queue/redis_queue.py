@@ -1,9 +1,11 @@
 """Redis Streams-based persistent queue for ingestion tasks.
 
-Uses Redis Streams (XADD/XREADGROUP/XACK) for:
+Uses Redis Streams (XADD/XREADGROUP/XACK/XAUTOCLAIM) for:
 - Durable task persistence across process restarts
 - Consumer group support for horizontal scaling
 - Built-in message acknowledgment and retry semantics
+- Reclaiming tasks left pending by crashed workers (live workers refresh
+  their in-flight entries with an XCLAIM JUSTID heartbeat)
 """
 
 from __future__ import annotations
@@ -12,7 +14,7 @@ import json
 import logging
 import time
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +55,10 @@ class RedisQueue:
         self.max_retries = max_retries
         self._redis: Any = None
         self._status_key = f"{stream_key}:status"
+        # Stream message ID of each task delivered to this consumer
+        self._msg_ids: Dict[str, str] = {}
+        # XAUTOCLAIM cursor, so reclaim() walks the whole pending list
+        self._reclaim_cursor = "0-0"
 
     async def initialize(self) -> None:
         """Connect to Redis and create consumer group.
@@ -149,14 +155,10 @@ class RedisQueue:
             return None
 
         msg_id, fields = messages[0]
-        task_id = fields["task_id"]
-        task_data = json.loads(fields["data"])
-        task_data["task_id"] = task_id
-        task_data["_msg_id"] = msg_id
-        task_data["_retry_count"] = int(fields.get("retry_count", "0"))
+        task_data = self._parse_message(msg_id, fields)
 
         # Update status
-        await self._redis.hset(self._status_key, task_id, "processing")
+        await self._redis.hset(self._status_key, task_data["task_id"], "processing")
         return task_data
 
     async def get_status(self, task_id: str) -> Optional[str]:
@@ -183,6 +185,9 @@ class RedisQueue:
 
         status = "done" if success else "failed"
         await self._redis.hset(self._status_key, task_id, status)
+        msg_id = self._msg_ids.pop(task_id, None)
+        if msg_id is not None:
+            await self._redis.xack(self.stream_key, self.consumer_group, msg_id)
 
         if error:
             await self._redis.hset(
@@ -192,14 +197,127 @@ class RedisQueue:
         logger.info(f"RedisQueue: Task {task_id} → {status}")
 
     async def get_pending_count(self) -> int:
-        """Return the number of pending messages in the stream.
+        """Return the number of tasks not yet delivered to a consumer.
+
+        Uses the consumer group lag (Redis 7+); older servers report the
+        stream length instead.
 
         Returns:
             Approximate count of pending messages.
         """
         self._ensure_connected()
+        for group in await self._redis.xinfo_groups(self.stream_key):
+            if group.get("name") == self.consumer_group and group.get("lag") is not None:
+                return int(group["lag"])
         return await self._redis.xlen(self.stream_key)
 
+    async def requeue(
+        self, task_data: Dict[str, Any], retry_count: int, error: str = ""
+    ) -> None:
+        """Append the task as a new stream entry, then ack the old delivery.
+
+        Args:
+            task_data: Task dict as returned by dequeue() or reclaim().
+            retry_count: Attempt number stored with the new entry.
+            error: Error of the failed attempt.
+        """
+        self._ensure_connected()
+
+        task_id = task_data["task_id"]
+        payload = {
+            k: v for k, v in task_data.items()
+            if k != "task_id" and not k.startswith("_")
+        }
+        await self._redis.xadd(self.stream_key, {
+            "task_id": task_id,
+            "data": json.dumps(payload),
+            "created_at": str(time.time()),
+            "retry_count": str(retry_count),
+        })
+        msg_id = self._msg_ids.pop(task_id, None) or task_data.get("_msg_id")
+        if msg_id is not None:
+            await self._redis.xack(self.stream_key, self.consumer_group, msg_id)
+        await self._redis.hset(self._status_key, task_id, "pending")
+        if error:
+            await self._redis.hset(f"{self._status_key}:errors", task_id, error)
+        logger.info(f"RedisQueue: Requeued task {task_id} (retry {retry_count})")
+
+    async def reclaim(self, min_idle_ms: int, count: int = 10) -> List[Dict[str, Any]]:
+        """Claim entries pending longer than min_idle_ms (XAUTOCLAIM).
+
+        Entries delivered to a consumer that crashed stay pending forever;
+        claiming them moves them to this consumer. Live consumers keep the
+        idle time of their entries low via heartbeat(), and entries this
+        consumer is already working on are never returned. Each call
+        resumes the scan of the pending list where the previous one stopped.
+
+        Args:
+            min_idle_ms: Minimum idle time since the last delivery or heartbeat.
+            count: Maximum number of entries to claim.
+
+        Returns:
+            Reclaimed task dicts with ``_reclaimed`` set.
+        """
+        self._ensure_connected()
+
+        response = await self._redis.xautoclaim(
+            self.stream_key,
+            self.consumer_group,
+            self.consumer_name,
+            min_idle_time=min_idle_ms,
+            start_id=self._reclaim_cursor,
+            count=count,
+        )
+        # [next_start_id, [(message_id, fields)], (Redis 7+: deleted IDs)]
+        # Redis returns "0-0" once the scan has reached the end of the list
+        next_id = response[0]
+        self._reclaim_cursor = next_id.decode() if isinstance(next_id, bytes) else str(next_id)
+        in_flight = set(self._msg_ids.values())
+        tasks = []
+        for msg_id, fields in response[1]:
+            if msg_id in in_flight:
+                continue
+            if not fields:
+                # Entry was trimmed from the stream; nothing left to run
+                await self._redis.xack(self.stream_key, self.consumer_group, msg_id)
+                continue
+            task_data = self._parse_message(msg_id, fields)
+            task_data["_reclaimed"] = True
+            await self._redis.hset(self._status_key, task_data["task_id"], "processing")
+            tasks.append(task_data)
+        if tasks:
+            logger.warning(f"RedisQueue: Reclaimed {len(tasks)} orphaned tasks")
+        return tasks
+
+    async def heartbeat(self) -> None:
+        """Reset the idle time of entries this consumer is still processing.
+
+        XCLAIM with JUSTID to this same consumer touches the pending
+        entries without redelivering them or bumping their delivery count.
+        """
+        self._ensure_connected()
+        msg_ids = list(self._msg_ids.values())
+        if not msg_ids:
+            return
+        await self._redis.xclaim(
+            self.stream_key,
+            self.consumer_group,
+            self.consumer_name,
+            min_idle_time=0,
+            message_ids=msg_ids,
+            justid=True,
+        )
+
+    def _parse_message(self, msg_id: str, fields: Dict[str, str]) -> Dict[str, Any]:
+        """Build a task dict from a stream entry and remember its message ID."""
+        task_id = fields["task_id"]
+        task_data = json.loads(fields["data"])
+        task_data["task_id"] = task_id
+        task_data["_msg_id"] = msg_id
+        task_data["_retry_count"] = int(fields.get("retry_count", "0"))
+        self._msg_ids[task_id] = msg_id
+        return task_data
+
     async def close(self) -> None:
         """Close Redis connection."""
         if self._redis:
@@ -11,14 +11,272 @@ Design Principles:
 - Observable: Accepts TraceContext for future integration
 - Persistent: Indexes saved to data/db/bm25/ directory
 - Deterministic: Same corpus produces same IDF scores
+- Versioned: Every save bumps a generation token in a small manifest file,
+  so long-lived readers can detect changes without re-reading the index
+- Compact: Postings live in flat NumPy arrays (CSR layout) instead of
+  per-posting dicts, so scoring is vectorized and memory stays small
+- Incremental: Each ingest appends an immutable segment and records deletes
+  as tombstones; segments are merged in the background (LSM-style), so the
+  cost of adding a file does not grow with the size of the index
 """
 
+import json
+import logging
 import pickle
 import math
 import os
+import threading
+import time
+from collections import Counter
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Tuple
 
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class _Segment:
+    """Immutable CSR posting segment with a tombstone (alive) mask.
+    
+    All postings of local term ``t`` live in
+    ``[term_offsets[t], term_offsets[t + 1])``.  Deleting documents never
+    mutates a segment: ``with_deleted()`` returns a new object that shares
+    the posting arrays and carries a new ``alive`` mask, so readers holding
+    the old object are unaffected.
+    
+    Attributes:
+        name: Segment file stem (e.g. ``seg_000003``).
+        term_list: Local term id -> term.
+        terms: Local vocabulary (term -> local term id).
+        chunk_ids: Local doc id -> chunk_id.
+        doc_lengths: int32[N] local doc id -> document length.
+        term_offsets: int64[V + 1] local term id -> posting range.
+        post_docs: int32[P] posting -> local doc id.
+        post_tfs: float32[P] posting -> term frequency.
+        alive: bool[N] local doc id -> not deleted.
+        del_file: Name of the tombstone file backing ``alive`` (or None).
+        live_docs: Number of live documents.
+        live_length: Total length of live documents.
+        live_df: int[V] local term id -> live document frequency.
+    """
+    
+    def __init__(
+        self,
+        name: str,
+        terms: List[str],
+        chunk_ids: List[str],
+        doc_lengths: np.ndarray,
+        term_offsets: np.ndarray,
+        post_docs: np.ndarray,
+        post_tfs: np.ndarray,
+    ) -> None:
+        self.name = name
+        self.term_list = terms
+        self.terms: Dict[str, int] = {term: i for i, term in enumerate(terms)}
+        self.chunk_ids = chunk_ids
+        self.doc_lengths = doc_lengths
+        self.term_offsets = term_offsets
+        self.post_docs = post_docs
+        self.post_tfs = post_tfs
+        self._set_alive(np.ones(len(chunk_ids), dtype=bool), None)
+    
+    @classmethod
+    def from_postings(
+        cls,
+        name: str,
+        terms: List[str],
+        chunk_ids: List[str],
+        doc_lengths: np.ndarray,
+        term_ids: np.ndarray,
+        doc_ids: np.ndarray,
+        tfs: np.ndarray,
+    ) -> "_Segment":
+        """Build a segment from flat (term_id, doc_id, tf) postings.
+        
+        Terms without postings are dropped from the vocabulary.
+        """
+        counts = np.bincount(term_ids, minlength=len(terms))
+        used = counts > 0
+        if not used.all():
+            remap = np.cumsum(used) - 1
+            term_ids = remap[term_ids]
+            terms = [t for t, u in zip(terms, used.tolist()) if u]
+            counts = counts[used]
+        
+        order = np.lexsort((doc_ids, term_ids))
+        return cls(
+            name=name,
+            terms=terms,
+            chunk_ids=chunk_ids,
+            doc_lengths=np.asarray(doc_lengths, dtype=np.int32),
+            term_offsets=np.concatenate(
+                [np.zeros(1, dtype=np.int64), np.cumsum(counts, dtype=np.int64)]
+            ),
+            post_docs=np.asarray(doc_ids, dtype=np.int32)[order],
+            post_tfs=np.asarray(tfs, dtype=np.float32)[order],
+        )
+    
+    @classmethod
+    def from_term_stats(cls, name: str, term_stats: List[Dict[str, Any]]) -> "_Segment":
+        """Build a segment from SparseEncoder output."""
+        terms: Dict[str, int] = {}
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        tfs: List[int] = []
+        for doc, stat in enumerate(term_stats):
+            for term, tf in stat["term_frequencies"].items():
+                if tf <= 0:
+                    continue
+                tid = terms.get(term)
+                if tid is None:
+                    tid = terms[term] = len(terms)
+                term_ids.append(tid)
+                doc_ids.append(doc)
+                tfs.append(tf)
+        
+        return cls.from_postings(
+            name=name,
+            terms=list(terms),
+            chunk_ids=[stat["chunk_id"] for stat in term_stats],
+            doc_lengths=np.asarray([s["doc_length"] for s in term_stats], dtype=np.int32),
+            term_ids=np.asarray(term_ids, dtype=np.int64),
+            doc_ids=np.asarray(doc_ids, dtype=np.int32),
+            tfs=np.asarray(tfs, dtype=np.float32),
+        )
+    
+    @classmethod
+    def merge(cls, name: str, segments: List["_Segment"]) -> "_Segment":
+        """Merge the live documents of several segments into a new one."""
+        vocab: Dict[str, int] = {}
+        chunk_ids: List[str] = []
+        parts_terms: List[np.ndarray] = [np.zeros(0, dtype=np.int64)]
+        parts_docs: List[np.ndarray] = [np.zeros(0, dtype=np.int32)]
+        parts_tfs: List[np.ndarray] = [np.zeros(0, dtype=np.float32)]
+        parts_len: List[np.ndarray] = [np.zeros(0, dtype=np.int32)]
+        for seg in segments:
+            remap = np.asarray(
+                [vocab.setdefault(t, len(vocab)) for t in seg.term_list], dtype=np.int64
+            )
+            term_ids, doc_ids, tfs, seg_chunk_ids, seg_lengths = seg.live_postings()
+            parts_terms.append(remap[term_ids])
+            parts_docs.append(doc_ids + len(chunk_ids))
+            parts_tfs.append(tfs)
+            parts_len.append(seg_lengths)
+            chunk_ids.extend(seg_chunk_ids)
+        
+        return cls.from_postings(
+            name=name,
+            terms=list(vocab),
+            chunk_ids=chunk_ids,
+            doc_lengths=np.concatenate(parts_len),
+            term_ids=np.concatenate(parts_terms),
+            doc_ids=np.concatenate(parts_docs),
+            tfs=np.concatenate(parts_tfs),
+        )
+    
+    @classmethod
+    def load(cls, path: Path, name: str) -> "_Segment":
+        """Load a segment file from disk.
+        
+        Raises:
+            ValueError: If the file is corrupted.
+        """
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                seg = cls(
+                    name=name,
+                    terms=data["terms"].tolist(),
+                    chunk_ids=data["chunk_ids"].tolist(),
+                    doc_lengths=data["doc_lengths"].astype(np.int32, copy=False),
+                    term_offsets=data["term_offsets"].astype(np.int64, copy=False),
+                    post_docs=data["post_docs"].astype(np.int32, copy=False),
+                    post_tfs=data["post_tfs"].astype(np.float32, copy=False),
+                )
+        except (OSError, KeyError, ValueError) as e:
+            raise ValueError(f"Corrupted index segment at {path}: {e}")
+        if len(seg.term_offsets) != len(seg.term_list) + 1 or len(seg.doc_lengths) != len(seg.chunk_ids):
+            raise ValueError(f"Corrupted index segment at {path}: inconsistent array sizes")
+        return seg
+    
+    def save(self, path: Path) -> None:
+        """Atomically write the segment postings (not tombstones) to *path*."""
+        temp_path = path.with_suffix('.tmp')
+        try:
+            # A file object is passed so np.savez does not append ".npz"
+            with open(temp_path, 'wb') as f:
+                np.savez(
+                    f,
+                    terms=np.array(self.term_list, dtype=str),
+                    chunk_ids=np.array(self.chunk_ids, dtype=str),
+                    doc_lengths=self.doc_lengths,
+                    term_offsets=self.term_offsets,
+                    post_docs=self.post_docs,
+                    post_tfs=self.post_tfs,
+                )
+            temp_path.replace(path)
+        except (IOError, OSError, TypeError, ValueError):
+            if temp_path.exists():
+                temp_path.unlink()
+            raise
+    
+    def with_deleted(self, deleted: np.ndarray, del_file: Optional[str]) -> "_Segment":
+        """Return a copy of this segment with *deleted* local doc ids dead."""
+        seg = object.__new__(_Segment)
+        seg.__dict__.update(self.__dict__)
+        alive = np.ones(len(self.chunk_ids), dtype=bool)
+        alive[np.asarray(deleted, dtype=np.int64)] = False
+        seg._set_alive(alive, del_file)
+        return seg
+    
+    def deleted_ids(self) -> np.ndarray:
+        """Local doc ids currently marked as deleted."""
+        return np.flatnonzero(~self.alive).astype(np.int32)
+    
+    def posting_term_ids(self) -> np.ndarray:
+        """Local term id of every posting (expanded from the CSR offsets)."""
+        return np.repeat(
+            np.arange(len(self.term_list), dtype=np.int64), np.diff(self.term_offsets)
+        )
+    
+    def live_postings(
+        self,
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, List[str], np.ndarray]:
+        """Return postings of live documents with compacted local doc ids.
+        
+        Returns:
+            Tuple of (term_ids, doc_ids, tfs, chunk_ids, doc_lengths).
+        """
+        term_ids = self.posting_term_ids()
+        if not self.has_deletes:
+            return term_ids, self.post_docs, self.post_tfs, list(self.chunk_ids), self.doc_lengths
+        
+        posting_mask = self.alive[self.post_docs]
+        new_doc_ids = (np.cumsum(self.alive) - 1).astype(np.int32)
+        chunk_ids = [cid for cid, a in zip(self.chunk_ids, self.alive.tolist()) if a]
+        return (
+            term_ids[posting_mask],
+            new_doc_ids[self.post_docs[posting_mask]],
+            self.post_tfs[posting_mask],
+            chunk_ids,
+            self.doc_lengths[self.alive],
+        )
+    
+    def _set_alive(self, alive: np.ndarray, del_file: Optional[str]) -> None:
+        """Install the alive mask and derive live statistics from it."""
+        self.alive = alive
+        self.del_file = del_file
+        self.has_deletes = not bool(alive.all())
+        self.live_docs = int(alive.sum())
+        self.live_length = int(self.doc_lengths[alive].sum())
+        if self.has_deletes:
+            self.live_df = np.bincount(
+                self.posting_term_ids()[alive[self.post_docs]],
+                minlength=len(self.term_list),
+            )
+        else:
+            self.live_df = np.diff(self.term_offsets)
+
 
 class BM25Indexer:
     """Build and query BM25 inverted indexes.
@@ -26,25 +284,20 @@ class BM25Indexer:
     This indexer receives term statistics from SparseEncoder and constructs
     a queryable BM25 index with IDF scores and posting lists.
     
-    Index Structure:
-        {
-            "metadata": {
-                "num_docs": int,
-                "avg_doc_length": float,
-                "total_terms": int
-            },
-            "index": {
-                "term": {
-                    "idf": float,
-                    "df": int,  # document frequency
-                    "postings": [
-                        {"chunk_id": str, "tf": int, "doc_length": int},
-                        ...
-                    ]
-                },
-                ...
-            }
-        }
+    Index Layout (per collection, under ``index_dir``):
+        {collection}_bm25.version      # manifest: generation + segment list
+        {collection}_segments/
+            seg_000000.npz             # immutable CSR posting segment
+            seg_000001.npz
+            seg_000001.del.3.npy       # tombstones (deleted local doc ids)
+    
+    Each segment stores a local vocabulary, chunk_id table, doc lengths and
+    CSR postings (see ``_Segment``).  Global statistics (live document
+    count, average length) are kept incrementally, and document frequencies
+    are summed over the live documents of all segments at query time, so
+    IDF is always exact.  Indexes written by older versions (a single
+    ``{collection}_bm25.npz`` or ``{collection}_bm25.pkl``) are converted
+    into a segment on first load.
     
     BM25 IDF Formula:
         IDF(term) = log((N - df + 0.5) / (df + 0.5))
@@ -55,14 +308,14 @@ class BM25Indexer:
     
     Example:
         >>> indexer = BM25Indexer(index_dir="data/db/bm25")
-        >>> 
+        >>>
         >>> # Build index from SparseEncoder output
         >>> term_stats = [
         ...     {"chunk_id": "1", "term_frequencies": {"hello": 2, "world": 1}, "doc_length": 3},
         ...     {"chunk_id": "2", "term_frequencies": {"hello": 1, "python": 1}, "doc_length": 2}
         ... ]
         >>> indexer.build(term_stats)
-        >>> 
+        >>>
         >>> # Query the index
         >>> results = indexer.query(["hello"], top_k=2)
         >>> len(results) <= 2  # True
@@ -73,6 +326,7 @@ class BM25Indexer:
         index_dir: str = "data/db/bm25",
         k1: float = 1.5,
         b: float = 0.75,
+        max_segments: int = 8,
     ):
         """Initialize BM25Indexer.
         
@@ -80,23 +334,39 @@ class BM25Indexer:
             index_dir: Directory to store index files (default: data/db/bm25)
             k1: BM25 term frequency saturation parameter (default: 1.5)
             b: BM25 length normalization parameter (default: 0.75)
+            max_segments: Segment count above which a background merge is
+                started (default: 8)
         
         Raises:
-            ValueError: If k1 or b are out of valid ranges
+            ValueError: If k1, b or max_segments are out of valid ranges
         """
         if k1 <= 0:
             raise ValueError(f"k1 must be > 0, got {k1}")
         if not 0 <= b <= 1:
             raise ValueError(f"b must be in [0, 1], got {b}")
+        if max_segments < 2:
+            raise ValueError(f"max_segments must be >= 2, got {max_segments}")
         
         self.index_dir = Path(index_dir)
         self.k1 = k1
         self.b = b
+        self.max_segments = max_segments
         
-        # In-memory index structure
-        self._index: Dict[str, Dict[str, Any]] = {}
+        # In-memory index structure (see class docstring)
         self._metadata: Dict[str, Any] = {}
+        self._segments: List[_Segment] = []
+        # Loaded segments by name, reused across reloads (segments are immutable)
+        self._segment_pool: Dict[str, _Segment] = {}
+        self._next_segment = 0
+        self._del_seq = 0
+        # Writer-side live chunk_id -> (segment name, local doc id), built lazily
+        self._locations: Optional[Dict[str, Tuple[str, int]]] = None
+        # Generation token of the on-disk index this instance reflects
+        self._generation: Optional[str] = None
         
+        self._write_lock = threading.RLock()
+        self._merge_thread: Optional[threading.Thread] = None
+    
     def build(
         self,
         term_stats: List[Dict[str, Any]],
@@ -106,10 +376,9 @@ class BM25Indexer:
         """Build BM25 index from term statistics.
         
         This method:
-        1. Calculates corpus-level statistics (N, avg_doc_length, DF)
-        2. Computes IDF for each term
-        3. Builds inverted index with posting lists
-        4. Persists to disk
+        1. Builds a single posting segment from the statistics
+        2. Replaces all existing segments of the collection
+        3. Persists the segment and a new manifest to disk
         
         Args:
             term_stats: List of statistics from SparseEncoder.encode()
@@ -136,53 +405,18 @@ class BM25Indexer:
         # Validate structure
         self._validate_term_stats(term_stats)
         
-        # Step 1: Calculate corpus-level statistics
-        num_docs = len(term_stats)
-        total_length = sum(stat["doc_length"] for stat in term_stats)
-        avg_doc_length = total_length / num_docs if num_docs > 0 else 0.0
-        
-        # Calculate document frequency (DF) for each term
-        doc_freq: Dict[str, int] = {}
-        for stat in term_stats:
-            for term in stat["term_frequencies"].keys():
-                doc_freq[term] = doc_freq.get(term, 0) + 1
-        
-        # Step 2: Build inverted index with IDF
-        index: Dict[str, Dict[str, Any]] = {}
-        
-        for term, df in doc_freq.items():
-            # Calculate IDF using BM25 formula
-            idf = self._calculate_idf(num_docs, df)
+        with self._write_lock:
+            manifest = self._read_manifest(collection) or {}
+            self._next_segment = max(self._next_segment, manifest.get("next_segment", 0))
+            old_names = [s["name"] for s in manifest.get("segments", [])]
             
-            # Build posting list for this term
-            postings = []
-            for stat in term_stats:
-                tf = stat["term_frequencies"].get(term, 0)
-                if tf > 0:  # Only include docs that contain this term
-                    postings.append({
-                        "chunk_id": stat["chunk_id"],
-                        "tf": tf,
-                        "doc_length": stat["doc_length"]
-                    })
+            segment = _Segment.from_term_stats(self._new_segment_name(), term_stats)
+            self._write_segment(collection, segment)
+            self._install(collection, [segment])
+            self._locations = None
+            self._save(collection)
             
-            index[term] = {
-                "idf": idf,
-                "df": df,
-                "postings": postings
-            }
-        
-        # Step 3: Store metadata
-        self._metadata = {
-            "num_docs": num_docs,
-            "avg_doc_length": avg_doc_length,
-            "total_terms": len(index),
-            "collection": collection,
-        }
-        
-        self._index = index
-        
-        # Step 4: Persist to disk
-        self._save(collection)
+            self._remove_segment_files(collection, old_names)
     
     def load(
         self,
@@ -191,6 +425,11 @@ class BM25Indexer:
     ) -> bool:
         """Load index from disk.
         
+        Segments already held by this indexer (or shared via
+        ``share_segments_from``) are reused; only new segments and changed
+        tombstones are read.  Legacy single-file indexes are converted into
+        a segment the first time they are loaded.
+        
         Args:
             collection: Collection name to load
             trace: Optional TraceContext for observability
@@ -201,26 +440,48 @@ class BM25Indexer:
         Raises:
             ValueError: If index file is corrupted
         """
-        index_path = self._get_index_path(collection)
-        
-        if not index_path.exists():
+        manifest = self._read_manifest(collection)
+        if manifest is None or "segments" not in manifest:
+            if self._get_index_path(collection).exists() or self._get_legacy_index_path(collection).exists():
+                with self._write_lock:
+                    return self._migrate_legacy(collection)
             return False
         
-        try:
-            with open(index_path, 'rb') as f:
-                data = pickle.load(f)
-            
-            # Validate structure
-            if "metadata" not in data or "index" not in data:
-                raise ValueError(f"Invalid index file structure: missing metadata or index")
-            
-            self._metadata = data["metadata"]
-            self._index = data["index"]
-            
-            return True
-            
-        except (pickle.UnpicklingError, EOFError, ValueError) as e:
-            raise ValueError(f"Corrupted index file at {index_path}: {e}")
+        segments_dir = self._get_segments_dir(collection)
+        segments: List[_Segment] = []
+        for entry in manifest["segments"]:
+            name = entry["name"]
+            del_file = entry.get("del_file")
+            seg = self._segment_pool.get(name)
+            if seg is None:
+                seg = _Segment.load(segments_dir / f"{name}.npz", name)
+            if seg.del_file != del_file:
+                deleted = (
+                    self._load_tombstones(segments_dir / del_file)
+                    if del_file else np.zeros(0, dtype=np.int32)
+                )
+                seg = seg.with_deleted(deleted, del_file)
+            segments.append(seg)
+        
+        self._next_segment = max(self._next_segment, manifest.get("next_segment", 0))
+        self._del_seq = max(self._del_seq, manifest.get("del_seq", 0))
+        self._install(collection, segments)
+        self._locations = None
+        self._generation = manifest.get("generation")
+        
+        return True
+    
+    def share_segments_from(self, other: "BM25Indexer") -> None:
+        """Reuse immutable segments already loaded by another indexer.
+        
+        Call before ``load()`` on a fresh indexer so that a reload only
+        reads the segments and tombstones that changed since *other* was
+        loaded.
+        
+        Args:
+            other: A previously loaded indexer for the same collection.
+        """
+        self._segment_pool.update(other._segment_pool)
     
     def query(
         self,
@@ -230,6 +491,11 @@ class BM25Indexer:
     ) -> List[Dict[str, Any]]:
         """Query the index using BM25 scoring.
         
+        Document frequencies are summed over the live documents of all
+        segments, so IDF is exact.  Scores are accumulated with vectorized
+        NumPy operations over the matching posting ranges, and only the best
+        ``top_k`` candidates are selected (``argpartition``) and sorted.
+        
         Args:
             query_terms: List of terms to search for
             top_k: Maximum number of results to return
@@ -247,48 +513,224 @@ class BM25Indexer:
             >>> results = indexer.query(["machine", "learning"], top_k=5)
             >>> results[0]["score"] > 0  # True if matches found
         """
-        if not self._index:
+        segments = self._segments
+        metadata = self._metadata
+        if not segments:
             raise ValueError("Index not loaded. Call load() or build() first.")
         
         if not query_terms:
             raise ValueError("query_terms cannot be empty")
         
+        num_docs = metadata["num_docs"]
+        if num_docs == 0 or top_k <= 0:
+            return []
+        avg_doc_length = metadata["avg_doc_length"] or 1.0
+        
         # Lowercase query terms to match index (SparseEncoder lowercases during build)
         query_terms = [t.lower() for t in query_terms]
         
-        # Calculate BM25 scores for all documents
-        scores: Dict[str, float] = {}
+        # Exact global IDF from live document frequencies across segments
+        idf: Dict[str, float] = {}
+        for term in set(query_terms):
+            df = 0
+            for seg in segments:
+                tid = seg.terms.get(term)
+                if tid is not None:
+                    df += int(seg.live_df[tid])
+            if df > 0:
+                idf[term] = self._calculate_idf(num_docs, df)
+        if not idf:
+            return []
         
-        for term in query_terms:
-            if term not in self._index:
-                continue  # Term not in corpus, skip
-            
-            term_data = self._index[term]
-            idf = term_data["idf"]
+        # Score matching postings segment by segment (global doc id = base + local)
+        bases: List[int] = []
+        parts_docs: List[np.ndarray] = []
+        parts_contrib: List[np.ndarray] = []
+        base = 0
+        for seg in segments:
+            bases.append(base)
+            term_ids = [seg.terms[t] for t in query_terms if t in idf and t in seg.terms]
+            if term_ids:
+                term_idf = [idf[t] for t in query_terms if t in idf and t in seg.terms]
+                starts = seg.term_offsets[term_ids]
+                ends = seg.term_offsets[np.asarray(term_ids) + 1]
+                docs = np.concatenate([seg.post_docs[s:e] for s, e in zip(starts, ends)])
+                tfs = np.concatenate([seg.post_tfs[s:e] for s, e in zip(starts, ends)])
+                weights = np.repeat(np.asarray(term_idf), ends - starts)
+                if seg.has_deletes:
+                    live = seg.alive[docs]
+                    docs, tfs, weights = docs[live], tfs[live], weights[live]
+                norms = self.k1 * (
+                    1 - self.b + self.b * (seg.doc_lengths[docs] / avg_doc_length)
+                )
+                parts_docs.append(docs.astype(np.int64) + base)
+                parts_contrib.append(weights * (tfs * (self.k1 + 1)) / (tfs + norms))
+            base += len(seg.chunk_ids)
+        
+        if not parts_docs:
+            return []
+        docs = np.concatenate(parts_docs)
+        if len(docs) == 0:
+            return []
+        
+        # Accumulate per candidate document
+        candidates, inverse = np.unique(docs, return_inverse=True)
+        scores = np.bincount(
+            inverse, weights=np.concatenate(parts_contrib), minlength=len(candidates)
+        )
+        
+        top = self._select_top(scores, top_k)
+        seg_of = np.searchsorted(np.asarray(bases), candidates[top], side="right") - 1
+        return [
+            {
+                "chunk_id": segments[s].chunk_ids[int(candidates[i]) - bases[s]],
+                "score": float(scores[i]),
+            }
+            for i, s in zip(top.tolist(), seg_of.tolist())
+        ]
+    
+    def query_batch(
+        self,
+        queries: List[List[str]],
+        top_k: int = 10,
+        trace: Optional[Any] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Score several queries in one pass over the index.
+        
+        The postings of every distinct query term are gathered and their
+        BM25 term weights computed once per segment, then credited to each
+        query containing the term; all (query, document) scores are
+        accumulated with a single ``bincount``.  Each result list equals what
+        ``query()`` returns for that query.
+        
+        Args:
+            queries: Query term lists, one per query
+            top_k: Maximum number of results per query
+            trace: Optional TraceContext for observability
+        
+        Returns:
+            One result list per query, in input order (same format as query()).
+        
+        Raises:
+            ValueError: If index not loaded or any query term list is empty
+        """
+        segments = self._segments
+        metadata = self._metadata
+        if not segments:
+            raise ValueError("Index not loaded. Call load() or build() first.")
+        
+        if any(not terms for terms in queries):
+            raise ValueError("query_terms cannot be empty")
+        
+        results: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        num_docs = metadata["num_docs"]
+        if not queries or num_docs == 0 or top_k <= 0:
+            return results
+        avg_doc_length = metadata["avg_doc_length"] or 1.0
+        
+        lowered = [[t.lower() for t in terms] for terms in queries]
+        
+        # Exact global IDF per distinct term (same as query())
+        idf: Dict[str, float] = {}
+        for term in sorted({t for terms in lowered for t in terms}):
+            df = 0
+            for seg in segments:
+                tid = seg.terms.get(term)
+                if tid is not None:
+                    df += int(seg.live_df[tid])
+            if df > 0:
+                idf[term] = self._calculate_idf(num_docs, df)
+        if not idf:
+            return results
+        term_index = {term: j for j, term in enumerate(idf)}
+        
+        # (query, term) pairs weighted by IDF; a repeated query term counts
+        # once per occurrence, as in query()
+        pair_q: List[int] = []
+        pair_t: List[int] = []
+        pair_w: List[float] = []
+        for qi, terms in enumerate(lowered):
+            for term, count in Counter(t for t in terms if t in idf).items():
+                pair_q.append(qi)
+                pair_t.append(term_index[term])
+                pair_w.append(idf[term] * count)
+        pair_q_arr = np.asarray(pair_q, dtype=np.int64)
+        pair_t_arr = np.asarray(pair_t, dtype=np.int64)
+        pair_w_arr = np.asarray(pair_w, dtype=np.float64)
+        
+        # Key = query * total_docs + global doc id
+        total_docs = sum(len(seg.chunk_ids) for seg in segments)
+        bases: List[int] = []
+        parts_keys: List[np.ndarray] = []
+        parts_contrib: List[np.ndarray] = []
+        base = 0
+        for seg in segments:
+            bases.append(base)
+            starts = np.zeros(len(term_index), dtype=np.int64)
+            lengths = np.zeros(len(term_index), dtype=np.int64)
+            for term, j in term_index.items():
+                tid = seg.terms.get(term)
+                if tid is not None:
+                    starts[j] = seg.term_offsets[tid]
+                    lengths[j] = seg.term_offsets[tid + 1] - starts[j]
             
-            for posting in term_data["postings"]:
-                chunk_id = posting["chunk_id"]
-                tf = posting["tf"]
-                doc_length = posting["doc_length"]
-                
-                # BM25 score contribution from this term
-                term_score = self._calculate_bm25_score(
-                    tf=tf,
-                    doc_length=doc_length,
-                    avg_doc_length=self._metadata["avg_doc_length"],
-                    idf=idf
+            pair_lengths = lengths[pair_t_arr]
+            if pair_lengths.any():
+                # Term weights once per posting of each distinct term ...
+                offsets = np.cumsum(lengths) - lengths
+                positions = self._expand_ranges(starts, lengths)
+                docs = seg.post_docs[positions]
+                tfs = seg.post_tfs[positions]
+                norms = self.k1 * (
+                    1 - self.b + self.b * (seg.doc_lengths[docs] / avg_doc_length)
                 )
+                term_weights = (tfs * (self.k1 + 1)) / (tfs + norms)
                 
-                scores[chunk_id] = scores.get(chunk_id, 0.0) + term_score
+                # ... then credited to every query containing the term
+                pair_of = np.repeat(np.arange(len(pair_t_arr)), pair_lengths)
+                idx = self._expand_ranges(offsets[pair_t_arr], pair_lengths)
+                pair_docs = docs[idx]
+                contrib = pair_w_arr[pair_of] * term_weights[idx]
+                owners = pair_q_arr[pair_of]
+                if seg.has_deletes:
+                    live = seg.alive[pair_docs]
+                    pair_docs, contrib, owners = pair_docs[live], contrib[live], owners[live]
+                parts_keys.append(owners * total_docs + pair_docs.astype(np.int64) + base)
+                parts_contrib.append(contrib)
+            base += len(seg.chunk_ids)
         
-        # Sort by score descending and return top_k
-        sorted_results = sorted(
-            [{"chunk_id": cid, "score": score} for cid, score in scores.items()],
-            key=lambda x: x["score"],
-            reverse=True
+        if not parts_keys:
+            return results
+        keys = np.concatenate(parts_keys)
+        if len(keys) == 0:
+            return results
+        
+        # Accumulate per (query, document); unique keys come out grouped by query
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        scores = np.bincount(
+            inverse, weights=np.concatenate(parts_contrib), minlength=len(unique_keys)
         )
+        owners = unique_keys // total_docs
+        candidates = unique_keys % total_docs
+        bounds = np.searchsorted(owners, np.arange(len(queries) + 1))
+        bases_arr = np.asarray(bases)
         
-        return sorted_results[:top_k]
+        for qi in range(len(queries)):
+            lo, hi = int(bounds[qi]), int(bounds[qi + 1])
+            if lo == hi:
+                continue
+            q_scores = scores[lo:hi]
+            q_candidates = candidates[lo:hi]
+            top = self._select_top(q_scores, top_k)
+            seg_of = np.searchsorted(bases_arr, q_candidates[top], side="right") - 1
+            results[qi] = [
+                {
+                    "chunk_id": segments[s].chunk_ids[int(q_candidates[i]) - bases[s]],
+                    "score": float(q_scores[i]),
+                }
+                for i, s in zip(top.tolist(), seg_of.tolist())
+            ]
+        return results
     
     def rebuild(
         self,
@@ -307,7 +749,7 @@ class BM25Indexer:
             trace: Optional TraceContext for observability
         """
         self.build(term_stats, collection, trace)
-
+    
     def add_documents(
         self,
         term_stats: List[Dict[str, Any]],
@@ -316,10 +758,13 @@ class BM25Indexer:
         trace: Optional[Any] = None,
     ) -> None:
         """Incrementally add documents to the BM25 index.
-
-        Directly inserts new postings and updates IDF scores without
-        reconstructing the entire index. Much faster than full rebuild.
-
+        
+        Writes the new documents as one small immutable segment, tombstones
+        any replaced chunks, and commits a new manifest.  Existing segments
+        are never rewritten here, so the cost depends on the size of the
+        batch rather than the size of the index.  A background merge is
+        started when the segment count exceeds ``max_segments``.
+        
         Args:
             term_stats: New term statistics from SparseEncoder.encode().
             collection: Collection name.
@@ -330,161 +775,494 @@ class BM25Indexer:
         """
         if not term_stats:
             return
-
+        
         self._validate_term_stats(term_stats)
-
-        # Load existing index (ignore if missing – will start fresh)
-        if not self._index:
-            if not self.load(collection):
+        
+        with self._write_lock:
+            if not self._sync_for_write(collection):
                 # No existing index — just build from scratch
                 self.build(term_stats, collection, trace)
                 return
-
-        # Remove stale postings for this document (re-ingest case)
-        if doc_id and self._index:
-            self._remove_postings_by_prefix(doc_id)
-
-        # Collect new chunk_ids for duplicate prevention
-        new_chunk_ids = {s["chunk_id"] for s in term_stats}
-
-        # Track which existing terms gain new postings (need IDF recalc)
-        affected_terms: set = set()
-
-        # Insert new postings directly into existing index
-        for stat in term_stats:
-            cid = stat["chunk_id"]
-            doc_length = stat["doc_length"]
-            for term, tf in stat["term_frequencies"].items():
-                if tf <= 0:
-                    continue
-                if term not in self._index:
-                    self._index[term] = {"idf": 0.0, "df": 0, "postings": []}
-                self._index[term]["postings"].append({
-                    "chunk_id": cid,
-                    "tf": tf,
-                    "doc_length": doc_length,
-                })
-                affected_terms.add(term)
-
-        # Recalculate metadata
-        all_chunk_ids: set = set()
-        total_length = 0
-        for term_data in self._index.values():
-            for p in term_data["postings"]:
-                if p["chunk_id"] not in all_chunk_ids:
-                    total_length += p["doc_length"]
-                    all_chunk_ids.add(p["chunk_id"])
-
-        num_docs = len(all_chunk_ids)
-        avg_doc_length = total_length / num_docs if num_docs else 0.0
-
-        # Update DF and IDF only for affected terms
-        for term in affected_terms:
-            td = self._index[term]
-            td["df"] = len(td["postings"])
-            td["idf"] = self._calculate_idf(num_docs, td["df"])
-
-        # Also update IDF for all other terms since num_docs changed
-        for term, td in self._index.items():
-            if term not in affected_terms:
-                td["idf"] = self._calculate_idf(num_docs, td["df"])
-
-        self._metadata = {
-            "num_docs": num_docs,
-            "avg_doc_length": avg_doc_length,
-            "total_terms": len(self._index),
-            "collection": collection,
-        }
-
-        self._save(collection)
-
-    def _remove_postings_by_prefix(self, prefix: str) -> None:
-        """Remove postings whose chunk_id starts with prefix (in-place)."""
-        terms_to_delete: list = []
-        for term, term_data in self._index.items():
-            term_data["postings"] = [
-                p for p in term_data["postings"]
-                if not p["chunk_id"].startswith(prefix)
-            ]
-            if not term_data["postings"]:
-                terms_to_delete.append(term)
-            else:
-                term_data["df"] = len(term_data["postings"])
-        for term in terms_to_delete:
-            del self._index[term]
-
+            
+            # Tombstone stale documents: same doc prefix (re-ingest) or same chunk_id
+            locations = self._chunk_locations()
+            stale = [s["chunk_id"] for s in term_stats if s["chunk_id"] in locations]
+            if doc_id:
+                stale.extend(cid for cid in locations if cid.startswith(doc_id))
+            segments = self._tombstone(collection, stale)
+            
+            segment = _Segment.from_term_stats(self._new_segment_name(), term_stats)
+            self._write_segment(collection, segment)
+            for local, cid in enumerate(segment.chunk_ids):
+                locations[cid] = (segment.name, local)
+            
+            self._install(collection, segments + [segment])
+            self._save(collection)
+        
+        self._maybe_schedule_merge(collection)
+    
     def remove_document(
         self,
         doc_id: str,
         collection: str = "default",
     ) -> bool:
         """Remove all postings for a document from the BM25 index.
-
-        Loads the index (if not already loaded), removes any postings
-        whose ``chunk_id`` starts with *doc_id*, recalculates statistics,
-        and re-saves the index.
-
+        
+        Matching chunks are recorded as tombstones and disappear from query
+        results (and from IDF statistics) immediately; their postings are
+        dropped physically when their segment is next merged.
+        
         Args:
             doc_id: Document identifier (or prefix).  All postings whose
                 ``chunk_id`` starts with this value are removed.
             collection: Collection name.
-
+        
         Returns:
             ``True`` if any postings were removed, ``False`` otherwise.
         """
-        if not self._index:
-            if not self.load(collection):
+        with self._write_lock:
+            if not self._sync_for_write(collection):
                 return False
-
-        removed_any = False
-        terms_to_delete: list[str] = []
-
-        for term, term_data in self._index.items():
-            original_len = len(term_data["postings"])
-            term_data["postings"] = [
-                p for p in term_data["postings"]
-                if not p["chunk_id"].startswith(doc_id)
-            ]
-            if len(term_data["postings"]) < original_len:
-                removed_any = True
-            # Mark empty terms for cleanup
-            if not term_data["postings"]:
-                terms_to_delete.append(term)
-            else:
-                term_data["df"] = len(term_data["postings"])
-
-        # Remove empty terms
-        for term in terms_to_delete:
-            del self._index[term]
-
-        if removed_any:
-            # Recalculate global metadata
-            all_chunk_ids: set[str] = set()
-            total_length = 0
-            for td in self._index.values():
-                for p in td["postings"]:
-                    all_chunk_ids.add(p["chunk_id"])
-                    total_length += p["doc_length"]
-
-            num_docs = len(all_chunk_ids)
-            avg_doc_length = total_length / num_docs if num_docs else 0.0
-
-            # Recalculate IDF values
-            for td in self._index.values():
-                td["idf"] = self._calculate_idf(num_docs, td["df"])
-
-            self._metadata = {
-                "num_docs": num_docs,
-                "avg_doc_length": avg_doc_length,
-                "total_terms": len(self._index),
-                "collection": collection,
-            }
+            
+            stale = [cid for cid in self._chunk_locations() if cid.startswith(doc_id)]
+            if not stale:
+                return False
+            
+            self._install(collection, self._tombstone(collection, stale))
             self._save(collection)
-
-        return removed_any
+        
+        self._maybe_schedule_merge(collection)
+        return True
+    
+    def remove_chunks(
+        self,
+        chunk_ids: List[str],
+        collection: str = "default",
+    ) -> int:
+        """Remove individual chunks from the BM25 index.
+        
+        Used by diff re-ingestion to drop the chunks that vanished from a
+        modified document while its unchanged chunks stay indexed.
+        
+        Args:
+            chunk_ids: Chunk IDs to remove (unknown IDs are ignored).
+            collection: Collection name.
+        
+        Returns:
+            Number of chunks removed.
+        """
+        if not chunk_ids:
+            return 0
+        with self._write_lock:
+            if not self._sync_for_write(collection):
+                return 0
+            
+            stale = [cid for cid in set(chunk_ids) if cid in self._chunk_locations()]
+            if not stale:
+                return 0
+            
+            self._install(collection, self._tombstone(collection, stale))
+            self._save(collection)
+        
+        self._maybe_schedule_merge(collection)
+        return len(stale)
+    
+    def merge_segments(self, collection: str = "default") -> bool:
+        """Merge the smaller segments of a collection into one.
+        
+        Reading postings, dropping tombstoned documents and writing the
+        merged segment happen outside the write lock; the manifest swap
+        re-applies any deletes that raced with the merge.
+        
+        Args:
+            collection: Collection name.
+        
+        Returns:
+            True if a merge was committed, False if there was nothing to do.
+        """
+        with self._write_lock:
+            if not self._sync_for_write(collection) or len(self._segments) < 2:
+                return False
+            # Merge the smaller segments (at least two) plus fully deleted ones
+            by_size = sorted(self._segments, key=lambda s: s.live_docs)
+            n_merge = max(2, len(by_size) - self.max_segments // 2)
+            sources = by_size[:n_merge] + [s for s in by_size[n_merge:] if s.live_docs == 0]
+            merged_name = self._new_segment_name()
+        
+        merged = _Segment.merge(merged_name, sources)
+        if merged.chunk_ids:
+            self._write_segment(collection, merged)
+        
+        source_names = [s.name for s in sources]
+        with self._write_lock:
+            if not self._sync_for_write(collection):
+                return False
+            current = {s.name: s for s in self._segments}
+            if any(name not in current for name in source_names):
+                # Index was rebuilt or merged by another writer meanwhile
+                self._remove_segment_files(collection, [merged_name])
+                return False
+            
+            # Deletes that happened while we were merging
+            raced: List[str] = []
+            for src in sources:
+                now = current[src.name]
+                if now.del_file != src.del_file:
+                    newly_dead = np.flatnonzero(src.alive & ~now.alive)
+                    raced.extend(now.chunk_ids[i] for i in newly_dead.tolist())
+            
+            remaining = [s for s in self._segments if s.name not in source_names]
+            if merged.chunk_ids:
+                remaining.append(merged)
+            self._install(collection, remaining)
+            self._locations = None
+            if raced:
+                self._install(collection, self._tombstone(collection, raced))
+            self._save(collection)
+            
+            self._remove_segment_files(collection, source_names)
+        
+        logger.info(
+            f"BM25 merged {len(sources)} segments of collection '{collection}' "
+            f"into {merged_name} ({len(merged.chunk_ids)} chunks)"
+        )
+        return True
+    
+    def wait_for_merge(self, timeout: Optional[float] = None) -> None:
+        """Block until a running background merge (if any) finishes.
+        
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+        """
+        thread = self._merge_thread
+        if thread is not None:
+            thread.join(timeout)
+    
+    def export_term_stats(self) -> List[Dict[str, Any]]:
+        """Reconstruct per-chunk term statistics from the loaded index.
+        
+        Produces the same structure ``SparseEncoder.encode()`` emits, which
+        is what other sparse backends (e.g. TantivyIndexer) build from.
+        
+        Returns:
+            List of ``{"chunk_id", "term_frequencies", "doc_length"}`` dicts
+            for all live chunks.
+        """
+        stats: List[Dict[str, Any]] = []
+        for seg in self._segments:
+            term_ids, doc_ids, tfs, chunk_ids, doc_lengths = seg.live_postings()
+            per_doc: List[Dict[str, int]] = [{} for _ in chunk_ids]
+            for t, d, tf in zip(term_ids.tolist(), doc_ids.tolist(), tfs.tolist()):
+                per_doc[d][seg.term_list[t]] = int(tf)
+            stats.extend(
+                {
+                    "chunk_id": cid,
+                    "term_frequencies": per_doc[i],
+                    "doc_length": int(doc_lengths[i]),
+                }
+                for i, cid in enumerate(chunk_ids)
+            )
+        return stats
+    
+    @property
+    def generation(self) -> Optional[str]:
+        """Generation token of the index currently held in memory."""
+        return self._generation
+    
+    def get_generation(self, collection: str = "default") -> Optional[str]:
+        """Read the on-disk generation token for a collection.
+        
+        This is a cheap check (one small file read) that lets callers keep
+        an index resident and reload only when another writer has saved a
+        new version.  Indexes written before the segment manifest existed
+        fall back to a token derived from the index file's mtime and size.
+        
+        Args:
+            collection: Collection name.
+        
+        Returns:
+            Generation token string, or None if no index exists on disk.
+        """
+        manifest = self._read_manifest(collection)
+        if manifest and manifest.get("generation") and "segments" in manifest:
+            return str(manifest["generation"])
+        
+        for path in (self._get_index_path(collection), self._get_legacy_index_path(collection)):
+            try:
+                st = path.stat()
+            except OSError:
+                continue
+            return f"legacy-{st.st_mtime_ns}-{st.st_size}"
+        return None
     
     # ===== Private Helper Methods =====
     
+    def _install(self, collection: str, segments: List[_Segment]) -> None:
+        """Make *segments* the current segment list and refresh global stats."""
+        num_docs = sum(s.live_docs for s in segments)
+        total_length = sum(s.live_length for s in segments)
+        self._segment_pool = {s.name: s for s in segments}
+        self._segments = segments
+        self._metadata = {
+            "num_docs": num_docs,
+            "avg_doc_length": total_length / num_docs if num_docs else 0.0,
+            "num_segments": len(segments),
+            "collection": collection,
+        }
+    
+    def _sync_for_write(self, collection: str) -> bool:
+        """Make sure the writer state matches what is on disk.
+        
+        Reloads (reusing unchanged segments) when another writer has saved
+        a newer generation since this instance last wrote or loaded.
+        
+        Returns:
+            True if an index exists, False if the collection has no index.
+        """
+        on_disk = self.get_generation(collection)
+        if on_disk is None:
+            self._install(collection, [])
+            self._locations = None
+            return False
+        if not self._segments or on_disk != self._generation:
+            return self.load(collection)
+        return True
+    
+    def _chunk_locations(self) -> Dict[str, Tuple[str, int]]:
+        """Return (building lazily) the live chunk_id -> location map."""
+        if self._locations is None:
+            locations: Dict[str, Tuple[str, int]] = {}
+            for seg in self._segments:
+                alive = seg.alive.tolist()
+                for local, cid in enumerate(seg.chunk_ids):
+                    if alive[local]:
+                        locations[cid] = (seg.name, local)
+            self._locations = locations
+        return self._locations
+    
+    def _tombstone(self, collection: str, chunk_ids: List[str]) -> List[_Segment]:
+        """Mark *chunk_ids* deleted and persist the affected tombstone files.
+        
+        Args:
+            collection: Collection name
+            chunk_ids: Live chunk ids to delete (unknown ids are ignored)
+        
+        Returns:
+            The new segment list, with affected segments replaced by copies
+            carrying the updated alive masks.
+        """
+        locations = self._chunk_locations()
+        by_segment: Dict[str, List[int]] = {}
+        for cid in set(chunk_ids):
+            loc = locations.pop(cid, None)
+            if loc is not None:
+                by_segment.setdefault(loc[0], []).append(loc[1])
+        if not by_segment:
+            return list(self._segments)
+        
+        segments_dir = self._get_segments_dir(collection)
+        updated: List[_Segment] = []
+        for seg in self._segments:
+            new_dead = by_segment.get(seg.name)
+            if not new_dead:
+                updated.append(seg)
+                continue
+            deleted = np.union1d(seg.deleted_ids(), np.asarray(new_dead, dtype=np.int32))
+            self._del_seq += 1
+            del_file = f"{seg.name}.del.{self._del_seq}.npy"
+            temp_path = segments_dir / f"{del_file}.tmp"
+            with open(temp_path, 'wb') as f:
+                np.save(f, deleted.astype(np.int32))
+            temp_path.replace(segments_dir / del_file)
+            updated.append(seg.with_deleted(deleted, del_file))
+        return updated
+    
+    def _maybe_schedule_merge(self, collection: str) -> None:
+        """Start a background merge when there are too many segments."""
+        if len(self._segments) <= self.max_segments:
+            return
+        if self._merge_thread is not None and self._merge_thread.is_alive():
+            return
+        
+        def _run() -> None:
+            try:
+                self.merge_segments(collection)
+            except Exception as e:
+                logger.warning(f"BM25 background merge failed for collection '{collection}': {e}")
+        
+        self._merge_thread = threading.Thread(
+            target=_run, daemon=True, name=f"bm25-merge-{collection}"
+        )
+        self._merge_thread.start()
+    
+    def _new_segment_name(self) -> str:
+        """Allocate the next segment name."""
+        name = f"seg_{self._next_segment:06d}"
+        self._next_segment += 1
+        return name
+    
+    def _write_segment(self, collection: str, segment: _Segment) -> None:
+        """Persist a new segment file into the collection's segments dir."""
+        segments_dir = self._get_segments_dir(collection)
+        segments_dir.mkdir(parents=True, exist_ok=True)
+        segment.save(segments_dir / f"{segment.name}.npz")
+    
+    def _remove_segment_files(self, collection: str, names: List[str]) -> None:
+        """Best-effort removal of files no longer referenced by the manifest.
+        
+        Removes segment/tombstone files of the segments in *names* (unless
+        they are still live) and superseded tombstone files of live segments.
+        """
+        segments_dir = self._get_segments_dir(collection)
+        live = {s.name for s in self._segments}
+        live_del = {s.del_file for s in self._segments if s.del_file}
+        try:
+            entries = list(segments_dir.iterdir())
+        except OSError:
+            return
+        for path in entries:
+            stem = path.name.split(".", 1)[0]
+            try:
+                if stem in names and stem not in live:
+                    path.unlink()
+                elif ".del." in path.name and stem in live and path.name not in live_del:
+                    path.unlink()
+            except OSError:
+                pass
+    
+    @staticmethod
+    def _load_tombstones(path: Path) -> np.ndarray:
+        """Load a tombstone file (deleted local doc ids).
+        
+        Raises:
+            ValueError: If the file is missing or corrupted
+        """
+        try:
+            return np.load(path, allow_pickle=False)
+        except (OSError, ValueError) as e:
+            raise ValueError(f"Corrupted tombstone file at {path}: {e}")
+    
+    def _read_manifest(self, collection: str) -> Optional[Dict[str, Any]]:
+        """Read the collection manifest, or None if it does not exist."""
+        try:
+            manifest = json.loads(
+                self._get_version_path(collection).read_text(encoding="utf-8")
+            )
+        except (OSError, ValueError):
+            return None
+        return manifest if isinstance(manifest, dict) else None
+    
+    def _migrate_legacy(self, collection: str) -> bool:
+        """Convert a legacy single-file index into the first segment.
+        
+        Handles both the single-file array layout (``{collection}_bm25.npz``)
+        and the original pickle layout.  The old file is renamed with a
+        ``.migrated`` suffix so it is no longer picked up.
+        
+        Args:
+            collection: Collection name
+        
+        Returns:
+            True if the legacy index was converted and loaded
+        
+        Raises:
+            ValueError: If the legacy file is corrupted
+        """
+        array_path = self._get_index_path(collection)
+        name = self._new_segment_name()
+        
+        if array_path.exists():
+            source = array_path
+            segment = _Segment.load(array_path, name)
+        else:
+            source = self._get_legacy_index_path(collection)
+            segment = self._segment_from_pickle(source, name)
+            if segment is None:
+                return False
+        
+        self._write_segment(collection, segment)
+        self._install(collection, [segment])
+        self._locations = None
+        self._save(collection)
+        try:
+            source.replace(source.with_name(source.name + ".migrated"))
+        except OSError:
+            pass
+        logger.info(
+            f"Migrated BM25 index {source.name} for collection '{collection}' "
+            f"({len(segment.chunk_ids)} chunks) to segment {name}"
+        )
+        return True
+    
+    @staticmethod
+    def _segment_from_pickle(path: Path, name: str) -> Optional[_Segment]:
+        """Convert an original per-posting-dict pickle index into a segment.
+        
+        Raises:
+            ValueError: If the pickle is corrupted
+        """
+        try:
+            with open(path, 'rb') as f:
+                data = pickle.load(f)
+            if "metadata" not in data or "index" not in data:
+                raise ValueError("Invalid index file structure: missing metadata or index")
+        except (pickle.UnpicklingError, EOFError, ValueError) as e:
+            raise ValueError(f"Corrupted index file at {path}: {e}")
+        
+        terms: List[str] = []
+        doc_of: Dict[str, int] = {}
+        chunk_ids: List[str] = []
+        doc_lengths: List[int] = []
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        tfs: List[int] = []
+        for term, term_data in data["index"].items():
+            tid = len(terms)
+            terms.append(term)
+            for posting in term_data["postings"]:
+                cid = posting["chunk_id"]
+                doc = doc_of.get(cid)
+                if doc is None:
+                    doc = doc_of[cid] = len(chunk_ids)
+                    chunk_ids.append(cid)
+                    doc_lengths.append(posting["doc_length"])
+                term_ids.append(tid)
+                doc_ids.append(doc)
+                tfs.append(posting["tf"])
+        
+        if not chunk_ids:
+            return None
+        
+        return _Segment.from_postings(
+            name=name,
+            terms=terms,
+            chunk_ids=chunk_ids,
+            doc_lengths=np.asarray(doc_lengths, dtype=np.int32),
+            term_ids=np.asarray(term_ids, dtype=np.int64),
+            doc_ids=np.asarray(doc_ids, dtype=np.int32),
+            tfs=np.asarray(tfs, dtype=np.float32),
+        )
+    
+    @staticmethod
+    def _select_top(scores: np.ndarray, top_k: int) -> np.ndarray:
+        """Indices of the ``top_k`` best scores, best first, without a full sort."""
+        k = min(top_k, len(scores))
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        return top[np.argsort(-scores[top], kind="stable")]
+    
+    @staticmethod
+    def _expand_ranges(starts: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+        """Concatenate ``arange(start, start + length)`` for every range, vectorized."""
+        total = int(lengths.sum())
+        if total == 0:
+            return np.zeros(0, dtype=np.int64)
+        first = np.cumsum(lengths) - lengths
+        within = np.arange(total, dtype=np.int64) - np.repeat(first, lengths)
+        return np.repeat(starts, lengths) + within
+    
     def _calculate_idf(self, num_docs: int, df: int) -> float:
         """Calculate IDF using BM25 formula.
         
@@ -508,6 +1286,8 @@ class BM25Indexer:
     ) -> float:
         """Calculate BM25 score for a single term in a document.
         
+        Scalar reference of the vectorized computation in ``query()``.
+        
         Formula: score = IDF * (tf * (k1 + 1)) / (tf + k1 * (1 - b + b * (doc_length / avg_doc_length)))
         
         Args:
@@ -556,19 +1336,55 @@ class BM25Indexer:
                     f"got {stat['doc_length']}"
                 )
     
+    def _get_segments_dir(self, collection: str) -> Path:
+        """Get the directory holding a collection's segment files.
+        
+        Args:
+            collection: Collection name
+        
+        Returns:
+            Path to segments directory
+        """
+        return self.index_dir / f"{collection}_segments"
+    
     def _get_index_path(self, collection: str) -> Path:
-        """Get file path for index file.
+        """Get file path for a single-file array index (pre-segment layout).
         
         Args:
             collection: Collection name
         
         Returns:
-            Path to index file
+            Path to single-file array index
+        """
+        return self.index_dir / f"{collection}_bm25.npz"
+    
+    def _get_legacy_index_path(self, collection: str) -> Path:
+        """Get file path for a pre-array (pickle) index file.
+        
+        Args:
+            collection: Collection name
+        
+        Returns:
+            Path to legacy pickle index file
         """
         return self.index_dir / f"{collection}_bm25.pkl"
     
+    def _get_version_path(self, collection: str) -> Path:
+        """Get file path for the manifest (generation + segments) of an index.
+        
+        Args:
+            collection: Collection name
+        
+        Returns:
+            Path to version manifest file
+        """
+        return self.index_dir / f"{collection}_bm25.version"
+    
     def _save(self, collection: str) -> None:
-        """Save index to disk.
+        """Commit the current segment list by writing a new manifest.
+        
+        Segment and tombstone files are written before this is called, so a
+        reader that observes the new generation always finds them on disk.
         
         Args:
             collection: Collection name
@@ -576,25 +1392,30 @@ class BM25Indexer:
         # Ensure directory exists
         self.index_dir.mkdir(parents=True, exist_ok=True)
         
-        index_path = self._get_index_path(collection)
-        
-        # Prepare data
-        data = {
-            "metadata": self._metadata,
-            "index": self._index
+        generation = f"{time.time_ns()}-{os.getpid()}-{os.urandom(4).hex()}"
+        manifest = {
+            "generation": generation,
+            "segments": [
+                {"name": s.name, "num_docs": len(s.chunk_ids), "del_file": s.del_file}
+                for s in self._segments
+            ],
+            "num_docs": self._metadata.get("num_docs", 0),
+            "avg_doc_length": self._metadata.get("avg_doc_length", 0.0),
+            "next_segment": self._next_segment,
+            "del_seq": self._del_seq,
+            "saved_at": time.time(),
         }
         
         # Write atomically (write to temp file, then rename)
-        temp_path = index_path.with_suffix('.tmp')
+        version_path = self._get_version_path(collection)
+        temp_path = version_path.with_suffix('.version.tmp')
         try:
-            with open(temp_path, 'wb') as f:
-                pickle.dump(data, f)
-            
-            # Atomic rename
-            temp_path.replace(index_path)
-            
-        except (IOError, OSError, pickle.PickleError, TypeError) as e:
+            temp_path.write_text(json.dumps(manifest), encoding="utf-8")
+            temp_path.replace(version_path)
+        except OSError:
             # Clean up temp file if write failed
             if temp_path.exists():
                 temp_path.unlink()
             raise
+        
+        self._generation = generation
@@ -0,0 +1,408 @@
+"""Local chunk docstore: chunk_id -> (text, metadata) in SQLite with an LRU.
+
+BM25/Tantivy hits carry only chunk IDs, and Chroma is a poor key-value
+store for turning them into text: every sparse query paid a
+``get_by_ids`` round-trip, and a vector store outage took sparse results
+down with it. VectorUpserter writes every chunk here as well, and sparse
+retrieval, parent expansion and the dashboard chunk browser read from it.
+
+Records have the same shape as ``BaseVectorStore.get_by_ids`` results
+(``{"id", "text", "metadata"}``) and metadata is flattened the way
+ChromaStore flattens it, so callers see identical data from either source.
+
+Design Principles:
+- Read-optimized: Primary-key lookups in one WAL-mode SQLite file per
+  collection, fronted by an in-process LRU of hot chunks
+- Content-addressed: Chunk IDs hash the chunk text, so cached entries
+  never go stale when another process re-ingests a file
+- Best effort: The vector store stays the source of truth; readers fall
+  back to it for chunks missing here (e.g. ingested before the docstore)
+- Thread-safe: One connection guarded by threading.Lock
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+CHUNK = "chunk"
+PARENT = "parent"
+
+# SQLite's default limit on host parameters per statement is 999
+_MAX_PARAMS = 900
+
+
+def flatten_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Flatten metadata the way ChromaStore stores it.
+
+    Scalars are kept, None is dropped, lists/tuples become comma-separated
+    strings and anything else becomes ``str(value)``.
+
+    Args:
+        metadata: Raw metadata dict.
+
+    Returns:
+        Flattened metadata dict.
+    """
+    flat: Dict[str, Any] = {}
+    for key, value in metadata.items():
+        if isinstance(value, (str, int, float, bool)):
+            flat[key] = value
+        elif value is None:
+            continue
+        elif isinstance(value, (list, tuple)):
+            flat[key] = ",".join(str(v) for v in value)
+        else:
+            flat[key] = str(value)
+    return flat
+
+
+class ChunkDocStore:
+    """SQLite-backed chunk text/metadata store with an in-process LRU.
+
+    Database Schema:
+        chunks (
+            chunk_id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,          -- "chunk" or "parent"
+            text TEXT NOT NULL,
+            metadata TEXT NOT NULL,      -- JSON
+            doc_hash TEXT,
+            source_path TEXT
+        )
+
+    Example:
+        >>> store = ChunkDocStore("data/db/docstore/default.db")
+        >>> store.put_many([{"id": "a1_0000_ff", "text": "...", "metadata": {...}}])
+        >>> store.get_many(["a1_0000_ff", "missing"])
+        [{'id': 'a1_0000_ff', 'text': '...', 'metadata': {...}}, {}]
+    """
+
+    def __init__(self, db_path: str, cache_size: int = 20000) -> None:
+        """Open (creating if needed) the docstore database.
+
+        Args:
+            db_path: Path to the SQLite database file.
+            cache_size: Maximum records kept in the in-process LRU (0 disables it).
+        """
+        self.db_path = Path(db_path)
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, Tuple[str, Dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = sqlite3.connect(
+            str(self.db_path), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA busy_timeout=20000")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS chunks (
+                chunk_id TEXT PRIMARY KEY,
+                kind TEXT NOT NULL,
+                text TEXT NOT NULL,
+                metadata TEXT NOT NULL,
+                doc_hash TEXT,
+                source_path TEXT
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_doc_hash ON chunks(doc_hash)")
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_chunks_source_path ON chunks(source_path)")
+        self._conn.commit()
+
+    def put_many(self, records: Sequence[Dict[str, Any]], kind: str = CHUNK) -> int:
+        """Insert or replace records.
+
+        Args:
+            records: Dicts with ``id``, ``text`` and ``metadata``.
+            kind: ``"chunk"`` for retrievable chunks, ``"parent"`` for
+                parent-retrieval context chunks.
+
+        Returns:
+            Number of records written.
+        """
+        rows = []
+        entries = []
+        for record in records:
+            chunk_id = str(record["id"])
+            text = str(record.get("text") or "")
+            metadata = flatten_metadata(record.get("metadata") or {})
+            rows.append((
+                chunk_id,
+                kind,
+                text,
+                json.dumps(metadata, ensure_ascii=False),
+                metadata.get("doc_hash"),
+                metadata.get("source_path"),
+            ))
+            entries.append((chunk_id, text, metadata))
+        if not rows:
+            return 0
+
+        with self._lock:
+            conn = self._require_conn()
+            conn.executemany(
+                "INSERT OR REPLACE INTO chunks "
+                "(chunk_id, kind, text, metadata, doc_hash, source_path) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.commit()
+            for chunk_id, text, metadata in entries:
+                if chunk_id in self._cache:
+                    self._cache[chunk_id] = (text, metadata)
+                    self._cache.move_to_end(chunk_id)
+        return len(rows)
+
+    def get_many(self, ids: Sequence[str]) -> List[Dict[str, Any]]:
+        """Get records by ID.
+
+        Args:
+            ids: Chunk (or parent) IDs.
+
+        Returns:
+            Records aligned with *ids*; an empty dict for each missing ID,
+            like ``BaseVectorStore.get_by_ids``. Metadata dicts are copies.
+        """
+        found: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        with self._lock:
+            for chunk_id in ids:
+                entry = self._cache.get(chunk_id)
+                if entry is not None:
+                    self._cache.move_to_end(chunk_id)
+                    found[chunk_id] = entry
+            missing = [i for i in dict.fromkeys(ids) if i not in found]
+            if missing:
+                conn = self._require_conn()
+                for batch in _batches(missing):
+                    placeholders = ", ".join("?" * len(batch))
+                    rows = conn.execute(
+                        f"SELECT chunk_id, text, metadata FROM chunks "
+                        f"WHERE chunk_id IN ({placeholders})",
+                        batch,
+                    ).fetchall()
+                    for chunk_id, text, metadata_json in rows:
+                        entry = (text, json.loads(metadata_json))
+                        found[chunk_id] = entry
+                        self._remember(chunk_id, entry)
+            hits = sum(1 for i in ids if i in found)
+            self._hits += hits
+            self._misses += len(ids) - hits
+
+        records: List[Dict[str, Any]] = []
+        for chunk_id in ids:
+            entry = found.get(chunk_id)
+            if entry is None:
+                records.append({})
+            else:
+                records.append({"id": chunk_id, "text": entry[0], "metadata": dict(entry[1])})
+        return records
+
+    def get_texts(self, ids: Sequence[str]) -> Dict[str, str]:
+        """Get texts by ID (e.g. parent chunks for context expansion).
+
+        Args:
+            ids: Chunk (or parent) IDs.
+
+        Returns:
+            Mapping of found IDs to their text.
+        """
+        return {r["id"]: r["text"] for r in self.get_many(ids) if r}
+
+    def list_by_doc_hash(self, doc_hash: str, kind: str = CHUNK) -> List[Dict[str, Any]]:
+        """List the records of one document in chunk_id order.
+
+        Args:
+            doc_hash: File SHA-256 stored in chunk metadata.
+            kind: Record kind to list.
+
+        Returns:
+            Records with ``id``, ``text`` and ``metadata``.
+        """
+        with self._lock:
+            rows = self._require_conn().execute(
+                "SELECT chunk_id, text, metadata FROM chunks "
+                "WHERE doc_hash = ? AND kind = ? ORDER BY chunk_id",
+                (doc_hash, kind),
+            ).fetchall()
+        return [
+            {"id": chunk_id, "text": text, "metadata": json.loads(metadata_json)}
+            for chunk_id, text, metadata_json in rows
+        ]
+
+    def delete(self, ids: Iterable[str]) -> int:
+        """Delete records by ID.
+
+        Args:
+            ids: Chunk (or parent) IDs.
+
+        Returns:
+            Number of records deleted.
+        """
+        ids = list(ids)
+        deleted = 0
+        with self._lock:
+            conn = self._require_conn()
+            for batch in _batches(ids):
+                placeholders = ", ".join("?" * len(batch))
+                deleted += conn.execute(
+                    f"DELETE FROM chunks WHERE chunk_id IN ({placeholders})", batch
+                ).rowcount
+            conn.commit()
+            for chunk_id in ids:
+                self._cache.pop(chunk_id, None)
+        return deleted
+
+    def delete_by_doc_hash(self, doc_hash: str) -> int:
+        """Delete every record (chunks and parents) of a document.
+
+        Args:
+            doc_hash: File SHA-256 stored in chunk metadata.
+
+        Returns:
+            Number of records deleted.
+        """
+        return self._delete_where("doc_hash = ?", (doc_hash,))
+
+    def delete_by_source_path(self, source_path: str) -> int:
+        """Delete every record ingested from *source_path*.
+
+        Args:
+            source_path: ``source_path`` metadata value.
+
+        Returns:
+            Number of records deleted.
+        """
+        return self._delete_where("source_path = ?", (source_path,))
+
+    def count(self, kind: str = CHUNK) -> int:
+        """Number of records of a kind."""
+        with self._lock:
+            return self._require_conn().execute(
+                "SELECT COUNT(*) FROM chunks WHERE kind = ?", (kind,)
+            ).fetchone()[0]
+
+    def clear(self) -> None:
+        """Delete all records."""
+        with self._lock:
+            conn = self._require_conn()
+            conn.execute("DELETE FROM chunks")
+            conn.commit()
+            self._cache.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Get LRU statistics."""
+        with self._lock:
+            total = self._hits + self._misses
+            hit_rate = self._hits / total if total > 0 else 0.0
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "cached": len(self._cache),
+                "cache_size": self.cache_size,
+                "hit_rate": round(hit_rate, 4),
+                "path": str(self.db_path),
+            }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    # ===== Private Helper Methods =====
+
+    def _require_conn(self) -> sqlite3.Connection:
+        """Return the open connection (caller holds the lock)."""
+        if self._conn is None:
+            raise RuntimeError(f"ChunkDocStore at {self.db_path} is closed")
+        return self._conn
+
+    def _remember(self, chunk_id: str, entry: Tuple[str, Dict[str, Any]]) -> None:
+        """Add an entry to the LRU (caller holds the lock)."""
+        if self.cache_size <= 0:
+            return
+        self._cache[chunk_id] = entry
+        self._cache.move_to_end(chunk_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _delete_where(self, where: str, params: Tuple[Any, ...]) -> int:
+        """Delete matching rows and drop them from the LRU."""
+        with self._lock:
+            conn = self._require_conn()
+            ids = [row[0] for row in conn.execute(
+                f"SELECT chunk_id FROM chunks WHERE {where}", params
+            )]
+            if not ids:
+                return 0
+            conn.execute(f"DELETE FROM chunks WHERE {where}", params)
+            conn.commit()
+            for chunk_id in ids:
+                self._cache.pop(chunk_id, None)
+        return len(ids)
+
+
+def _batches(ids: Sequence[str]) -> Iterable[List[str]]:
+    """Split IDs into batches that fit SQLite's parameter limit."""
+    for start in range(0, len(ids), _MAX_PARAMS):
+        yield list(ids[start:start + _MAX_PARAMS])
+
+
+# Global docstores, one per collection
+_docstores: Dict[str, ChunkDocStore] = {}
+_docstores_lock = threading.Lock()
+
+
+def get_chunk_docstore(collection: str, cache_size: Optional[int] = None) -> ChunkDocStore:
+    """Get the shared docstore of a collection (``data/db/docstore/<collection>.db``).
+
+    Args:
+        collection: Collection name.
+        cache_size: LRU size used when the store is created; defaults to
+            ``retrieval.docstore_cache_size`` from settings.
+    """
+    with _docstores_lock:
+        store = _docstores.get(collection)
+        if store is None:
+            from src.core.settings import resolve_path
+
+            if cache_size is None:
+                cache_size = _configured_cache_size()
+            store = ChunkDocStore(
+                str(resolve_path(f"data/db/docstore/{collection}.db")),
+                cache_size=cache_size,
+            )
+            _docstores[collection] = store
+    return store
+
+
+def close_chunk_docstores() -> None:
+    """Close every shared docstore (called on shutdown and before wiping data)."""
+    with _docstores_lock:
+        stores = list(_docstores.values())
+        _docstores.clear()
+    for store in stores:
+        store.close()
+
+
+def _configured_cache_size() -> int:
+    """Read ``retrieval.docstore_cache_size``, falling back to the default."""
+    try:
+        from src.core.settings import load_settings
+
+        return int(getattr(load_settings().retrieval, "docstore_cache_size", 20000))
+    except Exception:
+        return 20000
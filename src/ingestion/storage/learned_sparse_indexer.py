@@ -0,0 +1,270 @@
+"""Learned-sparse (BGE-M3 lexical weight) inverted index.
+
+BGE-M3 produces a weight per vocabulary token in the same forward pass as
+the dense vector (``BGEM3Embedding.embed_with_sparse``). This indexer stores
+those weights as postings and scores a query by the dot product of its
+token weights with each chunk's token weights, replacing jieba term counts
+and BM25 statistics with weights the model learned for retrieval.
+
+Design Principles:
+- Reuse: Storage is the BM25Indexer segment layout (CSR postings, tombstones,
+  background merges, generation manifest); only scoring differs
+- Compact: Posting weights are float32 arrays; scoring is vectorized
+- Single Pass: Chunk weights come from the dense encoding pass, query
+  weights from one embed_with_sparse() call per query batch
+- Drop-in: Same build/load/query/add_documents/remove_document API as the
+  other sparse backends, so SparseRetriever and ingestion use it unchanged
+"""
+
+import logging
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from src.ingestion.storage.bm25_indexer import BM25Indexer
+
+logger = logging.getLogger(__name__)
+
+
+class LearnedSparseIndexer(BM25Indexer):
+    """Inverted index over BGE-M3 lexical weights with dot-product scoring.
+
+    Term statistics use the SparseEncoder structure, with token weights in
+    place of term counts (see LearnedSparseEncoder):
+        {"chunk_id": str, "term_frequencies": {token_id: weight}, "doc_length": int}
+
+    Queries arrive as keyword lists (the SparseRetriever contract); they are
+    joined and encoded by ``query_encoder`` into token weights.
+
+    Attributes:
+        query_encoder: Embedding exposing ``embed_with_sparse()`` (e.g.
+            BGEM3Embedding), used to weight query tokens.
+
+    Example:
+        >>> indexer = LearnedSparseIndexer("data/db/learned_sparse", query_encoder=embedding)
+        >>> indexer.build([
+        ...     {"chunk_id": "1", "term_frequencies": {"6": 0.21, "1284": 0.18}, "doc_length": 2},
+        ... ])
+        >>> indexer.query(["电机", "参数"], top_k=5)
+    """
+
+    def __init__(
+        self,
+        index_dir: str = "data/db/learned_sparse",
+        query_encoder: Optional[Any] = None,
+        k1: float = 1.5,
+        b: float = 0.75,
+        max_segments: int = 8,
+    ):
+        """Initialize LearnedSparseIndexer.
+
+        Args:
+            index_dir: Directory to store index files.
+            query_encoder: Embedding with ``embed_with_sparse()``; required
+                for query() / query_batch() only.
+            k1: Unused (kept so indexers can be cloned like BM25Indexer).
+            b: Unused (kept so indexers can be cloned like BM25Indexer).
+            max_segments: Segment count above which a background merge is
+                started (default: 8).
+        """
+        super().__init__(index_dir=index_dir, k1=k1, b=b, max_segments=max_segments)
+        self.query_encoder = query_encoder
+
+    def query(
+        self,
+        query_terms: List[str],
+        top_k: int = 10,
+        trace: Optional[Any] = None,
+    ) -> List[Dict[str, Any]]:
+        """Query the index with the learned weights of the query text.
+
+        Args:
+            query_terms: Query keywords (joined with spaces and encoded).
+            top_k: Maximum number of results to return.
+            trace: Optional TraceContext for observability.
+
+        Returns:
+            List of {"chunk_id": str, "score": float}, best first.
+
+        Raises:
+            ValueError: If index not loaded, query_terms empty or no
+                query_encoder is configured.
+        """
+        return self.query_batch([query_terms], top_k=top_k, trace=trace)[0]
+
+    def query_batch(
+        self,
+        queries: List[List[str]],
+        top_k: int = 10,
+        trace: Optional[Any] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """Encode several queries in one model call and score them in one pass.
+
+        Args:
+            queries: Query keyword lists, one per query.
+            top_k: Maximum number of results per query.
+            trace: Optional TraceContext for observability.
+
+        Returns:
+            One result list per query, in input order (same format as query()).
+
+        Raises:
+            ValueError: If index not loaded, any query is empty or no
+                query_encoder is configured.
+        """
+        if not self._segments:
+            raise ValueError("Index not loaded. Call load() or build() first.")
+        if any(not terms for terms in queries):
+            raise ValueError("query_terms cannot be empty")
+        if not queries or self._metadata["num_docs"] == 0 or top_k <= 0:
+            return [[] for _ in queries]
+
+        weights = self.encode_queries([" ".join(terms) for terms in queries], trace)
+        return self.query_weights(weights, top_k=top_k)
+
+    def encode_queries(
+        self,
+        texts: List[str],
+        trace: Optional[Any] = None,
+    ) -> List[Dict[str, float]]:
+        """Return the lexical token weights of query texts.
+
+        Raises:
+            ValueError: If no query_encoder with embed_with_sparse() is set.
+        """
+        embed_with_sparse = getattr(self.query_encoder, "embed_with_sparse", None)
+        if embed_with_sparse is None:
+            raise ValueError(
+                "LearnedSparseIndexer needs an embedding with embed_with_sparse() "
+                "(embedding.provider: bge-m3) to encode queries"
+            )
+        _, weights = embed_with_sparse(texts, trace=trace)
+        return weights
+
+    def query_weights(
+        self,
+        query_weights: List[Dict[Any, float]],
+        top_k: int = 10,
+    ) -> List[List[Dict[str, Any]]]:
+        """Score already-encoded queries by dot product with chunk weights.
+
+        Postings of every distinct query token are gathered once per
+        segment and credited to each query holding the token; all (query,
+        document) scores are accumulated with a single ``bincount``.
+
+        Args:
+            query_weights: Token weights per query ({token_id: weight}).
+            top_k: Maximum number of results per query.
+
+        Returns:
+            One result list per query: {"chunk_id": str, "score": float},
+            best first.
+        """
+        segments = self._segments
+        results: List[List[Dict[str, Any]]] = [[] for _ in query_weights]
+        if not segments or top_k <= 0:
+            return results
+
+        # (query, token) pairs with positive weight
+        token_index: Dict[str, int] = {}
+        pair_q: List[int] = []
+        pair_t: List[int] = []
+        pair_w: List[float] = []
+        for qi, weights in enumerate(query_weights):
+            for token, weight in weights.items():
+                if weight <= 0:
+                    continue
+                pair_q.append(qi)
+                pair_t.append(token_index.setdefault(str(token), len(token_index)))
+                pair_w.append(float(weight))
+        if not pair_q:
+            return results
+        pair_q_arr = np.asarray(pair_q, dtype=np.int64)
+        pair_t_arr = np.asarray(pair_t, dtype=np.int64)
+        pair_w_arr = np.asarray(pair_w, dtype=np.float64)
+
+        # Key = query * total_docs + global doc id
+        total_docs = sum(len(seg.chunk_ids) for seg in segments)
+        bases: List[int] = []
+        parts_keys: List[np.ndarray] = []
+        parts_contrib: List[np.ndarray] = []
+        base = 0
+        for seg in segments:
+            bases.append(base)
+            starts = np.zeros(len(token_index), dtype=np.int64)
+            lengths = np.zeros(len(token_index), dtype=np.int64)
+            for token, j in token_index.items():
+                tid = seg.terms.get(token)
+                if tid is not None:
+                    starts[j] = seg.term_offsets[tid]
+                    lengths[j] = seg.term_offsets[tid + 1] - starts[j]
+
+            pair_lengths = lengths[pair_t_arr]
+            if pair_lengths.any():
+                positions = self._expand_ranges(starts[pair_t_arr], pair_lengths)
+                pair_of = np.repeat(np.arange(len(pair_t_arr)), pair_lengths)
+                docs = seg.post_docs[positions]
+                contrib = pair_w_arr[pair_of] * seg.post_tfs[positions]
+                owners = pair_q_arr[pair_of]
+                if seg.has_deletes:
+                    live = seg.alive[docs]
+                    docs, contrib, owners = docs[live], contrib[live], owners[live]
+                parts_keys.append(owners * total_docs + docs.astype(np.int64) + base)
+                parts_contrib.append(contrib)
+            base += len(seg.chunk_ids)
+
+        if not parts_keys:
+            return results
+        keys = np.concatenate(parts_keys)
+        if len(keys) == 0:
+            return results
+
+        # Accumulate per (query, document); unique keys come out grouped by query
+        unique_keys, inverse = np.unique(keys, return_inverse=True)
+        scores = np.bincount(
+            inverse, weights=np.concatenate(parts_contrib), minlength=len(unique_keys)
+        )
+        owners = unique_keys // total_docs
+        candidates = unique_keys % total_docs
+        bounds = np.searchsorted(owners, np.arange(len(query_weights) + 1))
+        bases_arr = np.asarray(bases)
+
+        for qi in range(len(query_weights)):
+            lo, hi = int(bounds[qi]), int(bounds[qi + 1])
+            if lo == hi:
+                continue
+            q_scores = scores[lo:hi]
+            q_candidates = candidates[lo:hi]
+            top = self._select_top(q_scores, top_k)
+            seg_of = np.searchsorted(bases_arr, q_candidates[top], side="right") - 1
+            results[qi] = [
+                {
+                    "chunk_id": segments[s].chunk_ids[int(q_candidates[i]) - bases[s]],
+                    "score": float(q_scores[i]),
+                }
+                for i, s in zip(top.tolist(), seg_of.tolist())
+            ]
+        return results
+
+    def export_term_stats(self) -> List[Dict[str, Any]]:
+        """Reconstruct per-chunk token weights from the loaded index.
+
+        Returns:
+            List of ``{"chunk_id", "term_frequencies", "doc_length"}`` dicts
+            (token weights as floats) for all live chunks.
+        """
+        stats: List[Dict[str, Any]] = []
+        for seg in self._segments:
+            term_ids, doc_ids, weights, chunk_ids, doc_lengths = seg.live_postings()
+            per_doc: List[Dict[str, float]] = [{} for _ in chunk_ids]
+            for t, d, w in zip(term_ids.tolist(), doc_ids.tolist(), weights.tolist()):
+                per_doc[d][seg.term_list[t]] = w
+            stats.extend(
+                {
+                    "chunk_id": cid,
+                    "term_frequencies": per_doc[i],
+                    "doc_length": int(doc_lengths[i]),
+                }
+                for i, cid in enumerate(chunk_ids)
+            )
+        return stats
@@ -0,0 +1,110 @@
+"""Factory for the configured sparse (keyword) indexer.
+
+``retrieval.sparse_provider`` selects the backend that ingestion writes,
+retrieval reads and document deletion cleans:
+- ``"bm25"`` (default): BM25Indexer under ``data/db/bm25/<collection>``
+- ``"tantivy"``: TantivyIndexer under ``data/db/tantivy/<collection>``
+- ``"bge_m3"``: LearnedSparseIndexer (BGE-M3 lexical weights) under
+  ``data/db/learned_sparse/<collection>``
+
+All expose the same build/load/query/add_documents/remove_document/
+remove_chunks API.
+"""
+
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+from typing import Any, List, Optional
+
+from src.core.settings import Settings, resolve_path
+
+logger = logging.getLogger(__name__)
+
+# Index directory root per provider (under data/db/)
+_INDEX_ROOTS = {"bm25": "bm25", "tantivy": "tantivy", "bge_m3": "learned_sparse"}
+
+
+def get_sparse_provider(settings: Settings) -> str:
+    """Return the configured sparse provider name ("bm25", "tantivy" or "bge_m3")."""
+    return getattr(getattr(settings, "retrieval", None), "sparse_provider", "bm25") or "bm25"
+
+
+def sparse_index_dir(settings: Settings, collection: str) -> str:
+    """Return the absolute index directory of a collection for the configured provider.
+
+    Args:
+        settings: Application settings.
+        collection: Collection name.
+
+    Returns:
+        Directory path as a string.
+    """
+    root = _INDEX_ROOTS.get(get_sparse_provider(settings), "bm25")
+    return str(resolve_path(f"data/db/{root}/{collection}"))
+
+
+def sparse_index_roots() -> List[Path]:
+    """Return the index root directory of every provider (for wiping all data).
+
+    Returns:
+        Absolute ``data/db/<root>`` paths, whether or not they exist.
+    """
+    return [resolve_path(f"data/db/{root}") for root in _INDEX_ROOTS.values()]
+
+
+def sparse_index_dirs(collection: str) -> List[Path]:
+    """Return a collection's index directory under every provider.
+
+    Clearing a collection removes all of them, so switching
+    ``sparse_provider`` never leaves a stale index behind.
+
+    Args:
+        collection: Collection name.
+
+    Returns:
+        Absolute ``data/db/<root>/<collection>`` paths, whether or not they exist.
+    """
+    return [root / collection for root in sparse_index_roots()]
+
+
+def create_sparse_indexer(
+    settings: Settings,
+    collection: str,
+    embedding: Optional[Any] = None,
+) -> Any:
+    """Create the sparse indexer for a collection.
+
+    Args:
+        settings: Application settings.
+        collection: Collection name.
+        embedding: Embedding client that encodes queries for the "bge_m3"
+            provider (share the dense client so the model loads once);
+            created from settings if omitted. Ignored by other providers.
+
+    Returns:
+        A BM25Indexer, TantivyIndexer or LearnedSparseIndexer instance.
+    """
+    index_dir = sparse_index_dir(settings, collection)
+    provider = get_sparse_provider(settings)
+    if provider == "tantivy":
+        from src.ingestion.storage.tantivy_indexer import TantivyIndexer
+
+        return TantivyIndexer(index_dir=index_dir)
+    if provider == "bge_m3":
+        from src.ingestion.storage.learned_sparse_indexer import LearnedSparseIndexer
+
+        if embedding is None:
+            # Cheap: BGEM3Embedding loads its model on first use
+            from src.libs.embedding.embedding_factory import EmbeddingFactory
+
+            try:
+                embedding = EmbeddingFactory.create(settings)
+            except Exception as e:
+                # Writes and deletes still work; queries raise a clear error
+                logger.warning(f"No query encoder for learned sparse index: {e}")
+        return LearnedSparseIndexer(index_dir=index_dir, query_encoder=embedding)
+
+    from src.ingestion.storage.bm25_indexer import BM25Indexer
+
+    return BM25Indexer(index_dir=index_dir)
@@ -10,6 +10,19 @@ Drop-in replacement for BM25Indexer via settings.yaml:
     retrieval:
       sparse_provider: tantivy  # or bm25
 
+Design Principles:
+- Consistent tokenization: Documents are indexed as the jieba terms produced
+  by SparseEncoder (whitespace-joined, whitespace tokenizer), so Tantivy
+  never re-splits Chinese text differently from the query side
+- Compact: Content is indexed with term frequencies only (no positions) and
+  not stored; chunk text lives in the vector store
+- Cheap deletes: Every document carries a raw ``doc_hash`` field, so removing
+  a document is a single ``delete_documents`` term instead of a corpus scan
+- Cached readers: The searcher is reused until this indexer commits or the
+  on-disk generation (``meta.json`` opstamp) changes
+- Batched commits: ``batch_commits()`` keeps one writer open across many
+  ``add_documents`` calls (e.g. folder ingestion) and commits once at the end
+
 Example:
     >>> indexer = TantivyIndexer(index_dir="data/db/tantivy")
     >>> indexer.build(term_stats, collection="default")
@@ -18,17 +31,26 @@ Example:
 
 from __future__ import annotations
 
+import json
 import logging
-import os
+import re
 import shutil
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
 # Lazy import to allow graceful fallback when tantivy is not installed
 _tantivy = None
 
+# Tokenizer of the content field; changing it requires a rebuild
+CONTENT_TOKENIZER = "whitespace"
+
+# Commit a batch early once this many documents are pending
+MAX_PENDING_DOCS = 50000
+
 
 def _ensure_tantivy() -> Any:
     """Lazy-import tantivy, raising a clear error if not installed.
@@ -52,6 +74,25 @@ def _ensure_tantivy() -> Any:
     return _tantivy
 
 
+def doc_key(doc_id: str) -> str:
+    """Normalize a document identifier to the value stored in ``doc_hash``.
+
+    The pipeline identifies documents as ``doc_<first 16 hex of sha256>``
+    while DocumentManager passes the full file sha256; both map to the same
+    16-character key. Other identifiers are used unchanged.
+
+    Args:
+        doc_id: Document ID or file hash.
+
+    Returns:
+        Key stored in (and deleted by) the ``doc_hash`` field.
+    """
+    key = doc_id[4:] if doc_id.startswith("doc_") else doc_id
+    if len(key) > 16 and re.fullmatch(r"[0-9a-f]+", key):
+        key = key[:16]
+    return key
+
+
 class TantivyIndexer:
     """Build and query Tantivy full-text indexes.
 
@@ -59,8 +100,9 @@ class TantivyIndexer:
     as a drop-in replacement via dependency injection.
 
     Index Schema:
-        - chunk_id (TEXT, stored): Unique chunk identifier
-        - content (TEXT, indexed+stored): Full text for BM25 scoring
+        - chunk_id (TEXT raw, stored): Unique chunk identifier
+        - doc_hash (TEXT raw, stored): Document key (see ``doc_key``)
+        - content (TEXT whitespace, indexed with frequencies): jieba terms
         - doc_length (UNSIGNED, stored): Token count for compatibility
 
     Args:
@@ -94,9 +136,16 @@ class TantivyIndexer:
         self.k1 = k1
         self.b = b
 
-        # Cached index objects per collection
+        # Cached index, searcher and writer objects per collection
         self._indexes: Dict[str, Any] = {}
+        self._searchers: Dict[str, Any] = {}
+        self._generations: Dict[str, Optional[str]] = {}
+        self._writers: Dict[str, Any] = {}
+        self._pending: Dict[str, int] = {}
         self._metadata: Dict[str, Any] = {}
+        self._active_collection: Optional[str] = None
+        self._batch_depth = 0
+        self._write_lock = threading.RLock()
 
     def _get_collection_path(self, collection: str) -> Path:
         """Get the directory path for a collection's Tantivy index.
@@ -112,9 +161,10 @@ class TantivyIndexer:
     def _build_schema(self) -> Any:
         """Build the Tantivy schema.
 
-        Uses 'raw' tokenizer for chunk_id to ensure exact-match semantics
-        (the default tokenizer would split IDs like 'doc1_chunk0' into
-        multiple tokens, breaking delete_documents).
+        Uses the 'raw' tokenizer for chunk_id and doc_hash so both are
+        single exact terms usable by delete_documents. Content is already
+        tokenized by SparseEncoder, so the whitespace tokenizer only splits
+        on the separators added by ``_reconstruct_content``.
 
         Returns:
             A tantivy.Schema object.
@@ -122,7 +172,10 @@ class TantivyIndexer:
         tv = _ensure_tantivy()
         sb = tv.SchemaBuilder()
         sb.add_text_field("chunk_id", stored=True, tokenizer_name="raw")
-        sb.add_text_field("content", stored=True, tokenizer_name="default")
+        sb.add_text_field("doc_hash", stored=True, tokenizer_name="raw")
+        sb.add_text_field(
+            "content", stored=False, tokenizer_name=CONTENT_TOKENIZER, index_option="freq"
+        )
         sb.add_unsigned_field("doc_length", stored=True)
         return sb.build()
 
@@ -134,24 +187,23 @@ class TantivyIndexer:
 
         Returns:
             A tantivy.Index object.
+
+        Raises:
+            RuntimeError: If the directory holds an index with an older schema.
         """
         if collection in self._indexes:
             return self._indexes[collection]
 
+        meta = self._read_meta(collection)
+        if meta is not None and not self._is_current_schema(meta):
+            raise RuntimeError(self._outdated_message(collection))
+
         tv = _ensure_tantivy()
         idx_path = self._get_collection_path(collection)
         idx_path.mkdir(parents=True, exist_ok=True)
 
-        schema = self._build_schema()
-
-        # Check if index already exists on disk
-        meta_file = idx_path / "meta.json"
-        if meta_file.exists():
-            # Open existing index
-            idx = tv.Index(schema, path=str(idx_path))
-        else:
-            # Create new index
-            idx = tv.Index(schema, path=str(idx_path))
+        # Opens the existing index or creates a new one
+        idx = tv.Index(self._build_schema(), path=str(idx_path))
 
         self._indexes[collection] = idx
         return idx
@@ -172,6 +224,7 @@ class TantivyIndexer:
                 - chunk_id (str)
                 - term_frequencies (Dict[str, int])
                 - doc_length (int)
+                - doc_hash (str, optional): Document ID or file hash
             collection: Collection name.
             trace: Optional TraceContext for observability.
 
@@ -182,54 +235,7 @@ class TantivyIndexer:
             raise ValueError("Cannot build index from empty term_stats")
 
         self._validate_term_stats(term_stats)
-
-        # Remove existing index directory for clean rebuild
-        idx_path = self._get_collection_path(collection)
-        if collection in self._indexes:
-            del self._indexes[collection]
-        if idx_path.exists():
-            shutil.rmtree(idx_path)
-
-        # Create fresh index
-        idx = self._get_or_create_index(collection)
-        writer = idx.writer()
-
-        tv = _ensure_tantivy()
-        num_docs = len(term_stats)
-        total_length = 0
-
-        for stat in term_stats:
-            chunk_id = stat["chunk_id"]
-            doc_length = stat["doc_length"]
-            total_length += doc_length
-
-            # Reconstruct full text from term frequencies for indexing
-            content = self._reconstruct_content(stat["term_frequencies"])
-
-            writer.add_document(tv.Document(
-                chunk_id=chunk_id,
-                content=content,
-                doc_length=doc_length,
-            ))
-
-        writer.commit()
-        idx.reload()
-
-        # Store metadata for compatibility
-        avg_doc_length = total_length / num_docs if num_docs > 0 else 0.0
-        self._metadata = {
-            "num_docs": num_docs,
-            "avg_doc_length": avg_doc_length,
-            "total_terms": sum(
-                len(s["term_frequencies"]) for s in term_stats
-            ),
-            "collection": collection,
-        }
-
-        logger.info(
-            f"TantivyIndexer: Built index for collection '{collection}' "
-            f"with {num_docs} documents"
-        )
+        self._build(term_stats, collection)
 
     def load(
         self,
@@ -238,25 +244,34 @@ class TantivyIndexer:
     ) -> bool:
         """Load index from disk.
 
-        For Tantivy, this simply checks if the index directory exists and
-        opens it. Tantivy uses Mmap so there is no heavy deserialization.
+        For Tantivy, this opens the index directory (Mmap, no heavy
+        deserialization). The reader is reloaded only when the on-disk
+        generation changed since the last load or commit, so calling this
+        before every query is cheap.
 
         Args:
             collection: Collection name to load.
             trace: Optional TraceContext for observability.
 
         Returns:
-            True if index loaded successfully, False if not found.
+            True if index loaded successfully, False if not found or if
+            it was built with an older schema.
         """
-        idx_path = self._get_collection_path(collection)
-        meta_file = idx_path / "meta.json"
-
-        if not meta_file.exists():
+        meta = self._read_meta(collection)
+        if meta is None:
+            return False
+        if not self._is_current_schema(meta):
+            logger.warning(self._outdated_message(collection))
             return False
 
         try:
             idx = self._get_or_create_index(collection)
-            idx.reload()
+            generation = self._generation_from_meta(collection, meta)
+            if collection not in self._generations or self._generations[collection] != generation:
+                idx.reload()
+                self._searchers.pop(collection, None)
+                self._generations[collection] = generation
+            self._active_collection = collection
             return True
         except Exception as e:
             logger.warning(
@@ -273,6 +288,9 @@ class TantivyIndexer:
     ) -> List[Dict[str, Any]]:
         """Query the index using Tantivy's BM25 scoring.
 
+        Terms are matched exactly (after lowercasing) against the indexed
+        jieba terms; any term matching scores the document.
+
         Args:
             query_terms: List of terms to search for.
             top_k: Maximum number of results to return.
@@ -292,17 +310,22 @@ class TantivyIndexer:
         if not query_terms:
             raise ValueError("query_terms cannot be empty")
 
-        # Find the active index (use the first loaded one if collection unknown)
-        # In practice, _ensure_index_loaded in SparseRetriever calls load() first
-        idx = next(iter(self._indexes.values()))
+        # Query the collection loaded last (SparseRetriever calls load() first)
+        collection = self._active_collection
+        if collection not in self._indexes:
+            collection = next(iter(self._indexes))
+        idx = self._indexes[collection]
 
-        # Build query string from terms
-        query_str = " ".join(t.lower() for t in query_terms)
+        # Content tokens never contain whitespace, so split multi-word terms
+        terms = list(dict.fromkeys(
+            part for term in query_terms for part in term.lower().split()
+        ))
+        if not terms:
+            return []
 
         try:
-            searcher = idx.searcher()
-            parsed_query = idx.parse_query(query_str, ["content"])
-            search_result = searcher.search(parsed_query, top_k)
+            searcher = self._get_searcher(collection)
+            search_result = searcher.search(self._terms_query(idx, terms), top_k)
 
             results: List[Dict[str, Any]] = []
             for score, doc_address in search_result.hits:
@@ -343,46 +366,48 @@ class TantivyIndexer:
     ) -> None:
         """Incrementally add documents to the Tantivy index.
 
-        If doc_id is provided, removes existing documents with matching
-        chunk_id prefix first (idempotent re-ingestion).
+        If doc_id is provided, existing documents with the same ``doc_hash``
+        are deleted first (idempotent re-ingestion); documents with the same
+        chunk_id are always replaced. Inside ``batch_commits()`` the changes
+        become visible when the batch ends, otherwise they are committed
+        immediately.
 
         Args:
             term_stats: New term statistics from SparseEncoder.encode().
             collection: Collection name.
-            doc_id: If provided, remove existing postings with this prefix
-                before adding new ones.
+            doc_id: Document ID (or file hash) of the chunks; stored in
+                ``doc_hash`` and used to remove the previous version.
             trace: Optional TraceContext.
+
+        Raises:
+            RuntimeError: If the collection holds an index with an older schema.
         """
         if not term_stats:
             return
 
         self._validate_term_stats(term_stats)
 
-        # Ensure index exists (load or create)
-        if collection not in self._indexes:
-            if not self.load(collection):
+        with self._write_lock:
+            # Ensure index exists (load or create)
+            if collection not in self._indexes and not self.load(collection):
+                if self._read_meta(collection) is not None:
+                    raise RuntimeError(self._outdated_message(collection))
                 # No existing index — build from scratch
-                self.build(term_stats, collection, trace)
+                self._build(term_stats, collection, doc_id)
                 return
 
-        tv = _ensure_tantivy()
-        idx = self._indexes[collection]
+            writer = self._get_writer(collection)
 
-        # Remove stale documents if re-ingesting
-        if doc_id:
-            self._remove_by_prefix(idx, doc_id)
-
-        # Add new documents
-        writer = idx.writer()
-        for stat in term_stats:
-            content = self._reconstruct_content(stat["term_frequencies"])
-            writer.add_document(tv.Document(
-                chunk_id=stat["chunk_id"],
-                content=content,
-                doc_length=stat["doc_length"],
-            ))
-        writer.commit()
-        idx.reload()
+            # Remove stale documents: same document (re-ingest) or same chunk_id
+            if doc_id:
+                self._delete_term(writer, "doc_hash", doc_key(doc_id))
+            for stat in term_stats:
+                self._delete_term(writer, "chunk_id", stat["chunk_id"])
+                writer.add_document(self._make_document(stat, stat.get("doc_hash") or doc_id))
+
+            self._pending[collection] = self._pending.get(collection, 0) + len(term_stats)
+            if self._batch_depth == 0 or self._pending[collection] >= MAX_PENDING_DOCS:
+                self._commit(collection)
 
         logger.info(
             f"TantivyIndexer: Added {len(term_stats)} documents to "
@@ -394,83 +419,310 @@ class TantivyIndexer:
         doc_id: str,
         collection: str = "default",
     ) -> bool:
-        """Remove all documents with chunk_id matching the doc_id prefix.
+        """Remove all chunks of a document.
 
         Args:
-            doc_id: Document identifier prefix.
+            doc_id: Document ID (``doc_<hash>``) or file sha256.
             collection: Collection name.
 
         Returns:
             True if any documents were removed, False otherwise.
         """
-        if collection not in self._indexes:
-            if not self.load(collection):
+        with self._write_lock:
+            if collection not in self._indexes:
+                if not self.load(collection):
+                    return False
+
+            key = doc_key(doc_id)
+            idx = self._indexes[collection]
+            try:
+                matches = self._get_searcher(collection).search(
+                    self._term_query(idx, "doc_hash", key), 1, count=True
+                ).count
+            except Exception as e:
+                logger.warning(f"Failed to look up document '{doc_id}': {e}")
+                return False
+            # Chunks added earlier in the current batch are not searchable yet
+            if not matches and not self._pending.get(collection):
                 return False
 
-        idx = self._indexes[collection]
-        removed = self._remove_by_prefix(idx, doc_id)
-        return removed
+            self._delete_term(self._get_writer(collection), "doc_hash", key)
+            if self._batch_depth == 0:
+                self._commit(collection)
+            return True
 
-    # ===== Private Helper Methods =====
+    def remove_chunks(
+        self,
+        chunk_ids: List[str],
+        collection: str = "default",
+    ) -> int:
+        """Remove individual chunks by chunk_id.
 
-    def _remove_by_prefix(self, idx: Any, prefix: str) -> bool:
-        """Remove documents whose chunk_id starts with prefix.
+        Args:
+            chunk_ids: Chunk IDs to remove.
+            collection: Collection name.
 
-        Scans all documents since Tantivy's default tokenizer splits
-        chunk_ids and prevents reliable prefix-based term queries.
+        Returns:
+            Number of chunk IDs whose deletion was queued.
+        """
+        if not chunk_ids:
+            return 0
+        with self._write_lock:
+            if collection not in self._indexes:
+                if not self.load(collection):
+                    return 0
+
+            writer = self._get_writer(collection)
+            for chunk_id in set(chunk_ids):
+                self._delete_term(writer, "chunk_id", chunk_id)
+            if self._batch_depth == 0:
+                self._commit(collection)
+        return len(set(chunk_ids))
+
+    @contextmanager
+    def batch_commits(self) -> Iterator["TantivyIndexer"]:
+        """Defer commits of ``add_documents``/``remove_document`` until exit.
+
+        One writer stays open per collection and everything is committed
+        once when the outermost batch ends (or early, every
+        ``MAX_PENDING_DOCS`` documents). Queries do not see the batched
+        changes before that, and the writer lock is held for the whole
+        batch.
+
+        Example:
+            >>> with indexer.batch_commits():
+            ...     for stats, doc_id in files:
+            ...         indexer.add_documents(stats, doc_id=doc_id)
+        """
+        with self._write_lock:
+            self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            with self._write_lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0:
+                    self.flush()
+
+    def flush(self) -> None:
+        """Commit pending changes of every collection."""
+        with self._write_lock:
+            for collection in list(self._writers):
+                self._commit(collection)
+
+    @property
+    def generation(self) -> Optional[str]:
+        """Generation token of the index currently loaded."""
+        return self._generations.get(self._active_collection or "")
+
+    def get_generation(self, collection: str = "default") -> Optional[str]:
+        """Read the on-disk generation token for a collection.
+
+        Tantivy rewrites ``meta.json`` on every commit, so its opstamp and
+        modification time identify the committed state.
 
         Args:
-            idx: Tantivy Index object.
-            prefix: Chunk ID prefix to match.
+            collection: Collection name.
 
         Returns:
-            True if any documents were deleted.
+            Generation token string, or None if no index exists on disk.
         """
-        try:
-            searcher = idx.searcher()
-            # Use a match-all query to scan all documents
-            all_query = idx.parse_query("*", ["content"])
-            all_results = searcher.search(all_query, limit=100000)
+        meta = self._read_meta(collection)
+        if meta is None:
+            return None
+        return self._generation_from_meta(collection, meta)
 
-            to_delete: list[str] = []
-            for _, doc_address in all_results.hits:
-                doc = searcher.doc(doc_address)
-                cid = doc["chunk_id"][0]
-                if cid.startswith(prefix):
-                    to_delete.append(cid)
+    def share_segments_from(self, other: "TantivyIndexer") -> None:
+        """Reuse the open Index objects of another indexer on the same directory.
 
-            if not to_delete:
-                return False
+        Args:
+            other: Indexer previously loaded from the same ``index_dir``.
+        """
+        if isinstance(other, TantivyIndexer) and other.index_dir == self.index_dir:
+            for collection, idx in other._indexes.items():
+                self._indexes.setdefault(collection, idx)
 
-            writer = idx.writer()
-            for cid in to_delete:
-                writer.delete_documents("chunk_id", cid)
+    # ===== Private Helper Methods =====
 
+    def _build(
+        self,
+        term_stats: List[Dict[str, Any]],
+        collection: str,
+        doc_id: Optional[str] = None,
+    ) -> None:
+        """Replace the collection's index with *term_stats*.
+
+        Args:
+            term_stats: Validated term statistics.
+            collection: Collection name.
+            doc_id: Document ID for entries without their own ``doc_hash``.
+        """
+        with self._write_lock:
+            # Remove existing index directory for clean rebuild
+            idx_path = self._get_collection_path(collection)
+            self._writers.pop(collection, None)
+            self._pending.pop(collection, None)
+            self._indexes.pop(collection, None)
+            self._searchers.pop(collection, None)
+            if idx_path.exists():
+                shutil.rmtree(idx_path)
+
+            # Create fresh index
+            idx = self._get_or_create_index(collection)
+            writer = idx.writer()
+            for stat in term_stats:
+                writer.add_document(self._make_document(stat, stat.get("doc_hash") or doc_id))
             writer.commit()
-            idx.reload()
-            return True
-        except Exception as e:
-            logger.warning(f"Failed to remove documents with prefix '{prefix}': {e}")
-            return False
+            # Dropping the writer releases the index lock
+            del writer
+            self._after_commit(collection)
+
+        num_docs = len(term_stats)
+        total_length = sum(s["doc_length"] for s in term_stats)
 
+        # Store metadata for compatibility
+        avg_doc_length = total_length / num_docs if num_docs > 0 else 0.0
+        self._metadata = {
+            "num_docs": num_docs,
+            "avg_doc_length": avg_doc_length,
+            "total_terms": sum(
+                len(s["term_frequencies"]) for s in term_stats
+            ),
+            "collection": collection,
+        }
+        self._active_collection = collection
+
+        logger.info(
+            f"TantivyIndexer: Built index for collection '{collection}' "
+            f"with {num_docs} documents"
+        )
+
+    def _get_searcher(self, collection: str) -> Any:
+        """Return the cached searcher, creating it after a reload."""
+        searcher = self._searchers.get(collection)
+        if searcher is None:
+            searcher = self._indexes[collection].searcher()
+            self._searchers[collection] = searcher
+        return searcher
+
+    def _get_writer(self, collection: str) -> Any:
+        """Return the open writer for a collection, creating it if needed."""
+        writer = self._writers.get(collection)
+        if writer is None:
+            writer = self._indexes[collection].writer()
+            self._writers[collection] = writer
+        return writer
+
+    def _commit(self, collection: str) -> None:
+        """Commit and release the collection's writer, then refresh readers."""
+        writer = self._writers.pop(collection, None)
+        pending = self._pending.pop(collection, 0)
+        if writer is None:
+            return
+        writer.commit()
+        # Dropping the writer releases the index lock for other processes
+        del writer
+        self._after_commit(collection)
+        logger.debug(f"TantivyIndexer: Committed {pending} documents to '{collection}'")
+
+    def _after_commit(self, collection: str) -> None:
+        """Make committed changes visible to the next searcher."""
+        self._indexes[collection].reload()
+        self._searchers.pop(collection, None)
+        self._generations[collection] = self.get_generation(collection)
+
+    def _make_document(self, stat: Dict[str, Any], doc_id: Optional[str]) -> Any:
+        """Build the Tantivy document for one term_stats entry."""
+        tv = _ensure_tantivy()
+        return tv.Document(
+            chunk_id=stat["chunk_id"],
+            doc_hash=doc_key(doc_id) if doc_id else "",
+            content=self._reconstruct_content(stat["term_frequencies"]),
+            doc_length=stat["doc_length"],
+        )
+
+    def _terms_query(self, idx: Any, terms: List[str]) -> Any:
+        """Build a disjunction of exact content terms."""
+        tv = _ensure_tantivy()
+        if hasattr(tv, "Query") and hasattr(tv.Query, "term_query"):
+            return tv.Query.boolean_query([
+                (tv.Occur.Should, tv.Query.term_query(idx.schema, "content", term))
+                for term in terms
+            ])
+        # Older tantivy: quote each term so the parser takes it verbatim
+        query_str = " ".join('"' + term.replace('"', "") + '"' for term in terms)
+        return idx.parse_query(query_str, ["content"])
+
+    def _term_query(self, idx: Any, field: str, value: str) -> Any:
+        """Build an exact term query on a raw field."""
+        tv = _ensure_tantivy()
+        if hasattr(tv, "Query") and hasattr(tv.Query, "term_query"):
+            return tv.Query.term_query(idx.schema, field, value)
+        return idx.parse_query(f'{field}:"{value}"', [field])
+
+    @staticmethod
+    def _delete_term(writer: Any, field: str, value: str) -> None:
+        """Delete documents whose raw *field* equals *value*."""
+        delete = getattr(writer, "delete_documents_by_term", None) or writer.delete_documents
+        delete(field, value)
+
+    def _read_meta(self, collection: str) -> Optional[Dict[str, Any]]:
+        """Read the collection's Tantivy meta.json, or None if it does not exist."""
+        meta_file = self._get_collection_path(collection) / "meta.json"
+        try:
+            meta = json.loads(meta_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return meta if isinstance(meta, dict) else None
+
+    def _generation_from_meta(self, collection: str, meta: Dict[str, Any]) -> str:
+        """Generation token from meta.json (opstamp plus mtime, unique across rebuilds)."""
+        meta_file = self._get_collection_path(collection) / "meta.json"
+        try:
+            mtime = meta_file.stat().st_mtime_ns
+        except OSError:
+            mtime = 0
+        return f"{meta.get('opstamp', 0)}-{mtime}"
+
+    @staticmethod
+    def _is_current_schema(meta: Dict[str, Any]) -> bool:
+        """True if meta.json describes the doc_hash / whitespace-content schema."""
+        fields = {f.get("name"): f for f in meta.get("schema", []) if isinstance(f, dict)}
+        if "doc_hash" not in fields or "content" not in fields:
+            return False
+        indexing = fields["content"].get("options", {}).get("indexing") or {}
+        return indexing.get("tokenizer") == CONTENT_TOKENIZER
+
+    def _outdated_message(self, collection: str) -> str:
+        """Explain how to replace an index built with an older schema."""
+        return (
+            f"Tantivy index for collection '{collection}' at "
+            f"{self._get_collection_path(collection)} uses an older schema; "
+            f"rebuild it with: python scripts/migrate_bm25_to_tantivy.py "
+            f"--collection {collection}"
+        )
 
     @staticmethod
     def _reconstruct_content(term_frequencies: Dict[str, int]) -> str:
-        """Reconstruct indexable content from term frequency dict.
+        """Build the pre-tokenized content for a document.
 
-        Since SparseEncoder only outputs term frequencies (not original text),
-        we reconstruct a document by repeating each term according to its
-        frequency. Tantivy will then score it with BM25.
+        SparseEncoder only outputs term frequencies (not original text), so
+        each jieba term is repeated by its frequency and joined with spaces;
+        the whitespace tokenizer turns this back into exactly those terms
+        with the same frequencies. Whitespace inside a term (never produced
+        by SparseEncoder) is replaced to keep it a single token.
 
         Args:
             term_frequencies: Dict of term -> frequency.
 
         Returns:
-            Reconstructed text string.
+            Space-separated term string.
         """
         tokens: List[str] = []
         for term, freq in term_frequencies.items():
-            tokens.extend([term] * freq)
+            token = "_".join(term.split())
+            if token:
+                tokens.extend([token] * freq)
         return " ".join(tokens)
 
     @staticmethod
@@ -4,6 +4,7 @@ This module implements the VectorUpserter component, responsible for:
 - Generating deterministic chunk IDs from content
 - Transforming chunks and vectors into storage records
 - Calling VectorStore for idempotent writes
+- Mirroring chunk text/metadata into the local ChunkDocStore
 - Supporting batch operations with consistent ordering
 
 Design Principles:
@@ -15,12 +16,16 @@ Design Principles:
 """
 
 import hashlib
+import logging
 from typing import List, Dict, Any, Optional
 
 from src.core.types import Chunk
 from src.core.settings import Settings
+from src.ingestion.storage.chunk_docstore import ChunkDocStore, get_chunk_docstore
 from src.libs.vector_store.vector_store_factory import VectorStoreFactory
 
+logger = logging.getLogger(__name__)
+
 
 class VectorUpserter:
     """Write chunks and vectors to vector database with idempotent guarantees.
@@ -69,6 +74,15 @@ class VectorUpserter:
         if collection_name:
             kwargs['collection_name'] = collection_name
         self.vector_store = VectorStoreFactory.create(settings, **kwargs)
+        self.collection_name = collection_name or settings.vector_store.collection_name
+    
+    @property
+    def docstore(self) -> ChunkDocStore:
+        """Shared chunk docstore of this collection."""
+        return get_chunk_docstore(
+            self.collection_name,
+            cache_size=getattr(getattr(self.settings, "retrieval", None), "docstore_cache_size", 20000),
+        )
     
     def upsert(
         self,
@@ -135,8 +149,29 @@ class VectorUpserter:
                 f"Vector store upsert failed: {str(e)}"
             ) from e
         
+        # Mirror into the docstore; readers fall back to the vector store
+        try:
+            self.docstore.put_many([
+                {"id": r["id"], "text": r["metadata"]["text"], "metadata": r["metadata"]}
+                for r in records
+            ])
+        except Exception as e:
+            logger.warning(f"Chunk docstore write failed (vector store is unaffected): {e}")
+        
         return chunk_ids
     
+    def delete(self, chunk_ids: List[str]) -> None:
+        """Delete chunks from the vector store and the docstore.
+        
+        Args:
+            chunk_ids: IDs returned by ``upsert``.
+        """
+        self.vector_store.delete(chunk_ids)
+        try:
+            self.docstore.delete(chunk_ids)
+        except Exception as e:
+            logger.warning(f"Chunk docstore delete failed: {e}")
+    
     def _generate_chunk_id(self, chunk: Chunk) -> str:
         """Generate deterministic chunk ID from content.
         
@@ -216,6 +251,44 @@ class VectorUpserter:
         
         return new_chunks, new_indices
     
+    def get_stored_records(self, chunks: List[Chunk]) -> List[Dict[str, Any]]:
+        """Fetch the stored records (with vectors) of chunks by their IDs.
+        
+        Because IDs are derived from source path, chunk index and content
+        hash, a record is found only if the same chunk text was stored at
+        the same position before. Used by DenseEncoder to skip re-embedding
+        unchanged chunks.
+        
+        Args:
+            chunks: Chunks to look up.
+        
+        Returns:
+            One record per chunk, in input order ('id', 'text', 'metadata',
+            'vector'); an empty dict where nothing is stored, the chunk lacks
+            ID metadata, or the store cannot return vectors.
+        """
+        if not chunks:
+            return []
+        
+        chunk_ids: List[Optional[str]] = []
+        for chunk in chunks:
+            try:
+                chunk_ids.append(self._generate_chunk_id(chunk))
+            except ValueError:
+                chunk_ids.append(None)
+        
+        lookup_ids = [cid for cid in chunk_ids if cid is not None]
+        if not lookup_ids:
+            return [{} for _ in chunks]
+        
+        try:
+            found = self.vector_store.get_by_ids(lookup_ids, include_vectors=True)
+        except (NotImplementedError, RuntimeError, ValueError):
+            return [{} for _ in chunks]
+        
+        by_id = {cid: record for cid, record in zip(lookup_ids, found)}
+        return [by_id.get(cid, {}) if cid is not None else {} for cid in chunk_ids]
+    
     def delete_by_source_path(self, source_path: str) -> int:
         """Delete all chunks with the given source_path from vector store.
 
@@ -229,6 +302,10 @@ class VectorUpserter:
         Returns:
             Number of chunks deleted.
         """
+        try:
+            self.docstore.delete_by_source_path(source_path)
+        except Exception as e:
+            logger.warning(f"Chunk docstore delete failed for '{source_path}': {e}")
         try:
             collection = self.vector_store._collection
             result = collection.get(
@@ -242,6 +319,34 @@ class VectorUpserter:
         except Exception:
             return 0
 
+    def get_records_by_source_path(self, source_path: str) -> List[Dict[str, Any]]:
+        """Fetch all stored records (with vectors) of one source document.
+
+        Used by diff re-ingestion to find the chunks of the previous
+        version of a modified document.
+
+        Args:
+            source_path: The source_path metadata value to match.
+
+        Returns:
+            Records ('id', 'text', 'metadata', 'vector'); empty if nothing is
+            stored or the store cannot be queried by metadata.
+        """
+        try:
+            collection = self.vector_store._collection
+            result = collection.get(
+                where={"source_path": source_path},
+                include=[],
+            )
+            ids = result["ids"]
+            if not ids:
+                return []
+            records = self.vector_store.get_by_ids(ids, include_vectors=True)
+        except Exception as e:
+            logger.warning(f"Could not read stored chunks of '{source_path}': {e}")
+            return []
+        return [r for r in records if r]
+
     def upsert_batch(
         self,
         batches: List[tuple[List[Chunk], List[List[float]]]],
@@ -5,9 +5,12 @@ Usage:
 
 This worker:
 1. Connects to the configured queue backend (Redis or Memory)
-2. Loops: dequeue → IngestionPipeline.run() → ack/nack
-3. Supports graceful shutdown via SIGTERM/SIGINT
-4. Retries failed tasks up to max_retries times
+2. Loops: dequeue → IngestionPipeline stages → ack, running up to
+   ``concurrency`` tasks at once with one cached pipeline per collection
+3. Supports graceful shutdown via SIGTERM/SIGINT (in-flight tasks finish)
+4. Requeues failed tasks with exponential backoff up to max_retries times
+5. Reclaims tasks orphaned by crashed workers (Redis XAUTOCLAIM)
+6. Logs queue depth and throughput metrics periodically
 """
 
 from __future__ import annotations
@@ -16,8 +19,10 @@ import asyncio
 import logging
 import signal
 import sys
+import time
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Set
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
@@ -28,16 +33,55 @@ from src.observability.logger import get_logger
 logger = get_logger(__name__)
 
 
+@dataclass
+class WorkerMetrics:
+    """Counters for queue depth and throughput reporting."""
+    started_at: float = field(default_factory=time.monotonic)
+    completed: int = 0
+    failed: int = 0
+    retried: int = 0
+    reclaimed: int = 0
+    in_flight: int = 0
+    busy_seconds: float = 0.0
+
+    def snapshot(self, queue_depth: Optional[int] = None) -> Dict[str, Any]:
+        """Return the counters plus derived throughput figures."""
+        uptime = max(time.monotonic() - self.started_at, 1e-9)
+        finished = self.completed + self.failed
+        return {
+            "queue_depth": queue_depth,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "failed": self.failed,
+            "retried": self.retried,
+            "reclaimed": self.reclaimed,
+            "tasks_per_minute": round(finished * 60.0 / uptime, 2),
+            "avg_task_seconds": round(self.busy_seconds / finished, 2) if finished else 0.0,
+            "uptime_seconds": round(uptime, 1),
+        }
+
+
 class IngestionWorker:
     """Async worker that consumes ingestion tasks from a queue.
 
     Supports both MemoryQueue and RedisQueue backends via the
-    BaseQueue protocol.
+    BaseQueue protocol. Up to ``concurrency`` tasks run at once; their
+    parse/transform/embed stages overlap, while storage runs one task at
+    a time per collection. Pipelines are created once per collection and
+    reused.
 
     Args:
         settings: Application settings.
         queue: Queue backend instance (MemoryQueue or RedisQueue).
         max_retries: Maximum retry count per task.
+        concurrency: Tasks processed at once.
+        retry_backoff: Delay before the first retry in seconds (doubled
+            for every further attempt).
+        max_backoff: Upper bound of the retry delay in seconds.
+        reclaim_idle: Seconds without a heartbeat before another worker
+            reclaims a delivered task. Running tasks are kept alive by a
+            heartbeat every third of this interval.
+        metrics_interval: Seconds between metrics log lines (0 = off).
     """
 
     def __init__(
@@ -45,6 +89,11 @@ class IngestionWorker:
         settings: Settings,
         queue: Any,
         max_retries: int = 3,
+        concurrency: int = 1,
+        retry_backoff: float = 5.0,
+        max_backoff: float = 300.0,
+        reclaim_idle: float = 600.0,
+        metrics_interval: float = 60.0,
     ) -> None:
         """Initialize the IngestionWorker.
 
@@ -52,15 +101,58 @@ class IngestionWorker:
             settings: Application settings for pipeline creation.
             queue: Queue backend (must satisfy BaseQueue protocol).
             max_retries: Max retries for failed tasks.
+            concurrency: Tasks processed at once.
+            retry_backoff: Base retry delay in seconds.
+            max_backoff: Maximum retry delay in seconds.
+            reclaim_idle: Idle seconds before orphaned tasks are reclaimed.
+            metrics_interval: Seconds between metrics log lines.
+
+        Raises:
+            ValueError: If concurrency < 1.
         """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be >= 1, got {concurrency}")
         self.settings = settings
         self.queue = queue
         self.max_retries = max_retries
+        self.concurrency = concurrency
+        self.retry_backoff = retry_backoff
+        self.max_backoff = max_backoff
+        self.reclaim_idle = reclaim_idle
+        self.metrics_interval = metrics_interval
+        self.metrics = WorkerMetrics()
         self._running = False
-        self._pipeline: Any = None
+        self._pipelines: Dict[str, Any] = {}
+        self._pipeline_lock = asyncio.Lock()
+        self._store_locks: Dict[str, asyncio.Lock] = {}
+        self._active: Set[asyncio.Task] = set()
+        self._retry_timers: Set[asyncio.Task] = set()
+
+    @classmethod
+    def from_settings(cls, settings: Settings, queue: Any) -> IngestionWorker:
+        """Create a worker configured by ``ingestion.worker`` and ``ingestion.redis``."""
+        ingestion = getattr(settings, "ingestion", None)
+        worker_cfg = getattr(ingestion, "worker", None) if ingestion else None
+        redis_cfg = getattr(ingestion, "redis", None) if ingestion else None
+        kwargs: Dict[str, Any] = {}
+        if redis_cfg is not None:
+            kwargs["max_retries"] = redis_cfg.max_retries
+            kwargs["reclaim_idle"] = float(redis_cfg.task_timeout)
+        if worker_cfg is not None:
+            kwargs.update(
+                concurrency=worker_cfg.concurrency,
+                retry_backoff=worker_cfg.retry_backoff,
+                max_backoff=worker_cfg.max_backoff,
+                metrics_interval=worker_cfg.metrics_interval,
+            )
+        return cls(settings, queue, **kwargs)
 
-    def _get_pipeline(self, collection: str = "default") -> Any:
-        """Lazily create an IngestionPipeline.
+    async def _get_pipeline(self, collection: str = "default") -> Any:
+        """Return the cached IngestionPipeline of a collection.
+
+        The first task of a collection builds the pipeline (embedding and
+        LLM clients, vector store, sparse index, transforms) off the event
+        loop; later tasks reuse it.
 
         Args:
             collection: Target collection name.
@@ -68,80 +160,208 @@ class IngestionWorker:
         Returns:
             An IngestionPipeline instance.
         """
-        from src.ingestion.pipeline import IngestionPipeline
-        return IngestionPipeline(self.settings, collection=collection)
+        pipeline = self._pipelines.get(collection)
+        if pipeline is not None:
+            return pipeline
+        async with self._pipeline_lock:
+            pipeline = self._pipelines.get(collection)
+            if pipeline is None:
+                from src.ingestion.pipeline import IngestionPipeline
+                pipeline = await asyncio.to_thread(
+                    IngestionPipeline, self.settings, collection=collection
+                )
+                self._pipelines[collection] = pipeline
+                self._store_locks[collection] = asyncio.Lock()
+        return pipeline
 
     async def start(self) -> None:
         """Start the worker loop.
 
-        Runs indefinitely, polling the queue for tasks, processing them
-        via IngestionPipeline, and acknowledging results.
+        Runs until stop() is called, keeping up to ``concurrency`` tasks
+        in flight. On shutdown, in-flight tasks are finished and cached
+        pipelines closed.
         """
         self._running = True
-        logger.info("IngestionWorker: Started, waiting for tasks...")
+        logger.info(f"IngestionWorker: Started (concurrency={self.concurrency}), waiting for tasks...")
+        slots = asyncio.Semaphore(self.concurrency)
+        background = [asyncio.ensure_future(self._reclaim_loop())]
+        heartbeat = asyncio.ensure_future(self._heartbeat_loop())
+        if self.metrics_interval > 0:
+            background.append(asyncio.ensure_future(self._metrics_loop()))
 
-        while self._running:
-            task = await self.queue.dequeue(timeout=5.0)
-            if task is None:
-                continue
-
-            task_id = task.get("task_id", "unknown")
-            file_path = task.get("file_path", "")
-            collection = task.get("collection", "default")
-            retry_count = task.get("_retry_count", 0)
-
-            logger.info(
-                f"IngestionWorker: Processing task {task_id} "
-                f"(file={file_path}, collection={collection}, "
-                f"retry={retry_count})"
-            )
-
-            try:
-                pipeline = self._get_pipeline(collection)
-                result = await pipeline.run(
-                    file_path=file_path,
-                    original_filename=task.get("original_filename"),
+        try:
+            while self._running:
+                await slots.acquire()
+                try:
+                    task = await self.queue.dequeue(timeout=5.0) if self._running else None
+                except Exception as exc:
+                    logger.error(f"IngestionWorker: Dequeue failed: {exc}")
+                    task = None
+                    await asyncio.sleep(1.0)
+                if task is None:
+                    slots.release()
+                    continue
+                runner = asyncio.ensure_future(self._process(task))
+                self._active.add(runner)
+                runner.add_done_callback(self._active.discard)
+                runner.add_done_callback(lambda _: slots.release())
+        finally:
+            for job in background:
+                job.cancel()
+            if self._active:
+                logger.info(f"IngestionWorker: Waiting for {len(self._active)} in-flight tasks")
+                await asyncio.gather(*self._active, return_exceptions=True)
+            # Heartbeats continue until in-flight tasks are settled
+            heartbeat.cancel()
+            # Pending retries stay unacked (Redis) and are reclaimed later
+            for timer in self._retry_timers:
+                timer.cancel()
+            for pipeline in self._pipelines.values():
+                pipeline.close()
+            self._pipelines.clear()
+
+    async def _process(self, task: Dict[str, Any]) -> None:
+        """Run one task and ack, retry or fail it."""
+        task_id = task.get("task_id", "unknown")
+        file_path = task.get("file_path", "")
+        collection = task.get("collection", "default")
+        retry_count = task.get("_retry_count", 0)
+
+        logger.info(
+            f"IngestionWorker: Processing task {task_id} "
+            f"(file={file_path}, collection={collection}, "
+            f"retry={retry_count})"
+        )
+
+        started = time.monotonic()
+        self.metrics.in_flight += 1
+        try:
+            pipeline = await self._get_pipeline(collection)
+            result = await self._run_pipeline(pipeline, collection, task)
+
+            if result.success:
+                await self.queue.ack(task_id, success=True)
+                self.metrics.completed += 1
+                logger.info(
+                    f"IngestionWorker: Task {task_id} completed "
+                    f"({result.chunk_count} chunks)"
                 )
+            else:
+                error_msg = result.error or "Pipeline returned failure"
+                await self._handle_failure(task, error_msg)
+
+        except Exception as exc:
+            error_msg = f"{type(exc).__name__}: {exc}"
+            logger.error(f"IngestionWorker: Task {task_id} error: {error_msg}")
+            await self._handle_failure(task, error_msg)
+        finally:
+            self.metrics.in_flight -= 1
+            self.metrics.busy_seconds += time.monotonic() - started
+
+    async def _run_pipeline(self, pipeline: Any, collection: str, task: Dict[str, Any]) -> Any:
+        """Run the pipeline stages for a task; storage is serialized per collection."""
+        job = pipeline.create_job(
+            task.get("file_path", ""),
+            original_filename=task.get("original_filename"),
+        )
+        try:
+            skipped = await pipeline.prepare_file(job)
+            if skipped is not None:
+                return skipped
+            await pipeline.transform_file(job)
+            await pipeline.encode_file(job)
+            async with self._store_locks[collection]:
+                return await pipeline.store_file(job)
+        except Exception as e:
+            return pipeline.fail_file(job, e)
 
-                if result.success:
-                    await self.queue.ack(task_id, success=True)
-                    logger.info(
-                        f"IngestionWorker: Task {task_id} completed "
-                        f"({result.chunk_count} chunks)"
-                    )
-                else:
-                    error_msg = result.error or "Pipeline returned failure"
-                    await self._handle_failure(task_id, error_msg, retry_count)
-
-            except Exception as exc:
-                error_msg = f"{type(exc).__name__}: {exc}"
-                logger.error(f"IngestionWorker: Task {task_id} error: {error_msg}")
-                await self._handle_failure(task_id, error_msg, retry_count)
-
-    async def _handle_failure(
-        self, task_id: str, error: str, retry_count: int
-    ) -> None:
-        """Handle a failed task — retry or mark as permanently failed.
+    async def _handle_failure(self, task: Dict[str, Any], error: str) -> None:
+        """Handle a failed task — requeue with backoff or mark as permanently failed.
 
         Args:
-            task_id: The task identifier.
+            task: The task dict.
             error: Error description.
-            retry_count: Current retry attempt number.
         """
+        task_id = task.get("task_id", "unknown")
+        retry_count = task.get("_retry_count", 0)
         if retry_count < self.max_retries:
+            delay = min(self.max_backoff, self.retry_backoff * (2 ** retry_count))
             logger.warning(
                 f"IngestionWorker: Task {task_id} failed "
                 f"(attempt {retry_count + 1}/{self.max_retries}), "
-                f"will retry"
+                f"will retry in {delay:.0f}s"
             )
-            await self.queue.ack(task_id, success=False, error=error)
+            self.metrics.retried += 1
+            timer = asyncio.ensure_future(self._requeue_later(task, retry_count + 1, error, delay))
+            self._retry_timers.add(timer)
+            timer.add_done_callback(self._retry_timers.discard)
         else:
             logger.error(
                 f"IngestionWorker: Task {task_id} permanently failed "
                 f"after {self.max_retries} attempts: {error}"
             )
+            self.metrics.failed += 1
             await self.queue.ack(task_id, success=False, error=error)
 
+    async def _requeue_later(
+        self, task: Dict[str, Any], retry_count: int, error: str, delay: float
+    ) -> None:
+        """Requeue a task after its backoff delay."""
+        await asyncio.sleep(delay)
+        try:
+            await self.queue.requeue(task, retry_count, error=error)
+        except Exception as exc:
+            logger.error(f"IngestionWorker: Requeue of task {task.get('task_id')} failed: {exc}")
+
+    async def _reclaim_loop(self) -> None:
+        """Periodically requeue tasks orphaned by crashed workers.
+
+        A reclaimed task counts as a failed attempt, so a task that keeps
+        crashing its worker ends up permanently failed.
+        """
+        reclaim = getattr(self.queue, "reclaim", None)
+        if reclaim is None:
+            return
+        interval = max(self.reclaim_idle / 2.0, 5.0)
+        while self._running:
+            try:
+                for task in await reclaim(int(self.reclaim_idle * 1000)):
+                    self.metrics.reclaimed += 1
+                    await self._handle_failure(task, "Reclaimed from an unresponsive worker")
+            except Exception as exc:
+                logger.warning(f"IngestionWorker: Reclaim failed: {exc}")
+            await asyncio.sleep(interval)
+
+    async def _heartbeat_loop(self) -> None:
+        """Keep this worker's in-flight tasks from being reclaimed by others.
+
+        Runs until cancelled, so tasks finishing during shutdown stay covered.
+        """
+        heartbeat = getattr(self.queue, "heartbeat", None)
+        if heartbeat is None:
+            return
+        interval = max(self.reclaim_idle / 3.0, 1.0)
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await heartbeat()
+            except Exception as exc:
+                logger.warning(f"IngestionWorker: Heartbeat failed: {exc}")
+
+    async def get_metrics(self) -> Dict[str, Any]:
+        """Return queue depth and throughput metrics."""
+        try:
+            depth: Optional[int] = await self.queue.get_pending_count()
+        except Exception:
+            depth = None
+        return self.metrics.snapshot(queue_depth=depth)
+
+    async def _metrics_loop(self) -> None:
+        """Log metrics every ``metrics_interval`` seconds."""
+        while True:
+            await asyncio.sleep(self.metrics_interval)
+            logger.info(f"IngestionWorker: Metrics {await self.get_metrics()}")
+
     def stop(self) -> None:
         """Signal the worker to stop gracefully."""
         logger.info("IngestionWorker: Shutdown requested")
@@ -205,7 +425,7 @@ async def main() -> None:
     settings = load_settings(args.config)
     queue = await create_queue(settings)
 
-    worker = IngestionWorker(settings=settings, queue=queue)
+    worker = IngestionWorker.from_settings(settings, queue)
 
     # Graceful shutdown on SIGTERM/SIGINT
     loop = asyncio.get_event_loop()
@@ -116,7 +116,7 @@ class BaseEmbedding(ABC):
         Returns:
             List of embedding vectors.
         """
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
             None,  # Use default executor
             lambda: self.embed(texts, trace, **kwargs)
@@ -8,18 +8,24 @@ embeddings for the same text. Useful for:
 Design Principles:
 - Thread-safe: Uses threading.Lock for concurrent access
 - Memory-bounded: LRU eviction when cache is full
-- Persistent option: Can save/load cache to disk
+- Persistent option: Binary memory-mapped store (see mmap_embedding_store)
+  shared by the query and chunk caches
+- Model-keyed: Keys include the embedding fingerprint (provider, model,
+  dimensions), so switching models never returns foreign vectors
+- Namespaced: Optional key namespace (e.g. collection) on top of that
 """
 
 from __future__ import annotations
 
 import hashlib
-import json
 import logging
+import re
 import threading
 from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.libs.embedding.mmap_embedding_store import MmapEmbeddingStore, StoreLockedError
 
 logger = logging.getLogger(__name__)
 
@@ -33,22 +39,59 @@ def normalize_query(query: str) -> str:
     
     Args:
         query: Raw query string.
-        
+    
     Returns:
         Normalized query string.
     """
     return " ".join(query.lower().split())
 
 
+def embedding_fingerprint(provider: str, model: str, dimensions: Optional[int] = None) -> str:
+    """Identify an embedding model for cache keys.
+    
+    Args:
+        provider: Provider name or class (e.g. "openai").
+        model: Model or deployment name.
+        dimensions: Output dimensions, if configured.
+    
+    Returns:
+        Fingerprint string such as ``"openaiembedding:text-embedding-v3:1024"``.
+    """
+    return f"{provider}:{model}:{dimensions or 'native'}".lower()
+
+
+def client_fingerprint(client: Any) -> str:
+    """Fingerprint an embedding client instance from its attributes.
+    
+    Args:
+        client: Embedding client (any BaseEmbedding implementation).
+    
+    Returns:
+        Fingerprint string (see embedding_fingerprint).
+    """
+    model = (
+        getattr(client, "model", None)
+        or getattr(client, "deployment_name", None)
+        or getattr(client, "model_name", None)
+        or ""
+    )
+    dimensions = getattr(client, "dimensions", None) or getattr(client, "dimension", None)
+    return embedding_fingerprint(type(client).__name__, str(model), dimensions)
+
+
 class EmbeddingCache:
     """LRU cache for text embeddings.
     
-    Caches embeddings keyed by text hash to avoid redundant API calls.
-    Thread-safe for concurrent access.
+    Caches embeddings keyed by (model fingerprint, namespace, text) hash to
+    avoid redundant API calls. Thread-safe for concurrent access.
+    
+    With ``persist_dir`` the vectors live in a memory-mapped
+    ``MmapEmbeddingStore`` (CLOCK eviction, survives restarts); otherwise
+    in an in-process OrderedDict.
     
     Example:
         >>> cache = EmbeddingCache(max_size=1000)
-        >>> 
+        >>>
         >>> # Check cache first
         >>> embedding = cache.get("Hello world")
         >>> if embedding is None:
@@ -59,46 +102,75 @@ class EmbeddingCache:
     def __init__(
         self,
         max_size: int = 10000,
-        persist_path: Optional[str] = None,
+        persist_dir: Optional[str] = None,
+        fingerprint: str = "",
+        dtype: str = "float32",
+        normalize: bool = True,
     ):
         """Initialize embedding cache.
         
         Args:
             max_size: Maximum number of embeddings to cache.
-            persist_path: Optional path to persist cache to disk.
+            persist_dir: Optional directory for the persistent binary store.
+            fingerprint: Embedding model fingerprint included in every key.
+            dtype: Storage dtype of the persistent store ("float32"/"float16").
+            normalize: Normalize text before hashing (queries); chunk caches
+                pass False so case and spacing changes are re-embedded.
         """
         self.max_size = max_size
-        self.persist_path = Path(persist_path) if persist_path else None
-        self._cache: OrderedDict[str, List[float]] = OrderedDict()
+        self.fingerprint = fingerprint
+        self.normalize = normalize
+        self._cache: OrderedDict[bytes, List[float]] = OrderedDict()
         self._lock = threading.Lock()
         self._hits = 0
         self._misses = 0
         
-        # Load from disk if persist_path exists
-        if self.persist_path and self.persist_path.exists():
-            self._load()
+        self._store: Optional[MmapEmbeddingStore] = None
+        if persist_dir:
+            try:
+                self._store = MmapEmbeddingStore(
+                    persist_dir, max_size=max_size, dtype=dtype, fingerprint=fingerprint
+                )
+            except (StoreLockedError, OSError, ValueError) as e:
+                logger.warning(f"Persistent embedding cache unavailable, using memory: {e}")
+    
+    @property
+    def persistent(self) -> bool:
+        """True if backed by the memory-mapped store."""
+        return self._store is not None
     
-    def _hash_text(self, text: str, normalize: bool = True) -> str:
-        """Generate hash key for text.
+    def _hash_text(self, text: str, namespace: Optional[str] = None) -> bytes:
+        """Generate the 16-byte key for text.
         
         Args:
             text: Text to hash.
-            normalize: Whether to normalize text before hashing (for queries).
+            namespace: Optional key namespace.
         """
-        if normalize:
+        if self.normalize:
             text = normalize_query(text)
-        return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
+        key_str = f"{self.fingerprint}|{namespace or ''}|{text}"
+        return hashlib.sha256(key_str.encode("utf-8")).digest()[:16]
     
-    def get(self, text: str) -> Optional[List[float]]:
+    def get(self, text: str, namespace: Optional[str] = None) -> Optional[List[float]]:
         """Get embedding from cache.
         
         Args:
             text: Text to look up.
-            
+            namespace: Optional key namespace.
+        
         Returns:
             Cached embedding or None if not found.
         """
-        key = self._hash_text(text)
+        key = self._hash_text(text, namespace)
+        
+        if self._store is not None:
+            embedding = self._store.get(key)
+            with self._lock:
+                if embedding is None:
+                    self._misses += 1
+                else:
+                    self._hits += 1
+            return embedding
         
         with self._lock:
             if key in self._cache:
@@ -110,139 +182,233 @@ class EmbeddingCache:
             self._misses += 1
             return None
     
-    def get_batch(self, texts: List[str]) -> Tuple[List[Optional[List[float]]], List[int]]:
+    def get_batch(
+        self,
+        texts: List[str],
+        namespace: Optional[str] = None,
+    ) -> Tuple[List[Optional[List[float]]], List[int]]:
         """Get embeddings for multiple texts.
         
         Args:
             texts: List of texts to look up.
-            
+            namespace: Optional key namespace.
+        
         Returns:
             Tuple of (embeddings, miss_indices) where embeddings[i] is None
             for cache misses, and miss_indices contains indices that need
             to be computed.
         """
-        results: List[Optional[List[float]]] = []
-        miss_indices: List[int] = []
+        keys = [self._hash_text(text, namespace) for text in texts]
         
-        with self._lock:
-            for i, text in enumerate(texts):
-                key = self._hash_text(text)
-                if key in self._cache:
-                    self._cache.move_to_end(key)
-                    results.append(self._cache[key])
-                    self._hits += 1
-                else:
-                    results.append(None)
-                    miss_indices.append(i)
-                    self._misses += 1
+        if self._store is not None:
+            results = self._store.get_many(keys)
+        else:
+            results = []
+            with self._lock:
+                for key in keys:
+                    if key in self._cache:
+                        self._cache.move_to_end(key)
+                        results.append(self._cache[key])
+                    else:
+                        results.append(None)
         
+        miss_indices = [i for i, r in enumerate(results) if r is None]
+        with self._lock:
+            self._misses += len(miss_indices)
+            self._hits += len(results) - len(miss_indices)
         return results, miss_indices
     
-    def put(self, text: str, embedding: List[float]) -> None:
+    def put(
+        self,
+        text: str,
+        embedding: List[float],
+        namespace: Optional[str] = None,
+    ) -> None:
         """Store embedding in cache.
         
         Args:
             text: Original text.
             embedding: Computed embedding vector.
+            namespace: Optional key namespace.
         """
-        key = self._hash_text(text)
-        
-        with self._lock:
-            # Remove oldest if at capacity
-            while len(self._cache) >= self.max_size:
-                self._cache.popitem(last=False)
-            
-            self._cache[key] = embedding
+        self.put_batch([text], [embedding], namespace)
     
-    def put_batch(self, texts: List[str], embeddings: List[List[float]]) -> None:
+    def put_batch(
+        self,
+        texts: List[str],
+        embeddings: List[List[float]],
+        namespace: Optional[str] = None,
+    ) -> None:
         """Store multiple embeddings in cache.
         
         Args:
             texts: List of original texts.
             embeddings: List of computed embeddings.
+            namespace: Optional key namespace.
         """
         if len(texts) != len(embeddings):
             raise ValueError("texts and embeddings must have same length")
         
+        keys = [self._hash_text(text, namespace) for text in texts]
+        
+        if self._store is not None:
+            try:
+                self._store.put_many(keys, embeddings)
+            except Exception as e:
+                logger.warning(f"Failed to persist embeddings: {e}")
+            return
+        
         with self._lock:
-            for text, embedding in zip(texts, embeddings):
-                key = self._hash_text(text)
-                
+            for key, embedding in zip(keys, embeddings):
                 # Remove oldest if at capacity
                 while len(self._cache) >= self.max_size:
                     self._cache.popitem(last=False)
                 
                 self._cache[key] = embedding
     
-    def stats(self) -> Dict[str, int]:
+    def stats(self) -> Dict[str, Any]:
         """Get cache statistics.
         
         Returns:
-            Dict with hits, misses, size, and hit_rate.
+            Dict with hits, misses, size, hit_rate and backend details.
         """
+        store_stats = self._store.stats() if self._store is not None else None
         with self._lock:
             total = self._hits + self._misses
             hit_rate = self._hits / total if total > 0 else 0.0
-            return {
+            stats: Dict[str, Any] = {
                 "hits": self._hits,
                 "misses": self._misses,
-                "size": len(self._cache),
+                "size": store_stats["size"] if store_stats else len(self._cache),
                 "max_size": self.max_size,
                 "hit_rate": round(hit_rate, 4),
+                "backend": "mmap" if store_stats else "memory",
+                "fingerprint": self.fingerprint,
             }
+        if store_stats:
+            stats.update({k: store_stats[k] for k in ("path", "dim", "dtype", "file_bytes")})
+        return stats
     
     def clear(self) -> None:
         """Clear all cached embeddings."""
+        if self._store is not None:
+            self._store.clear()
         with self._lock:
             self._cache.clear()
             self._hits = 0
             self._misses = 0
     
     def save(self) -> None:
-        """Save cache to disk (if persist_path configured)."""
-        if not self.persist_path:
-            return
+        """Flush the persistent store to disk (no-op for in-memory caches).
         
-        with self._lock:
-            try:
-                self.persist_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(self.persist_path, "w", encoding="utf-8") as f:
-                    json.dump(dict(self._cache), f)
-                logger.info(f"Saved {len(self._cache)} embeddings to {self.persist_path}")
-            except Exception as e:
-                logger.warning(f"Failed to save embedding cache: {e}")
+        Writes are already appended as they happen; this only forces the
+        mapped vectors and the log out of the page cache.
+        """
+        if self._store is not None:
+            self._store.flush()
     
-    def _load(self) -> None:
-        """Load cache from disk."""
-        if not self.persist_path or not self.persist_path.exists():
-            return
-        
-        try:
-            with open(self.persist_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-            
-            self._cache = OrderedDict(data)
-            logger.info(f"Loaded {len(self._cache)} embeddings from {self.persist_path}")
-        except Exception as e:
-            logger.warning(f"Failed to load embedding cache: {e}")
+    def close(self) -> None:
+        """Close the persistent store (the cache keeps working in memory)."""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+
+
+# Global cache instances, one per embedding fingerprint
+_query_caches: Dict[str, EmbeddingCache] = {}
+_chunk_caches: Dict[str, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def _store_dir(persist_dir: str, kind: str, fingerprint: str) -> str:
+    """Directory of the persistent store for one cache kind and model."""
+    from src.core.settings import resolve_path
+    
+    slug = re.sub(r"[^a-z0-9._-]+", "_", fingerprint.lower()).strip("_")[:60]
+    digest = hashlib.sha1(fingerprint.encode("utf-8")).hexdigest()[:8]
+    return str(Path(resolve_path(persist_dir)) / kind / f"{slug}-{digest}")
+
+
+def _get_cache(
+    registry: Dict[str, EmbeddingCache],
+    kind: str,
+    max_size: int,
+    fingerprint: Optional[str],
+    persist_dir: Optional[str],
+    dtype: str,
+    normalize: bool,
+) -> EmbeddingCache:
+    fp = fingerprint or ""
+    cache = registry.get(fp)
+    if cache is None:
+        with _caches_lock:
+            cache = registry.get(fp)
+            if cache is None:
+                directory = _store_dir(persist_dir, kind, fp) if persist_dir and fp else None
+                cache = EmbeddingCache(
+                    max_size=max_size,
+                    persist_dir=directory,
+                    fingerprint=fp,
+                    dtype=dtype,
+                    normalize=normalize,
+                )
+                registry[fp] = cache
+    return cache
 
 
-# Global cache instances
-_query_cache: Optional[EmbeddingCache] = None
-_chunk_cache: Optional[EmbeddingCache] = None
+def get_query_cache(
+    max_size: int = 1000,
+    fingerprint: Optional[str] = None,
+    persist_dir: Optional[str] = None,
+    dtype: str = "float32",
+) -> EmbeddingCache:
+    """Get global query embedding cache for an embedding model.
+    
+    Args:
+        max_size: Maximum cached queries (used when the cache is created).
+        fingerprint: Embedding model fingerprint (see client_fingerprint).
+        persist_dir: Root directory for the persistent store. Persistence
+            requires a fingerprint; otherwise the cache is in-memory.
+        dtype: Storage dtype of the persistent store.
+    """
+    return _get_cache(
+        _query_caches, "query", max_size, fingerprint, persist_dir, dtype, normalize=True
+    )
+
+
+def get_chunk_cache(
+    max_size: int = 50000,
+    fingerprint: Optional[str] = None,
+    persist_dir: Optional[str] = None,
+    dtype: str = "float32",
+) -> EmbeddingCache:
+    """Get global chunk embedding cache for an embedding model.
+    
+    Args:
+        max_size: Maximum cached chunks (used when the cache is created).
+        fingerprint: Embedding model fingerprint (see client_fingerprint).
+        persist_dir: Root directory for the persistent store.
+        dtype: Storage dtype of the persistent store.
+    """
+    return _get_cache(
+        _chunk_caches, "chunk", max_size, fingerprint, persist_dir, dtype, normalize=False
+    )
 
 
-def get_query_cache(max_size: int = 1000) -> EmbeddingCache:
-    """Get global query embedding cache."""
-    global _query_cache
-    if _query_cache is None:
-        _query_cache = EmbeddingCache(max_size=max_size)
-    return _query_cache
+def get_embedding_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Statistics of every query and chunk cache, keyed by kind and fingerprint."""
+    with _caches_lock:
+        query = dict(_query_caches)
+        chunk = dict(_chunk_caches)
+    return {
+        "query": {fp or "default": c.stats() for fp, c in query.items()},
+        "chunk": {fp or "default": c.stats() for fp, c in chunk.items()},
+    }
 
 
-def get_chunk_cache(max_size: int = 50000) -> EmbeddingCache:
-    """Get global chunk embedding cache."""
-    global _chunk_cache
-    if _chunk_cache is None:
-        _chunk_cache = EmbeddingCache(max_size=max_size)
-    return _chunk_cache
+def close_embedding_caches() -> None:
+    """Close every persistent store (called on shutdown)."""
+    with _caches_lock:
+        caches = list(_query_caches.values()) + list(_chunk_caches.values())
+    for cache in caches:
+        cache.close()
@@ -0,0 +1,492 @@
+"""Binary, memory-mapped persistent store for embedding vectors.
+
+Backs ``EmbeddingCache`` when persistence is enabled.  Replaces the old
+JSON dump of Python float lists (50k x 1024 floats of JSON text, slow to
+load and ~10x the memory of the raw vectors) with:
+
+- ``vectors.bin``: a float32 (or float16) row matrix, memory-mapped, so
+  startup does not read vectors and the OS page cache keeps hot rows resident
+- ``index.log``: an append-only log of fixed-size records mapping a 16-byte
+  key hash to a matrix row, replayed on open
+- ``meta.json``: model fingerprint, dimension and dtype
+
+One store directory holds exactly one embedding model (the directory name
+and every key include the model fingerprint), so switching
+``embedding.model`` or ``dimensions`` can never return foreign vectors.
+
+Design Principles:
+- Crash-safe appends: A reused row is first released with a FREE record,
+  then overwritten, then bound with a SET record; every record carries a
+  CRC32 and a torn tail is truncated on open, so a crash never maps a key
+  to the wrong vector
+- Bounded: At most ``max_size`` rows; CLOCK (second-chance) eviction
+- Compact: The log is rewritten once dead records dominate it
+- Single writer: An OS file lock guards the directory; a second process
+  gets ``StoreLockedError`` and falls back to an in-memory cache
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+import threading
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_OP_SET = 1
+_OP_FREE = 2
+_RECORD = struct.Struct("<B16sI")
+_RECORD_SIZE = _RECORD.size + 4  # + CRC32
+_MIN_ROWS = 1024
+_SUPPORTED_DTYPES = ("float32", "float16")
+
+
+class StoreLockedError(RuntimeError):
+    """Raised when another process already owns the store directory."""
+
+
+class MmapEmbeddingStore:
+    """Persistent key -> vector store on a memory-mapped matrix.
+
+    Keys are 16-byte digests computed by the caller (``EmbeddingCache``).
+
+    Example:
+        >>> store = MmapEmbeddingStore("data/cache/embeddings/query/x", max_size=10000)
+        >>> store.put(key, [0.1, 0.2, ...])
+        >>> store.get(key)
+        [0.1, 0.2, ...]
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        max_size: int,
+        dtype: str = "float32",
+        fingerprint: str = "",
+        fsync: bool = False,
+    ):
+        """Open (or create) a store.
+
+        Args:
+            directory: Store directory (one per embedding model).
+            max_size: Maximum number of vectors kept.
+            dtype: "float32" or "float16" (only used when creating the store).
+            fingerprint: Embedding model fingerprint recorded in meta.json.
+                An existing store with a different fingerprint is reset.
+            fsync: fsync the log after each write (survives power loss, slower).
+
+        Raises:
+            ValueError: If max_size or dtype is invalid.
+            StoreLockedError: If another process holds the store.
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be >= 1, got {max_size}")
+        if dtype not in _SUPPORTED_DTYPES:
+            raise ValueError(f"dtype must be one of {_SUPPORTED_DTYPES}, got {dtype!r}")
+
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.fingerprint = fingerprint
+        self.fsync = fsync
+        self.dtype = dtype
+        self.dim: Optional[int] = None
+
+        self._lock = threading.Lock()
+        self._index: Dict[bytes, int] = {}
+        self._row_keys: List[Optional[bytes]] = []
+        self._free_rows: List[int] = []
+        self._ref = np.zeros(0, dtype=bool)
+        self._hand = 0
+        self._next_row = 0
+        self._log_records = 0
+        self._vectors: Optional[np.memmap] = None
+        self._log_fd: Optional[int] = None
+        self._lock_fd: Optional[int] = None
+        self._dim_warned = False
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._acquire_dir_lock()
+        try:
+            self._open()
+        except Exception:
+            self.close()
+            raise
+
+    # ===== Public API =====
+
+    def get(self, key: bytes) -> Optional[List[float]]:
+        """Return the vector stored under *key*, or None."""
+        with self._lock:
+            row = self._index.get(key)
+            if row is None or self._vectors is None:
+                return None
+            self._ref[row] = True
+            return self._vectors[row].astype(np.float32).tolist()
+
+    def get_many(self, keys: Sequence[bytes]) -> List[Optional[List[float]]]:
+        """Return vectors for *keys* (None for misses)."""
+        with self._lock:
+            out: List[Optional[List[float]]] = []
+            for key in keys:
+                row = self._index.get(key)
+                if row is None or self._vectors is None:
+                    out.append(None)
+                    continue
+                self._ref[row] = True
+                out.append(self._vectors[row].astype(np.float32).tolist())
+            return out
+
+    def put(self, key: bytes, vector: Sequence[float]) -> None:
+        """Store *vector* under *key*."""
+        self.put_many([key], [vector])
+
+    def put_many(self, keys: Sequence[bytes], vectors: Sequence[Sequence[float]]) -> None:
+        """Store several vectors with one FREE write and one SET write.
+
+        Vectors whose dimension does not match the store are skipped.
+        """
+        if not keys:
+            return
+        if len(keys) > self.max_size:
+            keys, vectors = keys[-self.max_size:], vectors[-self.max_size:]
+        with self._lock:
+            if self._log_fd is None:
+                return
+            matrix = np.asarray(vectors, dtype=np.float32)
+            if matrix.ndim != 2 or matrix.shape[0] != len(keys):
+                return
+            if self.dim is None:
+                self._init_dim(matrix.shape[1])
+            if matrix.shape[1] != self.dim:
+                if not self._dim_warned:
+                    logger.warning(
+                        f"Embedding cache dimension mismatch: store={self.dim}, "
+                        f"vector={matrix.shape[1]} ({self.directory}); not caching"
+                    )
+                    self._dim_warned = True
+                return
+
+            rows: List[int] = []
+            assigned: Dict[bytes, int] = {}
+            free_records: List[bytes] = []
+            for key in keys:
+                if key in assigned:
+                    rows.append(assigned[key])
+                    continue
+                row = self._index.get(key)
+                if row is None:
+                    row = self._allocate_row(exclude=assigned.values())
+                if self._row_keys[row] is not None:
+                    # Release before overwriting so a crash can't bind the
+                    # old key to the new vector
+                    free_records.append(self._encode(_OP_FREE, self._row_keys[row], row))
+                    self._unbind(row)
+                assigned[key] = row
+                rows.append(row)
+
+            if free_records:
+                self._append(free_records)
+            # Writes to the shared mapping reach the page cache in order with
+            # the log writes, so no msync is needed to survive a process crash
+            self._vectors[rows] = matrix.astype(self.dtype)
+            if self.fsync:
+                self._vectors.flush()
+
+            set_records = []
+            for key, row in assigned.items():
+                self._index[key] = row
+                self._row_keys[row] = key
+                # Only reads mark a row as recently used, so CLOCK keeps
+                # rows that were hit over ones that were merely written
+                self._ref[row] = False
+                set_records.append(self._encode(_OP_SET, key, row))
+            self._append(set_records)
+            self._maybe_compact()
+
+    def clear(self) -> None:
+        """Drop every vector and delete the store files."""
+        with self._lock:
+            self._close_files()
+            for name in ("index.log", "vectors.bin", "meta.json"):
+                try:
+                    (self.directory / name).unlink()
+                except FileNotFoundError:
+                    pass
+            self._reset_state()
+            self._open()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._index)
+
+    def stats(self) -> Dict[str, object]:
+        """Get store statistics."""
+        with self._lock:
+            capacity = len(self._row_keys)
+            itemsize = np.dtype(self.dtype).itemsize
+            return {
+                "path": str(self.directory),
+                "size": len(self._index),
+                "max_size": self.max_size,
+                "dim": self.dim,
+                "dtype": self.dtype,
+                "file_bytes": capacity * (self.dim or 0) * itemsize,
+                "log_records": self._log_records,
+            }
+
+    def flush(self) -> None:
+        """Force mapped vectors and the log to disk."""
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.flush()
+            if self._log_fd is not None:
+                os.fsync(self._log_fd)
+
+    def close(self) -> None:
+        """Flush and close files, releasing the directory lock."""
+        with self._lock:
+            self._close_files()
+            self._release_dir_lock()
+
+    # ===== Private Helper Methods =====
+
+    def _reset_state(self) -> None:
+        self.dim = None
+        self._index = {}
+        self._row_keys = []
+        self._free_rows = []
+        self._ref = np.zeros(0, dtype=bool)
+        self._hand = 0
+        self._next_row = 0
+        self._log_records = 0
+
+    def _open(self) -> None:
+        """Load meta, map vectors and replay the log (caller holds lock)."""
+        meta_path = self.directory / "meta.json"
+        if meta_path.exists():
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            except Exception as e:
+                logger.warning(f"Corrupt embedding cache meta, resetting {self.directory}: {e}")
+                meta = None
+            if meta is None or meta.get("fingerprint", "") != self.fingerprint:
+                self._wipe()
+            else:
+                self.dim = meta.get("dim")
+                self.dtype = meta.get("dtype", self.dtype)
+
+        if self.dim is not None:
+            self._map_vectors(self._rows_on_disk())
+        self._replay_log()
+
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        self._log_fd = os.open(self.directory / "index.log", flags, 0o644)
+
+        if self._index:
+            logger.info(f"Loaded {len(self._index)} cached embeddings from {self.directory}")
+
+    def _wipe(self) -> None:
+        """Delete store files (model changed or meta corrupt)."""
+        for name in ("index.log", "vectors.bin", "meta.json"):
+            try:
+                (self.directory / name).unlink()
+            except FileNotFoundError:
+                pass
+        logger.info(f"Embedding cache reset for new model fingerprint: {self.directory}")
+
+    def _init_dim(self, dim: int) -> None:
+        """Fix the vector dimension on first write and persist meta.json."""
+        self.dim = dim
+        meta = {"fingerprint": self.fingerprint, "dim": dim, "dtype": self.dtype, "version": 1}
+        tmp = self.directory / "meta.json.tmp"
+        tmp.write_text(json.dumps(meta), encoding="utf-8")
+        os.replace(tmp, self.directory / "meta.json")
+        self._map_vectors(0)
+
+    def _rows_on_disk(self) -> int:
+        path = self.directory / "vectors.bin"
+        if not path.exists() or not self.dim:
+            return 0
+        return path.stat().st_size // (self.dim * np.dtype(self.dtype).itemsize)
+
+    def _map_vectors(self, rows: int) -> None:
+        """(Re)map vectors.bin with at least *rows* rows."""
+        assert self.dim is not None
+        rows = max(rows, min(self.max_size, _MIN_ROWS), len(self._row_keys))
+        path = self.directory / "vectors.bin"
+        row_bytes = self.dim * np.dtype(self.dtype).itemsize
+        self._unmap_vectors()
+        with open(path, "ab") as f:
+            if f.tell() < rows * row_bytes:
+                f.truncate(rows * row_bytes)
+        self._vectors = np.memmap(path, dtype=self.dtype, mode="r+", shape=(rows, self.dim))
+        grow = rows - len(self._row_keys)
+        if grow > 0:
+            self._row_keys.extend([None] * grow)
+            self._ref = np.concatenate([self._ref, np.zeros(grow, dtype=bool)])
+
+    def _unmap_vectors(self) -> None:
+        if self._vectors is not None:
+            self._vectors.flush()
+            mm = getattr(self._vectors, "_mmap", None)
+            self._vectors = None
+            if mm is not None:
+                mm.close()
+
+    def _replay_log(self) -> None:
+        """Rebuild the index from index.log, truncating a torn/corrupt tail."""
+        path = self.directory / "index.log"
+        if not path.exists():
+            return
+        data = path.read_bytes()
+        valid = 0
+        high_water = 0
+        for offset in range(0, len(data) - _RECORD_SIZE + 1, _RECORD_SIZE):
+            body = data[offset:offset + _RECORD.size]
+            (crc,) = struct.unpack_from("<I", data, offset + _RECORD.size)
+            if zlib.crc32(body) != crc:
+                break
+            op, key, row = _RECORD.unpack(body)
+            if row >= len(self._row_keys) or self.dim is None:
+                break  # Row beyond the vector file: torn write
+            if op == _OP_SET:
+                old_row = self._index.get(key)
+                if old_row is not None and old_row != row:
+                    self._row_keys[old_row] = None
+                if self._row_keys[row] is not None:
+                    self._index.pop(self._row_keys[row], None)
+                self._index[key] = row
+                self._row_keys[row] = key
+                high_water = max(high_water, row + 1)
+            elif op == _OP_FREE:
+                if self._row_keys[row] is not None:
+                    self._index.pop(self._row_keys[row], None)
+                    self._row_keys[row] = None
+            else:
+                break
+            valid += 1
+        self._log_records = valid
+        if valid * _RECORD_SIZE < len(data):
+            logger.warning(
+                f"Embedding cache log truncated after {valid} records "
+                f"(torn or corrupt tail): {path}"
+            )
+            with open(path, "r+b") as f:
+                f.truncate(valid * _RECORD_SIZE)
+        # Rows below the high-water mark without a key are reusable
+        self._free_rows = [r for r in range(high_water) if self._row_keys[r] is None]
+        self._next_row = high_water
+
+    def _allocate_row(self, exclude) -> int:
+        """Pick a row for a new key: free list, then growth, then CLOCK."""
+        excluded = set(exclude)
+        while self._free_rows:
+            row = self._free_rows.pop()
+            if row not in excluded and self._row_keys[row] is None:
+                return row
+        if self._next_row < self.max_size:
+            if self._next_row >= len(self._row_keys):
+                self._map_vectors(min(self.max_size, max(_MIN_ROWS, len(self._row_keys) * 2)))
+            row = self._next_row
+            self._next_row += 1
+            return row
+        # CLOCK: skip recently used rows once, evict the first cold one
+        capacity = self._next_row
+        for _ in range(2 * capacity + 1):
+            row = self._hand
+            self._hand = (self._hand + 1) % capacity
+            if row in excluded:
+                continue
+            if self._ref[row]:
+                self._ref[row] = False
+                continue
+            return row
+        raise RuntimeError("Embedding cache batch larger than max_size")
+
+    def _unbind(self, row: int) -> None:
+        key = self._row_keys[row]
+        if key is not None:
+            self._index.pop(key, None)
+            self._row_keys[row] = None
+
+    @staticmethod
+    def _encode(op: int, key: bytes, row: int) -> bytes:
+        body = _RECORD.pack(op, key, row)
+        return body + struct.pack("<I", zlib.crc32(body))
+
+    def _append(self, records: List[bytes]) -> None:
+        """Append records to the log in a single write."""
+        assert self._log_fd is not None
+        os.write(self._log_fd, b"".join(records))
+        if self.fsync:
+            os.fsync(self._log_fd)
+        self._log_records += len(records)
+
+    def _maybe_compact(self) -> None:
+        """Rewrite the log with live SET records once it is mostly dead."""
+        if self._log_records <= 2 * len(self._index) + _MIN_ROWS:
+            return
+        path = self.directory / "index.log"
+        tmp = self.directory / "index.log.tmp"
+        records = [self._encode(_OP_SET, key, row) for key, row in self._index.items()]
+        with open(tmp, "wb") as f:
+            f.write(b"".join(records))
+            f.flush()
+            os.fsync(f.fileno())
+        os.close(self._log_fd)
+        self._log_fd = None
+        os.replace(tmp, path)
+        flags = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, "O_BINARY", 0)
+        self._log_fd = os.open(path, flags, 0o644)
+        self._log_records = len(records)
+        logger.debug(f"Compacted embedding cache log to {len(records)} records")
+
+    def _close_files(self) -> None:
+        self._unmap_vectors()
+        if self._log_fd is not None:
+            try:
+                os.fsync(self._log_fd)
+            except OSError:
+                pass
+            os.close(self._log_fd)
+            self._log_fd = None
+
+    def _acquire_dir_lock(self) -> None:
+        """Take an exclusive, non-blocking OS lock on the store directory."""
+        fd = os.open(self.directory / "lock", os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.name == "nt":
+                import msvcrt
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError as e:
+            os.close(fd)
+            raise StoreLockedError(
+                f"Embedding cache at {self.directory} is in use by another process"
+            ) from e
+        self._lock_fd = fd
+
+    def _release_dir_lock(self) -> None:
+        if self._lock_fd is None:
+            return
+        try:
+            if os.name == "nt":
+                import msvcrt
+                os.lseek(self._lock_fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._lock_fd, msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(self._lock_fd, fcntl.LOCK_UN)
+        except OSError:
+            pass
+        os.close(self._lock_fd)
+        self._lock_fd = None
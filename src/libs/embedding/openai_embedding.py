@@ -7,7 +7,7 @@ the standard OpenAI Embeddings API.
 from __future__ import annotations
 
 import os
-from typing import Any, List, Optional
+from typing import Any, Dict, List, Optional
 
 from src.libs.embedding.base_embedding import BaseEmbedding
 
@@ -101,16 +101,11 @@ class OpenAIEmbedding(BaseEmbedding):
         # Pre-initialize OpenAI client for connection reuse
         try:
             from openai import OpenAI
-            client_kwargs = {
-                "api_key": self.api_key,
-                "base_url": self.base_url,
-            }
-            if self._use_azure_auth and self.api_version:
-                client_kwargs["default_query"] = {"api-version": self.api_version}
-                client_kwargs["default_headers"] = {"api-key": self.api_key}
-            self._client = OpenAI(**client_kwargs)
+            self._client = OpenAI(**self._client_kwargs())
         except ImportError:
             self._client = None  # Will be created lazily in embed()
+        # Async client is created on first embed_async() call
+        self._async_client = None
     
     def embed(
         self,
@@ -145,23 +140,81 @@ class OpenAIEmbedding(BaseEmbedding):
                     "OpenAI Python package not installed. "
                     "Install with: pip install openai"
                 ) from e
-            client_kwargs = {
-                "api_key": self.api_key,
-                "base_url": self.base_url,
-            }
-            if self._use_azure_auth and self.api_version:
-                client_kwargs["default_query"] = {"api-version": self.api_version}
-                client_kwargs["default_headers"] = {"api-key": self.api_key}
-            self._client = OpenAI(**client_kwargs)
+            self._client = OpenAI(**self._client_kwargs())
         client = self._client
         
+        api_params = self._build_params(texts, kwargs)
+        
+        # Call OpenAI API
+        try:
+            response = client.embeddings.create(**api_params)
+        except Exception as e:
+            raise self._wrap_error(e) from e
+        
+        return self._parse_response(response, len(api_params["input"]))
+    
+    async def embed_async(
+        self,
+        texts: List[str],
+        trace: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> List[List[float]]:
+        """Native async embed() using ``openai.AsyncOpenAI``.
+        
+        The request is awaited on the event loop (no worker thread), so
+        concurrent queries do not queue behind a thread pool.
+        
+        Args:
+            texts: List of text strings to embed. Must not be empty.
+            trace: Optional TraceContext for observability.
+            **kwargs: Override parameters (dimensions, etc.).
+        
+        Returns:
+            List of embedding vectors.
+        
+        Raises:
+            ValueError: If texts list is empty or contains invalid entries.
+            OpenAIEmbeddingError: If API call fails.
+        """
+        self.validate_texts(texts)
+        
+        if self._async_client is None:
+            try:
+                from openai import AsyncOpenAI
+            except ImportError:
+                # Old/missing SDK: fall back to the executor-based default
+                return await super().embed_async(texts, trace, **kwargs)
+            self._async_client = AsyncOpenAI(**self._client_kwargs())
+        
+        api_params = self._build_params(texts, kwargs)
+        
+        try:
+            response = await self._async_client.embeddings.create(**api_params)
+        except Exception as e:
+            raise self._wrap_error(e) from e
+        
+        return self._parse_response(response, len(api_params["input"]))
+    
+    def _client_kwargs(self) -> Dict[str, Any]:
+        """Constructor arguments shared by the sync and async clients."""
+        client_kwargs: Dict[str, Any] = {
+            "api_key": self.api_key,
+            "base_url": self.base_url,
+        }
+        if self._use_azure_auth and self.api_version:
+            client_kwargs["default_query"] = {"api-version": self.api_version}
+            client_kwargs["default_headers"] = {"api-key": self.api_key}
+        return client_kwargs
+    
+    def _build_params(self, texts: List[str], kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Build Embeddings API parameters for *texts*."""
         # Truncate texts that exceed model token limit
         # DashScope text-embedding-v3 max: 8192 tokens; ~1.5 chars/token for Chinese
         MAX_CHARS = 6000
         texts = [t[:MAX_CHARS] if len(t) > MAX_CHARS else t for t in texts]
         
         # Prepare API call parameters
-        api_params = {
+        api_params: Dict[str, Any] = {
             "input": texts,
             "model": self.model,
         }
@@ -176,25 +229,26 @@ class OpenAIEmbedding(BaseEmbedding):
         ):
             api_params["dimensions"] = dimensions
         
-        # Call OpenAI API
-        try:
-            response = client.embeddings.create(**api_params)
-        except OpenAIEmbeddingError:
-            raise
-        except (ConnectionError, TimeoutError) as e:
-            raise OpenAIEmbeddingError(
+        return api_params
+    
+    def _wrap_error(self, e: Exception) -> OpenAIEmbeddingError:
+        """Convert an API call exception into OpenAIEmbeddingError."""
+        if isinstance(e, OpenAIEmbeddingError):
+            return e
+        if isinstance(e, (ConnectionError, TimeoutError)):
+            return OpenAIEmbeddingError(
                 f"[Embedding:{self.model}] Network error: {type(e).__name__}: {e}"
-            ) from e
-        except (ValueError, TypeError) as e:
-            raise OpenAIEmbeddingError(
+            )
+        if isinstance(e, (ValueError, TypeError)):
+            return OpenAIEmbeddingError(
                 f"[Embedding:{self.model}] Parameter error: {type(e).__name__}: {e}"
-            ) from e
-        except Exception as e:
-            raise OpenAIEmbeddingError(
-                f"[Embedding:{self.model}] OpenAI Embeddings API call failed: {type(e).__name__}: {e}"
-            ) from e
-        
-        # Extract embeddings from response
+            )
+        return OpenAIEmbeddingError(
+            f"[Embedding:{self.model}] OpenAI Embeddings API call failed: {type(e).__name__}: {e}"
+        )
+    
+    def _parse_response(self, response: Any, expected: int) -> List[List[float]]:
+        """Extract embedding vectors from an Embeddings API response."""
         # Response format: response.data is a list of objects with .embedding attribute
         try:
             embeddings = [item.embedding for item in response.data]
@@ -204,9 +258,9 @@ class OpenAIEmbedding(BaseEmbedding):
             ) from e
         
         # Verify output matches input length
-        if len(embeddings) != len(texts):
+        if len(embeddings) != expected:
             raise OpenAIEmbeddingError(
-                f"[Embedding:{self.model}] Output length mismatch: expected {len(texts)}, got {len(embeddings)}"
+                f"[Embedding:{self.model}] Output length mismatch: expected {expected}, got {len(embeddings)}"
             )
         
         return embeddings
@@ -0,0 +1,354 @@
+"""Adaptive concurrency limiter for embedding API calls.
+
+Embedding providers (DashScope, OpenAI, Azure) enforce per-key request and
+token rate limits and answer HTTP 429 when they are exceeded. This module
+bounds the number of in-flight embedding requests and adapts that bound to
+what the provider actually accepts:
+
+- Additive increase: after ``increase_after`` consecutive successes the limit
+  grows by one, up to ``max_concurrency``
+- Multiplicative decrease: a 429 halves the limit (never below 1) and pauses
+  new requests for a backoff period (``Retry-After`` if the provider sent one,
+  otherwise exponential backoff with jitter)
+
+Design Principles:
+- Shared: One limiter per embedding model bounds every caller (batch
+  threads, nested encoders, concurrent pipelines) at once
+- Thread-safe: threading.Condition; async callers poll without blocking the
+  event loop or tying up executor threads (which embed_async may need)
+- Provider-agnostic: 429 detection walks the exception chain, so wrapped
+  provider errors (e.g. OpenAIEmbeddingError from openai.RateLimitError)
+  are recognized
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_RATE_LIMIT_PATTERN = re.compile(
+    r"\b429\b|rate[ _-]?limit|too many requests|throttl", re.IGNORECASE
+)
+
+
+def _exception_chain(exc: BaseException) -> List[BaseException]:
+    """Return *exc* and its causes/contexts (outermost first, no cycles)."""
+    chain: List[BaseException] = []
+    current: Optional[BaseException] = exc
+    while current is not None and current not in chain:
+        chain.append(current)
+        current = current.__cause__ or current.__context__
+    return chain
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Check whether *exc* (or anything it wraps) is a provider rate limit.
+
+    Args:
+        exc: Exception raised by an embedding call.
+
+    Returns:
+        True for HTTP 429 / throttling errors.
+    """
+    for err in _exception_chain(exc):
+        status = getattr(err, "status_code", None) or getattr(err, "status", None)
+        if status == 429:
+            return True
+        if type(err).__name__ in ("RateLimitError", "TooManyRequests"):
+            return True
+        if _RATE_LIMIT_PATTERN.search(str(err)):
+            return True
+    return False
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Extract the provider's ``Retry-After`` hint from *exc*, if any.
+
+    Args:
+        exc: Exception raised by an embedding call.
+
+    Returns:
+        Seconds to wait, or None if the response carried no hint.
+    """
+    for err in _exception_chain(exc):
+        response = getattr(err, "response", None)
+        headers = getattr(response, "headers", None)
+        if not headers:
+            continue
+        value = headers.get("retry-after") or headers.get("Retry-After")
+        try:
+            return max(0.0, float(value))
+        except (TypeError, ValueError):
+            continue
+    return None
+
+
+class AdaptiveRateLimiter:
+    """AIMD limiter on concurrent embedding requests.
+
+    Example:
+        >>> limiter = AdaptiveRateLimiter(max_concurrency=4)
+        >>> vectors = limiter.call(lambda: embedding.embed(texts))
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 4,
+        max_retries: int = 3,
+        base_backoff: float = 1.0,
+        max_backoff: float = 30.0,
+        increase_after: int = 5,
+    ):
+        """Initialize the limiter.
+
+        Args:
+            max_concurrency: Upper bound of in-flight requests.
+            max_retries: Retries per call after a rate limit or transient error.
+            base_backoff: First backoff delay in seconds (doubles per attempt).
+            max_backoff: Cap on a single backoff delay in seconds.
+            increase_after: Consecutive successes before the limit grows by one.
+
+        Raises:
+            ValueError: If max_concurrency < 1 or max_retries < 0.
+        """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be >= 1, got {max_concurrency}")
+        if max_retries < 0:
+            raise ValueError(f"max_retries must be >= 0, got {max_retries}")
+
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.increase_after = increase_after
+
+        self._limit = max_concurrency
+        self._in_flight = 0
+        self._successes = 0
+        self._paused_until = 0.0
+        self._cond = threading.Condition()
+
+        self._rate_limited = 0
+        self._retries = 0
+        self._calls = 0
+
+    @property
+    def limit(self) -> int:
+        """Current adaptive concurrency limit."""
+        with self._cond:
+            return self._limit
+
+    def acquire(self) -> None:
+        """Block until a request slot is free and no backoff is active."""
+        with self._cond:
+            while True:
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0 and self._in_flight < self._limit:
+                    self._in_flight += 1
+                    return
+                self._cond.wait(timeout=wait if wait > 0 else None)
+
+    async def acquire_async(self, poll_interval: float = 0.02) -> None:
+        """Async acquire(): waits on the event loop, not in a thread."""
+        while True:
+            with self._cond:
+                wait = self._paused_until - time.monotonic()
+                if wait <= 0 and self._in_flight < self._limit:
+                    self._in_flight += 1
+                    return
+            await asyncio.sleep(max(wait, poll_interval))
+
+    def release(self) -> None:
+        """Return a request slot."""
+        with self._cond:
+            self._in_flight -= 1
+            self._cond.notify_all()
+
+    def on_success(self) -> None:
+        """Record a successful request (may grow the limit)."""
+        with self._cond:
+            self._successes += 1
+            if self._limit < self.max_concurrency and self._successes >= self.increase_after:
+                self._limit += 1
+                self._successes = 0
+                logger.debug(f"Embedding concurrency limit raised to {self._limit}")
+                self._cond.notify_all()
+
+    def on_rate_limited(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """Record a 429: halve the limit and pause new requests.
+
+        429s from requests that were already in flight when a backoff
+        started do not halve the limit again.
+
+        Args:
+            attempt: Zero-based retry attempt of the failing call.
+            retry_after: Provider's Retry-After hint in seconds.
+
+        Returns:
+            Backoff delay in seconds.
+        """
+        delay = retry_after if retry_after is not None else self._backoff(attempt)
+        with self._cond:
+            now = time.monotonic()
+            self._rate_limited += 1
+            self._successes = 0
+            if now >= self._paused_until:
+                self._limit = max(1, self._limit // 2)
+            self._paused_until = max(self._paused_until, now + delay)
+        logger.warning(
+            f"Embedding API rate limited; concurrency limit -> {self._limit}, "
+            f"backing off {delay:.1f}s"
+        )
+        return delay
+
+    def call(self, fn: Callable[[], T], description: str = "embedding call") -> T:
+        """Run *fn* under the limiter, retrying rate limits and transient errors.
+
+        Args:
+            fn: Zero-argument callable performing one API request.
+            description: Label used in log messages.
+
+        Returns:
+            Result of *fn*.
+
+        Raises:
+            Exception: The last error once retries are exhausted, or any
+                non-retryable error (ValueError/TypeError anywhere in the
+                exception chain) immediately.
+        """
+        attempt = 0
+        while True:
+            self.acquire()
+            try:
+                result = fn()
+            except Exception as e:
+                self.release()
+                delay = self._on_error(e, attempt, description)
+                if delay is None:
+                    raise
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self.release()
+            self._count_success()
+            return result
+
+    async def call_async(
+        self,
+        fn: Callable[[], Any],
+        description: str = "embedding call",
+    ) -> Any:
+        """Async variant of call(); *fn* returns an awaitable.
+
+        Args:
+            fn: Zero-argument callable returning a coroutine for one request.
+            description: Label used in log messages.
+
+        Returns:
+            Awaited result of *fn*.
+        """
+        attempt = 0
+        while True:
+            await self.acquire_async()
+            try:
+                result = await fn()
+            except Exception as e:
+                self.release()
+                delay = self._on_error(e, attempt, description)
+                if delay is None:
+                    raise
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self.release()
+            self._count_success()
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Get limiter statistics.
+
+        Returns:
+            Dict with current limit, in-flight count, calls, retries and
+            rate-limit events.
+        """
+        with self._cond:
+            return {
+                "limit": self._limit,
+                "max_concurrency": self.max_concurrency,
+                "in_flight": self._in_flight,
+                "calls": self._calls,
+                "retries": self._retries,
+                "rate_limited": self._rate_limited,
+            }
+
+    # ===== Private Helper Methods =====
+
+    def _count_success(self) -> None:
+        with self._cond:
+            self._calls += 1
+        self.on_success()
+
+    def _on_error(self, exc: Exception, attempt: int, description: str) -> Optional[float]:
+        """Decide whether to retry *exc*; returns the delay or None to give up."""
+        if attempt >= self.max_retries or any(
+            isinstance(err, (ValueError, TypeError)) for err in _exception_chain(exc)
+        ):
+            return None
+        with self._cond:
+            self._retries += 1
+        if is_rate_limit_error(exc):
+            return self.on_rate_limited(attempt, retry_after_seconds(exc))
+        delay = self._backoff(attempt)
+        logger.warning(
+            f"{description} failed (attempt {attempt + 1}/{self.max_retries + 1}), "
+            f"retrying in {delay:.1f}s: {exc}"
+        )
+        return delay
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter."""
+        ceiling = min(self.max_backoff, self.base_backoff * (2 ** attempt))
+        return random.uniform(ceiling / 2, ceiling)
+
+
+# Global limiter instances, one per embedding model (provider rate limits
+# apply per key and model, not per client object)
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(
+    client: Any,
+    max_concurrency: int = 4,
+    max_retries: int = 3,
+) -> AdaptiveRateLimiter:
+    """Get the limiter shared by all clients of the same embedding model.
+
+    Args:
+        client: Embedding client instance (keyed by client_fingerprint).
+        max_concurrency: Upper bound used when the limiter is created.
+        max_retries: Retries per call used when the limiter is created.
+
+    Returns:
+        The client's AdaptiveRateLimiter.
+    """
+    from src.libs.embedding.embedding_cache import client_fingerprint
+
+    key = client_fingerprint(client)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter(
+                max_concurrency=max_concurrency, max_retries=max_retries
+            )
+            _limiters[key] = limiter
+    return limiter
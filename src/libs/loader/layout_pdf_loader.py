@@ -7,10 +7,18 @@ text block coordinate extraction to correctly handle:
 - Scanned page detection with OCR fallback
 - Table structure preservation
 
+Large PDFs can be parsed page-parallel: page ranges go to worker processes
+(each opening its own PyMuPDF handle) and the pages are merged back in
+reading order. Scanned pages are rendered and OCRed in batches after the
+layout pass (Tesseract reads a whole batch in one run; PaddleOCR still
+recognizes one page per call), and rendered pages and OCR text are cached per document hash
+and page, so a retried ingestion does not OCR the same pages again.
+
 Graceful Degradation:
 - No PyMuPDF → falls back to MarkItDown
 - No OCR engine → logs warning, returns empty text for scanned pages
 - Layout detection fails → falls back to sequential text extraction
+- Page workers fail → the PDF is parsed in-process
 """
 
 from __future__ import annotations
@@ -18,9 +26,16 @@ from __future__ import annotations
 import hashlib
 import io
 import logging
+import multiprocessing
+import os
 import re
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from src.core.types import Document
 from src.libs.loader.base_loader import BaseLoader
@@ -67,6 +82,32 @@ SCANNED_PAGE_TEXT_THRESHOLD = 50
 # of page width, treat as multi-column
 COLUMN_GAP_RATIO = 0.15
 
+# Shared pool for page-parallel parsing (created lazily)
+_page_pool: Optional[ProcessPoolExecutor] = None
+_page_pool_workers = 0
+_page_pool_lock = threading.Lock()
+
+# Loaders of a page worker process, by options (keeps OCR models loaded)
+_worker_loaders: Dict[Tuple[Any, ...], "LayoutPdfLoader"] = {}
+
+
+@dataclass
+class PageResult:
+    """Parsed content of one PDF page.
+
+    Attributes:
+        page_num: 0-based page index.
+        text: Layout-ordered Markdown (or OCR text for scanned pages).
+        is_scanned: True if the page was OCRed.
+        is_multi_column: True if multiple text columns were detected.
+        images: Metadata of the page images that were extracted.
+    """
+    page_num: int
+    text: str
+    is_scanned: bool = False
+    is_multi_column: bool = False
+    images: List[Dict[str, Any]] = field(default_factory=list)
+
 
 class LayoutPdfLoader(BaseLoader):
     """Layout-aware PDF Loader using PyMuPDF text block coordinates.
@@ -76,8 +117,12 @@ class LayoutPdfLoader(BaseLoader):
     2. Detect columns by clustering block X-coordinates
     3. Sort blocks in reading order (column-first, then top-to-bottom)
     4. If page has too little text (scanned), render to image → OCR
+       (in batches of ``ocr_batch_size`` pages after the layout pass)
     5. Detect table-like regions and preserve structure
 
+    With ``page_workers`` > 1, PDFs of at least 2 × ``min_pages_per_worker``
+    pages are split into page ranges parsed by worker processes.
+
     Falls back to MarkItDown if PyMuPDF is unavailable.
     """
 
@@ -87,6 +132,10 @@ class LayoutPdfLoader(BaseLoader):
         image_storage_dir: str | Path = "data/images",
         vision_llm: Optional[Any] = None,
         ocr_engine: str = "auto",
+        page_workers: int = 1,
+        min_pages_per_worker: int = 16,
+        ocr_batch_size: int = 8,
+        render_cache_dir: Optional[str | Path] = None,
     ) -> None:
         """Initialize LayoutPdfLoader.
 
@@ -95,10 +144,24 @@ class LayoutPdfLoader(BaseLoader):
             image_storage_dir: Base directory for storing extracted images.
             vision_llm: Optional Vision LLM (unused, kept for interface compat).
             ocr_engine: OCR engine to use: "auto", "tesseract", "paddleocr", "none".
+            page_workers: Worker processes parsing page ranges of one PDF
+                (1 = parse in-process).
+            min_pages_per_worker: Minimum pages per worker; smaller PDFs
+                use fewer workers.
+            ocr_batch_size: Scanned pages rendered and OCRed per batch.
+                Tesseract reads a whole batch in one run; PaddleOCR's
+                ``ocr()`` takes one image, so it is still called once per
+                page and the batch only groups rendering and caching.
+            render_cache_dir: Optional directory caching rendered pages and
+                their OCR text per document hash and page.
         """
         self.extract_images = extract_images
         self.image_storage_dir = Path(image_storage_dir)
         self.ocr_engine = ocr_engine
+        self.page_workers = max(1, page_workers)
+        self.min_pages_per_worker = max(1, min_pages_per_worker)
+        self.ocr_batch_size = max(1, ocr_batch_size)
+        self.render_cache_dir = Path(render_cache_dir) if render_cache_dir else None
         self._paddle_ocr: Optional[Any] = None
 
     def load(self, file_path: str | Path) -> Document:
@@ -128,35 +191,32 @@ class LayoutPdfLoader(BaseLoader):
             logger.error(f"Failed to open PDF {path}: {e}")
             raise RuntimeError(f"PDF open failed: {e}") from e
 
+        try:
+            page_count = len(pdf_doc)
+            pages: Optional[List[PageResult]] = None
+            shards = self._page_shards(page_count)
+            if len(shards) > 1:
+                pages = self._load_sharded(path, doc_hash, shards)
+            if pages is None:
+                pages = self._load_pages(pdf_doc, range(page_count), doc_hash)
+        finally:
+            pdf_doc.close()
+
         all_page_texts: List[str] = []
         images_metadata: List[Dict[str, Any]] = []
         scanned_pages: List[int] = []
         multi_col_pages: List[int] = []
 
-        for page_num in range(len(pdf_doc)):
-            page = pdf_doc[page_num]
-            page_text, is_scanned, is_multi_col = self._extract_page_layout(
-                page, page_num, pdf_doc, doc_hash
-            )
-            
-            # Extract image for this page if it contains visual elements
-            if self.extract_images:
-                try:
-                    page_images = self._extract_page_image(page, page_num, doc_hash)
-                    if page_images:
-                        for img in page_images:
-                            page_text += f"\n\n[IMAGE: {img['id']}]\n"
-                        images_metadata.extend(page_images)
-                except Exception as e:
-                    logger.warning(f"Image extraction failed for page {page_num + 1}: {e}")
-                    
+        for page in pages:
+            page_text = page.text
+            for img in page.images:
+                page_text += f"\n\n[IMAGE: {img['id']}]\n"
+            images_metadata.extend(page.images)
             all_page_texts.append(page_text)
-            if is_scanned:
-                scanned_pages.append(page_num + 1)
-            if is_multi_col:
-                multi_col_pages.append(page_num + 1)
-
-        pdf_doc.close()
+            if page.is_scanned:
+                scanned_pages.append(page.page_num + 1)
+            if page.is_multi_column:
+                multi_col_pages.append(page.page_num + 1)
 
         text_content = "\n\n".join(all_page_texts)
 
@@ -180,6 +240,100 @@ class LayoutPdfLoader(BaseLoader):
 
         return Document(id=doc_id, text=text_content, metadata=metadata)
 
+    # ------------------------------------------------------------------
+    # Page-parallel parsing
+    # ------------------------------------------------------------------
+
+    def _page_shards(self, page_count: int) -> List[Tuple[int, int]]:
+        """Split the pages into contiguous (start, stop) ranges.
+
+        Ranges are half a worker's share, so a worker that hits slow
+        (scanned) pages does not hold up the whole document.
+        """
+        workers = min(self.page_workers, page_count // self.min_pages_per_worker)
+        if workers <= 1:
+            return [(0, page_count)]
+        size = -(-page_count // (workers * 2))
+        return [(start, min(start + size, page_count)) for start in range(0, page_count, size)]
+
+    def _load_sharded(
+        self,
+        path: Path,
+        doc_hash: str,
+        shards: List[Tuple[int, int]],
+    ) -> Optional[List[PageResult]]:
+        """Parse page ranges in worker processes and merge them in page order.
+
+        Returns:
+            Results of all pages, or None if the workers failed (the caller
+            then parses in-process).
+        """
+        options = self._worker_options()
+        futures: List[Any] = []
+        try:
+            pool = _get_page_pool(self.page_workers)
+            futures = [
+                pool.submit(_load_page_range, str(path), doc_hash, start, stop, options)
+                for start, stop in shards
+            ]
+            pages: List[PageResult] = []
+            for future in futures:
+                pages.extend(future.result())
+        except BrokenProcessPool as e:
+            logger.warning(f"Page workers crashed, parsing {path.name} in-process: {e}")
+            for f in futures:
+                f.cancel()
+            shutdown_page_pool(wait=False)
+            return None
+        except Exception as e:
+            logger.warning(f"Page-parallel parsing failed, parsing {path.name} in-process: {e}")
+            # Results of the other ranges would be discarded
+            for f in futures:
+                f.cancel()
+            return None
+        logger.info(f"Parsed {len(pages)} pages of {path.name} in {len(shards)} ranges")
+        return pages
+
+    def _worker_options(self) -> Dict[str, Any]:
+        """Constructor options of the page workers' loaders."""
+        return {
+            "extract_images": self.extract_images,
+            "image_storage_dir": str(self.image_storage_dir),
+            "ocr_engine": self.ocr_engine,
+            "ocr_batch_size": self.ocr_batch_size,
+            "render_cache_dir": str(self.render_cache_dir) if self.render_cache_dir else None,
+        }
+
+    def _load_pages(
+        self,
+        pdf_doc: Any,
+        page_nums: Iterable[int],
+        doc_hash: str,
+    ) -> List[PageResult]:
+        """Parse pages of an open PDF; scanned pages are OCRed in batches."""
+        pages: List[PageResult] = []
+        for page_num in page_nums:
+            page = pdf_doc[page_num]
+            page_text, is_scanned, is_multi_col = self._extract_page_layout(
+                page, page_num, pdf_doc, doc_hash
+            )
+            result = PageResult(page_num, page_text, is_scanned, is_multi_col)
+
+            # Extract image for this page if it contains visual elements
+            if self.extract_images:
+                try:
+                    result.images = self._extract_page_image(page, page_num, doc_hash)
+                except Exception as e:
+                    logger.warning(f"Image extraction failed for page {page_num + 1}: {e}")
+            pages.append(result)
+
+        scanned = [p for p in pages if p.is_scanned]
+        if scanned:
+            ocr_texts = self._ocr_pages(pdf_doc, [p.page_num for p in scanned], doc_hash)
+            for page in scanned:
+                page.text = ocr_texts.get(page.page_num, "")
+        return pages
+
     # ------------------------------------------------------------------
     # Core layout extraction
     # ------------------------------------------------------------------
@@ -193,6 +347,8 @@ class LayoutPdfLoader(BaseLoader):
     ) -> Tuple[str, bool, bool]:
         """Extract text from a single page with layout analysis.
 
+        Scanned pages return empty text; they are OCRed by _ocr_pages.
+
         Returns:
             Tuple of (page_text, is_scanned, is_multi_column).
         """
@@ -212,8 +368,7 @@ class LayoutPdfLoader(BaseLoader):
 
         is_scanned = len(total_text.strip()) < SCANNED_PAGE_TEXT_THRESHOLD
         if is_scanned:
-            ocr_text = self._ocr_page(page, page_num, pdf_doc)
-            return ocr_text, True, False
+            return "", True, False
 
         # Detect columns
         page_width = page_dict.get("width", 612)
@@ -332,29 +487,77 @@ class LayoutPdfLoader(BaseLoader):
     # OCR fallback for scanned pages
     # ------------------------------------------------------------------
 
-    def _ocr_page(self, page: Any, page_num: int, pdf_doc: Any) -> str:
-        """Render page to image and OCR it."""
+    def _ocr_pages(self, pdf_doc: Any, page_nums: List[int], doc_hash: str) -> Dict[int, str]:
+        """OCR scanned pages in batches, reusing cached OCR text.
+
+        Returns:
+            OCR text (or a failure placeholder) per page index.
+        """
         engine = self._resolve_ocr_engine()
+        texts: Dict[int, str] = {}
         if engine == "none":
-            logger.warning(f"Page {page_num + 1} appears scanned but no OCR engine available")
-            return f"[SCANNED PAGE {page_num + 1} — OCR NOT AVAILABLE]"
+            for page_num in page_nums:
+                logger.warning(f"Page {page_num + 1} appears scanned but no OCR engine available")
+                texts[page_num] = f"[SCANNED PAGE {page_num + 1} — OCR NOT AVAILABLE]"
+            return texts
+
+        pending: List[int] = []
+        for page_num in page_nums:
+            cached = self._read_cached_text(doc_hash, page_num, engine)
+            if cached is not None:
+                texts[page_num] = cached
+            else:
+                pending.append(page_num)
+        if len(pending) < len(page_nums):
+            logger.info(f"OCR cache: {len(page_nums) - len(pending)}/{len(page_nums)} pages reused")
 
-        # Render page to image
-        try:
-            mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better OCR
-            pix = page.get_pixmap(matrix=mat)
-            img_bytes = pix.tobytes("png")
-            img = Image.open(io.BytesIO(img_bytes))
-        except Exception as e:
-            logger.warning(f"Failed to render page {page_num + 1} for OCR: {e}")
-            return f"[SCANNED PAGE {page_num + 1} — RENDER FAILED]"
+        for start in range(0, len(pending), self.ocr_batch_size):
+            rendered: Dict[int, Tuple[Any, Optional[Path]]] = {}
+            for page_num in pending[start:start + self.ocr_batch_size]:
+                try:
+                    rendered[page_num] = self._render_page(pdf_doc[page_num], page_num, doc_hash)
+                except Exception as e:
+                    logger.warning(f"Failed to render page {page_num + 1} for OCR: {e}")
+                    texts[page_num] = f"[SCANNED PAGE {page_num + 1} — RENDER FAILED]"
+            if not rendered:
+                continue
+
+            if engine == "tesseract":
+                batch_texts = self._ocr_tesseract_batch(rendered)
+            else:
+                # PaddleOCR.ocr() accepts a single image: one call per page
+                batch_texts = {n: self._ocr_paddle(img, n) for n, (img, _) in rendered.items()}
 
-        if engine == "tesseract":
-            return self._ocr_tesseract(img, page_num)
-        elif engine == "paddleocr":
-            return self._ocr_paddle(img, page_num)
+            for page_num, text in batch_texts.items():
+                texts[page_num] = text
+                if not text.startswith("[OCR FAILED"):
+                    self._write_cached_text(doc_hash, page_num, engine, text)
+        return texts
 
-        return ""
+    def _render_page(
+        self, page: Any, page_num: int, doc_hash: str
+    ) -> Tuple[Any, Optional[Path]]:
+        """Render a page at 2x for OCR (or load the cached render).
+
+        Returns:
+            Tuple of (PIL image, cached PNG path or None).
+        """
+        png_path = self._cache_path(doc_hash, page_num, ".png")
+        if png_path is not None and png_path.exists():
+            img = Image.open(png_path)
+            img.load()
+            return img, png_path
+
+        mat = fitz.Matrix(2.0, 2.0)  # 2x zoom for better OCR
+        pix = page.get_pixmap(matrix=mat)
+        img_bytes = pix.tobytes("png")
+        if png_path is not None:
+            try:
+                self._write_atomic(png_path, img_bytes)
+            except OSError as e:
+                logger.debug(f"Render cache write failed for page {page_num + 1}: {e}")
+                png_path = None
+        return Image.open(io.BytesIO(img_bytes)), png_path
 
     def _resolve_ocr_engine(self) -> str:
         """Determine which OCR engine to use."""
@@ -371,6 +574,46 @@ class LayoutPdfLoader(BaseLoader):
             return "tesseract"
         return "none"
 
+    def _ocr_tesseract_batch(self, rendered: Dict[int, Tuple[Any, Optional[Path]]]) -> Dict[int, str]:
+        """OCR several pages with one Tesseract run.
+
+        Tesseract reads a list file of image paths and separates the pages'
+        text with form feeds, so the language data is loaded once per
+        batch. Falls back to one run per page if the output cannot be split.
+        """
+        page_nums = list(rendered)
+        if len(page_nums) == 1:
+            n = page_nums[0]
+            return {n: self._ocr_tesseract(rendered[n][0], n)}
+
+        with tempfile.TemporaryDirectory(prefix="ocr_batch_") as tmp:
+            paths: List[str] = []
+            for n in page_nums:
+                img, png_path = rendered[n]
+                if png_path is None:
+                    png_path = Path(tmp) / f"p{n + 1:04d}.png"
+                    img.save(png_path)
+                paths.append(str(png_path))
+            list_file = Path(tmp) / "pages.txt"
+            list_file.write_text("\n".join(paths) + "\n", encoding="utf-8")
+            try:
+                output = pytesseract.image_to_string(str(list_file), lang="chi_sim+eng")
+            except Exception as e:
+                logger.warning(f"Batched Tesseract OCR failed, falling back to single pages: {e}")
+                output = None
+
+        parts = output.split("\f") if output is not None else []
+        if len(parts) == len(page_nums) + 1 and not parts[-1].strip():
+            parts = parts[:-1]
+        if len(parts) != len(page_nums):
+            return {n: self._ocr_tesseract(rendered[n][0], n) for n in page_nums}
+
+        logger.info(
+            f"Tesseract OCR pages {page_nums[0] + 1}-{page_nums[-1] + 1}: "
+            f"{sum(len(p) for p in parts)} chars"
+        )
+        return dict(zip(page_nums, parts))
+
     def _ocr_tesseract(self, img: Any, page_num: int) -> str:
         """OCR using Tesseract."""
         try:
@@ -481,6 +724,45 @@ class LayoutPdfLoader(BaseLoader):
             "render_method": "page_pixmap",
         }]
 
+    # ------------------------------------------------------------------
+    # Render / OCR cache
+    # ------------------------------------------------------------------
+
+    def _cache_path(self, doc_hash: str, page_num: int, suffix: str) -> Optional[Path]:
+        """Cache file of a page, keyed by document hash and page index."""
+        if self.render_cache_dir is None:
+            return None
+        return self.render_cache_dir / doc_hash[:16] / f"p{page_num + 1:04d}{suffix}"
+
+    def _read_cached_text(self, doc_hash: str, page_num: int, engine: str) -> Optional[str]:
+        path = self._cache_path(doc_hash, page_num, f".{engine}.txt")
+        if path is None or not path.exists():
+            return None
+        try:
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+    def _write_cached_text(self, doc_hash: str, page_num: int, engine: str, text: str) -> None:
+        """Cache a page's OCR text; its rendered PNG is no longer needed."""
+        path = self._cache_path(doc_hash, page_num, f".{engine}.txt")
+        if path is None:
+            return
+        try:
+            self._write_atomic(path, text.encode("utf-8"))
+            png_path = self._cache_path(doc_hash, page_num, ".png")
+            if png_path is not None and png_path.exists():
+                png_path.unlink()
+        except OSError as e:
+            logger.debug(f"OCR cache write failed for page {page_num + 1}: {e}")
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
     # ------------------------------------------------------------------
     # Utilities
     # ------------------------------------------------------------------
@@ -513,3 +795,52 @@ class LayoutPdfLoader(BaseLoader):
             image_storage_dir=self.image_storage_dir,
         )
         return fallback.load(path)
+
+
+# ─────────────────────────────────────────────────────────────────────────
+# Page worker pool
+# ─────────────────────────────────────────────────────────────────────────
+
+def _get_page_pool(workers: int) -> ProcessPoolExecutor:
+    """Get the shared page worker pool, (re)creating it for *workers*."""
+    global _page_pool, _page_pool_workers
+    with _page_pool_lock:
+        if _page_pool is None or _page_pool_workers != workers:
+            if _page_pool is not None:
+                _page_pool.shutdown(wait=False)
+            # Spawned, not forked: workers must not inherit the parent's locks
+            _page_pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+            _page_pool_workers = workers
+            logger.info(f"PDF page worker pool started (max_workers={workers})")
+        return _page_pool
+
+
+def shutdown_page_pool(wait: bool = True) -> None:
+    """Shut down the shared page worker pool (a new one is created on next use)."""
+    global _page_pool
+    with _page_pool_lock:
+        pool, _page_pool = _page_pool, None
+    if pool is not None:
+        pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def _load_page_range(
+    path: str,
+    doc_hash: str,
+    start: int,
+    stop: int,
+    options: Dict[str, Any],
+) -> List[PageResult]:
+    """Parse pages [start, stop) of a PDF (in a page worker process)."""
+    key = tuple(sorted(options.items()))
+    loader = _worker_loaders.get(key)
+    if loader is None:
+        loader = _worker_loaders[key] = LayoutPdfLoader(**options)
+    pdf_doc = fitz.open(path)
+    try:
+        return loader._load_pages(pdf_doc, range(start, stop), doc_hash)
+    finally:
+        pdf_doc.close()
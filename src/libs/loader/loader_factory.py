@@ -36,6 +36,7 @@ class LoaderFactory:
         image_storage_dir: str | Path = "data/images",
         vision_llm: Optional[Any] = None,
         pdf_parser: str = "markitdown",
+        layout_config: Optional[Any] = None,
     ) -> BaseLoader:
         """Create the appropriate loader for a given file.
 
@@ -45,6 +46,8 @@ class LoaderFactory:
             image_storage_dir: Base directory for storing extracted images.
             vision_llm: Optional Vision LLM instance for enhanced extraction.
             pdf_parser: PDF parsing backend: "markitdown", "layout", or "docling".
+            layout_config: Optional LayoutPdfConfig (ingestion.layout_pdf)
+                with page-parallel and OCR options for the layout parser.
 
         Returns:
             A BaseLoader instance appropriate for the file type.
@@ -75,10 +78,24 @@ class LoaderFactory:
             from src.libs.loader.layout_pdf_loader import LayoutPdfLoader
 
             logger.info("Using LayoutPdfLoader for PDF (layout analysis + OCR)")
+            layout_kwargs: dict[str, Any] = {}
+            if layout_config is not None:
+                from src.core.settings import resolve_path
+
+                layout_kwargs = {
+                    "page_workers": layout_config.page_workers,
+                    "min_pages_per_worker": layout_config.min_pages_per_worker,
+                    "ocr_batch_size": layout_config.ocr_batch_size,
+                    "render_cache_dir": (
+                        resolve_path(layout_config.render_cache_dir)
+                        if layout_config.render_cache_dir else None
+                    ),
+                }
             return LayoutPdfLoader(
                 extract_images=extract_images,
                 image_storage_dir=image_storage_dir,
                 vision_llm=vision_llm,
+                **layout_kwargs,
             )
 
         if suffix in (".pdf", ".docx", ".txt", ".md"):
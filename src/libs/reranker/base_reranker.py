@@ -25,6 +25,10 @@ class BaseReranker(ABC):
     - Fallback: Implementations should support safe degradation to original order.
     """
     
+    # True if a candidate's score depends only on (query, candidate text), not
+    # on the other candidates; CoreReranker then caches scores per pair.
+    pointwise: bool = False
+    
     @abstractmethod
     def rerank(
         self,
@@ -54,6 +58,15 @@ class BaseReranker(ABC):
         """
         pass
     
+    def score_fingerprint(self) -> str:
+        """Identify the scoring function for pair-level score caching.
+        
+        Returns:
+            String that changes whenever scores for the same pair would change
+            (backend, model, scoring options).
+        """
+        return type(self).__name__
+    
     def validate_query(self, query: str) -> None:
         """Validate the query string.
         
@@ -35,6 +35,8 @@ class CrossEncoderReranker(BaseReranker):
     - Deterministic Testing: Supports mock scorer injection for testing.
     """
     
+    pointwise = True
+    
     def __init__(
         self,
         settings: Any,
@@ -122,6 +124,15 @@ class CrossEncoderReranker(BaseReranker):
                 f"Failed to load Cross-Encoder model '{model_name}': {e}"
             ) from e
     
+    def score_fingerprint(self) -> str:
+        """Identify backend and model for pair-level score caching.
+        
+        Returns:
+            Fingerprint such as ``"cross_encoder:BAAI/bge-reranker-base"``.
+        """
+        model_name = getattr(getattr(self.settings, "rerank", None), "model", None)
+        return f"cross_encoder:{model_name or type(self.model).__name__}"
+    
     def rerank(
         self,
         query: str,
@@ -177,6 +188,33 @@ class CrossEncoderReranker(BaseReranker):
                 f"Cross-Encoder reranking failed: {e}"
             ) from e
     
+    def score_pairs(
+        self,
+        pairs: List[tuple[str, str]],
+        trace: Optional[Any] = None,
+    ) -> List[float]:
+        """Score (query, passage) pairs in one batched model call.
+        
+        The pairs may belong to different queries; CoreReranker.rerank_batch
+        uses this to score a whole batch of searches in one forward pass.
+        
+        Args:
+            pairs: List of (query, passage) tuples.
+            trace: Optional TraceContext for observability.
+        
+        Returns:
+            List of relevance scores (one per pair).
+        
+        Raises:
+            ValueError: If any query is invalid.
+            CrossEncoderRerankError: If scoring fails.
+        """
+        if not pairs:
+            return []
+        for query in {q for q, _ in pairs}:
+            self.validate_query(query)
+        return [float(s) for s in self._score_pairs(pairs, trace=trace)]
+    
     def _prepare_pairs(
         self,
         query: str,
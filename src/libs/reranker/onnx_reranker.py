@@ -0,0 +1,330 @@
+"""ONNX Runtime backend for the Cross-Encoder reranker.
+
+Runs the configured cross-encoder (default ``BAAI/bge-reranker-base``) with
+ONNX Runtime on CPU instead of fp32 PyTorch. On first use the Hugging Face
+checkpoint is exported to ONNX and quantized to int8 (dynamic quantization);
+later starts load the cached model directly.
+
+Scoring differs from ``CrossEncoder.predict`` in three ways that cut CPU time:
+- int8 weights (MatMul/Gemm run as integer kernels)
+- Pairs are sorted by token length and batched in buckets, so each batch
+  is padded only to its own longest pair
+- Passages are truncated to a token budget (``rerank.onnx.max_length``)
+
+Design Principles:
+- Drop-in: Subclasses CrossEncoderReranker; only model loading changes, the
+  rerank/score/sort flow is inherited
+- Cached export: ``<model_dir>/<model slug>/model[.int8].onnx`` plus the
+  tokenizer files, written once per model
+- Same score scale: single-logit models go through a sigmoid, as
+  sentence-transformers does, so rerank scores stay comparable
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.libs.reranker.cross_encoder_reranker import CrossEncoderReranker
+
+logger = logging.getLogger(__name__)
+
+FP32_FILENAME = "model.onnx"
+INT8_FILENAME = "model.int8.onnx"
+
+
+def default_num_threads() -> int:
+    """Intra-op thread count for ONNX Runtime on this machine.
+
+    Uses the physical core count when psutil is available (hyper-threads
+    do not speed up GEMM-bound inference), else half the logical CPUs.
+
+    Returns:
+        Number of threads (at least 1).
+    """
+    try:
+        import psutil
+
+        physical = psutil.cpu_count(logical=False)
+        if physical:
+            return physical
+    except ImportError:
+        pass
+    return max(1, (os.cpu_count() or 2) // 2)
+
+
+class OnnxCrossEncoder:
+    """ONNX Runtime cross-encoder with a ``predict(pairs)`` like sentence-transformers.
+
+    Example:
+        >>> model = OnnxCrossEncoder("BAAI/bge-reranker-base", "data/models/onnx")
+        >>> scores = model.predict([("query", "passage one"), ("query", "passage two")])
+    """
+
+    def __init__(
+        self,
+        model_name: str,
+        model_dir: str = "data/models/onnx",
+        quantize: bool = True,
+        num_threads: int = 0,
+        max_length: int = 384,
+        batch_size: int = 16,
+    ) -> None:
+        """Load (exporting and quantizing first if needed) the ONNX model.
+
+        Args:
+            model_name: Hugging Face model id, or a directory that already
+                holds ``model.onnx`` / ``model.int8.onnx`` and tokenizer files.
+            model_dir: Root directory for exported models.
+            quantize: Use the int8 dynamically quantized model.
+            num_threads: Intra-op threads; 0 picks default_num_threads().
+            max_length: Token budget per (query, passage) pair; the passage
+                is truncated to fit.
+            batch_size: Pairs per inference call.
+
+        Raises:
+            ImportError: If onnxruntime/transformers (or, for the first export,
+                torch/onnx) are not installed.
+            RuntimeError: If export or session creation fails.
+        """
+        if max_length < 8:
+            raise ValueError(f"max_length must be >= 8, got {max_length}")
+        if batch_size < 1:
+            raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+
+        self.model_name = model_name
+        self.quantize = quantize
+        self.num_threads = num_threads or default_num_threads()
+        self.max_length = max_length
+        self.batch_size = batch_size
+
+        try:
+            import onnxruntime as ort
+            from transformers import AutoTokenizer
+        except ImportError as e:
+            raise ImportError(
+                "onnxruntime and transformers are required for the ONNX reranker. "
+                "Install them with: pip install onnxruntime transformers"
+            ) from e
+
+        self.model_path = self._ensure_model(Path(model_dir))
+        self.tokenizer = AutoTokenizer.from_pretrained(str(self.model_path.parent))
+        self.pad_token_id = self.tokenizer.pad_token_id or 0
+
+        options = ort.SessionOptions()
+        options.intra_op_num_threads = self.num_threads
+        options.inter_op_num_threads = 1
+        options.execution_mode = ort.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(
+            str(self.model_path), sess_options=options, providers=["CPUExecutionProvider"]
+        )
+        self.input_names = {i.name for i in self.session.get_inputs()}
+        logger.info(
+            f"ONNX reranker loaded: {self.model_path} "
+            f"(threads={self.num_threads}, max_length={self.max_length})"
+        )
+
+    def predict(self, pairs: Sequence[Tuple[str, str]], batch_size: Optional[int] = None) -> np.ndarray:
+        """Score (query, passage) pairs.
+
+        Args:
+            pairs: Sequence of (query, passage) tuples.
+            batch_size: Optional override of the configured batch size.
+
+        Returns:
+            Array of relevance scores aligned with *pairs*.
+        """
+        if not pairs:
+            return np.zeros(0, dtype=np.float32)
+
+        encoded = self.tokenizer(
+            [q for q, _ in pairs],
+            [p for _, p in pairs],
+            truncation="longest_first",
+            max_length=self.max_length,
+            padding=False,
+        )
+        input_ids: List[List[int]] = encoded["input_ids"]
+        token_type_ids: Optional[List[List[int]]] = encoded.get("token_type_ids")
+
+        # Length buckets: neighbours in sorted order have similar lengths
+        order = np.argsort([len(ids) for ids in input_ids], kind="stable")
+        scores = np.zeros(len(pairs), dtype=np.float32)
+        size = batch_size or self.batch_size
+        for start in range(0, len(order), size):
+            batch = order[start:start + size]
+            feeds = self._pad_batch(input_ids, token_type_ids, batch)
+            logits = self.session.run(None, feeds)[0]
+            scores[batch] = self._logits_to_scores(logits)
+        return scores
+
+    # ===== Private Helper Methods =====
+
+    def _pad_batch(
+        self,
+        input_ids: List[List[int]],
+        token_type_ids: Optional[List[List[int]]],
+        batch: np.ndarray,
+    ) -> Dict[str, np.ndarray]:
+        """Build padded int64 input arrays for one length bucket."""
+        width = max(len(input_ids[i]) for i in batch)
+        ids = np.full((len(batch), width), self.pad_token_id, dtype=np.int64)
+        mask = np.zeros((len(batch), width), dtype=np.int64)
+        types = np.zeros((len(batch), width), dtype=np.int64)
+        for row, i in enumerate(batch):
+            length = len(input_ids[i])
+            ids[row, :length] = input_ids[i]
+            mask[row, :length] = 1
+            if token_type_ids is not None:
+                types[row, :length] = token_type_ids[i]
+
+        feeds = {"input_ids": ids, "attention_mask": mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = types
+        return feeds
+
+    @staticmethod
+    def _logits_to_scores(logits: np.ndarray) -> np.ndarray:
+        """Map logits to scores the way sentence-transformers' CrossEncoder does."""
+        logits = logits.astype(np.float32)
+        if logits.ndim == 1 or logits.shape[1] == 1:
+            return 1.0 / (1.0 + np.exp(-logits.reshape(-1)))
+        exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+        return (exp / exp.sum(axis=1, keepdims=True))[:, -1]
+
+    def _ensure_model(self, model_dir: Path) -> Path:
+        """Return the ONNX model path, exporting/quantizing it if missing."""
+        local = Path(self.model_name)
+        target_dir = local if local.is_dir() else model_dir / _model_slug(self.model_name)
+        fp32_path = target_dir / FP32_FILENAME
+        int8_path = target_dir / INT8_FILENAME
+
+        if self.quantize and int8_path.exists():
+            return int8_path
+        if not fp32_path.exists():
+            self._export(target_dir)
+        if not self.quantize:
+            return fp32_path
+
+        try:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+        except ImportError as e:
+            raise ImportError(
+                "onnx is required to quantize the reranker. Install it with: pip install onnx"
+            ) from e
+
+        logger.info(f"Quantizing reranker to int8: {int8_path}")
+        quantize_dynamic(str(fp32_path), str(int8_path), weight_type=QuantType.QInt8)
+        return int8_path
+
+    def _export(self, target_dir: Path) -> None:
+        """Export the Hugging Face checkpoint and its tokenizer to *target_dir*."""
+        try:
+            import torch
+            from transformers import AutoModelForSequenceClassification, AutoTokenizer
+        except ImportError as e:
+            raise ImportError(
+                "torch and transformers are required to export the reranker to ONNX. "
+                "Install them with: pip install torch transformers"
+            ) from e
+
+        logger.info(f"Exporting Cross-Encoder to ONNX: {self.model_name} -> {target_dir}")
+        target_dir.mkdir(parents=True, exist_ok=True)
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name)
+        model = AutoModelForSequenceClassification.from_pretrained(self.model_name)
+        model.eval()
+
+        sample = tokenizer(["query"], ["passage"], return_tensors="pt")
+        input_names = [n for n in ("input_ids", "attention_mask", "token_type_ids") if n in sample]
+        dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in input_names}
+        dynamic_axes["logits"] = {0: "batch"}
+
+        tmp_path = target_dir / f"{FP32_FILENAME}.tmp"
+        try:
+            with torch.no_grad():
+                torch.onnx.export(
+                    model,
+                    tuple(sample[name] for name in input_names),
+                    str(tmp_path),
+                    input_names=input_names,
+                    output_names=["logits"],
+                    dynamic_axes=dynamic_axes,
+                    opset_version=17,
+                    dynamo=False,
+                )
+        except Exception as e:
+            tmp_path.unlink(missing_ok=True)
+            raise RuntimeError(f"ONNX export of '{self.model_name}' failed: {e}") from e
+        os.replace(tmp_path, target_dir / FP32_FILENAME)
+        tokenizer.save_pretrained(str(target_dir))
+
+
+def _model_slug(model_name: str) -> str:
+    """Directory name for an exported model (``BAAI/bge-reranker-base`` -> ``BAAI--bge-reranker-base``)."""
+    return re.sub(r"[^A-Za-z0-9._-]+", "--", model_name).strip("-")
+
+
+class OnnxCrossEncoderReranker(CrossEncoderReranker):
+    """Cross-Encoder reranker running an int8 ONNX model on CPU.
+
+    Configured by ``rerank.model`` and the ``rerank.onnx`` section of
+    settings.yaml; registered in RerankerFactory as provider ``onnx``.
+    """
+
+    def score_fingerprint(self) -> str:
+        """Identify model, precision and token budget for pair-level score caching.
+
+        Returns:
+            Fingerprint such as ``"onnx:BAAI/bge-reranker-base:int8:384"``.
+        """
+        model = self.model
+        precision = "int8" if getattr(model, "quantize", True) else "fp32"
+        return (
+            f"onnx:{getattr(model, 'model_name', type(model).__name__)}:"
+            f"{precision}:{getattr(model, 'max_length', '')}"
+        )
+
+    def _load_cross_encoder_model(self, model_name: str) -> Any:
+        """Load the ONNX model (exported and quantized on first use).
+
+        Args:
+            model_name: Hugging Face model id or directory of an exported model.
+
+        Returns:
+            OnnxCrossEncoder instance.
+        """
+        onnx_settings = getattr(self.settings.rerank, "onnx", None)
+        options: Dict[str, Any] = {}
+        if onnx_settings is not None:
+            options = {
+                "model_dir": _resolve_dir(onnx_settings.model_dir),
+                "quantize": onnx_settings.quantize,
+                "num_threads": onnx_settings.num_threads,
+                "max_length": onnx_settings.max_length,
+                "batch_size": onnx_settings.batch_size,
+            }
+        # Explicit constructor kwargs (e.g. from the comparison script) win
+        for key in ("model_dir", "quantize", "num_threads", "max_length", "batch_size"):
+            if key in self.kwargs:
+                options[key] = self.kwargs[key]
+        try:
+            return OnnxCrossEncoder(model_name, **options)
+        except ImportError:
+            raise
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to load ONNX Cross-Encoder model '{model_name}': {e}"
+            ) from e
+
+
+def _resolve_dir(path: str) -> str:
+    """Resolve a repo-relative model directory."""
+    from src.core.settings import resolve_path
+
+    return str(resolve_path(path))
@@ -27,6 +27,12 @@ def _lazy_import_cross_encoder_reranker():
     return CrossEncoderReranker
 
 
+def _lazy_import_onnx_reranker():
+    """Lazy import to avoid circular dependencies."""
+    from src.libs.reranker.onnx_reranker import OnnxCrossEncoderReranker
+    return OnnxCrossEncoderReranker
+
+
 class RerankerFactory:
     """Factory for creating Reranker provider instances.
     
@@ -85,6 +91,11 @@ class RerankerFactory:
             CrossEncoderReranker = _lazy_import_cross_encoder_reranker()
             cls.register_provider("cross_encoder", CrossEncoderReranker)
         
+        # Lazy register ONNX Runtime Cross-Encoder reranker
+        if "onnx" not in cls._PROVIDERS:
+            OnnxCrossEncoderReranker = _lazy_import_onnx_reranker()
+            cls.register_provider("onnx", OnnxCrossEncoderReranker)
+        
         try:
             rerank_settings = settings.rerank
             if rerank_settings is None:
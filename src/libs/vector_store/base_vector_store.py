@@ -101,6 +101,36 @@ class BaseVectorStore(ABC):
         """
         pass
     
+    def query_batch(
+        self,
+        vectors: List[List[float]],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        trace: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> List[List[Dict[str, Any]]]:
+        """Query the vector store with several vectors at once.
+        
+        Default implementation calls query() once per vector. Providers whose
+        backend accepts multiple query vectors in one request (e.g. ChromaDB)
+        should override this.
+        
+        Args:
+            vectors: Query vectors.
+            top_k: Maximum number of results per vector.
+            filters: Optional metadata filters applied to every vector.
+            trace: Optional TraceContext for observability.
+            **kwargs: Provider-specific parameters.
+        
+        Returns:
+            One result list per input vector, in input order (same record
+            format as query()).
+        """
+        return [
+            self.query(vector, top_k=top_k, filters=filters, trace=trace, **kwargs)
+            for vector in vectors
+        ]
+    
     def validate_records(self, records: List[Dict[str, Any]]) -> None:
         """Validate records before upsert.
         
@@ -223,7 +253,8 @@ class BaseVectorStore(ABC):
         Args:
             ids: List of record IDs to retrieve.
             trace: Optional TraceContext for observability (reserved for Stage F).
-            **kwargs: Provider-specific parameters.
+            **kwargs: Provider-specific parameters. Providers that can return
+                stored embeddings accept ``include_vectors=True``.
         
         Returns:
             List of records in the same order as input ids.
@@ -231,6 +262,7 @@ class BaseVectorStore(ABC):
                 - 'id': Record identifier
                 - 'text': The stored text content
                 - 'metadata': Associated metadata
+                - 'vector': Stored embedding (only with include_vectors=True)
             If an ID is not found, an empty dict is returned for that position.
         
         Raises:
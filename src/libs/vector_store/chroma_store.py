@@ -340,10 +340,69 @@ class ChromaStore(BaseVectorStore):
         # Build ChromaDB where clause from filters
         where_clause = self._build_where_clause(filters) if filters else None
         
-        # Perform query with auto-restore on HNSW corruption
+        results = self._query_collection([vector], top_k, where_clause)
+        output = self._transform_query_results(results, 0)
+        
+        logger.debug(f"Query returned {len(output)} results")
+        return output
+    
+    def query_batch(
+        self,
+        vectors: List[List[float]],
+        top_k: int = 10,
+        filters: Optional[Dict[str, Any]] = None,
+        trace: Optional[Any] = None,
+        **kwargs: Any,
+    ) -> List[List[Dict[str, Any]]]:
+        """Query ChromaDB with several vectors in a single request.
+        
+        ChromaDB accepts a list of ``query_embeddings`` and searches them
+        together, so N query variants cost one round trip instead of N.
+        
+        Args:
+            vectors: Query vectors.
+            top_k: Maximum number of results per vector.
+            filters: Optional metadata filters applied to every vector.
+            trace: Optional TraceContext for observability.
+            **kwargs: Provider-specific parameters (unused for Chroma).
+        
+        Returns:
+            One result list per input vector, in input order.
+        
+        Raises:
+            ValueError: If a vector is empty or top_k is invalid.
+            RuntimeError: If the query operation fails.
+        """
+        if not vectors:
+            return []
+        for vector in vectors:
+            self.validate_query_vector(vector, top_k)
+        
+        where_clause = self._build_where_clause(filters) if filters else None
+        
+        results = self._query_collection(vectors, top_k, where_clause)
+        outputs = [self._transform_query_results(results, i) for i in range(len(vectors))]
+        
+        logger.debug(
+            f"Batch query ({len(vectors)} vectors) returned "
+            f"{sum(len(o) for o in outputs)} results"
+        )
+        return outputs
+    
+    def _query_collection(
+        self,
+        vectors: List[List[float]],
+        top_k: int,
+        where_clause: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Run a collection query with auto-restore on HNSW corruption.
+        
+        Raises:
+            RuntimeError: If the query fails (also after a restore attempt).
+        """
         try:
-            results = self.collection.query(
-                query_embeddings=[vector],
+            return self.collection.query(
+                query_embeddings=vectors,
                 n_results=top_k,
                 where=where_clause,
                 include=["metadatas", "distances", "documents"]
@@ -355,8 +414,8 @@ class ChromaStore(BaseVectorStore):
                 if self._try_restore_from_backup():
                     # Retry query once after restore
                     try:
-                        results = self.collection.query(
-                            query_embeddings=[vector],
+                        return self.collection.query(
+                            query_embeddings=vectors,
                             n_results=top_k,
                             where=where_clause,
                             include=["metadatas", "distances", "documents"]
@@ -373,16 +432,26 @@ class ChromaStore(BaseVectorStore):
                 raise RuntimeError(
                     f"Failed to query ChromaDB with top_k={top_k}: {e}"
                 ) from e
+    
+    @staticmethod
+    def _transform_query_results(results: Dict[str, Any], index: int) -> List[Dict[str, Any]]:
+        """Convert the *index*-th result set of a Chroma query to records.
+        
+        Args:
+            results: Raw ``collection.query`` output (nested per query vector).
+            index: Which query vector's results to convert.
         
-        # Transform results to standard format
-        # ChromaDB returns nested lists: [[id1, id2, ...]]
+        Returns:
+            Records sorted by similarity (descending).
+        """
+        # ChromaDB returns nested lists: [[id1, id2, ...], ...] per query vector
         output = []
         
-        if results and results['ids'] and results['ids'][0]:
-            ids = results['ids'][0]
-            distances = results['distances'][0] if 'distances' in results else [0.0] * len(ids)
-            metadatas = results['metadatas'][0] if 'metadatas' in results else [{}] * len(ids)
-            documents = results['documents'][0] if 'documents' in results else [''] * len(ids)
+        if results and results['ids'] and len(results['ids']) > index and results['ids'][index]:
+            ids = results['ids'][index]
+            distances = results['distances'][index] if results.get('distances') else [0.0] * len(ids)
+            metadatas = results['metadatas'][index] if results.get('metadatas') else [{}] * len(ids)
+            documents = results['documents'][index] if results.get('documents') else [''] * len(ids)
             
             for i, record_id in enumerate(ids):
                 # Convert distance to similarity score
@@ -398,7 +467,6 @@ class ChromaStore(BaseVectorStore):
                     'metadata': metadatas[i] if metadatas[i] else {}
                 })
         
-        logger.debug(f"Query returned {len(output)} results")
         return output
     
     def delete(
@@ -589,7 +657,7 @@ class ChromaStore(BaseVectorStore):
         Args:
             ids: List of record IDs to retrieve.
             trace: Optional TraceContext for observability.
-            **kwargs: Provider-specific parameters (unused for Chroma).
+            **kwargs: ``include_vectors=True`` also returns stored embeddings.
         
         Returns:
             List of records in the same order as input ids.
@@ -597,6 +665,7 @@ class ChromaStore(BaseVectorStore):
                 - 'id': Record identifier
                 - 'text': The stored text content
                 - 'metadata': Associated metadata
+                - 'vector': Stored embedding (only with include_vectors=True)
             If an ID is not found, an empty dict is returned for that position.
         
         Raises:
@@ -608,12 +677,16 @@ class ChromaStore(BaseVectorStore):
         
         # Ensure all IDs are strings
         str_ids = [str(id_) for id_ in ids]
+        include_vectors = bool(kwargs.get("include_vectors", False))
+        include = ["metadatas", "documents"]
+        if include_vectors:
+            include.append("embeddings")
         
         try:
             # ChromaDB's get method retrieves records by IDs
             results = self.collection.get(
                 ids=str_ids,
-                include=["metadatas", "documents"]
+                include=include
             )
         except (RuntimeError, ValueError) as e:
             raise RuntimeError(
@@ -627,6 +700,7 @@ class ChromaStore(BaseVectorStore):
             result_ids = results['ids']
             documents = results.get('documents', [None] * len(result_ids))
             metadatas = results.get('metadatas', [{}] * len(result_ids))
+            embeddings = results.get('embeddings') if include_vectors else None
             
             for i, record_id in enumerate(result_ids):
                 id_to_result[record_id] = {
@@ -634,6 +708,12 @@ class ChromaStore(BaseVectorStore):
                     'text': documents[i] if documents and documents[i] else '',
                     'metadata': metadatas[i] if metadatas and metadatas[i] else {}
                 }
+                if embeddings is not None and embeddings[i] is not None:
+                    # Newer chromadb returns numpy arrays
+                    vector = embeddings[i]
+                    id_to_result[record_id]['vector'] = (
+                        vector.tolist() if hasattr(vector, 'tolist') else list(vector)
+                    )
         
         # Return results in the same order as input ids
         output = []
@@ -22,11 +22,12 @@ from typing import Any, Dict, List, Optional, TYPE_CHECKING
 from mcp import types
 
 from src.core.response.response_builder import ResponseBuilder, MCPToolResponse
-from src.core.settings import load_settings, resolve_path, Settings
+from src.core.settings import load_settings, Settings
 from src.core.trace import TraceContext, TraceCollector
 from src.core.types import RetrievalResult
 
 if TYPE_CHECKING:
+    from src.core.query_engine.engine_pool import HybridSearchPool
     from src.core.query_engine.hybrid_search import HybridSearch
     from src.core.query_engine.reranker import CoreReranker
 
@@ -124,12 +125,12 @@ class QueryKnowledgeHubTool:
         self.config = config or QueryKnowledgeHubConfig()
         self._hybrid_search = hybrid_search
         self._reranker = reranker
-        self._embedding_client = None
+        self._pool: Optional[HybridSearchPool] = None
         self._response_builder = response_builder or ResponseBuilder()
         self._suggested_generator: Optional[SuggestedQuestionGenerator] = None
         
-        # Track initialization state
-        self._initialized = False
+        # Track initialization state (a pre-configured engine skips the pool)
+        self._initialized = hybrid_search is not None
         self._current_collection: Optional[str] = None
     
     @property
@@ -139,106 +140,53 @@ class QueryKnowledgeHubTool:
             self._settings = load_settings()
         return self._settings
     
-    def _ensure_initialized(self, collection: str) -> None:
-        """Ensure search components are initialized for the given collection.
+    def _ensure_initialized(self, collection: str) -> HybridSearch:
+        """Return the search engine for the given collection.
         
-        Caching strategy (balances speed vs freshness):
-        - **Fully cached** (stateless, never go stale): embedding client,
-          reranker, query processor, settings.
-        - **Cached until collection changes**: vector store (ChromaDB
+        Engines come from a per-collection LRU pool
+        (:class:`~src.core.query_engine.engine_pool.HybridSearchPool`), so
+        switching between collections reuses warm engines instead of
+        rebuilding them:
+        
+        - **Shared across engines** (stateless): embedding client,
+          reranker model, LLM (query rewriting + strategy routing).
+        - **Cached per collection**: vector store (ChromaDB
           PersistentClient reads from SQLite — sees data written by other
           processes), dense retriever, hybrid search.
-        - **Auto-refreshes on every query**: BM25 sparse index — the
-          ``SparseRetriever._ensure_index_loaded()`` always reloads from
-          disk, so the cached SparseRetriever object is fine.
+        - **Auto-refreshes on change**: BM25 sparse index — the
+          ``SparseRetriever._ensure_index_loaded()`` checks the on-disk
+          generation on every query and reloads only when it changed,
+          so pooled engines pick up dashboard-written data.
         
-        Only when *collection* changes do we tear down and rebuild.
+        A HybridSearch passed to the constructor is used as-is.
         
         Args:
             collection: Target collection name.
-        """
-        # Always rebuild vector_store and retriever components so that
-        # data ingested by other processes (e.g. Dashboard) is visible
-        # immediately without requiring an MCP Server restart.
-        
-        logger.info(f"Initializing query components for collection: {collection}")
         
-        # Import here to avoid circular imports and allow lazy loading
-        from src.core.query_engine.query_processor import QueryProcessor
-        from src.core.query_engine.hybrid_search import create_hybrid_search
-        from src.core.query_engine.dense_retriever import create_dense_retriever
-        from src.core.query_engine.sparse_retriever import create_sparse_retriever
-        from src.core.query_engine.reranker import create_core_reranker
-        from src.ingestion.storage.bm25_indexer import BM25Indexer
-        from src.libs.embedding.embedding_factory import EmbeddingFactory
-        from src.libs.vector_store.vector_store_factory import VectorStoreFactory
-        from src.libs.llm.llm_factory import LLMFactory
-        from src.ingestion.storage.parent_store import ParentStore
-        from src.ingestion.storage.graph_store import GraphStore
-        from src.core.query_engine.strategy_router import StrategyRouter
+        Returns:
+            HybridSearch engine for *collection*.
+        """
+        if self._initialized and self._pool is None:
+            return self._hybrid_search
         
-        # === Fully cached components (stateless, never go stale) ===
-        if self._embedding_client is None:
-            self._embedding_client = EmbeddingFactory.create(self.settings)
+        if self._pool is None:
+            from src.core.query_engine.engine_pool import HybridSearchPool
+            
+            # Reranking is applied by this tool (see _apply_rerank), so
+            # engines are built without one and share the pool's model.
+            self._pool = HybridSearchPool(
+                self.settings,
+                attach_reranker=False,
+                enable_query_rewrite=True,
+            )
         
         if self._reranker is None:
-            self._reranker = create_core_reranker(settings=self.settings)
-        
-        # === Rebuild for new collection ===
-        # ChromaDB PersistentClient uses SQLite under the hood —
-        # concurrent readers see committed writes from other processes
-        # (dashboard ingestion), so caching the client is safe.
-        vector_store = VectorStoreFactory.create(
-            self.settings,
-            collection_name=collection,
-        )
-        
-        dense_retriever = create_dense_retriever(
-            settings=self.settings,
-            embedding_client=self._embedding_client,
-            vector_store=vector_store,
-        )
-        
-        # BM25Indexer just holds the index dir path; the SparseRetriever
-        # calls _ensure_index_loaded() on every search, which always
-        # reloads from disk — so it picks up dashboard-written data.
-        bm25_indexer = BM25Indexer(index_dir=str(resolve_path(f"data/db/bm25/{collection}")))
-        sparse_retriever = create_sparse_retriever(
-            settings=self.settings,
-            bm25_indexer=bm25_indexer,
-            vector_store=vector_store,
-        )
-        sparse_retriever.default_collection = collection
-        
-        query_processor = QueryProcessor()
-        self._hybrid_search = create_hybrid_search(
-            settings=self.settings,
-            query_processor=query_processor,
-            dense_retriever=dense_retriever,
-            sparse_retriever=sparse_retriever,
-        )
-        
-        # === Inject Retrieval Augmentation Components ===
-        # 1. Parent Store (SQLite)
-        parent_db_path = str(resolve_path(f"data/db/parent_store/{collection}.db"))
-        self._hybrid_search.parent_store = ParentStore(db_path=parent_db_path)
-        
-        # 2. Graph Store (SQLite)
-        graph_db_path = str(resolve_path(f"data/db/graph_store/{collection}.db"))
-        self._hybrid_search.graph_store = GraphStore(db_path=graph_db_path)
-        
-        # 3. Strategy Router (LLM-driven)
-        try:
-            # Re-use or create LLM for intent recognition
-            llm = LLMFactory.create(self.settings)
-            self._hybrid_search.strategy_router = StrategyRouter(settings=self.settings, llm=llm)
-        except Exception as e:
-            logger.warning(f"Failed to initialize StrategyRouter with LLM: {e}")
-            self._hybrid_search.strategy_router = StrategyRouter(settings=self.settings)
+            self._reranker = self._pool.reranker
         
+        engine = self._pool.get(collection)
+        self._hybrid_search = engine
         self._current_collection = collection
-        self._initialized = True
-        logger.info(f"Query components initialized for collection: {collection}")
+        return engine
     
     async def execute(
         self,
@@ -284,14 +232,18 @@ class QueryKnowledgeHubTool:
         logger.info(f"[Thinking] Initializing: Setting up retrieval components for {effective_collection}...")
         try:
             # Initialize components for collection
-            await asyncio.to_thread(self._ensure_initialized, effective_collection)
+            engine = await asyncio.to_thread(self._ensure_initialized, effective_collection)
             
             # Perform hybrid search
-            results = await asyncio.to_thread(self._perform_search, query, effective_top_k, trace)
+            results = await asyncio.to_thread(
+                self._perform_search, query, effective_top_k, trace, engine
+            )
             
             # Apply reranking if enabled
             if self.config.enable_rerank and results:
-                results = await asyncio.to_thread(self._apply_rerank, query, results, effective_top_k, trace)
+                results = await asyncio.to_thread(
+                    self._apply_rerank, query, results, effective_top_k, trace, effective_collection
+                )
             
             # Build response
             logger.info("[Thinking] Finalizing: Assembling formatted response...")
@@ -346,6 +298,7 @@ class QueryKnowledgeHubTool:
         query: str,
         top_k: int,
         trace: Optional[Any] = None,
+        hybrid_search: Optional[HybridSearch] = None,
     ) -> List[RetrievalResult]:
         """Perform hybrid search.
         
@@ -353,18 +306,20 @@ class QueryKnowledgeHubTool:
             query: Search query.
             top_k: Maximum results.
             trace: Optional TraceContext for observability.
+            hybrid_search: Engine to use (defaults to the last initialized one).
             
         Returns:
             List of RetrievalResult.
         """
-        if self._hybrid_search is None:
+        hybrid_search = hybrid_search or self._hybrid_search
+        if hybrid_search is None:
             raise RuntimeError("HybridSearch not initialized")
         
         # Use a larger initial retrieval for reranking
         initial_top_k = top_k * 2 if self.config.enable_rerank else top_k
         
         try:
-            results = self._hybrid_search.search(
+            results = hybrid_search.search(
                 query=query,
                 top_k=initial_top_k,
                 filters=None,
@@ -382,6 +337,7 @@ class QueryKnowledgeHubTool:
         results: List[RetrievalResult],
         top_k: int,
         trace: Optional[Any] = None,
+        collection: Optional[str] = None,
     ) -> List[RetrievalResult]:
         """Apply reranking to search results.
         
@@ -390,6 +346,7 @@ class QueryKnowledgeHubTool:
             results: Search results to rerank.
             top_k: Final number of results.
             trace: Optional TraceContext for observability.
+            collection: Collection the results came from (rerank cache scope).
             
         Returns:
             Reranked results (or original if reranking fails).
@@ -403,6 +360,7 @@ class QueryKnowledgeHubTool:
                 results=results,
                 top_k=top_k,
                 trace=trace,
+                collection=collection,
             )
             
             if rerank_result.used_fallback:
@@ -50,7 +50,7 @@ class DataService:
 
         from src.core.settings import load_settings, resolve_path
         from src.ingestion.document_manager import DocumentManager
-        from src.ingestion.storage.bm25_indexer import BM25Indexer
+        from src.ingestion.storage.sparse_index_factory import create_sparse_indexer
         from src.ingestion.storage.image_storage import ImageStorage
         from src.libs.loader.file_integrity import SQLiteIntegrityChecker
         from src.libs.vector_store.vector_store_factory import VectorStoreFactory
@@ -60,7 +60,7 @@ class DataService:
         chroma = VectorStoreFactory.create(
             settings, collection_name=target_collection
         )
-        bm25 = BM25Indexer(index_dir=str(resolve_path(f"data/db/bm25/{target_collection}")))
+        bm25 = create_sparse_indexer(settings, target_collection)
         images = ImageStorage(
             db_path=str(resolve_path("data/db/image_index.db")),
             images_root=str(resolve_path("data/images")),
@@ -127,11 +127,21 @@ class DataService:
     def get_chunks(
         self, source_hash: str, collection: Optional[str] = None
     ) -> List[Dict[str, Any]]:
-        """Return chunk records from ChromaDB matching *source_hash*.
+        """Return chunk records matching *source_hash*.
 
+        Reads the local chunk docstore, falling back to ChromaDB for
+        documents ingested before the docstore existed.
         Each dict has keys: id, text, metadata.
         """
         self._ensure_stores(collection)
+        try:
+            from src.ingestion.storage.chunk_docstore import get_chunk_docstore
+
+            chunks = get_chunk_docstore(self._current_collection).list_by_doc_hash(source_hash)
+            if chunks:
+                return chunks
+        except Exception as exc:
+            logger.warning("Docstore lookup failed for %s: %s", source_hash, exc)
         try:
             results = self._chroma.collection.get(
                 where={"doc_hash": source_hash},
@@ -227,16 +237,29 @@ class DataService:
         except Exception as exc:
             summary["errors"].append(f"ChromaDB: {exc}")
 
-        # 2. Clear BM25 indexes (remove entire bm25 directory)
+        # 2. Clear sparse indexes (remove every provider's index root)
         try:
-            bm25_dir = resolve_path("data/db/bm25")
-            if bm25_dir.exists():
-                shutil.rmtree(bm25_dir)
-                bm25_dir.mkdir(parents=True, exist_ok=True)
+            from src.ingestion.storage.sparse_index_factory import sparse_index_roots
+
+            for index_dir in sparse_index_roots():
+                if index_dir.exists():
+                    shutil.rmtree(index_dir)
+                    index_dir.mkdir(parents=True, exist_ok=True)
             summary["bm25_cleared"] = True
         except Exception as exc:
             summary["errors"].append(f"BM25: {exc}")
 
+        # 2b. Clear chunk docstores
+        try:
+            from src.ingestion.storage.chunk_docstore import close_chunk_docstores
+
+            close_chunk_docstores()
+            docstore_dir = resolve_path("data/db/docstore")
+            if docstore_dir.exists():
+                shutil.rmtree(docstore_dir)
+        except Exception as exc:
+            summary["errors"].append(f"Docstore: {exc}")
+
         # 3. Clear image storage (SQLite DB + image files)
         try:
             img_db = resolve_path("data/db/image_index.db")
@@ -17,7 +17,7 @@ import logging
 import time
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from src.libs.evaluator.base_evaluator import BaseEvaluator
 
@@ -143,7 +143,7 @@ class EvalRunner:
 
     This class orchestrates:
     1. Loading the golden test set
-    2. Running HybridSearch for each query
+    2. Running HybridSearch for all queries (batched via search_batch)
     3. Optionally generating answers
     4. Invoking the evaluator to score each result
     5. Aggregating metrics into an EvalReport
@@ -194,13 +194,20 @@ class EvalRunner:
         test_set_path: str | Path,
         top_k: int = 10,
         collection: Optional[str] = None,
+        batch_size: int = 32,
     ) -> EvalReport:
         """Run evaluation on the golden test set.
 
+        Retrieval runs in batches of ``batch_size`` queries through
+        ``HybridSearch.search_batch`` (one embedding call, vector search,
+        BM25 pass and rerank per batch); search engines without it are
+        queried one test case at a time.
+
         Args:
             test_set_path: Path to golden_test_set.json.
             top_k: Number of chunks to retrieve per query.
             collection: Optional collection name filter.
+            batch_size: Number of queries retrieved per batch.
 
         Returns:
             EvalReport with per-query and aggregate metrics.
@@ -229,6 +236,10 @@ class EvalRunner:
 
         t0 = time.monotonic()
 
+        retrieved = self._retrieve_batch(
+            [tc.query for tc in test_cases], top_k, max(1, batch_size)
+        )
+
         for idx, tc in enumerate(test_cases):
             logger.info("Evaluating [%d/%d]: %s", idx + 1, len(test_cases), tc.query[:60])
             # Use user-provided answer override if available for this index
@@ -236,6 +247,7 @@ class EvalRunner:
             qr = self._evaluate_single(
                 tc, top_k=top_k, collection=collection,
                 answer_override=answer_override,
+                retrieved=retrieved[idx] if retrieved is not None else None,
             )
             report.query_results.append(qr)
 
@@ -256,6 +268,7 @@ class EvalRunner:
         top_k: int = 10,
         collection: Optional[str] = None,
         answer_override: Optional[str] = None,
+        retrieved: Optional[Tuple[List[Any], float]] = None,
     ) -> QueryResult:
         """Evaluate a single test case.
 
@@ -265,6 +278,8 @@ class EvalRunner:
             collection: Optional collection filter.
             answer_override: User-provided answer text. When set, used
                 instead of auto-generated answer from chunks.
+            retrieved: Chunks and retrieval latency (ms) from a batch
+                retrieval; if None, the chunks are retrieved here.
 
         Returns:
             QueryResult with metrics for this test case.
@@ -272,8 +287,12 @@ class EvalRunner:
         t0 = time.monotonic()
         qr = QueryResult(query=test_case.query)
 
-        # Step 1: Retrieve chunks
-        retrieved_chunks = self._retrieve(test_case.query, top_k, collection)
+        # Step 1: Retrieve chunks (unless retrieved with the batch)
+        retrieval_ms = 0.0
+        if retrieved is not None:
+            retrieved_chunks, retrieval_ms = retrieved
+        else:
+            retrieved_chunks = self._retrieve(test_case.query, top_k, collection)
         qr.retrieved_chunk_ids = [
             self._get_chunk_id(c) for c in retrieved_chunks
         ]
@@ -305,9 +324,85 @@ class EvalRunner:
             logger.warning("Evaluation failed for '%s': %s", test_case.query[:40], exc)
             qr.metrics = {}
 
-        qr.elapsed_ms = (time.monotonic() - t0) * 1000.0
+        qr.elapsed_ms = retrieval_ms + (time.monotonic() - t0) * 1000.0
         return qr
 
+    def _retrieve_batch(
+        self,
+        queries: List[str],
+        top_k: int,
+        batch_size: int,
+    ) -> Optional[List[Tuple[List[Any], float]]]:
+        """Retrieve chunks for all queries with HybridSearch.search_batch.
+
+        Each batch is reranked with one ``rerank_batch`` call when a
+        reranker is configured and supports it.
+
+        Returns:
+            (chunks, retrieval latency in ms) per query, or None if the
+            search engine has no ``search_batch`` (callers then retrieve
+            one query at a time).
+        """
+        search_batch = getattr(self.hybrid_search, "search_batch", None)
+        if not callable(search_batch):
+            return None
+
+        has_reranker = self.reranker is not None and getattr(self.reranker, 'is_enabled', False)
+        initial_top_k = top_k * 2 if has_reranker else top_k
+
+        retrieved: List[Tuple[List[Any], float]] = []
+        for start in range(0, len(queries), batch_size):
+            batch = queries[start:start + batch_size]
+            try:
+                items = search_batch(batch, top_k=initial_top_k)
+            except Exception as exc:
+                logger.warning(
+                    "Batch retrieval failed for queries %d-%d: %s",
+                    start + 1, start + len(batch), exc,
+                )
+                retrieved.extend(([], 0.0) for _ in batch)
+                continue
+
+            results: List[List[Any]] = []
+            latencies: List[float] = []
+            for item in items:
+                if item.error:
+                    logger.warning("Retrieval failed for '%s': %s", item.query[:40], item.error)
+                results.append(item.results)
+                latencies.append(item.timings_ms.get("total", 0.0))
+
+            if has_reranker:
+                t0 = time.monotonic()
+                results = self._rerank_batch(batch, results, top_k)
+                rerank_ms = (time.monotonic() - t0) * 1000.0
+                latencies = [ms + rerank_ms for ms in latencies]
+
+            retrieved.extend(zip(results, latencies))
+        return retrieved
+
+    def _rerank_batch(
+        self,
+        queries: List[str],
+        results_list: List[List[Any]],
+        top_k: int,
+    ) -> List[List[Any]]:
+        """Rerank a batch of result lists with the optional reranker.
+
+        Falls back to the unreranked results if reranking fails.
+        """
+        try:
+            rerank_batch = getattr(self.reranker, "rerank_batch", None)
+            if callable(rerank_batch):
+                return [r.results for r in rerank_batch(queries, results_list, top_k=top_k)]
+            return [
+                self.reranker.rerank(query=q, results=results, top_k=top_k).results
+                if results else results
+                for q, results in zip(queries, results_list)
+            ]
+        except Exception as exc:
+            logger.warning("Batch reranking failed: %s", exc)
+            return [results[:top_k] for results in results_list]
+
     def _retrieve(
         self,
         query: str,
@@ -16,6 +16,8 @@ from pathlib import Path
 from typing import Any, AsyncGenerator, Dict, List, Optional
 
 from src.core.query_engine.answer_cache import get_answer_cache
+from src.core.query_engine.cache_generation import get_cache_generations
+from src.core.query_engine.semantic_answer_cache import SemanticAnswerCache
 from src.core.response.multimodal_assembler import MultimodalAssembler
 from src.ingestion.storage.image_storage import ImageStorage
 from src.libs.llm.base_llm import BaseLLM, Message
@@ -80,6 +82,7 @@ class ChatService:
         llm: The language model client.
         hybrid_search: The hybrid search engine instance.
         history_repo: Repository for persisting QA history.
+        semantic_cache: Optional near-duplicate answer cache (opt-in).
     """
 
     def __init__(
@@ -87,6 +90,7 @@ class ChatService:
         llm: BaseLLM,
         hybrid_search: Any,
         history_repo: Optional[HistoryRepository] = None,
+        semantic_cache: Optional[SemanticAnswerCache] = None,
     ) -> None:
         """Initialize ChatService.
 
@@ -94,10 +98,13 @@ class ChatService:
             llm: Language model client for answer generation.
             hybrid_search: Hybrid search engine for document retrieval.
             history_repo: Optional history repository (created if None).
+            semantic_cache: Optional semantic answer cache; None disables
+                near-duplicate matching.
         """
         self.llm = llm
         self.hybrid_search = hybrid_search
         self.history_repo = history_repo or HistoryRepository()
+        self.semantic_cache = semantic_cache
 
     async def stream_answer(
         self,
@@ -125,31 +132,65 @@ class ChatService:
         references: List[Dict[str, Any]] = []
         t0 = time.perf_counter()
 
-        # Step 0: Check L3 answer cache
+        # Step 0: Check L3 answer cache (scoped to the collection's index
+        # generation captured now, so an ingestion mid-answer retires it)
         answer_cache = get_answer_cache()
-        cached = answer_cache.get(question)
+        generation = get_cache_generations().current(collection)
+        cached = answer_cache.get(question, collection=collection, generation=generation)
         if cached is not None:
             logger.info(f"[perf] L3 cache HIT: {question[:50]}...")
-            yield self._sse({"type": "references", "data": cached.sources})
-            yield self._sse({"type": "token", "content": cached.answer})
-            yield self._sse({"type": "done", "answer": cached.answer, "cache_hit": True})
+            for event in self._cached_answer_events(cached, "exact"):
+                yield event
             return
 
-        # Step 1: Retrieve
+        # Step 0b: Semantic cache for paraphrased questions. The question is
+        # embedded through the query embedding cache, so dense retrieval
+        # below reuses the vector instead of calling the API again.
+        query_vector: Optional[List[float]] = None
+        semantic_hit = None
+        if self.semantic_cache is not None:
+            try:
+                query_vector = await self.hybrid_search.aembed_query(question)
+            except Exception as e:
+                logger.warning(f"Semantic cache skipped (query embedding failed): {e}")
+            if query_vector is not None:
+                semantic_hit = self.semantic_cache.lookup(
+                    query_vector, collection=collection, generation=generation
+                )
+            if semantic_hit is not None and not self.semantic_cache.should_verify():
+                logger.info(
+                    f"[perf] L3 semantic cache HIT ({semantic_hit.similarity:.3f}): "
+                    f"{question[:50]}... ~ {semantic_hit.matched_query[:50]}"
+                )
+                for event in self._cached_answer_events(semantic_hit.cached, "semantic"):
+                    yield event
+                return
+
+        # Step 1: Retrieve (async path — never blocks the event loop; a
+        # client disconnect cancels this task and with it the search)
         results = []
         try:
-            results = self.hybrid_search.search(query=question, top_k=top_k)
+            results = await self.hybrid_search.asearch(query=question, top_k=top_k)
             t_retrieve = time.perf_counter() - t0
             logger.info(f"[perf] retrieval: {t_retrieve:.2f}s")
 
             references = [
                 {
+                    "chunk_id": r.chunk_id,
                     "source": r.metadata.get("source_path", "未知"),
                     "score": round(r.score, 4),
                     "text": r.text[:200],
                 }
                 for r in results
             ]
+
+            # Sampled semantic hit: serve it only if fresh retrieval agrees
+            if semantic_hit is not None and self.semantic_cache.verify(semantic_hit, references):
+                logger.info(f"[perf] L3 semantic cache HIT (verified): {question[:50]}...")
+                for event in self._cached_answer_events(semantic_hit.cached, "semantic"):
+                    yield event
+                return
+
             yield self._sse({"type": "references", "data": references})
         except Exception as e:
             logger.exception("Retrieval failed")
@@ -191,6 +232,10 @@ class ChatService:
                     images_sent = True
 
             logger.info(f"[perf] LLM stream: {time.perf_counter() - t1:.2f}s")
+        except asyncio.CancelledError:
+            # Client disconnected: stop the background image extraction too
+            image_task.cancel()
+            raise
         except Exception as e:
             logger.exception("LLM generation failed")
             yield self._sse({"type": "error", "message": f"生成失败: {e}"})
@@ -214,7 +259,19 @@ class ChatService:
                 answer=full_answer,
                 sources=references,
                 metadata={"collection": collection},
+                collection=collection,
+                generation=generation,
             )
+            if self.semantic_cache is not None and query_vector is not None:
+                self.semantic_cache.put(
+                    query=question,
+                    query_vector=query_vector,
+                    answer=full_answer,
+                    sources=references,
+                    metadata={"collection": collection},
+                    collection=collection,
+                    generation=generation,
+                )
         except Exception:
             pass
 
@@ -236,6 +293,28 @@ class ChatService:
         """
         return f"data: {json.dumps(data, ensure_ascii=False)}\n\n"
 
+    @classmethod
+    def _cached_answer_events(cls, cached: Any, tier: str) -> List[str]:
+        """SSE events replaying a cached answer.
+
+        Args:
+            cached: CachedAnswer from the exact or semantic answer cache.
+            tier: Cache tier that hit ("exact" or "semantic").
+
+        Returns:
+            SSE-formatted event strings.
+        """
+        return [
+            cls._sse({"type": "references", "data": cached.sources}),
+            cls._sse({"type": "token", "content": cached.answer}),
+            cls._sse({
+                "type": "done",
+                "answer": cached.answer,
+                "cache_hit": True,
+                "cache_tier": tier,
+            }),
+        ]
+
     @staticmethod
     def _build_context(results: list, max_chars: int = 8000) -> str:
         """Build context string from retrieval results.